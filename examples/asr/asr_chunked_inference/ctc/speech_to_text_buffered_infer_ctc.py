@@ -28,6 +28,7 @@ python speech_to_text_buffered_infer_ctc.py \
     chunk_len_in_secs=1.6 \
     model_stride=4 \
     batch_size=32 \
+    max_active_streams=null \
     clean_groundtruth_text=True \
     langid='en'
 
@@ -49,7 +50,7 @@ from omegaconf import OmegaConf
 from nemo.collections.asr.models import EncDecCTCModel, EncDecHybridRNNTCTCModel
 from nemo.collections.asr.parts.submodules.ctc_decoding import CTCDecodingConfig
 from nemo.collections.asr.parts.utils.eval_utils import cal_write_wer
-from nemo.collections.asr.parts.utils.streaming_utils import FrameBatchASR
+from nemo.collections.asr.parts.utils.streaming_utils import FrameBatchASR, MultiStreamFrameBatchASR
 from nemo.collections.asr.parts.utils.transcribe_utils import (
     compute_output_filename,
     get_buffered_pred_feat,
@@ -94,6 +95,9 @@ class TranscriptionConfig:
     model_stride: int = (
         8  # Model downsampling factor, 8 for Citrinet and FasConformer models and 4 for Conformer models.
     )
+    # Number of audio files transcribed concurrently. If set, the batches are filled with chunks from several files
+    # (MultiStreamFrameBatchASR) instead of transcribing one file at a time.
+    max_active_streams: Optional[int] = None
 
     # Decoding strategy for CTC models
     decoding: CTCDecodingConfig = CTCDecodingConfig()
@@ -208,12 +212,21 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
     mid_delay = math.ceil((chunk_len + (total_buffer - chunk_len) / 2) / model_stride_in_secs)
     logging.info(f"tokens_per_chunk is {tokens_per_chunk}, mid_delay is {mid_delay}")
 
-    frame_asr = FrameBatchASR(
-        asr_model=asr_model,
-        frame_len=chunk_len,
-        total_buffer=cfg.total_buffer_in_secs,
-        batch_size=cfg.batch_size,
-    )
+    if cfg.max_active_streams is not None:
+        frame_asr = MultiStreamFrameBatchASR(
+            asr_model=asr_model,
+            frame_len=chunk_len,
+            total_buffer=cfg.total_buffer_in_secs,
+            batch_size=cfg.batch_size,
+            max_active_streams=cfg.max_active_streams,
+        )
+    else:
+        frame_asr = FrameBatchASR(
+            asr_model=asr_model,
+            frame_len=chunk_len,
+            total_buffer=cfg.total_buffer_in_secs,
+            batch_size=cfg.batch_size,
+        )
 
     with torch.amp.autocast(asr_model.device.type, enabled=cfg.amp):
         hyps = get_buffered_pred_feat(
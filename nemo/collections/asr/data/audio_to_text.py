@@ -16,7 +16,12 @@ import json
 import math
 import multiprocessing
 import os
+import queue
+import threading
+import time
+from collections import deque
 from collections.abc import Iterable as IterableABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import braceexpand
@@ -25,6 +30,7 @@ import torch
 import webdataset as wds
 from torch.utils.data import ChainDataset
 from tqdm import tqdm
+from webdataset.tariterators import group_by_keys, tar_file_expander
 
 from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
 from nemo.collections.asr.parts.preprocessing.segment import ChannelSelectorType
@@ -134,6 +140,8 @@ class ASRManifestProcessor:
         bos_id: Id of beginning of sequence symbol to append if not None.
         eos_id: Id of end of sequence symbol to append if not None.
         pad_id: Id of pad symbol. Defaults to 0.
+        manifest_cache_dir: Optional directory of a persistent cache of the parsed and tokenized manifest.
+        manifest_num_workers: Number of worker processes used to parse and tokenize the manifest, 0 to disable.
     """
 
     def __init__(
@@ -148,6 +156,8 @@ class ASRManifestProcessor:
         pad_id: int = 0,
         index_by_file_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        manifest_cache_dir: Optional[str] = None,
+        manifest_num_workers: int = 0,
     ):
         self.parser = parser
 
@@ -159,6 +169,8 @@ class ASRManifestProcessor:
             max_number=max_utts,
             index_by_file_id=index_by_file_id,
             parse_func=manifest_parse_func,
+            cache_dir=manifest_cache_dir,
+            num_workers=manifest_num_workers,
         )
 
         self.eos_id = eos_id
@@ -402,6 +414,184 @@ def shard_manifests_if_needed(
     return manifest_filepaths
 
 
+class TarredIOStats:
+    """
+    Counters of where a tarred dataset pipeline spends its time, to tell I/O bound loading from decode bound loading.
+
+    Attributes:
+        io_wait_s: Time the pipeline was blocked waiting for shard data.
+        decode_s: Time spent building samples, summed over decoding threads.
+        decode_wait_s: Time the pipeline was blocked waiting for a decoded sample.
+        bytes_read: Number of shard bytes read.
+        num_shards: Number of shards read.
+        num_samples: Number of samples built.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.io_wait_s = 0.0
+            self.decode_s = 0.0
+            self.decode_wait_s = 0.0
+            self.bytes_read = 0
+            self.num_shards = 0
+            self.num_samples = 0
+
+    def add(self, **counters):
+        with self._lock:
+            for name, value in counters.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return (
+            f'{self.num_samples} samples from {self.num_shards} shards ({self.bytes_read / 2**20:.1f} MiB), '
+            f'blocked on I/O for {self.io_wait_s:.2f} s, decoding took {self.decode_s:.2f} s '
+            f'(blocked on decode for {self.decode_wait_s:.2f} s)'
+        )
+
+
+def prefetch_tar_shards(
+    src: Iterable[Dict], num_shards: int, max_bytes: Optional[int] = None, stats: Optional[TarredIOStats] = None
+):
+    """
+    WebDataset pipeline stage that reads the next `num_shards` shards in a background thread, so that opening and
+    reading a shard overlaps with processing the samples of the previous one.
+
+    Each shard is read into memory, and a new shard is only read when fewer than `num_shards` shards are buffered and,
+    if `max_bytes` is set, their total size is below `max_bytes`. A shard larger than `max_bytes` is still read when
+    the buffer is empty.
+
+    Args:
+        src: Iterator over dict(url=...), as yielded by wds.SimpleShardList.
+        num_shards: Maximum number of shards buffered ahead of the shard being processed.
+        max_bytes: Optional maximum number of bytes buffered ahead of the shard being processed.
+        stats: Optional TarredIOStats updated with the time spent waiting for shards.
+
+    Yields:
+        Dict(url=..., stream=...) with an in-memory stream of the shard, as expected by tar_file_expander.
+    """
+    if num_shards < 1:
+        raise ValueError(f'num_shards must be at least 1, got {num_shards}.')
+
+    buffer = queue.Queue()
+    condition = threading.Condition()
+    state = {'num_shards': 0, 'num_bytes': 0, 'stop': False}
+    done = object()
+
+    def has_room():
+        if state['num_shards'] == 0:
+            return True
+        if state['num_shards'] >= num_shards:
+            return False
+        return max_bytes is None or state['num_bytes'] < max_bytes
+
+    def read_shards():
+        try:
+            for sample in src:
+                with condition:
+                    condition.wait_for(lambda: state['stop'] or has_room())
+                    if state['stop']:
+                        return
+                with wds.gopen(sample['url']) as stream:
+                    data = stream.read()
+                with condition:
+                    state['num_shards'] += 1
+                    state['num_bytes'] += len(data)
+                buffer.put((sample, data))
+            buffer.put((done, None))
+        except Exception as error:
+            buffer.put((done, error))
+
+    thread = threading.Thread(target=read_shards, daemon=True)
+    thread.start()
+    try:
+        while True:
+            start = time.perf_counter()
+            sample, data = buffer.get()
+            if stats is not None:
+                stats.add(io_wait_s=time.perf_counter() - start)
+            if sample is done:
+                if data is not None:
+                    raise data
+                return
+
+            with condition:
+                state['num_shards'] -= 1
+                state['num_bytes'] -= len(data)
+                condition.notify()
+            if stats is not None:
+                stats.add(bytes_read=len(data), num_shards=1)
+            yield dict(sample, stream=io.BytesIO(data))
+    finally:
+        with condition:
+            state['stop'] = True
+            condition.notify()
+
+
+def threaded_map(src: Iterable, fn: Callable, num_threads: int = 0, stats: Optional[TarredIOStats] = None):
+    """
+    WebDataset pipeline stage that applies `fn` to each sample in a pool of `num_threads` threads, keeping the order
+    of the samples. At most 2 * `num_threads` samples are in flight at a time. With `num_threads` = 0, `fn` runs in
+    the calling thread, like wds.map.
+
+    Threads help when `fn` mostly runs code that releases the GIL, such as audio decoding and resampling.
+
+    Args:
+        src: Iterator over samples.
+        fn: Function applied to each sample.
+        num_threads: Number of threads.
+        stats: Optional TarredIOStats updated with the time spent in `fn` and waiting for its results.
+
+    Yields:
+        fn(sample) for each sample of src.
+    """
+
+    def timed_fn(sample):
+        start = time.perf_counter()
+        result = fn(sample)
+        if stats is not None:
+            stats.add(decode_s=time.perf_counter() - start, num_samples=1)
+        return result
+
+    if num_threads == 0:
+        for sample in src:
+            yield timed_fn(sample)
+        return
+
+    def get_result(future):
+        start = time.perf_counter()
+        result = future.result()
+        if stats is not None:
+            stats.add(decode_wait_s=time.perf_counter() - start)
+        return result
+
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=num_threads)
+    try:
+        for sample in src:
+            pending.append(executor.submit(timed_fn, sample))
+            if len(pending) >= 2 * num_threads:
+                yield get_result(pending.popleft())
+        while pending:
+            yield get_result(pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 class _AudioTextDataset(Dataset):
     """
     Dataset that loads tensors via a json file containing paths to audio files, transcripts, and durations (in seconds).
@@ -427,6 +617,10 @@ class _AudioTextDataset(Dataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        manifest_cache_dir: Optional directory of a persistent cache of the parsed and tokenized manifest.
+            Defaults to None.
+        manifest_num_workers: Number of worker processes used to parse and tokenize the manifest.
+            Defaults to 0 (parsing in the main process).
     """
 
     @property
@@ -457,6 +651,8 @@ class _AudioTextDataset(Dataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        manifest_cache_dir: Optional[str] = None,
+        manifest_num_workers: int = 0,
     ):
         if type(manifest_filepath) == str:
             manifest_filepath = manifest_filepath.split(",")
@@ -474,6 +670,8 @@ class _AudioTextDataset(Dataset):
             eos_id=eos_id,
             pad_id=pad_id,
             manifest_parse_func=manifest_parse_func,
+            manifest_cache_dir=manifest_cache_dir,
+            manifest_num_workers=manifest_num_workers,
         )
         self.featurizer = WaveformFeaturizer(sample_rate=sample_rate, int_values=int_values, augmentor=augmentor)
         self.trim = trim
@@ -554,6 +752,10 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        manifest_cache_dir: Optional directory of a persistent cache of the parsed and tokenized manifest.
+            Defaults to None.
+        manifest_num_workers: Number of worker processes used to parse and tokenize the manifest.
+            Defaults to 0 (parsing in the main process).
     """
 
     @property
@@ -588,6 +790,8 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        manifest_cache_dir: Optional[str] = None,
+        manifest_num_workers: int = 0,
     ):
         self.labels = labels
 
@@ -611,6 +815,8 @@ class AudioToCharDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            manifest_cache_dir=manifest_cache_dir,
+            manifest_num_workers=manifest_num_workers,
         )
 
 
@@ -650,6 +856,10 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        manifest_cache_dir: Optional directory of a persistent cache of the parsed and tokenized manifest.
+            Defaults to None.
+        manifest_num_workers: Number of worker processes used to parse and tokenize the manifest.
+            Defaults to 0 (parsing in the main process).
     """
 
     @property
@@ -678,6 +888,8 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        manifest_cache_dir: Optional[str] = None,
+        manifest_num_workers: int = 0,
     ):
         if use_start_end_token and hasattr(tokenizer, "bos_id") and tokenizer.bos_id > 0:
             bos_id = tokenizer.bos_id
@@ -712,6 +924,9 @@ class AudioToBPEDataset(_AudioTextDataset):
                 t = self._tokenizer.text_to_ids(*args)
                 return t
 
+            def batch_text_to_ids(self, texts):
+                return self._tokenizer.batch_text_to_ids(texts)
+
         super().__init__(
             manifest_filepath=manifest_filepath,
             parser=TokenizerWrapper(tokenizer),
@@ -728,6 +943,8 @@ class AudioToBPEDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            manifest_cache_dir=manifest_cache_dir,
+            manifest_num_workers=manifest_num_workers,
         )
 
 
@@ -825,6 +1042,14 @@ class _TarredAudioToTextDataset(IterableDataset):
         world_size (int): Total number of processes, used for partitioning shards. Defaults to 0.
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        prefetch_shards (int): Number of shards each worker reads ahead in a background thread, so that reading a
+            shard overlaps with decoding the previous one. Prefetched shards are held in memory. Defaults to 0
+            (shards are streamed without read-ahead).
+        prefetch_max_bytes (int): Optional limit on the number of bytes of prefetched shards held in memory by
+            each worker. Defaults to None.
+        decode_num_threads (int): Number of threads each worker uses to decode audio. Defaults to 0 (decoding in
+            the worker thread). Note that with augmentation, threads make the augmentations applied to each sample
+            non-deterministic.
     """
 
     def __init__(
@@ -848,6 +1073,9 @@ class _TarredAudioToTextDataset(IterableDataset):
         world_size: int = 0,
         return_sample_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        prefetch_shards: int = 0,
+        prefetch_max_bytes: Optional[int] = None,
+        decode_num_threads: int = 0,
     ):
         self.shard_manifests = shard_manifests
 
@@ -892,17 +1120,30 @@ class _TarredAudioToTextDataset(IterableDataset):
             global_rank=global_rank,
         )
 
+        self.prefetch_shards = prefetch_shards
+        self.decode_num_threads = decode_num_threads
+        self.io_stats = TarredIOStats()
+
+        if prefetch_shards > 0:
+            tar_stages = [
+                wds.pipelinefilter(prefetch_tar_shards)(prefetch_shards, prefetch_max_bytes, self.io_stats),
+                wds.pipelinefilter(tar_file_expander)(),
+                wds.pipelinefilter(group_by_keys)(),
+            ]
+        else:
+            tar_stages = [wds.tarfile_to_samples()]
+
         # Put together WebDataset pipeline
         self._dataset = wds.DataPipeline(
             wds.SimpleShardList(urls=audio_tar_filepaths),
             webdataset_split_by_workers,
             wds.shuffle(shuffle_n),
-            wds.tarfile_to_samples(),
+            *tar_stages,
             wds.rename(audio=VALID_FILE_FORMATS, key='__key__'),
             wds.to_tuple('audio', 'key'),
             self._filter,
             self._loop_offsets,
-            wds.map(self._build_sample),
+            wds.pipelinefilter(threaded_map)(self._build_sample, decode_num_threads, self.io_stats),
         )
 
     def _filter(self, iterator):
@@ -1012,7 +1253,17 @@ class _TarredAudioToTextDataset(IterableDataset):
         return self.manifest_processor.collection[sample_id]
 
     def __iter__(self):
-        return self._dataset.__iter__()
+        if self.prefetch_shards == 0 and self.decode_num_threads == 0:
+            return self._dataset.__iter__()
+        return self._iter_with_io_stats()
+
+    def _iter_with_io_stats(self):
+        """Iterates over the dataset and logs the I/O and decode times of this worker at the end of the pass."""
+        self.io_stats.reset()
+        yield from self._dataset
+        worker_info = torch.utils.data.get_worker_info()
+        worker_id = 0 if worker_info is None else worker_info.id
+        logging.info(f'Tarred dataset worker {worker_id}: {self.io_stats}')
 
     def _compute_len(self):
         if self.shard_manifests and torch.distributed.is_available() and torch.distributed.is_initialized():
@@ -1118,6 +1369,14 @@ class TarredAudioToCharDataset(_TarredAudioToTextDataset):
         world_size (int): Total number of processes, used for partitioning shards. Defaults to 0.
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        prefetch_shards (int): Number of shards each worker reads ahead in a background thread, so that reading a
+            shard overlaps with decoding the previous one. Prefetched shards are held in memory. Defaults to 0
+            (shards are streamed without read-ahead).
+        prefetch_max_bytes (int): Optional limit on the number of bytes of prefetched shards held in memory by
+            each worker. Defaults to None.
+        decode_num_threads (int): Number of threads each worker uses to decode audio. Defaults to 0 (decoding in
+            the worker thread). Note that with augmentation, threads make the augmentations applied to each sample
+            non-deterministic.
     """
 
     def __init__(
@@ -1145,6 +1404,9 @@ class TarredAudioToCharDataset(_TarredAudioToTextDataset):
         world_size: int = 0,
         return_sample_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        prefetch_shards: int = 0,
+        prefetch_max_bytes: Optional[int] = None,
+        decode_num_threads: int = 0,
     ):
         self.labels = labels
 
@@ -1172,6 +1434,9 @@ class TarredAudioToCharDataset(_TarredAudioToTextDataset):
             world_size=world_size,
             return_sample_id=return_sample_id,
             manifest_parse_func=manifest_parse_func,
+            prefetch_shards=prefetch_shards,
+            prefetch_max_bytes=prefetch_max_bytes,
+            decode_num_threads=decode_num_threads,
         )
 
 
@@ -1254,6 +1519,14 @@ class TarredAudioToBPEDataset(_TarredAudioToTextDataset):
         world_size (int): Total number of processes, used for partitioning shards. Defaults to 0.
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        prefetch_shards (int): Number of shards each worker reads ahead in a background thread, so that reading a
+            shard overlaps with decoding the previous one. Prefetched shards are held in memory. Defaults to 0
+            (shards are streamed without read-ahead).
+        prefetch_max_bytes (int): Optional limit on the number of bytes of prefetched shards held in memory by
+            each worker. Defaults to None.
+        decode_num_threads (int): Number of threads each worker uses to decode audio. Defaults to 0 (decoding in
+            the worker thread). Note that with augmentation, threads make the augmentations applied to each sample
+            non-deterministic.
     """
 
     def __init__(
@@ -1275,6 +1548,9 @@ class TarredAudioToBPEDataset(_TarredAudioToTextDataset):
         world_size: int = 0,
         return_sample_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        prefetch_shards: int = 0,
+        prefetch_max_bytes: Optional[int] = None,
+        decode_num_threads: int = 0,
     ):
         if use_start_end_token and hasattr(tokenizer, "bos_id") and tokenizer.bos_id > 0:
             bos_id = tokenizer.bos_id
@@ -1309,6 +1585,9 @@ class TarredAudioToBPEDataset(_TarredAudioToTextDataset):
                 t = self._tokenizer.text_to_ids(*args)
                 return t
 
+            def batch_text_to_ids(self, texts):
+                return self._tokenizer.batch_text_to_ids(texts)
+
         super().__init__(
             audio_tar_filepaths=audio_tar_filepaths,
             manifest_filepath=manifest_filepath,
@@ -1329,6 +1608,9 @@ class TarredAudioToBPEDataset(_TarredAudioToTextDataset):
             world_size=world_size,
             return_sample_id=return_sample_id,
             manifest_parse_func=manifest_parse_func,
+            prefetch_shards=prefetch_shards,
+            prefetch_max_bytes=prefetch_max_bytes,
+            decode_num_threads=decode_num_threads,
         )
 
 
@@ -158,6 +158,8 @@ def get_char_dataset(config: dict, augmentor: Optional['AudioAugmentor'] = None)
         parser=config.get('parser', 'en'),
         return_sample_id=config.get('return_sample_id', False),
         channel_selector=config.get('channel_selector', None),
+        manifest_cache_dir=config.get('manifest_cache_dir', None),
+        manifest_num_workers=config.get('manifest_num_workers', 0),
     )
     return dataset
 
@@ -238,6 +240,8 @@ def get_bpe_dataset(
         use_start_end_token=config.get('use_start_end_token', True),
         return_sample_id=config.get('return_sample_id', False),
         channel_selector=config.get('channel_selector', None),
+        manifest_cache_dir=config.get('manifest_cache_dir', None),
+        manifest_num_workers=config.get('manifest_num_workers', 0),
     )
     return dataset
 
@@ -376,6 +380,9 @@ def get_tarred_dataset(
                 global_rank=global_rank,
                 world_size=world_size,
                 return_sample_id=config.get('return_sample_id', False),
+                prefetch_shards=config.get('tarred_prefetch_shards', 0),
+                prefetch_max_bytes=config.get('tarred_prefetch_max_bytes', None),
+                decode_num_threads=config.get('tarred_decode_num_threads', 0),
             )
         else:
             dataset = audio_to_text.TarredAudioToBPEDataset(
@@ -395,6 +402,9 @@ def get_tarred_dataset(
                 global_rank=global_rank,
                 world_size=world_size,
                 return_sample_id=config.get('return_sample_id', False),
+                prefetch_shards=config.get('tarred_prefetch_shards', 0),
+                prefetch_max_bytes=config.get('tarred_prefetch_max_bytes', None),
+                decode_num_threads=config.get('tarred_decode_num_threads', 0),
             )
         if bucketing_weights:
             [datasets.append(dataset) for _ in range(bucketing_weights[dataset_idx])]
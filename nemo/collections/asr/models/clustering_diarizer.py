@@ -31,8 +31,10 @@ from nemo.collections.asr.models.classification_models import EncDecClassificati
 from nemo.collections.asr.models.label_models import EncDecSpeakerLabelModel
 from nemo.collections.asr.parts.mixins.mixins import DiarizationMixin
 from nemo.collections.asr.parts.utils.speaker_utils import (
+    SpeakerEmbeddingStore,
     audio_rttm_map,
     get_embs_and_timestamps,
+    get_model_checksum,
     get_uniqname_from_filepath,
     parse_scale_configs,
     perform_clustering,
@@ -329,17 +331,83 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
             )
         validate_vad_manifest(self.AUDIO_RTTM_MAP, vad_manifest=self._speaker_manifest_path)
 
+    def _get_embedding_store(self) -> Optional[SpeakerEmbeddingStore]:
+        """
+        On-disk store of the speaker embeddings of the subsegments if `embedding_cache_dir` is set, else None.
+        """
+        embedding_cache_dir = self._speaker_params.get('embedding_cache_dir', None)
+        if not embedding_cache_dir:
+            return None
+        if getattr(self, '_embedding_store', None) is None or self._embedding_store.store_dir != embedding_cache_dir:
+            self._embedding_store = SpeakerEmbeddingStore(
+                embedding_cache_dir, model_checksum=get_model_checksum(self._speaker_model)
+            )
+        return self._embedding_store
+
     def _extract_embeddings(self, manifest_file: str, scale_idx: int, num_scales: int):
         """
         This method extracts speaker embeddings from segments passed through manifest_file
         Optionally you may save the intermediate speaker embeddings for debugging or any use.
+        If `embedding_cache_dir` is set, the embeddings found in the embedding store are not extracted again.
         """
         logging.info("Extracting embeddings for Diarization")
-        self._setup_spkr_test_data(manifest_file)
         self.embeddings = {}
-        self._speaker_model.eval()
         self.time_stamps = {}
 
+        with open(manifest_file, 'r', encoding='utf-8') as manifest:
+            subsegments = [json.loads(line.strip()) for line in manifest.readlines()]
+        embedding_store = self._get_embedding_store()
+        if embedding_store is not None:
+            window, shift = self.multiscale_args_dict['scale_dict'][scale_idx]
+            cached_embs = embedding_store.lookup(subsegments, window, shift)
+            missing_indices = [i for i, emb in enumerate(cached_embs) if emb is None]
+            logging.info(
+                f"Found {len(subsegments) - len(missing_indices)} of {len(subsegments)} embeddings "
+                f"in {embedding_store.store_dir}"
+            )
+            if missing_indices:
+                missing_manifest_file = os.path.splitext(manifest_file)[0] + '_missing.json'
+                with open(missing_manifest_file, 'w', encoding='utf-8') as missing_manifest:
+                    for i in missing_indices:
+                        missing_manifest.write(json.dumps(subsegments[i]) + '\n')
+                missing_embs = self._run_speaker_model(missing_manifest_file, scale_idx, num_scales)
+                embedding_store.add([subsegments[i] for i in missing_indices], missing_embs, window, shift)
+                for i, emb in zip(missing_indices, missing_embs):
+                    cached_embs[i] = emb
+            all_embs = torch.stack([emb.float() for emb in cached_embs]) if cached_embs else torch.empty([0])
+        else:
+            all_embs = self._run_speaker_model(manifest_file, scale_idx, num_scales)
+
+        for i, dic in enumerate(subsegments):
+            uniq_name = get_uniqname_from_filepath(dic['audio_filepath'])
+            if uniq_name in self.embeddings:
+                self.embeddings[uniq_name] = torch.cat((self.embeddings[uniq_name], all_embs[i].view(1, -1)))
+            else:
+                self.embeddings[uniq_name] = all_embs[i].view(1, -1)
+            if uniq_name not in self.time_stamps:
+                self.time_stamps[uniq_name] = []
+            start = dic['offset']
+            end = start + dic['duration']
+            self.time_stamps[uniq_name].append([start, end])
+
+        if self._speaker_params.save_embeddings:
+            embedding_dir = os.path.join(self._speaker_dir, 'embeddings')
+            if not os.path.exists(embedding_dir):
+                os.makedirs(embedding_dir, exist_ok=True)
+
+            prefix = get_uniqname_from_filepath(manifest_file)
+            name = os.path.join(embedding_dir, prefix)
+            self._embeddings_file = name + f'_embeddings.pkl'
+            pkl.dump(self.embeddings, open(self._embeddings_file, 'wb'))
+            logging.info("Saved embedding files to {}".format(embedding_dir))
+
+    def _run_speaker_model(self, manifest_file: str, scale_idx: int, num_scales: int) -> torch.Tensor:
+        """
+        Run the speaker model on the segments of manifest_file and return their embeddings.
+        """
+        self._setup_spkr_test_data(manifest_file)
+        self._speaker_model.eval()
+
         all_embs = torch.empty([0])
         for test_batch in tqdm(
             self._speaker_model.test_dataloader(),
@@ -355,32 +423,7 @@ class ClusteringDiarizer(torch.nn.Module, Model, DiarizationMixin):
                 embs = embs.view(-1, emb_shape)
                 all_embs = torch.cat((all_embs, embs.cpu().detach()), dim=0)
             del test_batch
-
-        with open(manifest_file, 'r', encoding='utf-8') as manifest:
-            for i, line in enumerate(manifest.readlines()):
-                line = line.strip()
-                dic = json.loads(line)
-                uniq_name = get_uniqname_from_filepath(dic['audio_filepath'])
-                if uniq_name in self.embeddings:
-                    self.embeddings[uniq_name] = torch.cat((self.embeddings[uniq_name], all_embs[i].view(1, -1)))
-                else:
-                    self.embeddings[uniq_name] = all_embs[i].view(1, -1)
-                if uniq_name not in self.time_stamps:
-                    self.time_stamps[uniq_name] = []
-                start = dic['offset']
-                end = start + dic['duration']
-                self.time_stamps[uniq_name].append([start, end])
-
-        if self._speaker_params.save_embeddings:
-            embedding_dir = os.path.join(self._speaker_dir, 'embeddings')
-            if not os.path.exists(embedding_dir):
-                os.makedirs(embedding_dir, exist_ok=True)
-
-            prefix = get_uniqname_from_filepath(manifest_file)
-            name = os.path.join(embedding_dir, prefix)
-            self._embeddings_file = name + f'_embeddings.pkl'
-            pkl.dump(self.embeddings, open(self._embeddings_file, 'wb'))
-            logging.info("Saved embedding files to {}".format(embedding_dir))
+        return all_embs
 
     def diarize(self, paths2audio_files: List[str] = None, batch_size: int = 0):
         """
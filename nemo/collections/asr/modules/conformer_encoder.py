@@ -23,7 +23,6 @@ import torch.distributed
 import torch.nn as nn
 from omegaconf import DictConfig, ListConfig, open_dict
 
-from nemo.collections.asr.models.configs import CacheAwareStreamingConfig
 from nemo.collections.asr.parts.mixins.streaming import StreamingEncoder
 from nemo.collections.asr.parts.submodules.causal_convs import CausalConv1D
 from nemo.collections.asr.parts.submodules.conformer_modules import ConformerLayer
@@ -838,6 +837,9 @@ class ConformerEncoder(NeuralModule, StreamingEncoder, Exportable, AccessMixin):
             max_context (int): the value used for the cache size of last_channel layers if left context is set to infinity (-1)
                 Defaults to -1 (means feat_out is d_model)
         """
+        # Imported here since importing nemo.collections.asr.models imports this module.
+        from nemo.collections.asr.models.configs import CacheAwareStreamingConfig
+
         streaming_cfg = CacheAwareStreamingConfig()
 
         # When att_context_size is not specified, it uses the default_att_context_size
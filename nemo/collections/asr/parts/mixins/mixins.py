@@ -24,7 +24,6 @@ import torch
 from omegaconf import DictConfig, OmegaConf, open_dict
 from torch import Tensor
 
-import nemo.collections.asr.models as asr_models
 from nemo.collections.asr.parts.mixins.asr_adapter_mixins import ASRAdapterModelMixin
 from nemo.collections.asr.parts.mixins.streaming import StreamingEncoder
 from nemo.collections.asr.parts.utils import asr_module_utils
@@ -629,6 +628,9 @@ class ASRModuleMixin(ASRAdapterModelMixin):
             log_probs: the logits tensor of current streaming chunk, only returned when return_log_probs=True
             encoded_len: the length of the output log_probs + history chunk log_probs, only returned when return_log_probs=True
         """
+        # Imported here since importing nemo.collections.asr.models imports this module.
+        import nemo.collections.asr.models as asr_models
+
         if not isinstance(self, asr_models.EncDecRNNTModel) and not isinstance(self, asr_models.EncDecCTCModel):
             raise NotImplementedError(f"stream_step does not support {type(self)}!")
 
@@ -750,6 +752,9 @@ class ASRModuleMixin(ASRAdapterModelMixin):
         if paths2audio_files is None or len(paths2audio_files) == 0:
             return {}
 
+        # Imported here since importing nemo.collections.asr.models imports this module.
+        import nemo.collections.asr.models as asr_models
+
         if return_hypotheses and logprobs:
             raise ValueError(
                 "Either `return_hypotheses` or `logprobs` can be True at any given time."
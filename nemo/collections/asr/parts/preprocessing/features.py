@@ -416,6 +416,130 @@ class FilterbankFeatures(nn.Module):
     def filter_banks(self):
         return self.fb
 
+    def _magnitude(self, x):
+        # torch stft returns complex tensor (of shape [B,N,T]); so convert to magnitude
+        # guard is needed for sqrt if grads are passed through
+        guard = 0 if not self.use_grads else CONSTANT
+        x = torch.view_as_real(x)
+        return torch.sqrt(x.pow(2).sum(-1) + guard)
+
+    def _log_mel(self, x):
+        # dot with filterbank energies
+        x = torch.matmul(self.fb.to(x.dtype), x)
+        # log features if required
+        if self.log:
+            if self.log_zero_guard_type == "add":
+                x = torch.log(x + self.log_zero_guard_value_fn(x))
+            elif self.log_zero_guard_type == "clamp":
+                x = torch.log(torch.clamp(x, min=self.log_zero_guard_value_fn(x)))
+            else:
+                raise ValueError("log_zero_guard_type was not understood")
+        return x
+
+    def reset_streaming_state(self):
+        """
+        Forget the audio seen by `forward_streaming`, so that its next call starts new streams.
+        """
+        self._streaming_state = None
+
+    @staticmethod
+    def _reflect_tail(tail, pad):
+        # right reflect padding of a signal given its last `pad + 1` samples
+        return tail[:, -pad - 1 : -1].flip(1)
+
+    @torch.no_grad()
+    def forward_streaming(self, x, is_last=False):
+        """
+        Incremental featurization of a batch of audio streams, for streaming inference.
+
+        Each call takes the next chunk of samples of every stream and only computes the STFT frames whose window
+        became complete, keeping the samples of the incomplete frames (and the pre-emphasis and padding context)
+        until the next call. Once a stream ended with `is_last=True`, the concatenation of the returned features
+        matches the output of `forward` on the whole signal, up to float precision, before normalization and
+        `pad_to` padding, which are not applied here: the streaming utilities normalize each feature buffer.
+        Call `reset_streaming_state` before starting new streams.
+
+        Args:
+            x: next samples of each stream, [B, T]. All the streams advance by the same number of samples.
+            is_last: whether `x` is the end of the streams, so that the last frames are padded and returned.
+
+        Returns:
+            The features of the new frames, [B, nfilt, num_new_frames], and their number for each stream.
+        """
+        if self.training:
+            raise RuntimeError(f"{self.__class__.__name__}.forward_streaming only supports eval mode.")
+        if self.frame_splicing > 1:
+            raise NotImplementedError(f"{self.__class__.__name__}.forward_streaming does not support frame splicing.")
+
+        # exact_pad reflects the raw signal, otherwise torch.stft(center=True) reflects the pre-emphasized signal
+        raw_pad = self.stft_pad_amount or 0
+        signal_pad = 0 if self.exact_pad else self.n_fft // 2
+        state = getattr(self, '_streaming_state', None)
+        if state is None:
+            state = self._streaming_state = {'pending': x[:, :0], 'started': False}
+
+        if not state['started']:
+            # Reflect padding needs a few samples, accumulate the first chunks until there are enough of them.
+            x = torch.cat([state['pending'], x], dim=1)
+            if x.shape[1] <= max(raw_pad, signal_pad) and not is_last:
+                state['pending'] = x
+                return x.new_zeros(x.shape[0], self.nfilt, 0), torch.zeros(x.shape[0], dtype=torch.long)
+            raw_tail = x[:, :0]
+            if raw_pad > 0:
+                x = torch.cat([x[:, 1 : raw_pad + 1].flip(1), x], dim=1)
+        else:
+            raw_tail = state['raw_tail']
+        if is_last and raw_pad > 0:
+            x = torch.cat([x, self._reflect_tail(torch.cat([raw_tail, x], dim=1)[:, -raw_pad - 1 :], raw_pad)], dim=1)
+
+        if self.preemph is not None:
+            previous = x[:, :1] if not state['started'] else state['raw_tail'][:, -1:]
+            y = torch.cat([previous, x[:, :-1]], dim=1)
+            y = x - self.preemph * y
+            if not state['started']:
+                y[:, 0] = x[:, 0]
+        else:
+            y = x
+
+        if not state['started']:
+            signal, signal_tail = y[:, :0], y[:, :0]
+            if signal_pad > 0:
+                y = torch.cat([y[:, 1 : signal_pad + 1].flip(1), y], dim=1)
+        else:
+            signal, signal_tail = state['signal'], state['signal_tail']
+        if is_last and signal_pad > 0:
+            tail = torch.cat([signal_tail, y], dim=1)[:, -signal_pad - 1 :]
+            y = torch.cat([y, self._reflect_tail(tail, signal_pad)], dim=1)
+
+        context = max(raw_pad, signal_pad) + 1
+        state['raw_tail'] = torch.cat([raw_tail, x], dim=1)[:, -context:]
+        state['signal_tail'] = torch.cat([signal_tail, y], dim=1)[:, -context:]
+        signal = torch.cat([signal, y], dim=1)
+        num_frames = (signal.shape[1] - self.n_fft) // self.hop_length + 1 if signal.shape[1] >= self.n_fft else 0
+        state['signal'] = signal[:, num_frames * self.hop_length :]
+        state['started'] = True
+        if is_last:
+            self.reset_streaming_state()
+
+        lengths = torch.full((signal.shape[0],), num_frames, dtype=torch.long)
+        if num_frames == 0:
+            return signal.new_zeros(signal.shape[0], self.nfilt, 0), lengths
+
+        with torch.amp.autocast(signal.device.type, enabled=False):
+            spec = torch.stft(
+                signal[:, : (num_frames - 1) * self.hop_length + self.n_fft],
+                n_fft=self.n_fft,
+                hop_length=self.hop_length,
+                win_length=self.win_length,
+                center=False,
+                window=self.window.to(dtype=torch.float),
+                return_complex=True,
+            )
+        spec = self._magnitude(spec)
+        if self.mag_power != 1.0:
+            spec = spec.pow(self.mag_power)
+        return self._log_mel(spec), lengths
+
     def forward(self, x, seq_len, linear_spec=False):
         seq_len = self.get_seq_len(seq_len)
 
@@ -436,11 +560,7 @@ class FilterbankFeatures(nn.Module):
         with torch.amp.autocast(x.device.type, enabled=False):
             x = self.stft(x)
 
-        # torch stft returns complex tensor (of shape [B,N,T]); so convert to magnitude
-        # guard is needed for sqrt if grads are passed through
-        guard = 0 if not self.use_grads else CONSTANT
-        x = torch.view_as_real(x)
-        x = torch.sqrt(x.pow(2).sum(-1) + guard)
+        x = self._magnitude(x)
 
         if self.training and self.nb_augmentation_prob > 0.0:
             for idx in range(x.shape[0]):
@@ -455,16 +575,7 @@ class FilterbankFeatures(nn.Module):
         if linear_spec:
             return x, seq_len
 
-        # dot with filterbank energies
-        x = torch.matmul(self.fb.to(x.dtype), x)
-        # log features if required
-        if self.log:
-            if self.log_zero_guard_type == "add":
-                x = torch.log(x + self.log_zero_guard_value_fn(x))
-            elif self.log_zero_guard_type == "clamp":
-                x = torch.log(torch.clamp(x, min=self.log_zero_guard_value_fn(x)))
-            else:
-                raise ValueError("log_zero_guard_type was not understood")
+        x = self._log_mel(x)
 
         # frame splicing if required
         if self.frame_splicing > 1:
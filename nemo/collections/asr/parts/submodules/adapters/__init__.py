@@ -26,9 +26,17 @@ from nemo.collections.asr.parts.submodules.adapters.multi_head_attention_adapter
     RelPositionMultiHeadAttentionAdapter,
     RelPositionMultiHeadAttentionAdapterConfig,
 )
-from nemo.collections.asr.parts.submodules.adapters.transformer_multi_head_attention_adapter_module import (
-    TransformerMultiHeadAttentionAdapter,
-    TransformerMultiHeadAttentionAdapterConfig,
-)
 
 # fmt: on
+
+# The transformer adapters depend on nemo.collections.asr.modules, whose encoders import this package. They are imported
+# on first access so that this package can be imported before nemo.collections.asr.modules.
+_TRANSFORMER_ADAPTERS = ("TransformerMultiHeadAttentionAdapter", "TransformerMultiHeadAttentionAdapterConfig")
+
+
+def __getattr__(name):
+    if name in _TRANSFORMER_ADAPTERS:
+        from nemo.collections.asr.parts.submodules.adapters import transformer_multi_head_attention_adapter_module
+
+        return getattr(transformer_multi_head_attention_adapter_module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,6 +22,8 @@ from typing import List, Optional, Tuple, Union
 import torch
 
 from nemo.collections.asr.parts.k2.classes import GraphIntersectDenseConfig
+from nemo.collections.asr.parts.submodules.hotword_boosting import HotwordBoostingTree
+from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
 from nemo.collections.asr.parts.submodules.wfst_decoder import RivaDecoderConfig, WfstNbestHypothesis
 from nemo.collections.asr.parts.utils import rnnt_utils
 from nemo.collections.common.tokenizers.tokenizer_spec import TokenizerSpec
@@ -217,6 +219,10 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         compute_timestamps: A bool flag, which determines whether to compute the character/subword, or
                 word based timestamp mapping the output log-probabilities to discrite intervals of timestamps.
                 The timestamps will be available in the returned Hypothesis.timestep as a dictionary.
+                Only supported by the `batched` search type.
+        search_type: `default` (or `nemo`) for the KenLM based beam search of `BeamSearchDecoderWithLM`,
+            `pyctcdecode`, `flashlight`, or `batched` for the built-in prefix beam search of all the utterances of
+            the batch at once on the device of the model (see `batched_beam_search`).
 
     """
 
@@ -233,6 +239,7 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         kenlm_path: str = None,
         flashlight_cfg: Optional['FlashlightConfig'] = None,
         pyctcdecode_cfg: Optional['PyCTCDecodeConfig'] = None,
+        batched_beam_cfg: Optional['BatchedBeamConfig'] = None,
     ):
         super().__init__(blank_id=blank_id, beam_size=beam_size)
 
@@ -241,7 +248,7 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         self.preserve_alignments = preserve_alignments
         self.compute_timestamps = compute_timestamps
 
-        if self.compute_timestamps:
+        if self.compute_timestamps and search_type != "batched":
             raise ValueError("Currently this flag is not supported for beam search algorithms.")
 
         self.vocab = None  # This must be set by specific method by user before calling forward() !
@@ -252,10 +259,12 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
             self.search_algorithm = self._pyctcdecode_beam_search
         elif search_type == "flashlight":
             self.search_algorithm = self.flashlight_beam_search
+        elif search_type == "batched":
+            self.search_algorithm = self.batched_beam_search
         else:
             raise NotImplementedError(
                 f"The search type ({search_type}) supplied is not supported!\n"
-                f"Please use one of : (default, nemo, pyctcdecode)"
+                f"Please use one of : (default, nemo, pyctcdecode, flashlight, batched)"
             )
 
         # Log the beam search algorithm
@@ -276,12 +285,20 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
             flashlight_cfg = FlashlightConfig()
         self.flashlight_cfg = flashlight_cfg
 
+        if batched_beam_cfg is None:
+            batched_beam_cfg = BatchedBeamConfig()
+        self.batched_beam_cfg = batched_beam_cfg
+
         # Default beam search scorer functions
         self.default_beam_scorer = None
         self.pyctcdecode_beam_scorer = None
         self.flashlight_beam_scorer = None
         self.token_offset = 0
 
+        # Models fused with the batched beam search, loaded at the first call
+        self.ngram_lm = None
+        self.hotword_boosting = None
+
     @typecheck()
     def forward(
         self,
@@ -599,6 +616,221 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
 
         return nbest_hypotheses
 
+    def _load_fusion_models(self, device: torch.device) -> List[Tuple[torch.nn.Module, float]]:
+        """
+        Loads the models fused with the batched beam search at the first call.
+
+        Returns:
+            list of (model, weight), the models score the tokens after a batch of states like `NGramGPULanguageModel`
+        """
+        vocab_size = len(self.vocab)
+        if self.kenlm_path is not None and self.ngram_lm is None:
+            if not os.path.exists(self.kenlm_path):
+                raise FileNotFoundError(
+                    f"ARPA file not found at : {self.kenlm_path}. Please set a valid path in the decoding config."
+                )
+            # token level LM, see train_kenlm.py in scripts/asr_language_modeling/
+            if self.decoding_type == 'subword':
+                self.ngram_lm = NGramGPULanguageModel.from_arpa(
+                    self.kenlm_path, vocab_size=vocab_size, token_offset=self.token_offset
+                )
+            else:
+                self.ngram_lm = NGramGPULanguageModel.from_arpa(
+                    self.kenlm_path, vocab_size=vocab_size, vocabulary=self.vocab
+                )
+        if self.batched_beam_cfg.hotwords and self.hotword_boosting is None:
+            if self.decoding_type == 'subword':
+                hotwords = [self.tokenizer.text_to_ids(word) for word in self.batched_beam_cfg.hotwords]
+            else:
+                hotwords = [[self.vocab_index_map[char] for char in word] for word in self.batched_beam_cfg.hotwords]
+            self.hotword_boosting = HotwordBoostingTree.from_token_sequences(
+                hotwords, vocab_size=vocab_size, weight=self.batched_beam_cfg.hotword_weight
+            )
+
+        fusion_models = []
+        if self.ngram_lm is not None:
+            fusion_models.append((self.ngram_lm.to(device), self.beam_alpha))
+        if self.hotword_boosting is not None:
+            fusion_models.append((self.hotword_boosting.to(device), 1.0))
+        return fusion_models
+
+    @torch.no_grad()
+    def batched_beam_search(
+        self, x: torch.Tensor, out_len: torch.Tensor
+    ) -> List[Union[rnnt_utils.Hypothesis, rnnt_utils.NBestHypotheses]]:
+        """
+        CTC prefix beam search of all the utterances of the batch at once, on the device of `x`.
+
+        The hypotheses are kept in [B, K] tensors, with the log probabilities of their prefix ending with blank
+        and with a non-blank label. At each frame, the hypotheses are extended with all the labels, the extensions
+        which are already hypotheses of the beam are merged with them, and the K best prefixes are kept
+        (after keeping the `beam_size_token` best labels of each hypothesis).
+
+        The N-gram LM of `kenlm_path` (token level ARPA file, like for subword models in `default_beam_search`)
+        and the hotwords of `batched_beam_cfg` are fused with the acoustic scores:
+        final_score = acoustic_score + beam_alpha * lm_score + beam_beta * seq_length + hotword_score.
+
+        Args:
+            x: Tensor of shape [B, T, V+1], where B is the batch size, T is the maximum sequence length,
+                and V is the vocabulary size. The tensor contains log-probabilities.
+            out_len: Tensor of shape [B], contains lengths of each sequence in the batch.
+
+        Returns:
+            A list of NBestHypotheses objects, one for each sequence in the batch. The timestamps of the hypotheses
+            are the frames of their tokens.
+        """
+        batch_size, max_time, num_labels = x.shape
+        beam_size = self.beam_size
+        device = x.device
+        log_probs_all = x.float()
+        if out_len is None:
+            out_len = torch.full([batch_size], max_time, dtype=torch.long, device=device)
+        out_len = out_len.to(device)
+
+        fusion_models = self._load_fusion_models(device)
+        # position of the labels in the scores of the fused models, which do not have blank
+        label_tokens = torch.arange(num_labels, device=device)
+        label_tokens = (label_tokens - (label_tokens > self.blank_id).long()).clamp_(max=num_labels - 2)
+        is_blank_label = torch.arange(num_labels, device=device) == self.blank_id
+
+        hyps = rnnt_utils.BatchedBeamHyps(
+            batch_size=batch_size,
+            beam_size=beam_size,
+            init_length=max(max_time // 4, 1),
+            blank_index=self.blank_id,
+            device=device,
+            float_dtype=torch.float32,
+        )
+        blank_scores = hyps.scores.clone()
+        non_blank_scores = torch.full_like(blank_scores, float('-inf'))
+        # weighted scores of the fused models and length bonus
+        fusion_scores = torch.zeros_like(blank_scores)
+        fusion_states = [
+            model.get_init_states(batch_size * beam_size).view(batch_size, beam_size) for model, _ in fusion_models
+        ]
+        # frames after the end of the utterances are blank frames, which do not change the prefix scores
+        padding_log_probs = torch.where(is_blank_label, 0.0, float('-inf'))
+        num_tokens_kept = min(self.batched_beam_cfg.beam_size_token or beam_size, num_labels - 1)
+
+        for t in range(max_time):
+            log_probs = torch.where((t < out_len).unsqueeze(-1), log_probs_all[:, t], padding_log_probs)
+            prefix_scores = torch.logaddexp(blank_scores, non_blank_scores)
+            last_labels = hyps.last_label
+
+            # hypotheses with the same prefix: blank, or repetition of the last label
+            same_blank_scores = prefix_scores + log_probs[:, self.blank_id].unsqueeze(-1)
+            same_non_blank_scores = torch.where(
+                last_labels != self.blank_id, non_blank_scores + log_probs.gather(1, last_labels), float('-inf')
+            )
+
+            # extensions with a new label, the last label is only repeated after a blank
+            is_last_label = last_labels.unsqueeze(-1) == torch.arange(num_labels, device=device)
+            extension_scores = torch.where(is_last_label, blank_scores.unsqueeze(-1), prefix_scores.unsqueeze(-1))
+            extension_scores = torch.where(
+                is_blank_label, float('-inf'), extension_scores + log_probs.unsqueeze(1)
+            )  # [B, K, V+1]
+
+            # extensions which are hypotheses of the beam: extension_is_hyp[b, k, j] if hyp j = hyp k + label
+            valid = torch.isfinite(prefix_scores)
+            extension_is_hyp = (
+                (hyps.transcript_hash.unsqueeze(2) == hyps.prefix_hash.unsqueeze(1))
+                & (hyps.current_lengths.unsqueeze(2) + 1 == hyps.current_lengths.unsqueeze(1))
+                & valid.unsqueeze(2)
+                & valid.unsqueeze(1)
+            )
+            hyp_last_labels = last_labels.unsqueeze(1).expand(-1, beam_size, -1)
+            merged_scores = torch.where(
+                extension_is_hyp, extension_scores.gather(2, hyp_last_labels), float('-inf')
+            ).logsumexp(dim=1)
+            same_non_blank_scores = torch.logaddexp(same_non_blank_scores, merged_scores)
+            is_merged = torch.zeros_like(extension_scores, dtype=torch.long).scatter_add_(
+                2, hyp_last_labels, extension_is_hyp.long()
+            )
+            extension_scores = torch.where(is_merged > 0, float('-inf'), extension_scores)
+
+            extension_fusion_scores = (fusion_scores.unsqueeze(-1) + self.beam_beta).expand(-1, -1, num_labels)
+            next_fusion_states = []
+            for (model, weight), states in zip(fusion_models, fusion_states):
+                model_scores, model_next_states = model.advance(states.view(-1))
+                model_scores = model_scores.view(batch_size, beam_size, -1)[..., label_tokens]
+                extension_fusion_scores = extension_fusion_scores + weight * model_scores
+                next_fusion_states.append(model_next_states.view(batch_size, beam_size, -1)[..., label_tokens])
+
+            # top-k labels of each hypothesis, then top-k of the beam
+            top_extension_scores, top_labels = (extension_scores + extension_fusion_scores).topk(
+                num_tokens_kept, dim=-1
+            )
+            candidate_scores = torch.cat(
+                (
+                    torch.logaddexp(same_blank_scores, same_non_blank_scores) + fusion_scores,
+                    top_extension_scores.flatten(1),
+                ),
+                dim=1,
+            )
+            scores, candidate_indices = candidate_scores.topk(beam_size, dim=-1)
+            is_extension = candidate_indices >= beam_size
+            extension_indices = (candidate_indices - beam_size).clamp_(min=0)
+            parents = torch.where(is_extension, extension_indices // num_tokens_kept, candidate_indices)
+            labels = torch.where(is_extension, top_labels.flatten(1).gather(1, extension_indices), self.blank_id)
+            flat_labels = parents * num_labels + labels
+
+            blank_scores = torch.where(is_extension, float('-inf'), same_blank_scores.gather(1, parents))
+            non_blank_scores = torch.where(
+                is_extension,
+                extension_scores.flatten(1).gather(1, flat_labels),
+                same_non_blank_scores.gather(1, parents),
+            )
+            fusion_scores = torch.where(
+                is_extension,
+                extension_fusion_scores.flatten(1).gather(1, flat_labels),
+                fusion_scores.gather(1, parents),
+            )
+            fusion_states = [
+                torch.where(is_extension, next_states.flatten(1).gather(1, flat_labels), states.gather(1, parents))
+                for states, next_states in zip(fusion_states, next_fusion_states)
+            ]
+            hyps = hyps.select(parents)
+            hyps.add_results_(labels, t, scores)
+
+        for (model, weight), states in zip(fusion_models, fusion_states):
+            fusion_scores = fusion_scores + weight * model.get_final(states.view(-1)).view(batch_size, beam_size)
+        scores = torch.logaddexp(blank_scores, non_blank_scores) + fusion_scores
+
+        return self._batched_beam_to_hypotheses(hyps, scores, x, out_len)
+
+    def _batched_beam_to_hypotheses(
+        self, hyps: rnnt_utils.BatchedBeamHyps, scores: torch.Tensor, x: torch.Tensor, out_len: torch.Tensor
+    ) -> List[rnnt_utils.NBestHypotheses]:
+        """Converts the beams of `batched_beam_search` to NBestHypotheses, best hypothesis first."""
+        scores, order = scores.sort(dim=-1, descending=True)
+        # move all data to cpu to avoid overhead with moving data by chunks
+        scores, order = scores.cpu(), order.cpu()
+        lengths = hyps.current_lengths.cpu()
+        transcript = hyps.transcript.cpu()
+        timestamps = hyps.timestamps.cpu()
+
+        nbest_hypotheses = []
+        for b in range(hyps.batch_size):
+            hypotheses = []
+            for score, k in zip(scores[b].tolist(), order[b].tolist()):
+                if score == float('-inf'):
+                    break
+                length = lengths[b, k]
+                hypothesis = rnnt_utils.Hypothesis(
+                    score=score,
+                    y_sequence=transcript[b, k, :length].tolist(),
+                    dec_state=None,
+                    timestamp=timestamps[b, k, :length].tolist(),
+                    last_token=None,
+                )
+                # Note this view is shared amongst all beams within the sample
+                if self.preserve_alignments:
+                    hypothesis.alignments = x[b][: out_len[b]]
+                hypotheses.append(hypothesis)
+            nbest_hypotheses.append(rnnt_utils.NBestHypotheses(hypotheses))
+
+        return nbest_hypotheses
+
     def set_decoding_type(self, decoding_type: str):
         super().set_decoding_type(decoding_type)
 
@@ -607,6 +839,10 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         if self.decoding_type == 'subword':
             self.token_offset = DEFAULT_TOKEN_OFFSET
 
+        # the tokens of the fused models depend on the decoding type
+        self.ngram_lm = None
+        self.hotword_boosting = None
+
 
 class WfstCTCInfer(AbstractBeamCTCInfer):
     """A WFST-based beam CTC decoder.
@@ -900,6 +1136,15 @@ class FlashlightConfig:
     sil_weight: float = 0.0
 
 
+@dataclass
+class BatchedBeamConfig:
+    # Number of labels kept for each hypothesis at each frame, before the pruning of the beam (beam size if None)
+    beam_size_token: Optional[int] = None
+    # Hotwords and bonus of each of their tokens
+    hotwords: Optional[List[str]] = None
+    hotword_weight: float = 1.0
+
+
 @dataclass
 class BeamCTCInferConfig:
     beam_size: int
@@ -914,6 +1159,7 @@ class BeamCTCInferConfig:
 
     flashlight_cfg: Optional[FlashlightConfig] = field(default_factory=lambda: FlashlightConfig())
     pyctcdecode_cfg: Optional[PyCTCDecodeConfig] = field(default_factory=lambda: PyCTCDecodeConfig())
+    batched_beam_cfg: Optional[BatchedBeamConfig] = field(default_factory=lambda: BatchedBeamConfig())
 
 
 @dataclass
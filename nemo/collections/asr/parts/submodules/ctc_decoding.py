@@ -49,6 +49,9 @@ class AbstractCTCDecoding(ConfidenceMixin):
 
                     beam (for DeepSpeed KenLM based decoding).
 
+                    beam_batch (for the built-in batched prefix beam search, with optional N-gram LM
+                    and hotwords, on the device of the model).
+
             compute_timestamps:
                 A bool flag, which determines whether to compute the character/subword, or
                 word based timestamp mapping the output log-probabilities to discrite intervals of timestamps.
@@ -191,6 +194,10 @@ class AbstractCTCDecoding(ConfidenceMixin):
                         of calculation of beam search, so that users may update / change the decoding strategy
                         to point to the correct file.
 
+                    batched_beam_cfg:
+                        optional config of the `beam_batch` strategy (see `ctc_beam_decoding.BatchedBeamConfig`),
+                        with the hotwords and their weight. The `kenlm_path` of this strategy must be an ARPA file.
+
         blank_id:
             The id of the RNNT blank token.
         supported_punctuation:
@@ -225,7 +232,7 @@ class AbstractCTCDecoding(ConfidenceMixin):
         self.segment_seperators = self.cfg.get('segment_seperators', ['.', '?', '!'])
         self.segment_gap_threshold = self.cfg.get('segment_gap_threshold', None)
 
-        possible_strategies = ['greedy', 'greedy_batch', 'beam', 'pyctcdecode', 'flashlight', 'wfst']
+        possible_strategies = ['greedy', 'greedy_batch', 'beam', 'beam_batch', 'pyctcdecode', 'flashlight', 'wfst']
         if self.cfg.strategy not in possible_strategies:
             raise ValueError(f"Decoding strategy must be one of {possible_strategies}. Given {self.cfg.strategy}")
 
@@ -240,7 +247,7 @@ class AbstractCTCDecoding(ConfidenceMixin):
         if self.compute_timestamps is None:
             if self.cfg.strategy in ['greedy', 'greedy_batch']:
                 self.compute_timestamps = self.cfg.greedy.get('compute_timestamps', False)
-            elif self.cfg.strategy in ['beam']:
+            elif self.cfg.strategy in ['beam', 'beam_batch']:
                 self.compute_timestamps = self.cfg.beam.get('compute_timestamps', False)
 
         # initialize confidence-related fields
@@ -292,6 +299,23 @@ class AbstractCTCDecoding(ConfidenceMixin):
 
             self.decoding.override_fold_consecutive_value = False
 
+        elif self.cfg.strategy == 'beam_batch':
+
+            self.decoding = ctc_beam_decoding.BeamCTCInfer(
+                blank_id=blank_id,
+                beam_size=self.cfg.beam.get('beam_size', 1),
+                search_type='batched',
+                return_best_hypothesis=self.cfg.beam.get('return_best_hypothesis', True),
+                preserve_alignments=self.preserve_alignments,
+                compute_timestamps=self.compute_timestamps,
+                beam_alpha=self.cfg.beam.get('beam_alpha', 1.0),
+                beam_beta=self.cfg.beam.get('beam_beta', 0.0),
+                kenlm_path=self.cfg.beam.get('kenlm_path', None),
+                batched_beam_cfg=self.cfg.beam.get('batched_beam_cfg', None),
+            )
+
+            self.decoding.override_fold_consecutive_value = False
+
         elif self.cfg.strategy == 'pyctcdecode':
 
             self.decoding = ctc_beam_decoding.BeamCTCInfer(
@@ -516,6 +540,9 @@ class AbstractCTCDecoding(ConfidenceMixin):
                     prediction = prediction[:predictions_len]
                 decoded_prediction = prediction[prediction != self.blank_id].tolist()
                 token_lengths = [1] * len(decoded_prediction)  # preserve number of repetitions per token
+                if hyp.timestamp is not None and len(hyp.timestamp) == len(decoded_prediction):
+                    # frames of the tokens (batched beam search), same convention as `fold_consecutive` above
+                    token_lengths = np.diff([0] + list(hyp.timestamp)).tolist()
                 token_repetitions = [1] * len(decoded_prediction)  # preserve number of repetitions per token
 
             # De-tokenize the integer tokens; if not computing timestamps
@@ -1033,6 +1060,9 @@ class CTCDecoding(AbstractCTCDecoding):
 
                     -   beam (for DeepSpeed KenLM based decoding).
 
+                    -   beam_batch (for the built-in batched prefix beam search, with optional N-gram LM
+                        and hotwords, on the device of the model).
+
             compute_timestamps:
                 A bool flag, which determines whether to compute the character/subword, or
                 word based timestamp mapping the output log-probabilities to discrite intervals of timestamps.
@@ -1175,6 +1205,10 @@ class CTCDecoding(AbstractCTCDecoding):
                         of calculation of beam search, so that users may update / change the decoding strategy
                         to point to the correct file.
 
+                    batched_beam_cfg:
+                        optional config of the `beam_batch` strategy (see `ctc_beam_decoding.BatchedBeamConfig`),
+                        with the hotwords and their weight. The `kenlm_path` of this strategy must be an ARPA file.
+
         blank_id: The id of the RNNT blank token.
     """
 
@@ -1256,6 +1290,9 @@ class CTCBPEDecoding(AbstractCTCDecoding):
 
                     -   beam (for DeepSpeed KenLM based decoding).
 
+                    -   beam_batch (for the built-in batched prefix beam search, with optional N-gram LM
+                        and hotwords, on the device of the model).
+
             compute_timestamps:
                 A bool flag, which determines whether to compute the character/subword, or
                 word based timestamp mapping the output log-probabilities to discrite intervals of timestamps.
@@ -1392,6 +1429,10 @@ class CTCBPEDecoding(AbstractCTCDecoding):
                         of calculation of beam search, so that users may update / change the decoding strategy
                         to point to the correct file.
 
+                    batched_beam_cfg:
+                        optional config of the `beam_batch` strategy (see `ctc_beam_decoding.BatchedBeamConfig`),
+                        with the hotwords and their weight. The `kenlm_path` of this strategy must be an ARPA file.
+
         tokenizer: NeMo tokenizer object, which inherits from TokenizerSpec.
     """
 
@@ -0,0 +1,136 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Tuple
+
+import torch
+from torch import nn
+
+
+class HotwordBoostingTree(nn.Module):
+    """
+    Prefix tree of hotwords stored in tensors, used like `NGramGPULanguageModel` for batched shallow fusion
+    in beam search decoders: the state of a hypothesis is a single integer (a node of the tree) and the scores
+    of all the tokens after all the hypotheses of a beam are computed with a lookup in dense [S, V] tables.
+
+    Each token of a hotword gets a bonus of `weight`. When a hypothesis leaves a hotword before its end, the bonus
+    of the tokens of the unfinished hotword is taken back, so that only complete hotwords are boosted.
+    After a complete hotword or a mismatch, the search restarts from the root of the tree with the current token.
+
+    Args:
+        next_states: [S, V] state after each token.
+        scores: [S, V] bonus of each token.
+        final_scores: [S] bonus at the end of the hypotheses (taking back unfinished hotwords).
+    """
+
+    def __init__(self, next_states: torch.Tensor, scores: torch.Tensor, final_scores: torch.Tensor):
+        super().__init__()
+        self.vocab_size = scores.shape[1]
+        self.register_buffer("next_states", next_states)
+        self.register_buffer("scores", scores)
+        self.register_buffer("final_scores", final_scores)
+
+    @classmethod
+    def from_token_sequences(
+        cls, hotwords: List[List[int]], vocab_size: int, weight: float = 1.0
+    ) -> "HotwordBoostingTree":
+        """
+        Builds the tree of hotwords.
+
+        Args:
+            hotwords: token ids of the hotwords, without blank.
+            vocab_size: number of tokens of the ASR model, without blank.
+            weight: bonus of each token of a hotword.
+
+        Returns:
+            The tree on CPU.
+        """
+        children = [{}]
+        is_end = [False]
+        # bonus of the tokens since the last complete hotword of the path to each node
+        pending = [0.0]
+        for tokens in hotwords:
+            node = 0
+            for token in tokens:
+                if not 0 <= token < vocab_size:
+                    raise ValueError(f"Hotword token {token} is out of the vocabulary of {vocab_size} tokens")
+                if token not in children[node]:
+                    children[node][token] = len(children)
+                    children.append({})
+                    is_end.append(False)
+                    pending.append(pending[node] + weight)
+                node = children[node][token]
+            if tokens:
+                is_end[node] = True
+        # complete hotwords confirm the bonus of their tokens
+        stack = [(0, 0.0)]
+        while stack:
+            node, node_pending = stack.pop()
+            pending[node] = 0.0 if is_end[node] else node_pending
+            stack.extend((child, pending[node] + weight) for child in children[node].values())
+
+        num_states = len(children)
+        pending = torch.tensor(pending)
+        # complete hotwords without continuation go back to the root
+        targets = [child if children[child] else 0 for child in range(num_states)]
+        next_states = torch.zeros([num_states, vocab_size], dtype=torch.long)
+        scores = torch.zeros([num_states, vocab_size])
+        for token, child in children[0].items():
+            next_states[0, token] = targets[child]
+            scores[0, token] = weight
+        # leaving a hotword: take back the pending bonus, and restart from the root with the same token
+        scores[1:] = scores[0] - pending[1:, None]
+        next_states[1:] = next_states[0]
+        for node in range(1, num_states):
+            for token, child in children[node].items():
+                next_states[node, token] = targets[child]
+                scores[node, token] = weight
+        return cls(next_states=next_states, scores=scores, final_scores=-pending)
+
+    @property
+    def num_states(self) -> int:
+        return self.final_scores.shape[0]
+
+    def get_init_states(self, batch_size: int, bos: bool = True) -> torch.Tensor:
+        """
+        Initial states of a batch of hypotheses (the root of the tree, `bos` is ignored).
+
+        Returns:
+            [batch_size] states.
+        """
+        return torch.zeros([batch_size], dtype=torch.long, device=self.final_scores.device)
+
+    def advance(self, states: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Scores all the tokens of the vocabulary after a batch of states.
+
+        Args:
+            states: [B] states of the hypotheses.
+
+        Returns:
+            A tuple of [B, V] bonuses of the tokens and [B, V] states after the tokens.
+        """
+        return self.scores[states], self.next_states[states]
+
+    def get_final(self, states: torch.Tensor) -> torch.Tensor:
+        """
+        Bonuses at the end of the hypotheses, negative for the hypotheses ending in the middle of a hotword.
+
+        Args:
+            states: [B] states of the hypotheses.
+
+        Returns:
+            [B] bonuses.
+        """
+        return self.final_scores[states]
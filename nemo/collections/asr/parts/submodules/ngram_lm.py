@@ -0,0 +1,279 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import re
+from typing import Dict, List, Optional, Tuple
+
+import torch
+from torch import nn
+
+from nemo.utils import logging
+
+BOS_WORD = "<s>"
+EOS_WORD = "</s>"
+UNK_WORD = "<unk>"
+# KenLM assigns this log10 probability to <unk> when the ARPA file does not contain it
+DEFAULT_UNK_LOG10_PROB = -100.0
+
+
+def _read_arpa(lm_path: str) -> Dict[int, List[Tuple[float, Tuple[str, ...], float]]]:
+    """
+    Reads an ARPA file.
+
+    Returns:
+        A dictionary mapping the order of the n-grams to a list of (log10 probability, words, log10 backoff).
+    """
+    ngrams = {}
+    order = None
+    header_re = re.compile(r"^\\(\d+)-grams:$")
+    with open(lm_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("\\"):
+                match = header_re.match(line)
+                order = int(match.group(1)) if match else None
+                if order is not None:
+                    ngrams[order] = []
+                continue
+            if order is None:
+                # \data\ section
+                continue
+            parts = line.split()
+            backoff = float(parts[order + 1]) if len(parts) > order + 1 else 0.0
+            ngrams[order].append((float(parts[0]), tuple(parts[1 : order + 1]), backoff))
+    if not ngrams:
+        raise ValueError(f"No n-grams found in {lm_path}, is it an ARPA file?")
+    return ngrams
+
+
+class NGramGPULanguageModel(nn.Module):
+    """
+    N-gram language model stored in tensors, for batched shallow fusion in beam search decoders.
+
+    The n-gram contexts of an ARPA model are the states of the model, the n-grams are arcs between the states,
+    sorted by (source state, label). Scoring a batch of (state, label) pairs is done with binary searches in the
+    arcs for all the pairs at once, following the backoff arcs of the states which do not have an arc with
+    the label (at most `order` times). This gives the same scores as KenLM's `BaseScore` and the state
+    of a hypothesis is a single integer, so that the scores of all the hypotheses of a beam over the whole
+    vocabulary are computed with a few tensor ops on the device of the model.
+
+    Scores are natural log probabilities. Labels are the token ids of the ASR model, without blank.
+
+    Args:
+        arc_keys: [A] sorted keys `source_state * num_labels + label` of the arcs.
+        arc_weights: [A] log probabilities of the arcs.
+        arc_next_states: [A] destination states of the arcs.
+        backoff_weights: [S] backoff log weights of the states.
+        backoff_next_states: [S] state reached by backing off from each state, the root state 0 backs off to itself.
+        vocab_size: number of tokens of the ASR model.
+        order: order of the n-gram model.
+        bos_state: state after the beginning of sentence.
+        unk_score: log probability of the tokens which are not in the model.
+    """
+
+    def __init__(
+        self,
+        arc_keys: torch.Tensor,
+        arc_weights: torch.Tensor,
+        arc_next_states: torch.Tensor,
+        backoff_weights: torch.Tensor,
+        backoff_next_states: torch.Tensor,
+        vocab_size: int,
+        order: int,
+        bos_state: int,
+        unk_score: float,
+    ):
+        super().__init__()
+        self.vocab_size = vocab_size
+        # labels of the model: tokens, then </s>
+        self.num_labels = vocab_size + 1
+        self.eos_id = vocab_size
+        self.order = order
+        self.bos_state = bos_state
+        self.unk_score = unk_score
+        self.register_buffer("arc_keys", arc_keys)
+        self.register_buffer("arc_weights", arc_weights)
+        self.register_buffer("arc_next_states", arc_next_states)
+        self.register_buffer("backoff_weights", backoff_weights)
+        self.register_buffer("backoff_next_states", backoff_next_states)
+
+    @classmethod
+    def from_arpa(
+        cls, lm_path: str, vocab_size: int, token_offset: int = 0, vocabulary: Optional[List[str]] = None
+    ) -> "NGramGPULanguageModel":
+        """
+        Loads an ARPA model.
+
+        Args:
+            lm_path: path to the ARPA file.
+            vocab_size: number of tokens of the ASR model, without blank.
+            token_offset: the word of token `i` in the ARPA file is `chr(i + token_offset)` if `token_offset` > 0
+                (subword models, see scripts/asr_language_modeling/ngram_lm/train_kenlm.py), else `str(i)`.
+            vocabulary: explicit ARPA word of each token, overrides `token_offset`.
+
+        Returns:
+            The language model on CPU.
+        """
+        if vocabulary is None:
+            if token_offset:
+                vocabulary = [chr(i + token_offset) for i in range(vocab_size)]
+            else:
+                vocabulary = [str(i) for i in range(vocab_size)]
+        if len(vocabulary) != vocab_size:
+            raise ValueError(f"Expected {vocab_size} words in the vocabulary, got {len(vocabulary)}")
+
+        ngrams = _read_arpa(lm_path)
+        order = max(ngrams)
+        labels = {word: label for label, word in enumerate(vocabulary)}
+        labels[EOS_WORD] = vocab_size
+        # <s> is only a context, it cannot be predicted
+        labels[BOS_WORD] = vocab_size + 1
+        num_labels = vocab_size + 1
+        log10 = math.log(10.0)
+
+        unk_score = DEFAULT_UNK_LOG10_PROB * log10
+        # states are the n-gram contexts, the root state 0 is the empty context
+        states = {(): 0}
+        backoffs = [0.0]
+        skipped = 0
+        for n in range(1, order):
+            for _, words, backoff in ngrams.get(n, []):
+                if n == 1 and words[0] == UNK_WORD:
+                    continue
+                if any(word not in labels for word in words):
+                    continue
+                states[tuple(labels[word] for word in words)] = len(backoffs)
+                backoffs.append(backoff * log10)
+
+        def longest_state_suffix(context):
+            while context not in states:
+                context = context[1:]
+            return states[context]
+
+        backoff_next_states = [0] * len(states)
+        for context, state in states.items():
+            if context:
+                backoff_next_states[state] = longest_state_suffix(context[1:])
+
+        arc_keys, arc_weights, arc_next_states = [], [], []
+        for n in range(1, order + 1):
+            for prob, words, _ in ngrams.get(n, []):
+                if n == 1 and words[0] == UNK_WORD:
+                    unk_score = prob * log10
+                    continue
+                if any(word not in labels for word in words):
+                    skipped += 1
+                    continue
+                ngram = tuple(labels[word] for word in words)
+                context = ngram[:-1]
+                if ngram[-1] >= num_labels or context not in states:
+                    # <s> is never predicted, and n-grams without context are malformed
+                    continue
+                arc_keys.append(states[context] * num_labels + ngram[-1])
+                arc_weights.append(prob * log10)
+                arc_next_states.append(longest_state_suffix(ngram))
+        if skipped:
+            logging.info(f"Skipped {skipped} n-grams with words which are not in the vocabulary of the model")
+
+        arc_keys = torch.tensor(arc_keys, dtype=torch.long)
+        arc_keys, order_idx = torch.sort(arc_keys)
+        bos_state = states.get((labels[BOS_WORD],), 0)
+        return cls(
+            arc_keys=arc_keys,
+            arc_weights=torch.tensor(arc_weights, dtype=torch.float32)[order_idx],
+            arc_next_states=torch.tensor(arc_next_states, dtype=torch.long)[order_idx],
+            backoff_weights=torch.tensor(backoffs, dtype=torch.float32),
+            backoff_next_states=torch.tensor(backoff_next_states, dtype=torch.long),
+            vocab_size=vocab_size,
+            order=order,
+            bos_state=bos_state,
+            unk_score=unk_score,
+        )
+
+    @property
+    def num_states(self) -> int:
+        return self.backoff_weights.shape[0]
+
+    def get_init_states(self, batch_size: int, bos: bool = True) -> torch.Tensor:
+        """
+        Initial states of a batch of hypotheses.
+
+        Args:
+            batch_size: number of hypotheses.
+            bos: start after the beginning of sentence (like KenLM's `BeginSentenceWrite`), else with an empty context.
+
+        Returns:
+            [batch_size] states.
+        """
+        return torch.full(
+            [batch_size], self.bos_state if bos else 0, dtype=torch.long, device=self.backoff_weights.device
+        )
+
+    def score_labels(self, states: torch.Tensor, labels: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Scores labels after states, all the arguments are broadcasted.
+
+        Args:
+            states: states of the hypotheses.
+            labels: labels, tokens of the ASR model or `eos_id`.
+
+        Returns:
+            A tuple of log probabilities of the labels and states after the labels.
+        """
+        states, labels = torch.broadcast_tensors(states, labels)
+        num_arcs = self.arc_keys.shape[0]
+        scores = torch.zeros(states.shape, dtype=self.arc_weights.dtype, device=states.device)
+        next_states = torch.zeros_like(states)
+        backoff = torch.zeros_like(scores)
+        found = torch.zeros(states.shape, dtype=torch.bool, device=states.device)
+        for _ in range(self.order):
+            keys = states * self.num_labels + labels
+            arc_idx = torch.searchsorted(self.arc_keys, keys).clamp_(max=num_arcs - 1)
+            match = (self.arc_keys[arc_idx] == keys) & ~found
+            scores = torch.where(match, backoff + self.arc_weights[arc_idx], scores)
+            next_states = torch.where(match, self.arc_next_states[arc_idx], next_states)
+            found |= match
+            backoff = torch.where(found, backoff, backoff + self.backoff_weights[states])
+            states = self.backoff_next_states[states]
+        # the root state has arcs for all the words of the model, the other tokens are unknown
+        scores = torch.where(found, scores, backoff + self.unk_score)
+        return scores, next_states
+
+    def advance(self, states: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Scores all the tokens of the vocabulary after a batch of states.
+
+        Args:
+            states: [B] states of the hypotheses.
+
+        Returns:
+            A tuple of [B, V] log probabilities of the tokens and [B, V] states after the tokens.
+        """
+        labels = torch.arange(self.vocab_size, device=states.device)
+        return self.score_labels(states[:, None], labels[None, :])
+
+    def get_final(self, states: torch.Tensor) -> torch.Tensor:
+        """
+        Log probabilities of the end of sentence after a batch of states.
+
+        Args:
+            states: [B] states of the hypotheses.
+
+        Returns:
+            [B] log probabilities.
+        """
+        return self.score_labels(states, torch.full_like(states, self.eos_id))[0]
@@ -0,0 +1,582 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+import torch
+
+from nemo.collections.asr.modules import rnnt_abstract
+from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
+from nemo.collections.asr.parts.utils.rnnt_utils import BatchedBeamHyps, Hypothesis, NBestHypotheses
+from nemo.core.classes import Typing, typecheck
+from nemo.core.neural_types import AcousticEncodedRepresentation, HypothesisType, LengthsType, NeuralType
+
+
+@dataclass
+class _BeamState:
+    """Hypotheses of the beams with the decoder output and state after their transcripts, [B, K, ...] tensors"""
+
+    hyps: BatchedBeamHyps
+    decoder_output: torch.Tensor  # [B, K, 1, H], projected by the joint
+    decoder_state: List[torch.Tensor]  # [B, K, ...] tensors of the decoder state
+    lm_states: Optional[torch.Tensor] = None  # [B, K] states of the n-gram LM
+
+    def select(self, beam_indices: torch.Tensor) -> "_BeamState":
+        batch_indices = torch.arange(beam_indices.shape[0], device=beam_indices.device).unsqueeze(1)
+        return _BeamState(
+            hyps=self.hyps.select(beam_indices),
+            decoder_output=self.decoder_output[batch_indices, beam_indices],
+            decoder_state=[state[batch_indices, beam_indices] for state in self.decoder_state],
+            lm_states=self.lm_states[batch_indices, beam_indices] if self.lm_states is not None else None,
+        )
+
+    def cat(self, other: "_BeamState") -> "_BeamState":
+        return _BeamState(
+            hyps=self.hyps.cat(other.hyps),
+            decoder_output=torch.cat((self.decoder_output, other.decoder_output), dim=1),
+            decoder_state=[torch.cat(states, dim=1) for states in zip(self.decoder_state, other.decoder_state)],
+            lm_states=torch.cat((self.lm_states, other.lm_states), dim=1) if self.lm_states is not None else None,
+        )
+
+    def with_scores(self, scores: torch.Tensor) -> "_BeamState":
+        hyps = self.hyps.select(torch.arange(self.hyps.beam_size, device=scores.device).expand_as(scores))
+        hyps.scores = scores
+        return _BeamState(hyps, self.decoder_output, self.decoder_state, self.lm_states)
+
+    def topk(self, k: int, sorting_scores: Optional[torch.Tensor] = None) -> "_BeamState":
+        """Best k hypotheses of each beam, by score or by `sorting_scores`"""
+        sorting_scores = self.hyps.scores if sorting_scores is None else sorting_scores
+        return self.select(sorting_scores.topk(min(k, self.hyps.beam_size), dim=-1)[1])
+
+
+class BeamBatchedRNNTInfer(Typing):
+    """
+    Batched beam search for RNNT models: the beams of all the utterances of the batch are decoded at once,
+    stored in fixed-shape tensors (see `rnnt_utils.BatchedBeamHyps`). Each step of the search runs the
+    decoder and the joint once for all the hypotheses of the batch, and pruning, recombination of equal
+    hypotheses and prefix merging are tensor ops, instead of the per-utterance loops over lists of `Hypothesis`
+    of `BeamRNNTInfer`.
+
+    Args:
+        decoder_model: rnnt_utils.AbstractRNNTDecoder implementation, with blank as pad.
+        joint_model: rnnt_utils.AbstractRNNTJoint implementation.
+        beam_size: number of hypotheses of each beam.
+        search_type: str representing the type of beam search to perform, one of -
+
+            `maes` - modified adaptive expansion search, as `BeamRNNTInfer` with `search_type='maes'`. The
+                expansions of each adaptive step are kept in a fixed number of slots (`maes_max_expansions`),
+                and prefix merging is done for prefixes shorter by one label (`maes_prefix_alpha` of 0 or 1).
+
+            `alsd` - alignment-length synchronous decoding, as `BeamRNNTInfer` with `search_type='alsd'`. The
+                finished hypotheses are kept in a second beam of `beam_size` hypotheses.
+
+        score_norm: bool, whether to normalize the scores of the log probabilities.
+        return_best_hypothesis: bool, decides whether to return a single hypothesis (the best out of N),
+            or return all N hypothesis (sorted with best score first) in a NBestHypotheses container.
+        alsd_max_target_len: Used for `search_type=alsd`. The maximum expected target sequence length
+            during beam search, int, or float for a multiple of the length of each utterance.
+        maes_num_steps: Number of adaptive steps to take. int > 1.
+        maes_prefix_alpha: Maximum prefix length in prefix search, 0 or 1.
+        maes_expansion_gamma: Float pruning threshold used in the prune-by-value step when computing the expansions.
+        maes_expansion_beta: Maximum number of prefix expansions allowed, in addition to the beam size.
+        maes_max_expansions: Number of expansions of each utterance kept at each adaptive step of mAES, the best
+            ones are kept if there are more. Defaults to beam_size * (beam_size + maes_expansion_beta), which
+            keeps all the expansions of the first step: lower values are faster, but may change the results.
+        softmax_temperature: Scales the logits of the joint prior to computing log_softmax.
+        ngram_lm_model: Path to an ARPA N-gram LM, loaded into a `NGramGPULanguageModel`.
+        ngram_lm_alpha: Alpha weight of N-gram LM.
+    """
+
+    @property
+    def input_types(self):
+        """Returns definitions of module input ports."""
+        return {
+            "encoder_output": NeuralType(('B', 'D', 'T'), AcousticEncodedRepresentation()),
+            "encoded_lengths": NeuralType(tuple('B'), LengthsType()),
+            "partial_hypotheses": [NeuralType(elements_type=HypothesisType(), optional=True)],  # must always be last
+        }
+
+    @property
+    def output_types(self):
+        """Returns definitions of module output ports."""
+        return {"predictions": [NeuralType(elements_type=HypothesisType())]}
+
+    def __init__(
+        self,
+        decoder_model: rnnt_abstract.AbstractRNNTDecoder,
+        joint_model: rnnt_abstract.AbstractRNNTJoint,
+        beam_size: int,
+        search_type: str = 'maes',
+        score_norm: bool = True,
+        return_best_hypothesis: bool = True,
+        alsd_max_target_len: Union[int, float] = 1.0,
+        maes_num_steps: int = 2,
+        maes_prefix_alpha: int = 1,
+        maes_expansion_gamma: float = 2.3,
+        maes_expansion_beta: int = 2,
+        maes_max_expansions: Optional[int] = None,
+        softmax_temperature: float = 1.0,
+        ngram_lm_model: Optional[str] = None,
+        ngram_lm_alpha: float = 0.3,
+    ):
+        self.decoder = decoder_model
+        self.joint = joint_model
+
+        self.blank = decoder_model.blank_idx
+        self.vocab_size = decoder_model.vocab_size
+        self.search_type = search_type
+        self.return_best_hypothesis = return_best_hypothesis
+        self.score_norm = score_norm
+        self.softmax_temperature = softmax_temperature
+
+        if beam_size < 1:
+            raise ValueError("Beam search size cannot be less than 1!")
+        self.beam_size = min(beam_size, self.vocab_size)
+
+        if search_type == "maes":
+            self.search_algorithm = self.modified_adaptive_expansion_search
+        elif search_type == "alsd":
+            self.search_algorithm = self.align_length_sync_decoding
+        else:
+            raise NotImplementedError(
+                f"The search type ({search_type}) supplied is not supported!\nPlease use one of : (maes, alsd)"
+            )
+
+        if not self.decoder.blank_as_pad:
+            raise ValueError(
+                f"Search type was chosen as '{search_type}', however the decoder module provided "
+                f"does not support the `blank` token as a pad value, which is required by batched beam search."
+            )
+
+        self.alsd_max_target_length = alsd_max_target_len
+        self.maes_num_steps = int(maes_num_steps)
+        self.maes_prefix_alpha = int(maes_prefix_alpha)
+        self.maes_expansion_gamma = float(maes_expansion_gamma)
+        self.maes_expansion_beta = int(maes_expansion_beta)
+        self.max_candidates = self.beam_size + self.maes_expansion_beta
+        self.maes_max_expansions = maes_max_expansions or self.beam_size * self.max_candidates
+
+        if self.maes_prefix_alpha not in (0, 1):
+            raise ValueError("Batched beam search supports `maes_prefix_alpha` of 0 or 1.")
+        if search_type == 'maes' and self.maes_num_steps < 2:
+            raise ValueError("`maes_num_steps` must be greater than 1.")
+        if search_type == 'maes' and self.vocab_size < self.max_candidates:
+            raise ValueError(
+                f"beam_size ({beam_size}) + expansion_beta ({maes_expansion_beta}) "
+                f"should be smaller or equal to vocabulary size ({self.vocab_size})."
+            )
+
+        self.token_offset = 0
+        self.ngram_lm_arpa_path = ngram_lm_model
+        self.ngram_lm = None
+        self.ngram_lm_alpha = ngram_lm_alpha
+
+        # delay this import here instead of at the beginning to avoid circular imports.
+        from nemo.collections.asr.modules.rnnt import RNNTDecoder
+
+        # LSTM states are [L, B, H], other decoders are batch first
+        self._state_batch_dim = 1 if isinstance(self.decoder, RNNTDecoder) else 0
+        self._state_type = tuple if isinstance(self.decoder, RNNTDecoder) else list
+
+    @typecheck()
+    def __call__(
+        self,
+        encoder_output: torch.Tensor,
+        encoded_lengths: torch.Tensor,
+        partial_hypotheses: Optional[List[Hypothesis]] = None,
+    ) -> Tuple[List[Union[Hypothesis, NBestHypotheses]]]:
+        """Perform batched beam search.
+
+        Args:
+            encoder_output: Encoded speech features (B, D_enc, T_max)
+            encoded_lengths: Lengths of the encoder outputs
+
+        Returns:
+            A tuple with a list of the best Hypothesis of each utterance (when `return_best_hypothesis=True`),
+            otherwise a list of NBestHypotheses, sorted with the best hypothesis first.
+        """
+        if partial_hypotheses is not None:
+            raise NotImplementedError("`partial_hypotheses` support is not supported")
+
+        # Preserve decoder and joint training state
+        decoder_training_state = self.decoder.training
+        joint_training_state = self.joint.training
+
+        with torch.inference_mode():
+            encoder_output = encoder_output.transpose(1, 2)  # (B, T, D)
+            encoder_output = encoder_output.to(dtype=next(self.joint.parameters()).dtype)
+            encoded_lengths = encoded_lengths.to(encoder_output.device)
+
+            self.decoder.eval()
+            self.joint.eval()
+
+            if self.ngram_lm_arpa_path is not None and self.ngram_lm is None:
+                self.ngram_lm = NGramGPULanguageModel.from_arpa(
+                    self.ngram_lm_arpa_path, vocab_size=self.vocab_size, token_offset=self.token_offset
+                )
+            if self.ngram_lm is not None:
+                self.ngram_lm.to(encoder_output.device)
+
+            batched_hyps = self.search_algorithm(encoder_output, encoded_lengths)
+            if self.return_best_hypothesis:
+                hypotheses = batched_hyps.to_hyps_list(score_norm=self.score_norm)
+            else:
+                hypotheses = batched_hyps.to_nbest_hyps_list(score_norm=self.score_norm)
+
+        self.decoder.train(decoder_training_state)
+        self.joint.train(joint_training_state)
+
+        return (hypotheses,)
+
+    def _to_beam_states(self, states, batch_size: int, beam_size: int) -> List[torch.Tensor]:
+        """Decoder states of B * K hypotheses to [B, K, ...] tensors"""
+        dim = self._state_batch_dim
+        return [
+            state.movedim(dim, 0).reshape(batch_size, beam_size, *state.shape[:dim], *state.shape[dim + 1 :])
+            for state in states
+        ]
+
+    def _from_beam_states(self, states: List[torch.Tensor]):
+        """[B, K, ...] tensors to decoder states of B * K hypotheses"""
+        return self._state_type(
+            state.reshape(-1, *state.shape[2:]).movedim(0, self._state_batch_dim).contiguous() for state in states
+        )
+
+    def _init_beam_state(self, batch_size: int, device: torch.device, float_dtype: torch.dtype, max_time: int):
+        hyps = BatchedBeamHyps(
+            batch_size=batch_size,
+            beam_size=self.beam_size,
+            init_length=max(max_time, 1),
+            blank_index=self.blank,
+            device=device,
+            float_dtype=float_dtype,
+        )
+        # decoder output after the <SOS> (<blank>) symbol
+        labels = torch.full([batch_size * self.beam_size, 1], self.blank, dtype=torch.long, device=device)
+        decoder_output, state, *_ = self.decoder.predict(
+            labels, None, add_sos=False, batch_size=batch_size * self.beam_size
+        )
+        decoder_output = self.joint.project_prednet(decoder_output)
+        return _BeamState(
+            hyps=hyps,
+            decoder_output=decoder_output.view(batch_size, self.beam_size, 1, -1),
+            decoder_state=self._to_beam_states(state, batch_size, self.beam_size),
+            lm_states=(
+                self.ngram_lm.get_init_states(batch_size * self.beam_size).view(batch_size, self.beam_size)
+                if self.ngram_lm is not None
+                else None
+            ),
+        )
+
+    def _advance_decoder_(self, beam: _BeamState, labels: torch.Tensor):
+        """Runs the decoder (inplace) on the labels of the hypotheses, blank labels keep the previous output"""
+        batch_size, beam_size = labels.shape
+        decoder_output, state, *_ = self.decoder.predict(
+            labels.reshape(-1, 1),
+            self._from_beam_states(beam.decoder_state),
+            add_sos=False,
+            batch_size=batch_size * beam_size,
+        )
+        decoder_output = self.joint.project_prednet(decoder_output).view(batch_size, beam_size, 1, -1)
+        state = self._to_beam_states(state, batch_size, beam_size)
+        non_blank = labels != self.blank
+        beam.decoder_output = torch.where(
+            non_blank.view(batch_size, beam_size, 1, 1), decoder_output, beam.decoder_output
+        )
+        beam.decoder_state = [
+            torch.where(non_blank.view(batch_size, beam_size, *([1] * (new.dim() - 2))), new, old)
+            for new, old in zip(state, beam.decoder_state)
+        ]
+
+    def _joint_log_probs(self, encoder_output: torch.Tensor, decoder_output: torch.Tensor) -> torch.Tensor:
+        """
+        Args:
+            encoder_output: [B, K, H] projected encoder output of the frame of each hypothesis
+            decoder_output: [B, K, 1, H] projected decoder output of each hypothesis
+
+        Returns:
+            [B, K, V + 1] log probabilities of the labels
+        """
+        batch_size, beam_size = decoder_output.shape[:2]
+        logits = self.joint.joint_after_projection(
+            encoder_output.reshape(batch_size * beam_size, 1, -1),
+            decoder_output.reshape(batch_size * beam_size, 1, -1),
+        )
+        logits = logits.view(batch_size, beam_size, -1)
+        return torch.log_softmax(logits / self.softmax_temperature, dim=-1)
+
+    def _lm_scores(self, beam: _BeamState) -> Tuple[Optional[torch.Tensor], Optional[torch.Tensor]]:
+        """[B, K, V] LM scores of the tokens after each hypothesis and LM states after the tokens"""
+        if self.ngram_lm is None:
+            return None, None
+        batch_size, beam_size = beam.lm_states.shape
+        scores, next_states = self.ngram_lm.advance(beam.lm_states.view(-1))
+        return scores.view(batch_size, beam_size, -1), next_states.view(batch_size, beam_size, -1)
+
+    def _gather_labels(self, values: torch.Tensor, labels: torch.Tensor) -> torch.Tensor:
+        """Values [B, K, V] of the non-blank labels [B, K, ...] of each hypothesis, 0 for blank labels"""
+        safe_labels = torch.where(labels == self.blank, 0, labels).clamp(max=values.shape[-1] - 1)
+        gathered = torch.gather(values, 2, safe_labels.view(*labels.shape[:2], -1)).view(labels.shape)
+        return torch.where(labels == self.blank, 0, gathered)
+
+    def _add_labels(
+        self,
+        beam: _BeamState,
+        beam_indices: torch.Tensor,
+        labels: torch.Tensor,
+        scores: torch.Tensor,
+        time_indices: Union[torch.Tensor, int],
+        lm_next_states: Optional[torch.Tensor],
+    ) -> _BeamState:
+        """New beams with the labels added to the hypotheses `beam_indices` of the beams"""
+        # LM states after all the tokens of the parent hypotheses
+        next_lm_states = None
+        if lm_next_states is not None:
+            batch_indices = torch.arange(labels.shape[0], device=labels.device).unsqueeze(1)
+            token_states = lm_next_states[batch_indices, beam_indices, torch.where(labels == self.blank, 0, labels)]
+            next_lm_states = torch.where(
+                labels == self.blank, beam.lm_states[batch_indices, beam_indices], token_states
+            )
+        new_beam = beam.select(beam_indices)
+        new_beam.lm_states = next_lm_states
+        new_beam.hyps.add_results_(labels, time_indices, scores)
+        self._advance_decoder_(new_beam, labels)
+        return new_beam
+
+    def _merge_prefixes(self, beam: _BeamState, log_probs: torch.Tensor, lm_scores: Optional[torch.Tensor]):
+        """
+        Prefix search of mAES for prefixes shorter by one label: the score of each hypothesis is merged with
+        the scores of reaching it from its prefixes in the beam with the current frame.
+        """
+        hyps = beam.hyps
+        valid = torch.isfinite(hyps.scores)
+        # [B, K (extended hypotheses), K (prefixes)]
+        is_prefix = (
+            (hyps.prefix_hash.unsqueeze(2) == hyps.transcript_hash.unsqueeze(1))
+            & (hyps.current_lengths.unsqueeze(2) == hyps.current_lengths.unsqueeze(1) + 1)
+            & valid.unsqueeze(2)
+            & valid.unsqueeze(1)
+        )
+        # score of the last label of each hypothesis after each prefix: [B, K (prefixes), K (extended hypotheses)]
+        last_labels = hyps.last_label.unsqueeze(1).expand(-1, hyps.beam_size, -1)
+        prefix_scores = hyps.scores.unsqueeze(2) + self._gather_labels(log_probs, last_labels)
+        if lm_scores is not None:
+            prefix_scores = prefix_scores + self.ngram_lm_alpha * self._gather_labels(lm_scores, last_labels)
+        prefix_scores = torch.where(is_prefix, prefix_scores.transpose(1, 2), float('-inf'))
+        merged_scores = torch.logaddexp(hyps.scores, torch.logsumexp(prefix_scores, dim=-1))
+        hyps.scores = torch.where(is_prefix.any(dim=-1), merged_scores, hyps.scores)
+
+    def modified_adaptive_expansion_search(
+        self, encoder_output: torch.Tensor, encoded_lengths: torch.Tensor
+    ) -> BatchedBeamHyps:
+        """
+        Batched modified adaptive expansion search, based on https://ieeexplore.ieee.org/document/9250505
+
+        Args:
+            encoder_output: Encoded speech features (B, T_max, D_enc)
+            encoded_lengths: Lengths of the encoder outputs
+
+        Returns:
+            BatchedBeamHyps with the beams of all the utterances
+        """
+        batch_size, max_time, _ = encoder_output.shape
+        device = encoder_output.device
+        encoder_output = self.joint.project_encoder(encoder_output)
+        kept = self._init_beam_state(batch_size, device, encoder_output.dtype, max_time)
+
+        for t in range(max_time):
+            # utterances which are over keep their beam
+            active = (t < encoded_lengths).unsqueeze(1)  # [B, 1]
+            encoder_output_t = encoder_output[:, t : t + 1].expand(-1, self.beam_size, -1)
+            log_probs = self._joint_log_probs(encoder_output_t, kept.decoder_output)
+            lm_scores, lm_next_states = self._lm_scores(kept)
+            if self.maes_prefix_alpha > 0:
+                scores = kept.hyps.scores
+                self._merge_prefixes(kept, log_probs, lm_scores)
+                kept.hyps.scores = torch.where(active, kept.hyps.scores, scores)
+
+            # hypotheses at the beginning of the frame, expansions cannot be equal to them
+            frame_hashes = kept.hyps.transcript_hash.view(batch_size, 1, 1, -1)
+            frame_lengths = kept.hyps.current_lengths.view(batch_size, 1, 1, -1)
+            frame_valid = torch.isfinite(kept.hyps.scores).view(batch_size, 1, 1, -1)
+
+            hyps = kept
+            # best hypotheses ending with blank at this frame
+            blank_beam = None
+            for n in range(self.maes_num_steps):
+                if n > 0:
+                    log_probs = self._joint_log_probs(
+                        encoder_output_t[:, :1].expand(-1, hyps.hyps.beam_size, -1), hyps.decoder_output
+                    )
+                    lm_scores, lm_next_states = self._lm_scores(hyps)
+                scores = hyps.hyps.scores
+                # candidates: best labels of each hypothesis, pruned by value
+                top_log_probs, top_labels = log_probs.topk(self.max_candidates, dim=-1)  # [B, K, C]
+                keep = (top_log_probs >= top_log_probs[..., :1] - self.maes_expansion_gamma) & active.unsqueeze(-1)
+                candidate_scores = scores.unsqueeze(-1) + top_log_probs
+                is_blank = top_labels == self.blank
+
+                if n == 0:
+                    # utterances which are over keep their hypotheses unchanged
+                    blank_scores = torch.where(active, float('-inf'), scores)
+                else:
+                    blank_scores = torch.full_like(scores, float('-inf'))
+                blank_scores = torch.maximum(
+                    blank_scores, torch.where(keep & is_blank, candidate_scores, float('-inf')).amax(dim=-1)
+                )
+                blank_candidates = hyps.with_scores(blank_scores)
+                if blank_beam is not None:
+                    blank_candidates = blank_beam.cat(blank_candidates)
+                blank_beam = blank_candidates.topk(self.beam_size)
+
+                if lm_scores is not None:
+                    candidate_scores = candidate_scores + self.ngram_lm_alpha * self._gather_labels(
+                        lm_scores, top_labels
+                    )
+                new_hashes = hyps.hyps.hash_with_labels(top_labels).unsqueeze(-1)
+                new_lengths = (hyps.hyps.current_lengths + 1).view(batch_size, -1, 1, 1)
+                is_duplicate = ((new_hashes == frame_hashes) & (new_lengths == frame_lengths) & frame_valid).any(
+                    dim=-1
+                )
+                expansion_scores = torch.where(keep & ~is_blank & ~is_duplicate, candidate_scores, float('-inf'))
+
+                # best expansions, in a fixed number of slots
+                expansion_scores, expansion_indices = expansion_scores.view(batch_size, -1).topk(
+                    min(self.maes_max_expansions, expansion_scores[0].numel()), dim=-1
+                )
+                has_expansions = torch.isfinite(expansion_scores)
+                if not has_expansions.any():
+                    break
+                expansion_labels = torch.where(
+                    has_expansions, top_labels.view(batch_size, -1).gather(1, expansion_indices), self.blank
+                )
+                hyps = self._add_labels(
+                    hyps,
+                    expansion_indices // self.max_candidates,
+                    expansion_labels,
+                    expansion_scores,
+                    t,
+                    lm_next_states,
+                )
+
+                if n == self.maes_num_steps - 1:
+                    # expansions of the last step end with blank at this frame
+                    log_probs = self._joint_log_probs(
+                        encoder_output_t[:, :1].expand(-1, hyps.hyps.beam_size, -1), hyps.decoder_output
+                    )
+                    hyps.hyps.scores = hyps.hyps.scores + log_probs[..., self.blank]
+                    blank_beam = blank_beam.cat(hyps).topk(self.beam_size)
+
+            kept = blank_beam
+
+        return kept.hyps
+
+    def align_length_sync_decoding(
+        self, encoder_output: torch.Tensor, encoded_lengths: torch.Tensor
+    ) -> BatchedBeamHyps:
+        """
+        Batched alignment-length synchronous beam search, based on https://ieeexplore.ieee.org/document/9053040
+
+        Args:
+            encoder_output: Encoded speech features (B, T_max, D_enc)
+            encoded_lengths: Lengths of the encoder outputs
+
+        Returns:
+            BatchedBeamHyps with the beams of all the utterances
+        """
+        batch_size, max_time, _ = encoder_output.shape
+        device = encoder_output.device
+        encoder_output = self.joint.project_encoder(encoder_output)
+        beam = self._init_beam_state(batch_size, device, encoder_output.dtype, max_time)
+        # finished hypotheses, ranked by their final score
+        final = beam.with_scores(torch.full_like(beam.hyps.scores, float('-inf')))
+
+        # compute u_max as either a specific static limit, or a multiple of the length of each utterance
+        if isinstance(self.alsd_max_target_length, float):
+            u_max = (self.alsd_max_target_length * encoded_lengths).long()
+        else:
+            u_max = torch.full_like(encoded_lengths, int(self.alsd_max_target_length))
+        num_steps = (encoded_lengths + u_max).unsqueeze(1)
+        last_frames = (encoded_lengths - 1).unsqueeze(1)
+        batch_indices = torch.arange(batch_size, device=device).unsqueeze(1)
+
+        for i in range(int((encoded_lengths + u_max).max().item()) if batch_size > 0 else 0):
+            scores = beam.hyps.scores
+            time_indices = i - beam.hyps.current_lengths  # [B, K]
+            expand = torch.isfinite(scores) & (time_indices <= last_frames) & (i < num_steps)
+            # utterances without hypotheses to expand are over and keep their beam
+            active = expand.any(dim=-1, keepdim=True)
+            if not active.any():
+                break
+
+            safe_time_indices = time_indices.clamp(min=0, max=max_time - 1)
+            log_probs = self._joint_log_probs(encoder_output[batch_indices, safe_time_indices], beam.decoder_output)
+            blank_scores = torch.where(
+                expand, scores + log_probs[..., self.blank], torch.where(active, float('-inf'), scores)
+            )
+            finished = expand & (time_indices == last_frames)
+            if finished.any():
+                final_candidates = final.cat(beam.with_scores(torch.where(finished, blank_scores, float('-inf'))))
+                final = final_candidates.topk(
+                    self.beam_size, final_candidates.hyps.sorting_scores(score_norm=self.score_norm)
+                )
+
+            token_log_probs = log_probs.clone()
+            token_log_probs[..., self.blank] = float('-inf')
+            top_log_probs, top_labels = token_log_probs.topk(self.beam_size, dim=-1)  # [B, K, beam]
+            token_scores = scores.unsqueeze(-1) + top_log_probs
+            lm_scores, lm_next_states = self._lm_scores(beam)
+            if lm_scores is not None:
+                token_scores = token_scores + self.ngram_lm_alpha * self._gather_labels(lm_scores, top_labels)
+            token_scores = torch.where(expand.unsqueeze(-1), token_scores, float('-inf'))
+
+            # candidates of each hypothesis: blank, then the best tokens
+            candidate_scores = torch.cat((blank_scores.unsqueeze(-1), token_scores), dim=-1)
+            candidate_labels = torch.cat((torch.full_like(top_labels[..., :1], self.blank), top_labels), dim=-1)
+            num_candidates = candidate_scores.shape[-1]
+            next_scores, next_indices = candidate_scores.view(batch_size, -1).topk(self.beam_size, dim=-1)
+            parent_indices = next_indices // num_candidates
+            next_labels = candidate_labels.view(batch_size, -1).gather(1, next_indices)
+            beam = self._add_labels(
+                beam,
+                parent_indices,
+                next_labels,
+                next_scores,
+                safe_time_indices.gather(1, parent_indices),
+                lm_next_states,
+            )
+            # recombine the hypotheses with the same transcript, this may leave less hypotheses in the beam
+            beam.hyps.recombine_()
+
+        # finished hypotheses if any, else the last beam
+        has_final = torch.isfinite(final.hyps.scores).any(dim=-1, keepdim=True)
+        beam_indices = torch.arange(self.beam_size, device=device).unsqueeze(0) + torch.where(
+            has_final, 0, self.beam_size
+        )
+        return final.hyps.cat(beam.hyps).select(beam_indices)
+
+    def set_decoding_type(self, decoding_type: str):
+        """
+        Sets decoding type. Please check train_kenlm.py in scripts/asr_language_modeling/ to find out why we need
+        Args:
+            decoding_type: decoding type
+        """
+        # TOKEN_OFFSET for BPE-based models
+        if decoding_type == 'subword':
+            from nemo.collections.asr.parts.submodules.ctc_beam_decoding import DEFAULT_TOKEN_OFFSET
+
+            self.token_offset = DEFAULT_TOKEN_OFFSET
+            # reloaded with the new token offset
+            self.ngram_lm = None
@@ -35,6 +35,7 @@ import torch
 from tqdm import tqdm
 
 from nemo.collections.asr.modules import rnnt_abstract
+from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
 from nemo.collections.asr.parts.utils.rnnt_utils import (
     HATJointOutput,
     Hypothesis,
@@ -221,7 +222,9 @@ class BeamRNNTInfer(Typing):
             other than basic beam search.
 
         ngram_lm_model: str
-            The path to the N-gram LM
+            The path to the N-gram LM. ARPA files (`.arpa`) are loaded into a `NGramGPULanguageModel`, which scores
+            all the hypotheses of the beam at once on the device of the model and does not require KenLM.
+            Other files are loaded with KenLM.
         ngram_lm_alpha: float
             Alpha weight of N-gram LM
         tokens_type: str
@@ -349,8 +352,14 @@ class BeamRNNTInfer(Typing):
         self.preserve_alignments = preserve_alignments
 
         self.token_offset = 0
+        self.ngram_lm_arpa_path = None
 
-        if ngram_lm_model:
+        if ngram_lm_model and ngram_lm_model.endswith(".arpa"):
+            # loaded by the search, once the token offset is known (see `set_decoding_type`)
+            self.ngram_lm_arpa_path = ngram_lm_model
+            self.ngram_lm = None
+            self.ngram_lm_alpha = ngram_lm_alpha
+        elif ngram_lm_model:
             if KENLM_AVAILABLE:
                 self.ngram_lm = kenlm.Model(ngram_lm_model)
                 self.ngram_lm_alpha = ngram_lm_alpha
@@ -864,9 +873,6 @@ class BeamRNNTInfer(Typing):
         Returns:
             nbest_hyps: N-best decoding results
         """
-        # delay this import here instead of at the beginning to avoid circular imports.
-        from nemo.collections.asr.modules.rnnt import RNNTDecoder, StatelessTransducerDecoder
-
         if partial_hypotheses is not None:
             raise NotImplementedError("`partial_hypotheses` support is not supported")
 
@@ -922,62 +928,20 @@ class BeamRNNTInfer(Typing):
             B_ = []
             h_states = []
 
-            # preserve the list of batch indices which are added into the list
-            # and those which are removed from the list
-            # This is necessary to perform state updates in the correct batch indices later
-            batch_ids = list(range(len(B)))  # initialize as a list of all batch ids
-            batch_removal_ids = []  # update with sample ids which are removed
-
-            for bid, hyp in enumerate(B):
+            for hyp in B:
                 u = len(hyp.y_sequence) - 1
                 t = i - u
 
                 if t > (h_length - 1):
-                    batch_removal_ids.append(bid)
                     continue
 
                 B_.append(hyp)
                 h_states.append((t, h[t]))
 
             if B_:
-                # Compute the subset of batch ids which were *not* removed from the list above
-                sub_batch_ids = None
-                if len(B_) != beam:
-                    sub_batch_ids = batch_ids
-                    for id in batch_removal_ids:
-                        # sub_batch_ids contains list of ids *that were not removed*
-                        sub_batch_ids.remove(id)
-
-                    # extract the states of the sub batch only.
-                    if isinstance(self.decoder, RNNTDecoder) or isinstance(self.decoder, StatelessTransducerDecoder):
-                        beam_state_ = (beam_state[sub_batch_id] for sub_batch_id in sub_batch_ids)
-                    else:
-                        raise NotImplementedError("Unknown decoder type.")
-
-                else:
-                    # If entire batch was used (none were removed), simply take all the states
-                    beam_state_ = beam_state
-
-                # Decode a batch/sub-batch of beam states and scores
+                # Decode a batch of beam states and scores, the states are aligned with B_
                 beam_y, beam_state_ = self.decoder.batch_score_hypothesis(B_, cache)
 
-                # If only a subset of batch ids were updated (some were removed)
-                if sub_batch_ids is not None:
-                    # For each state in the RNN (2 for LSTM)
-                    # Update the current batch states with the sub-batch states (in the correct indices)
-                    # These indices are specified by sub_batch_ids, the ids of samples which were updated.
-                    if isinstance(self.decoder, RNNTDecoder) or isinstance(self.decoder, StatelessTransducerDecoder):
-                        # LSTM decoder, state is [layer x batch x hidden]
-                        index = 0
-                        for sub_batch_id in sub_batch_ids:
-                            beam_state[sub_batch_id] = beam_state_[index]
-                            index += 1
-                    else:
-                        raise NotImplementedError("Unknown decoder type.")
-                else:
-                    # If entire batch was updated, simply update all the states
-                    beam_state = beam_state_
-
                 # h_states = list of [t, h[t]]
                 # so h[1] here is a h[t] of shape [D]
                 # Simply stack all of the h[t] within the sub_batch/batch (T <= beam)
@@ -1019,13 +983,6 @@ class BeamRNNTInfer(Typing):
                     if h_states[j][0] == (h_length - 1):
                         final.append(new_hyp)
 
-                    # Here, we carefully select the indices of the states that we want to preserve
-                    # for the next token (non-blank) update.
-                    if sub_batch_ids is not None:
-                        h_states_idx = sub_batch_ids[j]
-                    else:
-                        h_states_idx = j
-
                     # for each current hypothesis j
                     # extract the top token score and top token id for the jth hypothesis
                     for logp, k in zip(beam_topk[0][j], beam_topk[1][j] + index_incr):
@@ -1034,7 +991,7 @@ class BeamRNNTInfer(Typing):
                         new_hyp = Hypothesis(
                             score=(hyp.score + float(logp)),
                             y_sequence=(hyp.y_sequence[:] + [int(k)]),
-                            dec_state=beam_state[h_states_idx],
+                            dec_state=beam_state_[j],
                             lm_state=hyp.lm_state,
                             timestamp=hyp.timestamp[:] + [i],
                             length=i,
@@ -1065,9 +1022,8 @@ class BeamRNNTInfer(Typing):
                         if int(label) == self.blank:
                             B_i.alignments.append([])  # blank buffer for next timestep
 
-            # If B_ is empty list, then we may be able to early exit
-            elif len(batch_ids) == len(batch_removal_ids):
-                # break early
+            # If B_ is empty list, every hypothesis is past the end of the encoder output, so exit early
+            else:
                 break
 
         if final:
@@ -1104,6 +1060,14 @@ class BeamRNNTInfer(Typing):
 
         h = h[0]  # [T, D]
 
+        if self.ngram_lm_arpa_path is not None and self.ngram_lm is None:
+            self.ngram_lm = NGramGPULanguageModel.from_arpa(
+                self.ngram_lm_arpa_path, vocab_size=self.vocab_size, token_offset=self.token_offset
+            )
+        batched_ngram_lm = isinstance(self.ngram_lm, NGramGPULanguageModel)
+        if batched_ngram_lm:
+            self.ngram_lm.to(h.device)
+
         # prepare the batched beam states
         beam = min(self.beam_size, self.vocab_size)
         beam_state = self.decoder.initialize_state(
@@ -1133,7 +1097,9 @@ class BeamRNNTInfer(Typing):
         state = beam_state[0]
 
         # Setup ngram LM:
-        if self.ngram_lm:
+        if batched_ngram_lm:
+            init_lm_state = self.ngram_lm.bos_state
+        elif self.ngram_lm:
             init_lm_state = kenlm.State()
             self.ngram_lm.BeginSentenceWrite(init_lm_state)
 
@@ -1207,6 +1173,12 @@ class BeamRNNTInfer(Typing):
                     hyps, beam_idx, beam_logp, self.maes_expansion_gamma, self.maes_expansion_beta
                 )
 
+                if batched_ngram_lm:
+                    # LM scores of all the tokens after all the hypotheses at once
+                    lm_states = torch.tensor([hyp.ngram_lm_state for hyp in hyps], device=h.device)
+                    lm_scores, lm_next_states = self.ngram_lm.advance(lm_states)
+                    lm_scores, lm_next_states = lm_scores.tolist(), lm_next_states.tolist()
+
                 # List that contains the hypothesis after prefix expansion
                 list_exp = []
                 for i, hyp in enumerate(hyps):  # For all hypothesis
@@ -1235,10 +1207,14 @@ class BeamRNNTInfer(Typing):
                                 new_hyp.timestamp.append(t)
 
                                 # Setup ngram LM:
-                                if self.ngram_lm:
+                                if batched_ngram_lm:
+                                    lm_score = lm_scores[i][int(k)]
+                                    new_hyp.ngram_lm_state = lm_next_states[i][int(k)]
+                                elif self.ngram_lm:
                                     lm_score, new_hyp.ngram_lm_state = self.compute_ngram_score(
                                         hyp.ngram_lm_state, int(k)
                                     )
+                                if self.ngram_lm:
                                     if self.hat_subtract_ilm:
                                         new_hyp.score += self.ngram_lm_alpha * lm_score - float(
                                             self.hat_ilm_weight * ilm_ytm[i, 0, 0, k]
@@ -1473,6 +1449,12 @@ class BeamRNNTInfer(Typing):
         """
         Score computation for kenlm ngram language model.
         """
+        if isinstance(self.ngram_lm, NGramGPULanguageModel):
+            device = self.ngram_lm.arc_keys.device
+            lm_score, next_state = self.ngram_lm.score_labels(
+                torch.tensor(current_lm_state, device=device), torch.tensor(label, device=device)
+            )
+            return lm_score.item(), next_state.item()
 
         if self.token_offset:
             label = chr(label + self.token_offset)
@@ -1496,6 +1478,10 @@ class BeamRNNTInfer(Typing):
 
             self.token_offset = DEFAULT_TOKEN_OFFSET
 
+            if self.ngram_lm_arpa_path is not None:
+                # reloaded with the new token offset
+                self.ngram_lm = None
+
 
 @dataclass
 class BeamRNNTInferConfig:
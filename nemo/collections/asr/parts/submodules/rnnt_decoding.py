@@ -23,7 +23,12 @@ import numpy as np
 import torch
 from omegaconf import OmegaConf
 
-from nemo.collections.asr.parts.submodules import rnnt_beam_decoding, rnnt_greedy_decoding, tdt_beam_decoding
+from nemo.collections.asr.parts.submodules import (
+    rnnt_batched_beam_decoding,
+    rnnt_beam_decoding,
+    rnnt_greedy_decoding,
+    tdt_beam_decoding,
+)
 from nemo.collections.asr.parts.utils.asr_confidence_utils import ConfidenceConfig, ConfidenceMixin
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis, NBestHypotheses
 from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
@@ -41,6 +46,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
                 Possible values are :
                 -   greedy, greedy_batch (for greedy decoding).
                 -   beam, tsd, alsd (for beam search decoding).
+                -   maes_batch, alsd_batch (for beam search decoding of all the utterances of a batch at once).
 
             compute_hypothesis_token_set: A bool flag, which determines whether to compute a list of decoded
                 tokens as well as the decoded string. Default is False in order to avoid double decoding
@@ -249,7 +255,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
                     "currently only greedy and greedy_batch inference is supported for multi-blank models"
                 )
 
-        possible_strategies = ['greedy', 'greedy_batch', 'beam', 'tsd', 'alsd', 'maes']
+        possible_strategies = ['greedy', 'greedy_batch', 'beam', 'tsd', 'alsd', 'maes', 'maes_batch', 'alsd_batch']
         if self.cfg.strategy not in possible_strategies:
             raise ValueError(f"Decoding strategy must be one of {possible_strategies}")
 
@@ -258,7 +264,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
             if self.cfg.strategy in ['greedy', 'greedy_batch']:
                 self.preserve_alignments = self.cfg.greedy.get('preserve_alignments', False)
 
-            elif self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes']:
+            elif self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes', 'maes_batch', 'alsd_batch']:
                 self.preserve_alignments = self.cfg.beam.get('preserve_alignments', False)
 
         # Update compute timestamps
@@ -266,7 +272,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
             if self.cfg.strategy in ['greedy', 'greedy_batch']:
                 self.compute_timestamps = self.cfg.greedy.get('compute_timestamps', False)
 
-            elif self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes']:
+            elif self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes', 'maes_batch', 'alsd_batch']:
                 self.compute_timestamps = self.cfg.beam.get('compute_timestamps', False)
 
         # Test if alignments are being preserved for RNNT
@@ -288,7 +294,7 @@ class AbstractRNNTDecoding(ConfidenceMixin):
         # Confidence estimation is not implemented for these strategies
         if (
             not self.preserve_frame_confidence
-            and self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes']
+            and self.cfg.strategy in ['beam', 'tsd', 'alsd', 'maes', 'maes_batch', 'alsd_batch']
             and self.cfg.beam.get('preserve_frame_confidence', False)
         ):
             raise NotImplementedError(f"Confidence calculation is not supported for strategy `{self.cfg.strategy}`")
@@ -478,6 +484,25 @@ class AbstractRNNTDecoding(ConfidenceMixin):
                         ngram_lm_model=self.cfg.beam.get('ngram_lm_model', None),
                         ngram_lm_alpha=self.cfg.beam.get('ngram_lm_alpha', 0.3),
                     )
+        elif self.cfg.strategy in ['maes_batch', 'alsd_batch']:
+            self.decoding = rnnt_batched_beam_decoding.BeamBatchedRNNTInfer(
+                decoder_model=decoder,
+                joint_model=joint,
+                beam_size=self.cfg.beam.beam_size,
+                return_best_hypothesis=decoding_cfg.beam.get('return_best_hypothesis', True),
+                search_type=self.cfg.strategy[: -len('_batch')],
+                score_norm=self.cfg.beam.get('score_norm', True),
+                alsd_max_target_len=self.cfg.beam.get('alsd_max_target_len', 2),
+                maes_num_steps=self.cfg.beam.get('maes_num_steps', 2),
+                maes_prefix_alpha=self.cfg.beam.get('maes_prefix_alpha', 1),
+                maes_expansion_gamma=self.cfg.beam.get('maes_expansion_gamma', 2.3),
+                maes_expansion_beta=self.cfg.beam.get('maes_expansion_beta', 2),
+                maes_max_expansions=self.cfg.beam.get('maes_max_expansions', None),
+                softmax_temperature=self.cfg.beam.get('softmax_temperature', 1.0),
+                ngram_lm_model=self.cfg.beam.get('ngram_lm_model', None),
+                ngram_lm_alpha=self.cfg.beam.get('ngram_lm_alpha', 0.3),
+            )
+
         else:
 
             raise ValueError(
@@ -1253,6 +1278,8 @@ class RNNTDecoding(AbstractRNNTDecoding):
 
                 -   beam, tsd, alsd (for beam search decoding).
 
+                -   maes_batch, alsd_batch (for beam search decoding of all the utterances of a batch at once).
+
             compute_hypothesis_token_set: A bool flag, which determines whether to compute a list of decoded
                 tokens as well as the decoded string. Default is False in order to avoid double decoding
                 unless required.
@@ -1433,8 +1460,13 @@ class RNNTDecoding(AbstractRNNTDecoding):
             supported_punctuation=supported_punctuation,
         )
 
-        if isinstance(self.decoding, rnnt_beam_decoding.BeamRNNTInfer) or isinstance(
-            self.decoding, tdt_beam_decoding.BeamTDTInfer
+        if isinstance(
+            self.decoding,
+            (
+                rnnt_beam_decoding.BeamRNNTInfer,
+                rnnt_batched_beam_decoding.BeamBatchedRNNTInfer,
+                tdt_beam_decoding.BeamTDTInfer,
+            ),
         ):
             self.decoding.set_decoding_type('char')
 
@@ -1519,6 +1551,8 @@ class RNNTBPEDecoding(AbstractRNNTDecoding):
 
                 -   beam, tsd, alsd (for beam search decoding).
 
+                -   maes_batch, alsd_batch (for beam search decoding of all the utterances of a batch at once).
+
             compute_hypothesis_token_set: A bool flag, which determines whether to compute a list of decoded
                 tokens as well as the decoded string. Default is False in order to avoid double decoding
                 unless required.
@@ -1710,8 +1744,13 @@ class RNNTBPEDecoding(AbstractRNNTDecoding):
             supported_punctuation=supported_punctuation,
         )
 
-        if isinstance(self.decoding, rnnt_beam_decoding.BeamRNNTInfer) or isinstance(
-            self.decoding, tdt_beam_decoding.BeamTDTInfer
+        if isinstance(
+            self.decoding,
+            (
+                rnnt_beam_decoding.BeamRNNTInfer,
+                rnnt_batched_beam_decoding.BeamBatchedRNNTInfer,
+                tdt_beam_decoding.BeamTDTInfer,
+            ),
         ):
             self.decoding.set_decoding_type('subword')
 
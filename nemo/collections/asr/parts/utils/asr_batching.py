@@ -13,16 +13,19 @@
 # limitations under the License.
 
 import math
-from typing import Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 import numpy as np
 import torch
 from torch.utils.data.distributed import DistributedSampler
 
 from nemo.collections.asr.data.audio_to_text import AudioToBPEDataset, AudioToCharDataset
-from nemo.collections.asr.models.asr_model import ASRModel
+from nemo.collections.common.parts.preprocessing.collections import ColumnarEntries
 from nemo.utils import logging
 
+if TYPE_CHECKING:
+    from nemo.collections.asr.models.asr_model import ASRModel
+
 
 class SemiSortBatchSampler(DistributedSampler):
     def __init__(
@@ -202,7 +205,7 @@ class SemiSortBatchSampler(DistributedSampler):
 
 
 def get_semi_sorted_batch_sampler(
-    model: ASRModel, dataset: Union[AudioToCharDataset, AudioToBPEDataset], config: dict
+    model: 'ASRModel', dataset: Union[AudioToCharDataset, AudioToBPEDataset], config: dict
 ) -> SemiSortBatchSampler:
     """
     Instantiates a Semi Sorted (Batch) Sampler.
@@ -224,7 +227,12 @@ def get_semi_sorted_batch_sampler(
             f"but found {type(dataset)}."
         )
 
-    durations = [sample.duration for sample in dataset.manifest_processor.collection.data]
+    data = dataset.manifest_processor.collection.data
+    if isinstance(data, ColumnarEntries):
+        # Read the duration column directly instead of building every entry, missing durations are NaN.
+        durations = data.columns['duration']
+    else:
+        durations = [sample.duration for sample in data]
 
     sampler = SemiSortBatchSampler(
         global_rank=model.global_rank,
@@ -25,7 +25,7 @@ from nemo.collections.asr.parts.utils.online_clustering import get_merge_quantit
 
 
 class LongFormSpeakerClustering(torch.nn.Module):
-    def __init__(self, cuda: bool = False):
+    def __init__(self, cuda: bool = False, sparse_affinity: bool = False, knn_size: int = 64):
         """
         Initializes a speaker clustering class tailored for long-form audio, leveraging methods from the `SpeakerClustering` class.
         The clustering algorithm for long-form content is executed via the `forward_infer` function (not shown here). Input embedding 
@@ -38,9 +38,13 @@ class LongFormSpeakerClustering(torch.nn.Module):
         Args:
             cuda (bool):
                 Flag indicating whether CUDA is available for computation.
+            sparse_affinity (bool):
+                If True, use sparse k-nearest-neighbor affinity graphs for long inputs (see `SpeakerClustering`).
+            knn_size (int):
+                Number of nearest neighbors of each segment in the sparse affinity mode.
         """
         super().__init__()
-        self.speaker_clustering = SpeakerClustering(cuda=cuda)
+        self.speaker_clustering = SpeakerClustering(cuda=cuda, sparse_affinity=sparse_affinity, knn_size=knn_size)
         self.embeddings_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.tensor([0])]
         self.cuda = cuda
@@ -31,7 +31,8 @@
 # https://arxiv.org/pdf/2003.02405.pdf and the implementation from
 # https://github.com/tango4j/Auto-Tuning-Spectral-Clustering.
 
-from typing import Dict, List, Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
 import torch
 from torch.linalg import eigh, eigvalsh
@@ -529,6 +530,115 @@ def getMultiScaleCosAffinityMatrix(
     return fused_sim_d
 
 
+def get_argmin_mat_sorted(timestamps_in_scales: List[torch.Tensor]) -> List[torch.Tensor]:
+    """
+    Memory efficient version of `get_argmin_mat` for long sessions: the closest segment of each scale is found with
+    a binary search on the sorted segment anchors instead of building (Number of base segments) x (Number of
+    segments) distance matrices.
+
+    Args:
+        timestamps_in_scales (list):
+            List containing timestamp tensors for each scale.
+            Each tensor has dimensions of (Number of base segments) x 2.
+
+    Returns:
+        session_scale_mapping_list (list):
+            List containing argmin arrays indexed by scale index.
+    """
+    base_scale_anchor = torch.mean(timestamps_in_scales[-1], dim=1)
+    session_scale_mapping_list = []
+    for scale_idx in range(len(timestamps_in_scales)):
+        curr_scale_anchor = torch.mean(timestamps_in_scales[scale_idx], dim=1)
+        sorted_anchor, sorted_idx = torch.sort(curr_scale_anchor, stable=True)
+        right = torch.searchsorted(sorted_anchor, base_scale_anchor).clamp(max=sorted_anchor.shape[0] - 1)
+        left = (right - 1).clamp(min=0)
+        # ties go to the earlier segment, like the argmin of `get_argmin_mat`
+        use_left = torch.abs(sorted_anchor[left] - base_scale_anchor) <= torch.abs(
+            sorted_anchor[right] - base_scale_anchor
+        )
+        session_scale_mapping_list.append(sorted_idx[torch.where(use_left, left, right)])
+    return session_scale_mapping_list
+
+
+def getMultiScaleCosAffinityKNN(
+    multiscale_weights: torch.Tensor,
+    embeddings_in_scales: List[torch.Tensor],
+    timestamps_in_scales: List[torch.Tensor],
+    knn_size: int = 64,
+    chunk_size: int = 256,
+    device: torch.device = torch.device('cpu'),
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Calculate the `knn_size` nearest neighbors of each base-scale segment in the fused affinity matrix of
+    `getMultiScaleCosAffinityMatrix` without building the N by N matrix: the rows of the fused matrix are
+    calculated by chunks of `chunk_size` segments, and only their largest values are kept. The memory is
+    O(chunk_size * N + N * knn_size) instead of O(N^2), which allows clustering sessions of several hours.
+
+    Args:
+        multiscale_weights (Tensor):
+            Tensor containing multiscale weights
+            Dimensions: (Number of scales) x 1
+        embeddings_in_scales (list):
+            List containing split embedding tensors by each scale
+        timestamps_in_scales (list):
+            List containing split timestamps tensors by each scale
+        knn_size (int):
+            Number of neighbors kept for each segment, including the segment itself.
+        chunk_size (int):
+            Number of rows of the fused affinity matrix calculated at once.
+        device (torch.device):
+            Torch device variable
+
+    Returns:
+        knn_values (Tensor):
+            The largest fused affinity values of each segment, in descending order.
+            Dimensions: (Number of base-scale segments) x knn_size
+        knn_indices (Tensor):
+            The indices of the segments of `knn_values`.
+            Dimensions: (Number of base-scale segments) x knn_size
+    """
+    multiscale_weights = torch.squeeze(multiscale_weights, dim=0).to(device)
+    session_scale_mapping_list = get_argmin_mat_sorted(timestamps_in_scales)
+    num_segments = len(timestamps_in_scales[-1])
+    knn_size = min(knn_size, num_segments)
+    eps = torch.tensor(3.5e-4)
+
+    # First pass: the min-max normalization of `getCosAffinityMatrix` needs the range of each scale
+    norm_embs: List[torch.Tensor] = []
+    min_values: List[torch.Tensor] = []
+    max_values: List[torch.Tensor] = []
+    for scale_idx in range(len(timestamps_in_scales)):
+        emb_t = embeddings_in_scales[scale_idx].float().to(device)
+        emb_t = emb_t / (torch.norm(emb_t, dim=1).unsqueeze(1) + eps)
+        # `cos_similarity` sets the diagonal to 1
+        v_min, v_max = torch.ones(1, device=device), torch.ones(1, device=device)
+        for start in range(0, emb_t.shape[0], chunk_size):
+            score_chunk = torch.mm(emb_t[start : start + chunk_size], emb_t.t())
+            v_min = torch.min(v_min, score_chunk.min())
+            v_max = torch.max(v_max, score_chunk.max())
+        norm_embs.append(emb_t)
+        min_values.append(v_min)
+        max_values.append(v_max)
+
+    # Second pass: fuse the rows of the scales and keep the nearest neighbors
+    knn_values_list: List[torch.Tensor] = []
+    knn_indices_list: List[torch.Tensor] = []
+    for start in range(0, num_segments, chunk_size):
+        end = min(start + chunk_size, num_segments)
+        fused_sim_chunk = torch.zeros(end - start, num_segments, device=device)
+        for scale_idx in range(len(timestamps_in_scales)):
+            mapping_argmat = session_scale_mapping_list[scale_idx].to(device)
+            rows = mapping_argmat[start:end]
+            score_chunk = torch.mm(norm_embs[scale_idx][rows], norm_embs[scale_idx].t())
+            score_chunk[torch.arange(end - start, device=device), rows] = 1.0
+            score_chunk = (score_chunk - min_values[scale_idx]) / (max_values[scale_idx] - min_values[scale_idx])
+            fused_sim_chunk += multiscale_weights[scale_idx] * score_chunk[:, mapping_argmat]
+        knn_values, knn_indices = torch.topk(fused_sim_chunk, knn_size, dim=1)
+        knn_values_list.append(knn_values)
+        knn_indices_list.append(knn_indices)
+    return torch.cat(knn_values_list), torch.cat(knn_indices_list)
+
+
 def getLaplacian(X: torch.Tensor) -> torch.Tensor:
     """
     Calculate a laplacian matrix from an affinity matrix X.
@@ -746,6 +856,129 @@ def estimateNumofSpeakers(
     return num_of_spk, lambdas, lambda_gap
 
 
+def getSparseAffinityGraph(knn_indices: torch.Tensor, p_value: int) -> torch.Tensor:
+    """
+    Sparse version of `getAffinityGraphMat`: binarize the top-p neighbors of each segment and symmetrize the graph.
+    The diagonal is dropped, as in `getLaplacian`.
+
+    Args:
+        knn_indices (Tensor):
+            The indices of the nearest neighbors of each segment in descending order of affinity, from
+            `getMultiScaleCosAffinityKNN`. Dimensions: (Number of segments) x (Number of neighbors)
+        p_value (int):
+            The number of neighbors that are selected for each segment, at most the number of neighbors.
+
+    Returns:
+        affinity_graph (Tensor):
+            A coalesced sparse COO matrix equal to the dense symmetrized affinity graph without its diagonal.
+    """
+    num_segments = knn_indices.shape[0]
+    rows = torch.arange(num_segments, device=knn_indices.device).unsqueeze(1).expand(-1, p_value).reshape(-1)
+    cols = knn_indices[:, :p_value].reshape(-1)
+    edges = torch.cat([torch.stack([rows, cols]), torch.stack([cols, rows])], dim=1)
+    edges = edges[:, edges[0] != edges[1]]
+    values = torch.full((edges.shape[1],), 0.5, device=knn_indices.device)
+    # duplicated edges are summed, like 0.5 * (X + X.T)
+    return torch.sparse_coo_tensor(edges, values, (num_segments, num_segments)).coalesce()
+
+
+def isSparseGraphFullyConnected(affinity_graph: torch.Tensor) -> bool:
+    """
+    Check whether the given sparse affinity graph is fully connected, by propagating the smallest node index
+    of each connected component through the edges.
+    """
+    edges = affinity_graph.indices()
+    labels = torch.arange(affinity_graph.shape[0], device=edges.device)
+    for _ in range(affinity_graph.shape[0]):
+        new_labels = labels.scatter_reduce(0, edges[0], labels[edges[1]], reduce='amin')
+        new_labels = new_labels[new_labels]
+        if torch.equal(new_labels, labels):
+            break
+        labels = new_labels
+    return bool((labels == 0).all())
+
+
+def getSparseLaplacian(affinity_graph: torch.Tensor) -> torch.Tensor:
+    """
+    Calculate a sparse laplacian matrix in CSR format from a sparse affinity graph without diagonal.
+    """
+    num_segments = affinity_graph.shape[0]
+    device = affinity_graph.device
+    degrees = torch.zeros(num_segments, device=device).index_add_(
+        0, affinity_graph.indices()[0], affinity_graph.values()
+    )
+    diag_index = torch.arange(num_segments, device=device)
+    D = torch.sparse_coo_tensor(torch.stack([diag_index, diag_index]), degrees, (num_segments, num_segments))
+    L = (D - affinity_graph).coalesce()
+    return L.to_sparse_csr()
+
+
+def getInitEigenvectors(num_segments: int, num_vectors: int, largest: bool, device: torch.device) -> torch.Tensor:
+    """
+    Deterministic initial vectors for LOBPCG: cosines along the segments, of increasing frequencies from a constant
+    vector (the eigenvector of the smallest eigenvalue of a laplacian), or of decreasing frequencies from
+    the highest one if `largest` is True.
+    """
+    positions = (torch.arange(num_segments, device=device).float() + 0.5) / num_segments
+    frequencies = torch.arange(num_vectors, device=device).float()
+    if largest:
+        frequencies = num_segments - 1 - frequencies
+    return torch.cos(math.pi * positions.unsqueeze(1) * frequencies.unsqueeze(0))
+
+
+def sparseEigDecompose(
+    laplacian: torch.Tensor,
+    num_eigs: int,
+    init_vectors: Optional[torch.Tensor] = None,
+    largest: bool = False,
+    tol: float = 1e-4,
+    max_iter: int = 200,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Calculate `num_eigs` eigenvalues and eigenvectors of a sparse laplacian matrix with LOBPCG, without
+    the full eigendecomposition of `eigDecompose`. Small matrices, for which LOBPCG is not applicable,
+    use the dense `eigh`.
+
+    Args:
+        laplacian (Tensor):
+            Sparse laplacian matrix from `getSparseLaplacian`.
+        num_eigs (int):
+            Number of eigenpairs to calculate.
+        init_vectors (Tensor, optional):
+            Initial eigenvectors, for example the eigenvectors of a similar laplacian matrix.
+            If None, `getInitEigenvectors` is used.
+        largest (bool):
+            If True, calculate the largest eigenvalues, else the smallest ones.
+        tol (float):
+            Residual tolerance of LOBPCG.
+        max_iter (int):
+            Maximum number of iterations of LOBPCG.
+
+    Returns:
+        lambdas (Tensor):
+            The eigenvalues in ascending order.
+        diffusion_map (Tensor):
+            The eigenvectors of the eigenvalues in columns.
+    """
+    num_segments = laplacian.shape[0]
+    num_eigs = min(num_eigs, num_segments)
+    if num_segments < 3 * num_eigs:
+        lambdas, diffusion_map = eigh(laplacian.to_dense())
+        if largest:
+            lambdas, diffusion_map = lambdas[num_segments - num_eigs :], diffusion_map[:, num_segments - num_eigs :]
+        else:
+            lambdas, diffusion_map = lambdas[:num_eigs], diffusion_map[:, :num_eigs]
+        return lambdas, diffusion_map
+
+    if init_vectors is None or init_vectors.shape[1] != num_eigs:
+        init_vectors = getInitEigenvectors(num_segments, num_eigs, largest=largest, device=laplacian.device)
+    lambdas, diffusion_map = torch.lobpcg(
+        laplacian, k=num_eigs, X=init_vectors, largest=largest, tol=tol, niter=max_iter
+    )
+    lambdas, sorted_idx = torch.sort(lambdas)
+    return lambdas, diffusion_map[:, sorted_idx]
+
+
 class SpectralClustering:
     """
     Perform spectral clustering by calculating spectral embeddings then run k-means clustering
@@ -823,6 +1056,36 @@ class SpectralClustering:
 
         """
         spectral_emb = self.getSpectralEmbeddings(affinity, n_spks=self.n_clusters, cuda=cuda)
+        return self.clusterEmbeddingsMajorityVote(spectral_emb, device=device)
+
+    def clusterDiffusionMap(
+        self, diffusion_map: torch.Tensor, device: torch.device = torch.device('cpu')
+    ) -> torch.Tensor:
+        """
+        Perform k-means clustering on spectral embeddings from precomputed eigenvectors of the laplacian
+        matrix, for example the eigenvectors calculated by `SparseNMESC`.
+
+        Args:
+            diffusion_map (Tensor):
+                Eigenvectors of the smallest eigenvalues of the laplacian matrix in ascending order of eigenvalues,
+                at least `n_clusters` of them.
+            device (torch.device):
+                Torch device variable
+
+        Returns:
+            labels (Tensor):
+                clustering label output
+        """
+        # same order as `getSpectralEmbeddings`
+        spectral_emb = diffusion_map[:, : self.n_clusters].flip(dims=[1])
+        return self.clusterEmbeddingsMajorityVote(spectral_emb, device=device)
+
+    def clusterEmbeddingsMajorityVote(
+        self, spectral_emb: torch.Tensor, device: torch.device = torch.device('cpu')
+    ) -> torch.Tensor:
+        """
+        Run k-means clustering on the spectral embeddings (self.n_random_trials) times and take a majority vote.
+        """
         labels_set = []
 
         for random_state_seed in range(self.random_state, self.random_state + self.n_random_trials):
@@ -1121,6 +1384,177 @@ class NMESC:
         return p_value_list
 
 
+class SparseNMESC:
+    """
+    NME-SC on a sparse k-nearest-neighbor affinity graph, for sessions too long for the dense N by N matrices
+    of `NMESC`. Instead of subsampling the affinity matrix, the p-value search runs on all the segments:
+    the binarized graph of each p-value is built from the nearest neighbors of `getMultiScaleCosAffinityKNN`,
+    and only the smallest `max_num_speakers + 1` eigenvalues (and the largest one) of its laplacian are
+    calculated with LOBPCG. The eigenvectors of each p-value are the initial vectors of the next one, and
+    the eigenvectors of the selected p-value are returned for the spectral embeddings, so that no
+    eigendecomposition is repeated.
+
+    The p-values are limited to the number of neighbors, and the p-values that do not give a fully connected
+    graph are skipped.
+
+    Args:
+        Please refer to def __init__() and `NMESC`.
+    """
+
+    def __init__(
+        self,
+        knn_indices: torch.Tensor,
+        max_num_speakers: int = 10,
+        max_rp_threshold: float = 0.15,
+        sparse_search: bool = True,
+        sparse_search_volume: int = 30,
+        fixed_thres: float = -1.0,
+        maj_vote_spk_count: bool = False,
+        eig_tol: float = 1e-4,
+        eig_max_iter: int = 200,
+    ):
+        """
+        Args:
+            knn_indices (Tensor):
+                The indices of the nearest neighbors of each segment in descending order of affinity, from
+                `getMultiScaleCosAffinityKNN`. Dimensions: (Number of segments) x (Number of neighbors)
+            max_num_speakers (int):
+                Maximum number of speakers for estimating number of speakers.
+            max_rp_threshold (float):
+                Limits the range of parameter search, as a ratio of the number of segments.
+            sparse_search (bool):
+                If True, limit the number of p_values we search to sparse_search_volume.
+            sparse_search_volume (int):
+                Number of p_values we search during NME analysis.
+            fixed_thres (float):
+                A fixed threshold which can be used instead of estimating the threshold with NME analysis.
+            maj_vote_spk_count (bool):
+                If True, take a majority vote on all p-values in the given range to estimate the number of speakers.
+            eig_tol (float):
+                Residual tolerance of LOBPCG.
+            eig_max_iter (int):
+                Maximum number of iterations of LOBPCG.
+        """
+        self.knn_indices: torch.Tensor = knn_indices
+        self.max_num_speakers: int = max_num_speakers
+        self.max_rp_threshold: float = max_rp_threshold
+        self.sparse_search: bool = sparse_search
+        self.sparse_search_volume: int = sparse_search_volume
+        self.fixed_thres: float = fixed_thres
+        self.maj_vote_spk_count: bool = maj_vote_spk_count
+        self.eig_tol: float = eig_tol
+        self.eig_max_iter: int = eig_max_iter
+        self.min_p_value = torch.tensor(2)
+        self.max_N = torch.tensor(0)
+        self.eps = 1e-10
+
+    def forward(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Scan the p-values and find a p-value that generates the smallest g_p value.
+
+        Returns:
+            est_num_of_spk (Tensor):
+                Estimated number of speakers from NMESC approach
+            p_hat_value (Tensor):
+                Estimated p-value (determines how many neighboring values to be selected)
+            diffusion_map (Tensor):
+                The eigenvectors of the `max_num_speakers + 1` smallest eigenvalues of the laplacian of the
+                affinity graph of `p_hat_value`, in ascending order of eigenvalues.
+        """
+        p_value_list = self.getPvalueList()
+        # The graph of a larger p-value contains the graph of a smaller one: skip the p-values giving
+        # disconnected graphs, but keep at least the largest one
+        first_idx = p_value_list.shape[0] - 1
+        for p_idx in range(p_value_list.shape[0] - 1):
+            if isSparseGraphFullyConnected(getSparseAffinityGraph(self.knn_indices, int(p_value_list[p_idx]))):
+                first_idx = p_idx
+                break
+        p_value_list = p_value_list[first_idx:]
+
+        eig_ratio_list = torch.zeros(p_value_list.shape[0])
+        est_num_of_spk_list = torch.zeros(p_value_list.shape[0], dtype=torch.int)
+        diffusion_map_list: List[torch.Tensor] = []
+        init_vectors: Optional[torch.Tensor] = None
+        for p_idx in range(p_value_list.shape[0]):
+            g_p, est_num_of_spk, diffusion_map = self.getEigRatio(int(p_value_list[p_idx]), init_vectors)
+            init_vectors = diffusion_map
+            eig_ratio_list[p_idx] = g_p
+            est_num_of_spk_list[p_idx] = est_num_of_spk
+            # only keep the eigenvectors of the best p-value so far
+            if p_idx == 0 or g_p < eig_ratio_list[:p_idx].min():
+                diffusion_map_list = [diffusion_map]
+
+        index_nn = torch.argmin(eig_ratio_list)
+        p_hat_value = p_value_list[index_nn]
+        if self.maj_vote_spk_count:
+            est_num_of_spk = torch.mode(est_num_of_spk_list)[0]
+        else:
+            est_num_of_spk = est_num_of_spk_list[index_nn]
+        return est_num_of_spk, p_hat_value, diffusion_map_list[0]
+
+    def getEigRatio(
+        self, p_neighbors: int, init_vectors: Optional[torch.Tensor] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        For a given p_neighbors value, calculate g_p, which is a ratio between p_neighbors and the
+        maximum eigengap values, from the smallest eigenvalues of the sparse laplacian.
+
+        Args:
+            p_neighbors (int):
+                Determines how many binary graph connections we want to keep for each row.
+            init_vectors (Tensor, optional):
+                Initial eigenvectors for LOBPCG, for example the eigenvectors of the previous p-value.
+
+        Returns:
+            g_p (Tensor):
+                The ratio between p_neighbors value and the maximum eigen gap value.
+            est_num_of_spk (Tensor):
+                Estimated number of speakers
+            diffusion_map (Tensor):
+                The eigenvectors of the smallest eigenvalues of the laplacian.
+        """
+        laplacian = getSparseLaplacian(getSparseAffinityGraph(self.knn_indices, p_neighbors))
+        lambdas, diffusion_map = sparseEigDecompose(
+            laplacian,
+            num_eigs=self.max_num_speakers + 1,
+            init_vectors=init_vectors,
+            tol=self.eig_tol,
+            max_iter=self.eig_max_iter,
+        )
+        max_lambda, _ = sparseEigDecompose(
+            laplacian, num_eigs=1, largest=True, tol=self.eig_tol, max_iter=self.eig_max_iter
+        )
+        lambda_gap_list = getLamdaGaplist(lambdas)
+        est_num_of_spk = torch.argmax(lambda_gap_list[: self.max_num_speakers]) + 1
+        max_eig_gap = lambda_gap_list[est_num_of_spk - 1] / (max_lambda.max().item() + self.eps)
+        g_p = (p_neighbors / self.knn_indices.shape[0]) / (max_eig_gap + self.eps)
+        return g_p, est_num_of_spk, diffusion_map
+
+    def getPvalueList(self) -> torch.Tensor:
+        """
+        Generates a p-value (p_neighbour) list for searching, as in `NMESC.getPvalueList`, but limited to
+        the number of neighbors of the sparse affinity graph.
+
+        Returns:
+            p_value_list (Tensor):
+                Tensor containing the p_values to be searched.
+        """
+        num_segments, knn_size = self.knn_indices.shape[0], self.knn_indices.shape[1]
+        thres = self.fixed_thres if self.fixed_thres > 0.0 else self.max_rp_threshold
+        self.max_N = torch.max(torch.floor(torch.tensor(num_segments * thres)).type(torch.int), self.min_p_value)
+        self.max_N = torch.min(self.max_N, torch.tensor(knn_size).type(torch.int))
+        if self.fixed_thres > 0.0:
+            p_value_list = self.max_N.unsqueeze(0).int()
+        elif self.sparse_search:
+            search_volume = torch.min(self.max_N, torch.tensor(self.sparse_search_volume).type(torch.int))
+            N = torch.max(search_volume, torch.tensor(2))
+            steps = min(self.max_N, N)
+            p_value_list = torch.linspace(start=1, end=self.max_N, steps=steps).type(torch.int)
+        else:
+            p_value_list = torch.arange(1, self.max_N + 1)
+        return p_value_list
+
+
 class SpeakerClustering(torch.nn.Module):
     def __init__(
         self,
@@ -1130,11 +1564,17 @@ class SpeakerClustering(torch.nn.Module):
         maj_vote_spk_count: bool = False,
         parallelism: bool = False,
         cuda: bool = False,
+        sparse_affinity: bool = False,
+        knn_size: int = 64,
     ):
         """
         Clustering method for speaker diarization based on cosine similarity.
         NME-SC part is converted to torch.tensor based operations in NeMo 1.9.
 
+        With `sparse_affinity=True`, sessions with more than `nme_mat_size` segments are clustered on a sparse
+        k-nearest-neighbor affinity graph with a partial eigendecomposition (see `SparseNMESC`), so that the
+        memory and time do not grow with the square and the cube of the number of segments.
+
         Args:
             min_samples_for_nmesc (int):
                 The minimum number of samples required for NME clustering. This avoids
@@ -1152,6 +1592,12 @@ class SpeakerClustering(torch.nn.Module):
                 Use dynamic parallelism feature in torch.jit compiler to accelerate the p-value search.
             cuda (bool):
                 Boolean variable for toggling cuda availability.
+            sparse_affinity (bool):
+                If True, use sparse k-nearest-neighbor affinity graphs for the sessions longer than `nme_mat_size`
+                segments instead of dense affinity matrices.
+            knn_size (int):
+                Number of nearest neighbors kept for each segment in the sparse affinity mode. This is also
+                the largest p-value of the NME analysis in this mode.
         """
         super().__init__()
         self.min_samples_for_nmesc: int = min_samples_for_nmesc
@@ -1160,6 +1606,8 @@ class SpeakerClustering(torch.nn.Module):
         self.parallelism: bool = parallelism
         self.cuda: bool = cuda
         self.maj_vote_spk_count: bool = maj_vote_spk_count
+        self.sparse_affinity: bool = sparse_affinity
+        self.knn_size: int = knn_size
         self.embeddings_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
         self.timestamps_in_scales: List[torch.Tensor] = [torch.Tensor(0)]
         self.device = torch.device("cuda") if self.cuda else torch.device("cpu")
@@ -1244,6 +1692,60 @@ class SpeakerClustering(torch.nn.Module):
         Y = spectral_model.forward(affinity_mat)
         return Y
 
+    def forward_unit_infer_sparse(
+        self,
+        knn_indices: torch.Tensor,
+        oracle_num_speakers: int = -1,
+        max_num_speakers: int = 8,
+        max_rp_threshold: float = 0.15,
+        sparse_search_volume: int = 30,
+        est_num_of_spk_enhanced: torch.Tensor = torch.tensor(-1),
+        fixed_thres: float = -1.0,
+        kmeans_random_trials: int = 1,
+    ) -> torch.LongTensor:
+        """
+        Sparse version of `forward_unit_infer`: takes the nearest neighbors of each segment from
+        `getMultiScaleCosAffinityKNN` instead of a dense affinity matrix and returns the speaker labels
+        for the segments. The eigenvectors of the NME analysis are reused for the spectral embeddings.
+
+        Args:
+            knn_indices (Tensor):
+                The indices of the nearest neighbors of each segment in descending order of affinity.
+                Dimensions: (Number of segments) x (Number of neighbors)
+            See `forward_unit_infer` for the other arguments.
+
+        Returns:
+            Y (LongTensor):
+                Speaker labels (clustering output) in integer format for the segments in the given input embeddings.
+        """
+        nmesc = SparseNMESC(
+            knn_indices,
+            max_num_speakers=max_num_speakers,
+            max_rp_threshold=max_rp_threshold,
+            sparse_search=self.sparse_search,
+            sparse_search_volume=sparse_search_volume,
+            fixed_thres=fixed_thres,
+            maj_vote_spk_count=self.maj_vote_spk_count,
+        )
+        est_num_of_spk, p_hat_value, diffusion_map = nmesc.forward()
+
+        if oracle_num_speakers > 0:
+            n_clusters = int(oracle_num_speakers)
+        elif est_num_of_spk_enhanced > 0:
+            n_clusters = int(est_num_of_spk_enhanced.item())
+        else:
+            n_clusters = int(est_num_of_spk.item())
+
+        if n_clusters > diffusion_map.shape[1]:
+            laplacian = getSparseLaplacian(getSparseAffinityGraph(knn_indices, int(p_hat_value)))
+            _, diffusion_map = sparseEigDecompose(laplacian, num_eigs=n_clusters)
+
+        spectral_model = SpectralClustering(
+            n_clusters=n_clusters, n_random_trials=kmeans_random_trials, cuda=self.cuda, device=self.device
+        )
+        Y = spectral_model.clusterDiffusionMap(diffusion_map, device=self.device)
+        return Y
+
     def forward(self, param_dict: Dict[str, torch.Tensor]) -> torch.LongTensor:
         """
         A function wrapper designed for inference in exported script format.
@@ -1368,6 +1870,25 @@ class SpeakerClustering(torch.nn.Module):
         if oracle_num_speakers > 0:
             max_num_speakers = oracle_num_speakers
 
+        if self.sparse_affinity and emb.shape[0] > self.nme_mat_size:
+            _, knn_indices = getMultiScaleCosAffinityKNN(
+                multiscale_weights=multiscale_weights,
+                embeddings_in_scales=self.embeddings_in_scales,
+                timestamps_in_scales=self.timestamps_in_scales,
+                knn_size=self.knn_size,
+                device=self.device,
+            )
+            return self.forward_unit_infer_sparse(
+                knn_indices=knn_indices,
+                oracle_num_speakers=oracle_num_speakers,
+                max_rp_threshold=max_rp_threshold,
+                max_num_speakers=max_num_speakers,
+                sparse_search_volume=sparse_search_volume,
+                est_num_of_spk_enhanced=est_num_of_spk_enhanced,
+                kmeans_random_trials=kmeans_random_trials,
+                fixed_thres=fixed_thres,
+            )
+
         mat = getMultiScaleCosAffinityMatrix(
             multiscale_weights=multiscale_weights,
             embeddings_in_scales=self.embeddings_in_scales,
@@ -26,6 +26,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -442,6 +443,241 @@ class BatchedHyps:
         self.current_lengths += active_mask
 
 
+class BatchedBeamHyps:
+    """
+    Class to store beams of hypotheses (labels, time indices, scores) of a whole batch in [B, K, ...] tensors
+    for batched RNNT beam search. Empty slots of a beam have a score of -inf.
+
+    Transcripts are also stored as polynomial hashes of the label sequences, so that equal hypotheses
+    (for recombination) and hypotheses extending other hypotheses by one label (for prefix merging)
+    are found with tensor comparisons instead of comparing Python lists.
+    """
+
+    _HASH_MULTIPLIER = 1_000_003
+    _HASH_MODULUS = 2_147_483_647
+
+    def __init__(
+        self,
+        batch_size: int,
+        beam_size: int,
+        init_length: int,
+        blank_index: int,
+        device: Optional[torch.device] = None,
+        float_dtype: Optional[torch.dtype] = None,
+    ):
+        """
+
+        Args:
+            batch_size: batch size for hypotheses
+            beam_size: number of hypotheses of each beam
+            init_length: initial estimate for the length of hypotheses (if the real length is higher,
+                tensors will be reallocated)
+            blank_index: index of the blank label, blank labels are not stored in the transcripts
+            device: device for storing hypotheses
+            float_dtype: float type for scores
+        """
+        if init_length <= 0:
+            raise ValueError(f"init_length must be > 0, got {init_length}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be > 0, got {batch_size}")
+        if beam_size <= 0:
+            raise ValueError(f"beam_size must be > 0, got {beam_size}")
+        self.batch_size = batch_size
+        self.beam_size = beam_size
+        self.blank_index = blank_index
+        self._max_length = init_length
+
+        self.current_lengths = torch.zeros((batch_size, beam_size), device=device, dtype=torch.long)
+        self.transcript = torch.zeros((batch_size, beam_size, self._max_length), device=device, dtype=torch.long)
+        self.timestamps = torch.zeros((batch_size, beam_size, self._max_length), device=device, dtype=torch.long)
+        # each beam starts with a single empty hypothesis
+        self.scores = torch.full((batch_size, beam_size), float('-inf'), device=device, dtype=float_dtype)
+        self.scores[:, 0] = 0.0
+        # hash of the transcript, and of the transcript without its last label
+        self.transcript_hash = torch.zeros((batch_size, beam_size), device=device, dtype=torch.long)
+        self.prefix_hash = torch.zeros_like(self.transcript_hash)
+        # last label of the transcript, blank for empty transcripts
+        self.last_label = torch.full((batch_size, beam_size), blank_index, device=device, dtype=torch.long)
+        self._batch_indices = torch.arange(batch_size, device=device)
+
+    def _allocate_more(self):
+        """
+        Allocate 2x space for tensors, similar to common C++ std::vector implementations
+        to maintain O(1) insertion time complexity
+        """
+        self.transcript = torch.cat((self.transcript, torch.zeros_like(self.transcript)), dim=-1)
+        self.timestamps = torch.cat((self.timestamps, torch.zeros_like(self.timestamps)), dim=-1)
+        self._max_length *= 2
+
+    def select(self, beam_indices: torch.Tensor) -> "BatchedBeamHyps":
+        """
+        Gathers hypotheses from each beam.
+
+        Args:
+            beam_indices: [B, K'] indices of the hypotheses in their beam, K' can differ from the beam size
+
+        Returns:
+            new BatchedBeamHyps with beams of K' hypotheses
+        """
+        hyps = copy.copy(self)
+        hyps.beam_size = beam_indices.shape[1]
+        batch_indices = self._batch_indices.unsqueeze(1)
+        hyps.current_lengths = self.current_lengths[batch_indices, beam_indices]
+        hyps.transcript = self.transcript[batch_indices, beam_indices]
+        hyps.timestamps = self.timestamps[batch_indices, beam_indices]
+        hyps.scores = self.scores[batch_indices, beam_indices]
+        hyps.transcript_hash = self.transcript_hash[batch_indices, beam_indices]
+        hyps.prefix_hash = self.prefix_hash[batch_indices, beam_indices]
+        hyps.last_label = self.last_label[batch_indices, beam_indices]
+        return hyps
+
+    def cat(self, other: "BatchedBeamHyps") -> "BatchedBeamHyps":
+        """
+        Concatenates the beams of two BatchedBeamHyps with the same batch size.
+
+        Returns:
+            new BatchedBeamHyps with beams of (self.beam_size + other.beam_size) hypotheses
+        """
+        while self._max_length < other._max_length:
+            self._allocate_more()
+        while other._max_length < self._max_length:
+            other._allocate_more()
+        hyps = copy.copy(self)
+        hyps.beam_size = self.beam_size + other.beam_size
+        hyps.current_lengths = torch.cat((self.current_lengths, other.current_lengths), dim=1)
+        hyps.transcript = torch.cat((self.transcript, other.transcript), dim=1)
+        hyps.timestamps = torch.cat((self.timestamps, other.timestamps), dim=1)
+        hyps.scores = torch.cat((self.scores, other.scores), dim=1)
+        hyps.transcript_hash = torch.cat((self.transcript_hash, other.transcript_hash), dim=1)
+        hyps.prefix_hash = torch.cat((self.prefix_hash, other.prefix_hash), dim=1)
+        hyps.last_label = torch.cat((self.last_label, other.last_label), dim=1)
+        return hyps
+
+    def hash_with_labels(self, labels: torch.Tensor) -> torch.Tensor:
+        """
+        Hashes of the transcripts extended with labels.
+
+        Args:
+            labels: [B, K, ...] non-blank labels
+
+        Returns:
+            [B, K, ...] hashes, broadcasted with the labels
+        """
+        transcript_hash = self.transcript_hash.view(*self.transcript_hash.shape, *([1] * (labels.dim() - 2)))
+        return (transcript_hash * self._HASH_MULTIPLIER + labels + 1) % self._HASH_MODULUS
+
+    def add_results_(self, labels: torch.Tensor, time_indices: Union[torch.Tensor, int], scores: torch.Tensor):
+        """
+        Add results (inplace) from a decoding step: appends the non-blank labels to the transcripts,
+        the transcripts with blank labels are unchanged, and replaces the scores.
+
+        Args:
+            labels: [B, K] labels
+            time_indices: time index of the labels, int or tensor broadcastable to [B, K]
+            scores: [B, K] new scores of the hypotheses
+        """
+        if self.current_lengths.max().item() >= self._max_length:
+            self._allocate_more()
+        non_blank = labels != self.blank_index
+        positions = self.current_lengths.unsqueeze(-1)
+        # positions after the current length are not part of the transcripts, no need to mask blank labels
+        self.transcript.scatter_(2, positions, labels.unsqueeze(-1))
+        time_indices = torch.as_tensor(time_indices, device=labels.device).expand_as(labels)
+        self.timestamps.scatter_(2, positions, time_indices.unsqueeze(-1))
+        self.prefix_hash = torch.where(non_blank, self.transcript_hash, self.prefix_hash)
+        self.transcript_hash = torch.where(non_blank, self.hash_with_labels(labels), self.transcript_hash)
+        self.last_label = torch.where(non_blank, labels, self.last_label)
+        self.current_lengths = self.current_lengths + non_blank
+        self.scores = scores
+
+    def same_transcripts(self) -> torch.Tensor:
+        """
+        Returns:
+            [B, K, K] mask of the pairs of hypotheses of a beam with the same transcript, empty slots excluded
+        """
+        valid = torch.isfinite(self.scores)
+        return (
+            (self.transcript_hash.unsqueeze(2) == self.transcript_hash.unsqueeze(1))
+            & (self.current_lengths.unsqueeze(2) == self.current_lengths.unsqueeze(1))
+            & valid.unsqueeze(2)
+            & valid.unsqueeze(1)
+        )
+
+    def recombine_(self):
+        """
+        Recombines (inplace) the hypotheses of a beam with the same transcript: the hypothesis with the best score
+        gets the log-sum-exp of their scores, the other ones are removed from the beam.
+        """
+        same = self.same_transcripts()
+        merged_scores = torch.logsumexp(torch.where(same, self.scores.unsqueeze(1), float('-inf')), dim=-1)
+        # hypothesis k is dominated by hypothesis j if j has a better score, or the same score and a lower index
+        beam_indices = torch.arange(self.beam_size, device=self.scores.device)
+        dominated = (self.scores.unsqueeze(1) > self.scores.unsqueeze(2)) | (
+            (self.scores.unsqueeze(1) == self.scores.unsqueeze(2))
+            & (beam_indices.view(1, -1) < beam_indices.view(-1, 1))
+        )
+        is_best = ~(same & dominated).any(dim=-1)
+        self.scores = torch.where(is_best & torch.isfinite(self.scores), merged_scores, float('-inf'))
+
+    def sorting_scores(self, score_norm: bool = True) -> torch.Tensor:
+        """
+        Scores used to rank the hypotheses, optionally normalized by the length of the hypotheses
+        (counting the initial blank, like `BeamRNNTInfer.sort_nbest`).
+        """
+        if score_norm:
+            return self.scores / (self.current_lengths + 1)
+        return self.scores
+
+    def to_nbest_hyps_list(self, score_norm: bool = True) -> List[NBestHypotheses]:
+        """
+        Converts the beams to a list of NBestHypotheses, sorted with the best hypothesis first.
+
+        Args:
+            score_norm: rank the hypotheses by their score normalized by their length
+
+        Returns:
+            list of NBestHypotheses, one per utterance
+        """
+        sorting_scores, order = self.sorting_scores(score_norm).sort(dim=-1, descending=True)
+        # move all data to cpu to avoid overhead with moving data by chunks
+        order = order.cpu()
+        valid = torch.isfinite(sorting_scores).cpu()
+        scores = self.scores.cpu()
+        lengths = self.current_lengths.cpu()
+        transcript = self.transcript.cpu()
+        timestamps = self.timestamps.cpu()
+        blank = torch.tensor([self.blank_index], dtype=torch.long)
+        results = []
+        for b in range(self.batch_size):
+            hypotheses = []
+            for k in order[b][valid[b]].tolist():
+                length = lengths[b, k]
+                hypotheses.append(
+                    Hypothesis(
+                        score=scores[b, k].item(),
+                        # beam search hypotheses start with the blank label
+                        y_sequence=torch.cat((blank, transcript[b, k, :length])),
+                        timestamp=timestamps[b, k, :length],
+                        dec_state=None,
+                        length=length.item(),
+                    )
+                )
+            results.append(NBestHypotheses(hypotheses))
+        return results
+
+    def to_hyps_list(self, score_norm: bool = True) -> List[Hypothesis]:
+        """
+        Converts the beams to a list of the best hypotheses.
+
+        Args:
+            score_norm: rank the hypotheses by their score normalized by their length
+
+        Returns:
+            list of Hypothesis, one per utterance
+        """
+        return [nbest.n_best_hypotheses[0] for nbest in self.to_nbest_hyps_list(score_norm=score_norm)]
+
+
 class BatchedAlignments:
     """
     Class to store batched alignments (logits, labels, frame_confidence).
@@ -13,12 +13,13 @@
 # limitations under the License.
 
 import gc
+import hashlib
 import json
 import math
 import os
 import shutil
 from copy import deepcopy
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import soundfile as sf
@@ -473,7 +474,11 @@ def perform_clustering(
         logging.warning("cuda=False, using CPU for eigen decomposition. This might slow down the clustering process.")
         cuda = False
 
-    speaker_clustering = LongFormSpeakerClustering(cuda=cuda)
+    speaker_clustering = LongFormSpeakerClustering(
+        cuda=cuda,
+        sparse_affinity=clustering_params.get('sparse_affinity', False),
+        knn_size=clustering_params.get('knn_size', 64),
+    )
 
     if clustering_params.get('export_script_module', False):
         speaker_clustering = torch.jit.script(speaker_clustering)
@@ -938,6 +943,155 @@ def segments_manifest_to_subsegments_manifest(
     return subsegments_manifest_file
 
 
+def get_audio_file_hash(audio_filepath: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Calculate the SHA-1 hash of the content of an audio file, so that cached results follow the audio
+    and not its path.
+
+    Args:
+        audio_filepath (str): path to the audio file
+        chunk_size (int): number of bytes read at once
+
+    Returns:
+        hex digest of the content of the file
+    """
+    hasher = hashlib.sha1()
+    with open(audio_filepath, 'rb') as audio_file:
+        for chunk in iter(lambda: audio_file.read(chunk_size), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def get_model_checksum(model: torch.nn.Module) -> str:
+    """
+    Calculate the SHA-1 checksum of the parameters and buffers of a model.
+
+    Args:
+        model (torch.nn.Module): speaker embedding model
+
+    Returns:
+        hex digest of the state dict of the model
+    """
+    hasher = hashlib.sha1()
+    for name, tensor in sorted(model.state_dict().items()):
+        hasher.update(name.encode())
+        hasher.update(tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8).numpy().tobytes())
+    return hasher.hexdigest()
+
+
+class SpeakerEmbeddingStore:
+    """
+    Content-addressed on-disk store of the speaker embeddings of subsegments, so that diarization re-runs with the
+    same audio files and speaker model (for example when tuning VAD or clustering parameters) only extract
+    the embeddings of the subsegments that changed.
+
+    The embeddings are keyed by (audio hash, offset, duration, window, shift, model checksum). All the subsegments of
+    an audio file at one scale are stored in a single file, named after the hash of (audio hash, window, shift,
+    model checksum), which holds their offsets and durations in `1/10**decimals` seconds and their embeddings.
+
+    Args:
+        store_dir (str): directory of the store, created if needed
+        model_checksum (str): checksum of the speaker model, from `get_model_checksum`
+        decimals (int): number of decimals of the offsets and durations of the subsegments in the keys
+    """
+
+    def __init__(self, store_dir: str, model_checksum: str, decimals: int = 3):
+        self.store_dir = store_dir
+        self.model_checksum = model_checksum
+        self.decimals = decimals
+        self._audio_hashes = {}
+        os.makedirs(store_dir, exist_ok=True)
+
+    def get_audio_hash(self, audio_filepath: str) -> str:
+        """
+        Hash of the content of an audio file, calculated once per file, size and modification time.
+        """
+        stat = os.stat(audio_filepath)
+        key = (os.path.abspath(audio_filepath), stat.st_size, stat.st_mtime_ns)
+        if key not in self._audio_hashes:
+            self._audio_hashes[key] = get_audio_file_hash(audio_filepath)
+        return self._audio_hashes[key]
+
+    def get_store_path(self, audio_hash: str, window: float, shift: float) -> str:
+        """
+        Path of the file holding the embeddings of an audio file at one scale.
+        """
+        key = f'{audio_hash}-{window:.{self.decimals}f}-{shift:.{self.decimals}f}-{self.model_checksum}'
+        key_hash = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.store_dir, key_hash[:2], f'{key_hash}.pt')
+
+    def _get_segment_key(self, offset: float, duration: float) -> Tuple[int, int]:
+        return round(offset * 10**self.decimals), round(duration * 10**self.decimals)
+
+    def _group_by_file(self, subsegments: List[dict], window: float, shift: float) -> Dict[str, List[int]]:
+        groups = {}
+        for index, meta in enumerate(subsegments):
+            path = self.get_store_path(self.get_audio_hash(meta['audio_filepath']), window, shift)
+            groups.setdefault(path, []).append(index)
+        return groups
+
+    @staticmethod
+    def _load(path: str) -> Tuple[torch.Tensor, torch.Tensor]:
+        if not os.path.exists(path):
+            return torch.empty([0, 2], dtype=torch.long), torch.empty([0, 0])
+        stored = torch.load(path, map_location='cpu')
+        return stored['segments'], stored['embeddings']
+
+    def lookup(self, subsegments: List[dict], window: float, shift: float) -> List[Optional[torch.Tensor]]:
+        """
+        Find the stored embeddings of subsegments.
+
+        Args:
+            subsegments (list): subsegments as dictionaries with `audio_filepath`, `offset` and `duration` keys,
+                like the lines of the manifest of `segments_manifest_to_subsegments_manifest`
+            window (float): window length of the scale of the subsegments
+            shift (float): shift length of the scale of the subsegments
+
+        Returns:
+            the embedding of each subsegment, or None for the subsegments that are not in the store
+        """
+        embeddings = [None] * len(subsegments)
+        for path, indices in self._group_by_file(subsegments, window, shift).items():
+            segments, stored_embeddings = self._load(path)
+            stored_index = {tuple(segment): i for i, segment in enumerate(segments.tolist())}
+            for index in indices:
+                key = self._get_segment_key(subsegments[index]['offset'], subsegments[index]['duration'])
+                if key in stored_index:
+                    embeddings[index] = stored_embeddings[stored_index[key]]
+        return embeddings
+
+    def add(self, subsegments: List[dict], embeddings: torch.Tensor, window: float, shift: float) -> None:
+        """
+        Store the embeddings of subsegments, next to the embeddings already stored for the same audio files.
+
+        Args:
+            subsegments (list): subsegments as dictionaries with `audio_filepath`, `offset` and `duration` keys
+            embeddings (Tensor): embeddings of the subsegments, (number of subsegments) x (embedding dimension)
+            window (float): window length of the scale of the subsegments
+            shift (float): shift length of the scale of the subsegments
+        """
+        if len(subsegments) != embeddings.shape[0]:
+            raise ValueError("Mismatch of counts between subsegments and embedding vectors")
+        embeddings = embeddings.detach().cpu()
+        for path, indices in self._group_by_file(subsegments, window, shift).items():
+            segments, stored_embeddings = self._load(path)
+            new_keys = [self._get_segment_key(subsegments[i]['offset'], subsegments[i]['duration']) for i in indices]
+            new_segments = torch.tensor(new_keys, dtype=torch.long)
+            if segments.shape[0] > 0:
+                # new embeddings replace the stored ones of the same subsegments
+                new_keys = set(new_keys)
+                keep = torch.tensor([tuple(segment) not in new_keys for segment in segments.tolist()])
+                new_segments = torch.cat([segments[keep], new_segments])
+                new_embeddings = torch.cat([stored_embeddings[keep], embeddings[indices]])
+            else:
+                new_embeddings = embeddings[indices]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write then rename, so that interrupted runs do not leave truncated files
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            torch.save({'segments': new_segments, 'embeddings': new_embeddings}, tmp_path)
+            os.replace(tmp_path, path)
+
+
 def get_subsegments(
     offset: float,
     window: float,
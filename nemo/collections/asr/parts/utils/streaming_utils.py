@@ -14,6 +14,7 @@
 
 import copy
 import os
+from collections import deque
 from typing import Optional
 
 import numpy as np
@@ -22,9 +23,8 @@ from omegaconf import OmegaConf
 from torch.utils.data import DataLoader
 
 from nemo.collections.asr.data.audio_to_text_lhotse_prompted import PromptedAudioToTextMiniBatch
-from nemo.collections.asr.models import ASRModel
 from nemo.collections.asr.parts.mixins.streaming import StreamingEncoder
-from nemo.collections.asr.parts.preprocessing.features import normalize_batch
+from nemo.collections.asr.parts.preprocessing.features import FilterbankFeatures, normalize_batch
 from nemo.collections.asr.parts.preprocessing.segment import get_samples
 from nemo.core.classes import IterableDataset
 from nemo.core.neural_types import LengthsType, MelSpectrogramType, NeuralType
@@ -352,7 +352,7 @@ class StreamingFeatureBufferer:
     is provided at each step of a streaming pipeline.
     """
 
-    def __init__(self, asr_model, chunk_size, buffer_size):
+    def __init__(self, asr_model, chunk_size, buffer_size, incremental_features: bool = False):
         '''
         Args:
             asr_model:
@@ -361,6 +361,10 @@ class StreamingFeatureBufferer:
                 Duration of the new chunk of audio
             buffer_size (float):
                 Size of the total audio in seconds maintained in the buffer
+            incremental_features (bool):
+                Compute the features of each new chunk incrementally with `FilterbankFeatures.forward_streaming`
+                instead of running the preprocessor over the whole audio buffer. The new frames are available
+                as soon as their window is complete instead of one chunk later.
         '''
 
         self.NORM_CONSTANT = 1e-5
@@ -383,16 +387,25 @@ class StreamingFeatureBufferer:
         self.buffer = torch.ones([self.n_feat, total_buffer_len], dtype=torch.float32) * self.ZERO_LEVEL_SPEC_DB_VAL
         self.feature_chunk_len = int(chunk_size / timestep_duration)
         self.feature_buffer_len = total_buffer_len
+        self.incremental_features = incremental_features
 
-        self.reset()
         cfg = copy.deepcopy(asr_model.cfg)
         OmegaConf.set_struct(cfg.preprocessor, False)
 
         cfg.preprocessor.dither = 0.0
         cfg.preprocessor.pad_to = 0
         cfg.preprocessor.normalize = "None"
+
+        # Imported here since importing nemo.collections.asr.models imports this module.
+        from nemo.collections.asr.models import ASRModel
+
         self.raw_preprocessor = ASRModel.from_config_dict(cfg.preprocessor)
         self.raw_preprocessor.to(asr_model.device)
+        if incremental_features:
+            if not isinstance(getattr(self.raw_preprocessor, 'featurizer', None), FilterbankFeatures):
+                raise ValueError("incremental_features requires a preprocessor with a FilterbankFeatures featurizer")
+            self.raw_preprocessor.eval()
+        self.reset()
 
     def reset(self):
         '''
@@ -404,6 +417,8 @@ class StreamingFeatureBufferer:
         self.feature_buffer = (
             torch.ones([self.n_feat, self.feature_buffer_len], dtype=torch.float32) * self.ZERO_LEVEL_SPEC_DB_VAL
         )
+        if self.incremental_features:
+            self.raw_preprocessor.featurizer.reset_streaming_state()
 
     def _add_chunk_to_buffer(self, chunk):
         """
@@ -451,6 +466,17 @@ class StreamingFeatureBufferer:
         features = features.squeeze()
         self._update_feature_buffer(features[:, -self.feature_chunk_len :])
 
+    def _compute_chunk_features(self, chunk):
+        """
+        Extract the features of the frames completed by `chunk` and add them to `feature_buffer`.
+        """
+        features, _ = self.raw_preprocessor.featurizer.forward_streaming(chunk.unsqueeze(0).to(self.asr_model.device))
+        features = features[0, :, -self.feature_buffer_len :].cpu()
+        num_frames = features.shape[1]
+        if num_frames > 0:
+            self.feature_buffer[:, :-num_frames] = self.feature_buffer[:, num_frames:].clone()
+            self.feature_buffer[:, -num_frames:] = features
+
     def update_feature_buffer(self, chunk):
         """
         Update time-series signal `chunk` to the buffer then generate features out of the
@@ -467,7 +493,10 @@ class StreamingFeatureBufferer:
             temp_chunk[: chunk.shape[0]] = chunk
             chunk = temp_chunk
         self._add_chunk_to_buffer(chunk)
-        self._convert_buffer_to_features()
+        if self.incremental_features:
+            self._compute_chunk_features(chunk)
+        else:
+            self._convert_buffer_to_features()
 
 
 class AudioFeatureIterator(IterableDataset):
@@ -756,6 +785,10 @@ class FrameBatchASR:
         cfg.preprocessor.dither = 0.0
         cfg.preprocessor.pad_to = 0
         cfg.preprocessor.normalize = "None"
+
+        # Imported here since importing nemo.collections.asr.models imports this module.
+        from nemo.collections.asr.models import ASRModel
+
         self.raw_preprocessor = ASRModel.from_config_dict(cfg.preprocessor)
         self.raw_preprocessor.to(asr_model.device)
         self.preprocessor = self.raw_preprocessor
@@ -800,14 +833,7 @@ class FrameBatchASR:
 
             feat_signal, feat_signal_len = batch
             feat_signal, feat_signal_len = feat_signal.to(device), feat_signal_len.to(device)
-            forward_outs = self.asr_model(processed_signal=feat_signal, processed_signal_length=feat_signal_len)
-
-            if len(forward_outs) == 2:  # hybrid ctc rnnt model
-                encoded, encoded_len = forward_outs
-                log_probs = self.asr_model.ctc_decoder(encoder_output=encoded)
-                predictions = log_probs.argmax(dim=-1, keepdim=False)
-            else:
-                log_probs, encoded_len, predictions = forward_outs
+            log_probs, encoded_len, predictions = self._forward_buffers(feat_signal, feat_signal_len)
 
             preds = torch.unbind(predictions)
             for pred in preds:
@@ -821,6 +847,17 @@ class FrameBatchASR:
             del encoded_len
             del predictions
 
+    def _forward_buffers(self, feat_signal, feat_signal_len):
+        forward_outs = self.asr_model(processed_signal=feat_signal, processed_signal_length=feat_signal_len)
+
+        if len(forward_outs) == 2:  # hybrid ctc rnnt model
+            encoded, encoded_len = forward_outs
+            log_probs = self.asr_model.ctc_decoder(encoder_output=encoded)
+            predictions = log_probs.argmax(dim=-1, keepdim=False)
+        else:
+            log_probs, encoded_len, predictions = forward_outs
+        return log_probs, encoded_len, predictions
+
     def transcribe(self, tokens_per_chunk: int, delay: int, keep_logits: bool = False):
         self.infer_logits(keep_logits)
         self.unmerged = []
@@ -850,6 +887,210 @@ class FrameBatchASR:
         return hypothesis
 
 
+class _BufferedStream:
+    """
+    State of one audio stream of MultiStreamFrameBatchASR: its raw features, left-padded to the buffer length
+    and right-padded to a whole number of frames, and the predictions of the chunks processed so far.
+    """
+
+    def __init__(self, stream_id, features, num_frames):
+        self.stream_id = stream_id
+        self.features = features
+        self.num_frames = num_frames
+        self.next_frame = 0
+        self.preds = []
+        self.logits = []
+
+    @property
+    def is_finished(self):
+        return self.next_frame == self.num_frames
+
+
+class MultiStreamFrameBatchASR(FrameBatchASR):
+    """
+    Buffered CTC inference over many audio streams at once.
+
+    FrameBatchASR transcribes one stream at a time, so its batches never span several files and short files
+    leave most of a batch empty. This class keeps a pool of up to ``max_active_streams`` streams: every step
+    fills a batch with the next buffers of the active streams in round-robin order, runs the model once,
+    retires the streams whose last buffer was processed and admits pending streams in their place.
+    The buffers of a stream are built and normalized with tensor ops on the model device instead of
+    per-frame NumPy copies, and each stream gets the same transcript as with FrameBatchASR.
+
+    Usage:
+        asr = MultiStreamFrameBatchASR(asr_model, frame_len=1.6, total_buffer=4.0, batch_size=32)
+        for audio_filepath in audio_filepaths:
+            asr.add_audio_file(audio_filepath, delay, model_stride_in_secs)
+        hyps = asr.transcribe(tokens_per_chunk, delay)  # {stream_id: hypothesis}
+    """
+
+    def __init__(
+        self,
+        asr_model,
+        frame_len=1.6,
+        total_buffer=4.0,
+        batch_size=4,
+        max_active_streams: Optional[int] = None,
+    ):
+        """
+        Args:
+          frame_len: frame's duration, seconds
+          total_buffer: duration of the buffer (frame and its left and right context), seconds
+          batch_size: number of buffers per forward pass of the model
+          max_active_streams: number of streams whose features are kept in memory, defaults to batch_size
+        """
+        super().__init__(asr_model, frame_len=frame_len, total_buffer=total_buffer, batch_size=batch_size)
+        self.n_frame_len = self.frame_bufferer.n_frame_len
+        self.feature_buffer_len = self.frame_bufferer.feature_buffer_len
+        self.zero_level = self.frame_bufferer.ZERO_LEVEL_SPEC_DB_VAL
+        self.max_active_streams = max_active_streams or batch_size
+        self.reset()
+
+    def reset(self):
+        """
+        Drop all the pending and active streams
+        """
+        super().reset()
+        self.pending_streams = deque()
+        self.active_streams = []
+        self._num_added_streams = 0
+
+    def add_audio_file(self, audio_filepath: str, delay, model_stride_in_secs, stream_id=None):
+        """
+        Queue an audio file, returns its stream id (the order in which streams were added by default).
+        """
+        samples = get_samples(audio_filepath)
+        return self.add_audio(samples, delay, model_stride_in_secs, stream_id=stream_id)
+
+    def add_audio(self, samples: np.ndarray, delay, model_stride_in_secs, stream_id=None):
+        """
+        Queue audio samples, returns their stream id (the order in which streams were added by default).
+        Features are only computed when the stream becomes active.
+        """
+        if stream_id is None:
+            stream_id = self._num_added_streams
+        self._num_added_streams += 1
+        samples = np.pad(samples, (0, int(delay * model_stride_in_secs * self.asr_model._cfg.sample_rate)))
+        self.pending_streams.append((stream_id, samples))
+        return stream_id
+
+    @property
+    def num_streams(self):
+        return len(self.pending_streams) + len(self.active_streams)
+
+    @torch.no_grad()
+    def _activate_stream(self, stream_id, samples):
+        device = self.asr_model.device
+        audio_signal = torch.from_numpy(samples).unsqueeze_(0).to(device)
+        audio_signal_len = torch.tensor([samples.shape[0]], device=device)
+        features, features_len = self.raw_preprocessor(input_signal=audio_signal, length=audio_signal_len)
+        features = features[0, :, : features_len[0]]
+
+        # Same frames as AudioFeatureIterator: full frames, then a last zero-padded (possibly empty) frame.
+        num_frames = features.shape[1] // self.n_frame_len + 1
+        right_pad = num_frames * self.n_frame_len - features.shape[1]
+        features = torch.nn.functional.pad(features, (0, right_pad), value=0.0)
+        # Buffers start filled with the zero level, as in FeatureFrameBufferer.
+        left_pad = self.feature_buffer_len - self.n_frame_len
+        features = torch.nn.functional.pad(features, (left_pad, 0), value=self.zero_level)
+        self.active_streams.append(_BufferedStream(stream_id, features, num_frames))
+
+    def _fill_streams(self):
+        while self.pending_streams and len(self.active_streams) < self.max_active_streams:
+            self._activate_stream(*self.pending_streams.popleft())
+
+    def _next_batch(self):
+        """
+        Take the next buffers of the active streams in round-robin order, up to batch_size buffers.
+        Returns the streams and the [first, last) frames taken from each of them.
+        """
+        counts = [0] * len(self.active_streams)
+        remaining = [stream.num_frames - stream.next_frame for stream in self.active_streams]
+        total = 0
+        while total < self.batch_size and any(remaining):
+            for i in range(len(counts)):
+                if remaining[i] > 0 and total < self.batch_size:
+                    counts[i] += 1
+                    remaining[i] -= 1
+                    total += 1
+        return [
+            (stream, stream.next_frame, stream.next_frame + count)
+            for stream, count in zip(self.active_streams, counts)
+            if count > 0
+        ]
+
+    def _get_frame_buffers(self, batch):
+        buffers = []
+        for stream, start, end in batch:
+            # Buffer k ends with frame k: it spans [k * frame_len, k * frame_len + buffer_len) of the padded features.
+            span = stream.features[
+                :, start * self.n_frame_len : (end - 1) * self.n_frame_len + self.feature_buffer_len
+            ]
+            buffers.append(span.unfold(1, self.feature_buffer_len, self.n_frame_len))
+        buffers = torch.cat(buffers, dim=1).transpose(0, 1)
+        mean = buffers.mean(dim=2, keepdim=True)
+        std = buffers.std(dim=2, unbiased=False, keepdim=True)
+        return (buffers - mean) / (std + 1e-5)
+
+    @torch.no_grad()
+    def step(self, tokens_per_chunk: int, delay: int, keep_logits: bool = False):
+        """
+        Run the model on one batch of buffers and retire the streams that are done.
+
+        Returns:
+            A list of (stream_id, hypothesis) pairs, or (stream_id, hypothesis, logits) with keep_logits,
+            for the streams that finished during this step.
+        """
+        self._fill_streams()
+        batch = self._next_batch()
+        if not batch:
+            return []
+
+        frame_buffers = self._get_frame_buffers(batch)
+        frame_buffers_len = torch.full(
+            (frame_buffers.shape[0],), self.feature_buffer_len, dtype=torch.long, device=frame_buffers.device
+        )
+        log_probs, _, predictions = self._forward_buffers(frame_buffers, frame_buffers_len)
+        T = predictions.shape[1]
+        start, end = T - 1 - delay, T - 1 - delay + tokens_per_chunk
+        predictions = predictions[:, start:end].cpu()
+        if keep_logits:
+            log_probs = log_probs[:, start:end].cpu()
+
+        offset = 0
+        for stream, first, last in batch:
+            num_buffers = last - first
+            stream.preds.append(predictions[offset : offset + num_buffers].reshape(-1))
+            if keep_logits:
+                stream.logits.append(log_probs[offset : offset + num_buffers].reshape(-1, log_probs.shape[-1]))
+            stream.next_frame = last
+            offset += num_buffers
+
+        finished = []
+        for stream in self.active_streams:
+            if stream.is_finished:
+                hypothesis = self.greedy_merge(torch.cat(stream.preds).tolist())
+                if keep_logits:
+                    finished.append((stream.stream_id, hypothesis, torch.cat(stream.logits, 0)))
+                else:
+                    finished.append((stream.stream_id, hypothesis))
+        self.active_streams = [stream for stream in self.active_streams if not stream.is_finished]
+        return finished
+
+    def transcribe(self, tokens_per_chunk: int, delay: int, keep_logits: bool = False):
+        """
+        Transcribe all the queued streams.
+
+        Returns:
+            A dict from stream id to hypothesis, or to (hypothesis, logits) with keep_logits.
+        """
+        results = {}
+        while self.num_streams > 0:
+            for stream_id, *outputs in self.step(tokens_per_chunk, delay, keep_logits):
+                results[stream_id] = tuple(outputs) if keep_logits else outputs[0]
+        return results
+
+
 class BatchedFeatureFrameBufferer(FeatureFrameBufferer):
     """
     Batched variant of FeatureFrameBufferer where batch dimension is the independent audio samples.
@@ -18,7 +18,7 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 import torch
 from omegaconf import DictConfig
@@ -26,13 +26,19 @@ from tqdm.auto import tqdm
 
 import nemo.collections.asr as nemo_asr
 from nemo.collections.asr.metrics.wer import word_error_rate
-from nemo.collections.asr.models import ASRModel, EncDecMultiTaskModel
 from nemo.collections.asr.parts.utils import manifest_utils, rnnt_utils
-from nemo.collections.asr.parts.utils.streaming_utils import FrameBatchASR, FrameBatchMultiTaskAED
+from nemo.collections.asr.parts.utils.streaming_utils import (
+    FrameBatchASR,
+    FrameBatchMultiTaskAED,
+    MultiStreamFrameBatchASR,
+)
 from nemo.collections.common.metrics.punct_er import OccurancePunctuationErrorRate
 from nemo.collections.common.parts.preprocessing.manifest import get_full_path
 from nemo.utils import logging, model_utils
 
+if TYPE_CHECKING:
+    from nemo.collections.asr.models import ASRModel
+
 
 def get_buffered_pred_feat_rnnt(
     asr: FrameBatchASR,
@@ -144,7 +150,28 @@ def get_buffered_pred_feat(
     if filepaths is None and manifest is None:
         raise ValueError("Either filepaths or manifest shoud not be None")
 
-    if filepaths:
+    if isinstance(asr, MultiStreamFrameBatchASR):
+        if manifest:
+            filepaths = []
+            with open(manifest, "r", encoding='utf_8') as mfst_f:
+                for L in mfst_f:
+                    L = L.strip()
+                    if not L:
+                        continue
+                    row = json.loads(L)
+                    if 'text' in row:
+                        refs.append(row['text'])
+                    filepaths.append(get_full_path(audio_file=row['audio_filepath'], manifest_file=manifest))
+        asr.reset()
+        results = {}
+        for audio_file in tqdm(filepaths, desc="Sample:"):
+            asr.add_audio_file(audio_file, delay, model_stride_in_secs)
+            # only read the next files once the pool of active streams has room for them
+            while len(asr.pending_streams) > 0 and asr.num_streams > asr.max_active_streams:
+                results.update(asr.step(tokens_per_chunk, delay))
+        results.update(asr.transcribe(tokens_per_chunk, delay))
+        hyps = [results[idx] for idx in range(len(filepaths))]
+    elif filepaths:
         for L in tqdm(filepaths, desc="Sample:"):
             asr.reset()
             asr.read_audio_file(L, delay, model_stride_in_secs)
@@ -193,7 +220,7 @@ def get_buffered_pred_feat_multitaskAED(
     # Normalization will be done per buffer in frame_bufferer
     # Do not normalize whatever the model's preprocessor setting is
     preprocessor_cfg.normalize = "None"
-    preprocessor = EncDecMultiTaskModel.from_config_dict(preprocessor_cfg)
+    preprocessor = nemo_asr.models.EncDecMultiTaskModel.from_config_dict(preprocessor_cfg)
     preprocessor.to(device)
     hyps = []
     refs = []
@@ -252,11 +279,11 @@ def wrap_transcription(hyps: List[str]) -> List[rnnt_utils.Hypothesis]:
     return wrapped_hyps
 
 
-def setup_model(cfg: DictConfig, map_location: torch.device) -> Tuple[ASRModel, str]:
+def setup_model(cfg: DictConfig, map_location: torch.device) -> Tuple['ASRModel', str]:
     """Setup model from cfg and return model and model name for next step"""
     if cfg.model_path is not None and cfg.model_path != "None":
         # restore model from .nemo file path
-        model_cfg = ASRModel.restore_from(restore_path=cfg.model_path, return_config=True)
+        model_cfg = nemo_asr.models.ASRModel.restore_from(restore_path=cfg.model_path, return_config=True)
         classpath = model_cfg.target  # original class path
         imported_class = model_utils.import_class_by_path(classpath)  # type: ASRModel
         logging.info(f"Restoring model : {imported_class.__name__}")
@@ -267,7 +294,7 @@ def setup_model(cfg: DictConfig, map_location: torch.device) -> Tuple[ASRModel,
         model_name = os.path.splitext(os.path.basename(cfg.model_path))[0]
     else:
         # restore model by name
-        asr_model = ASRModel.from_pretrained(
+        asr_model = nemo_asr.models.ASRModel.from_pretrained(
             model_name=cfg.pretrained_name,
             map_location=map_location,
         )  # type: ASRModel
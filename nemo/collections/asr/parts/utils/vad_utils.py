@@ -17,7 +17,6 @@ import json
 import math
 import multiprocessing
 import os
-import shutil
 from dataclasses import dataclass
 from itertools import repeat
 from math import ceil, floor
@@ -37,7 +36,6 @@ from pyannote.metrics import detection
 from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import ParameterGrid
 from tqdm import tqdm
-from nemo.collections.asr.models import EncDecClassificationModel, EncDecFrameClassificationModel
 from nemo.collections.common.parts.preprocessing.manifest import get_full_path
 from nemo.utils import logging
 
@@ -285,6 +283,29 @@ def load_tensor_from_file(filepath: str) -> Tuple[torch.Tensor, str]:
     return torch.tensor(frame), name
 
 
+def load_padded_tensors_from_files(filepaths: List[str]) -> Tuple[torch.Tensor, torch.Tensor, List[str]]:
+    """
+    Load the frame predictions of several files with load_tensor_from_file into a padded batch.
+
+    Returns:
+        sequences (torch.Tensor): [B, T] predictions, zero-padded.
+        lengths (torch.Tensor): [B] number of predictions of each file.
+        names (List[str]): name of each file.
+    """
+    tensors, names = zip(*[load_tensor_from_file(filepath) for filepath in filepaths])
+    lengths = torch.tensor([len(tensor) for tensor in tensors], dtype=torch.long)
+    sequences = torch.nn.utils.rnn.pad_sequence(list(tensors), batch_first=True)
+    return sequences, lengths, list(names)
+
+
+def _length_sorted_batches(filepaths: List[str], batch_size: int) -> List[List[str]]:
+    """
+    Split files into batches of similar sizes, to limit padding in load_padded_tensors_from_files.
+    """
+    filepaths = sorted(filepaths, key=lambda filepath: os.path.getsize(filepath))
+    return [filepaths[i : i + batch_size] for i in range(0, len(filepaths), batch_size)]
+
+
 def generate_overlap_vad_seq(
     frame_pred_dir: str,
     smoothing_method: str,
@@ -342,8 +363,17 @@ def generate_overlap_vad_seq(
             )
 
     else:
-        for frame_filepath in tqdm(frame_filepathlist, desc='generating preds', leave=False):
-            generate_overlap_vad_seq_per_file(frame_filepath, per_args)
+        # Smooth the predictions of batches of files with vectorized ops instead of one file at a time.
+        per_args_float = {"overlap": overlap, "window_length_in_sec": window_length_in_sec}
+        per_args_float["shift_length_in_sec"] = shift_length_in_sec
+        batches = _length_sorted_batches(frame_filepathlist, batch_size=32)
+        for batch in tqdm(batches, desc='generating preds', leave=False):
+            frames, lengths, names = load_padded_tensors_from_files(batch)
+            preds, preds_lengths = generate_overlap_vad_seq_batch(frames, lengths, per_args_float, smoothing_method)
+            for pred, pred_len, name in zip(preds, preds_lengths.tolist(), names):
+                overlap_filepath = os.path.join(overlap_out_dir, name + "." + smoothing_method)
+                with open(overlap_filepath, "w", encoding='utf-8') as f:
+                    f.write("".join(f"{value:.4f}\n" for value in pred[:pred_len].tolist()))
 
     return overlap_out_dir
 
@@ -427,6 +457,81 @@ def generate_overlap_vad_seq_per_tensor(
     return preds
 
 
+def generate_overlap_vad_seq_batch(
+    frames: torch.Tensor, lengths: torch.Tensor, per_args: Dict[str, float], smoothing_method: str
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched version of generate_overlap_vad_seq_per_tensor: smooths the frame predictions of several
+    recordings at once with vectorized ops and gives the same results.
+
+    Args:
+        frames (torch.Tensor): [B, T] frame predictions, padded.
+        lengths (torch.Tensor): [B] number of frame predictions of each recording.
+        per_args: see generate_overlap_vad_seq_per_tensor.
+        smoothing_method (str): median or mean smoothing filter.
+
+    Returns:
+        preds (torch.Tensor): [B, T * shift] smoothed predictions, padded.
+        preds_lengths (torch.Tensor): [B] number of smoothed predictions of each recording.
+    """
+    overlap = per_args['overlap']
+    frame_len = per_args.get('frame_len', 0.01)
+    shift = int(per_args['shift_length_in_sec'] / frame_len)  # number of units of shift
+    seg = int((per_args['window_length_in_sec'] / frame_len + 1))  # number of units of each window/segment
+    jump_on_target = int(seg * (1 - overlap))  # jump on target generated sequence
+    jump_on_frame = int(jump_on_target / shift)  # jump on input frame sequence
+    if jump_on_frame < 1:
+        raise ValueError(
+            f"Your input makes jump_on_frame={jump_on_frame} < 1 which is invalid. Please try different "
+            "window_length_in_sec, shift_length_in_sec and overlap choices. See generate_overlap_vad_seq_per_tensor."
+        )
+    if smoothing_method not in ('mean', 'median'):
+        raise ValueError("smoothing_method should be either mean or median")
+
+    lengths = lengths.to(frames.device)
+    target_lengths = lengths * shift
+    num_windows = (lengths + jump_on_frame - 1) // jump_on_frame
+    # windows start every `window_step` target units: window m covers [m * window_step, m * window_step + seg)
+    window_step = jump_on_frame * shift
+    max_windows_per_unit = math.ceil(seg / window_step)
+
+    positions = torch.arange(frames.shape[1] * shift, device=frames.device)
+    last_window = positions // window_step
+    in_target = positions.unsqueeze(0) < target_lengths.unsqueeze(1)
+    # values[b, j, k]: prediction of the k-th last window covering unit j, from the oldest to the newest window
+    values, valid = [], []
+    for k in reversed(range(max_windows_per_unit)):
+        window = last_window - k
+        covers = (window >= 0) & (window * window_step + seg > positions)
+        window_valid = covers.unsqueeze(0) & (window.unsqueeze(0) < num_windows.unsqueeze(1)) & in_target
+        frame_idx = (window.clamp(min=0) * jump_on_frame).clamp(max=frames.shape[1] - 1)
+        values.append(frames[:, frame_idx])
+        valid.append(window_valid)
+
+    if smoothing_method == 'mean':
+        # accumulate in the same order as generate_overlap_vad_seq_per_tensor for identical float results
+        preds = torch.zeros(frames.shape[0], positions.shape[0], dtype=frames.dtype, device=frames.device)
+        pred_count = torch.zeros_like(preds)
+        for window_values, window_valid in zip(values, valid):
+            preds = preds + torch.where(window_valid, window_values, torch.zeros_like(window_values))
+            pred_count = pred_count + window_valid.to(preds.dtype)
+        preds = preds / pred_count
+        missing = pred_count == 0
+    else:
+        values = torch.stack(values, dim=-1)
+        values = torch.where(torch.stack(valid, dim=-1), values, torch.full_like(values, float('nan')))
+        preds = torch.nanquantile(values, q=0.5, dim=-1)
+        missing = torch.isnan(preds)
+
+    # units covered by no window take the value of the last covered unit of their recording
+    covered_positions = torch.where(missing | ~in_target, torch.full_like(positions, -1), positions.unsqueeze(0))
+    last_covered = covered_positions.max(dim=1).values.clamp(min=0)
+    fill = preds.gather(1, last_covered.unsqueeze(1)).expand_as(preds)
+    preds = torch.where(missing & in_target, fill, preds)
+    preds = preds.masked_fill(~in_target, 0.0)
+    return preds, target_lengths
+
+
 def generate_overlap_vad_seq_per_file(frame_filepath: str, per_args: dict) -> str:
     """
     A wrapper for generate_overlap_vad_seq_per_tensor.
@@ -825,6 +930,219 @@ def generate_vad_segment_table_per_file_star(args):
     return generate_vad_segment_table_per_file(*args)
 
 
+def cal_vad_onset_offset_batch(
+    scale: str, onset: float, offset: float, sequences: torch.Tensor, lengths: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched version of cal_vad_onset_offset: onset and offset thresholds of each padded sequence, [B] each.
+    """
+    if scale == "absolute":
+        onset, offset = cal_vad_onset_offset(scale, onset, offset)
+        return (
+            torch.full((sequences.shape[0],), onset, dtype=sequences.dtype, device=sequences.device),
+            torch.full((sequences.shape[0],), offset, dtype=sequences.dtype, device=sequences.device),
+        )
+
+    lengths = lengths.to(sequences.device)
+    valid = torch.arange(sequences.shape[1], device=sequences.device).unsqueeze(0) < lengths.unsqueeze(1)
+    if scale == "relative":
+        mini = sequences.masked_fill(~valid, float('inf')).min(dim=1).values
+        maxi = sequences.masked_fill(~valid, float('-inf')).max(dim=1).values
+    elif scale == "percentile":
+        # same as percentile(): the ceil(size * perc / 100)-th smallest value
+        ordered = sequences.masked_fill(~valid, float('inf')).sort(dim=1).values
+        mini = ordered.gather(1, (torch.ceil(lengths * 1 / 100).long() - 1).clamp(min=0).unsqueeze(1)).squeeze(1)
+        maxi = ordered.gather(1, (torch.ceil(lengths * 99 / 100).long() - 1).clamp(min=0).unsqueeze(1)).squeeze(1)
+    else:
+        raise ValueError(f"Unknown scale {scale}, should be either absolute, relative or percentile")
+    return mini + onset * (maxi - mini), mini + offset * (maxi - mini)
+
+
+def _compact_segments(
+    starts: torch.Tensor, ends: torch.Tensor, keep: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Gather the kept [B, S] segment boundaries at the beginning of each row.
+
+    Returns:
+        segments (torch.Tensor): [B, max_num_segments, 2] segments, zero-padded.
+        num_segments (torch.Tensor): [B] number of segments of each row.
+    """
+    num_segments = keep.sum(dim=1)
+    segments = torch.zeros(
+        keep.shape[0], int(num_segments.max()) if keep.numel() > 0 else 0, 2, dtype=starts.dtype, device=starts.device
+    )
+    rows = torch.arange(keep.shape[0], device=keep.device).unsqueeze(1).expand_as(keep)
+    columns = keep.long().cumsum(dim=1) - 1
+    segments[rows[keep], columns[keep]] = torch.stack((starts[keep], ends[keep]), dim=1)
+    return segments, num_segments
+
+
+def _segments_mask(segments: torch.Tensor, num_segments: torch.Tensor) -> torch.Tensor:
+    return torch.arange(segments.shape[1], device=segments.device).unsqueeze(0) < num_segments.unsqueeze(1)
+
+
+def _merge_adjacent_segments(
+    segments: torch.Tensor, num_segments: torch.Tensor, merge: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Merge the sorted segments k and k + 1 of each row for which merge[:, k] is True.
+    """
+    valid = _segments_mask(segments, num_segments)
+    merge = merge & valid[:, 1:]
+    no_merge = torch.zeros_like(valid[:, :1])
+    head = ~torch.cat((no_merge, merge), dim=1) & valid
+    tail = ~torch.cat((merge, no_merge), dim=1) & valid
+    heads, _ = _compact_segments(segments[..., 0], segments[..., 0], head)
+    tails, num_segments = _compact_segments(segments[..., 1], segments[..., 1], tail)
+    return torch.stack((heads[..., 0], tails[..., 1]), dim=-1), num_segments
+
+
+def merge_overlap_segment_batch(
+    segments: torch.Tensor, num_segments: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched version of merge_overlap_segment for [B, S, 2] padded segments sorted by start time.
+    """
+    if segments.shape[1] < 2:
+        return segments, num_segments
+    return _merge_adjacent_segments(segments, num_segments, segments[:, :-1, 1] >= segments[:, 1:, 0])
+
+
+def binarization_batch(
+    sequences: torch.Tensor,
+    lengths: torch.Tensor,
+    per_args: Dict[str, float],
+    onset: Optional[torch.Tensor] = None,
+    offset: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched version of binarization: onset/offset hysteresis of padded frame predictions of several recordings
+    with vectorized ops instead of a Python loop over frames. It gives the same segments, except in corner cases
+    where padded segments tie and the unstable sort of merge_overlap_segment leaves them partially unmerged,
+    while they are always merged here.
+
+    A frame above onset starts speech, a frame below offset ends it. When onset < offset, a frame that is both
+    toggles the state. So the state after a frame is given by the last frame that is only above onset or only
+    below offset, and by the parity of the number of toggling frames since then.
+
+    Args:
+        sequences (torch.Tensor): [B, T] frame level predictions, padded.
+        lengths (torch.Tensor): [B] number of predictions of each recording.
+        per_args: see binarization.
+        onset, offset (torch.Tensor): optional [B] thresholds of each recording, e.g. from
+            cal_vad_onset_offset_batch, instead of the ones of per_args.
+
+    Returns:
+        speech_segments (torch.Tensor): [B, max_num_segments, 2] speech segments of each recording, zero-padded.
+        num_segments (torch.Tensor): [B] number of speech segments of each recording.
+    """
+    frame_length_in_sec = per_args.get('frame_length_in_sec', 0.01)
+    pad_onset = per_args.get('pad_onset', 0.0)
+    pad_offset = per_args.get('pad_offset', 0.0)
+    if onset is None:
+        onset = torch.full((sequences.shape[0],), per_args.get('onset', 0.5))
+    if offset is None:
+        offset = torch.full((sequences.shape[0],), per_args.get('offset', 0.5))
+
+    device = sequences.device
+    lengths = lengths.to(device)
+    num_rows, num_frames = sequences.shape
+    frame_idx = torch.arange(num_frames, device=device).unsqueeze(0)
+    valid = frame_idx < lengths.unsqueeze(1)
+    above = (sequences > onset.to(device, sequences.dtype).unsqueeze(1)) & valid
+    below = (sequences < offset.to(device, sequences.dtype).unsqueeze(1)) & valid
+    toggle = above & below
+    decisive = above ^ below
+
+    last_decisive = torch.where(decisive, frame_idx, torch.full_like(frame_idx, -1)).cummax(dim=1).values
+    last_idx = last_decisive.clamp(min=0)
+    decisive_state = above.gather(1, last_idx) & (last_decisive >= 0)
+    num_toggles = toggle.long().cumsum(dim=1)
+    toggles_before = torch.where(last_decisive >= 0, num_toggles.gather(1, last_idx), torch.zeros_like(num_toggles))
+    speech = (decisive_state ^ ((num_toggles - toggles_before) % 2 == 1)) & valid
+
+    previous = torch.cat((torch.zeros_like(speech[:, :1]), speech[:, :-1]), dim=1)
+    is_start = speech & ~previous
+    is_end = ~speech & previous & valid
+    # speech until the last frame ends at the index of the last frame
+    last_frame = (lengths - 1).clamp(min=0).unsqueeze(1)
+    is_final = speech.gather(1, last_frame) & (lengths.unsqueeze(1) > 0)
+
+    max_segments = int(is_start.sum(dim=1).max()) if num_rows > 0 and num_frames > 0 else 0
+    start_idx, num_starts = _compact_segments(frame_idx.expand_as(speech), frame_idx.expand_as(speech), is_start)
+    end_idx, _ = _compact_segments(frame_idx.expand_as(speech), frame_idx.expand_as(speech), is_end)
+    start_idx, end_idx = start_idx[..., 0], end_idx[..., 0]
+    end_idx = torch.nn.functional.pad(end_idx, (0, max_segments - end_idx.shape[1]))
+    segment_idx = torch.arange(max_segments, device=device).unsqueeze(0)
+    is_last_segment = is_final & (segment_idx == num_starts.unsqueeze(1) - 1)
+    end_idx = torch.where(is_last_segment, last_frame, end_idx)
+
+    # same double precision arithmetic as binarization
+    starts = (start_idx.double() * frame_length_in_sec - pad_onset).clamp(min=0)
+    ends = end_idx.double() * frame_length_in_sec + pad_offset
+    keep = (segment_idx < num_starts.unsqueeze(1)) & ((ends > starts) | is_last_segment)
+    segments, num_segments = _compact_segments(starts.float(), ends.float(), keep)
+    return merge_overlap_segment_batch(segments, num_segments)
+
+
+def filtering_batch(
+    speech_segments: torch.Tensor, num_segments: torch.Tensor, per_args: Dict[str, float]
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Batched version of filtering for the [B, S, 2] padded speech segments of binarization_batch.
+    """
+    min_duration_on = per_args.get('min_duration_on', 0.0)
+    min_duration_off = per_args.get('min_duration_off', 0.0)
+    filter_speech_first = per_args.get('filter_speech_first', 1.0)
+
+    def filter_speech(segments, num_segments):
+        if min_duration_on <= 0.0:
+            return segments, num_segments
+        keep = (segments[..., 1] - segments[..., 0] >= min_duration_on) & _segments_mask(segments, num_segments)
+        return _compact_segments(segments[..., 0], segments[..., 1], keep)
+
+    def fill_short_gaps(segments, num_segments):
+        if min_duration_off <= 0.0 or segments.shape[1] < 2:
+            return segments, num_segments
+        gap_start, gap_end = segments[:, :-1, 1], segments[:, 1:, 0]
+        merge = (gap_end - gap_start < min_duration_off) | (gap_start >= gap_end)
+        return _merge_adjacent_segments(segments, num_segments, merge)
+
+    if filter_speech_first == 1.0:
+        return fill_short_gaps(*filter_speech(speech_segments, num_segments))
+    return filter_speech(*fill_short_gaps(speech_segments, num_segments))
+
+
+def generate_vad_segment_table_batch(
+    sequences: torch.Tensor, lengths: torch.Tensor, per_args: dict
+) -> List[torch.Tensor]:
+    """
+    Batched version of generate_vad_segment_table_per_tensor, including the onset and offset scaling of
+    prepare_gen_segment_table, computed for each recording.
+
+    Args:
+        sequences (torch.Tensor): [B, T] frame level predictions, padded.
+        lengths (torch.Tensor): [B] number of predictions of each recording.
+        per_args (dict): post-processing parameters, see binarization and filtering.
+
+    Returns:
+        A list of [N, 3] tensors of (start, end, duration) speech segments, one for each recording.
+    """
+    UNIT_FRAME_LEN = 0.01
+
+    scale = per_args.get('scale', 'absolute')
+    per_args = {key: float(value) for key, value in per_args.items() if isinstance(value, (bool, int, float))}
+    onset, offset = cal_vad_onset_offset_batch(
+        scale, per_args.get('onset', 0.5), per_args.get('offset', 0.5), sequences, lengths
+    )
+    segments, num_segments = binarization_batch(sequences, lengths, per_args, onset=onset, offset=offset)
+    segments, num_segments = filtering_batch(segments, num_segments, per_args)
+    durations = segments[..., 1:2] - segments[..., 0:1] + UNIT_FRAME_LEN
+    segments = torch.cat((segments, durations), dim=-1)
+    return [row[:count] for row, count in zip(segments, num_segments.tolist())]
+
+
 def vad_construct_pyannote_object_per_file(
     vad_table_filepath: str, groundtruth_RTTM_file: str
 ) -> Tuple[Annotation, Annotation]:
@@ -872,6 +1190,23 @@ def get_parameter_grid(params: dict) -> list:
     return params_grid
 
 
+def _intersection_duration(segments: List[List[float]], other_segments: List[List[float]]) -> float:
+    """
+    Total duration of the intersection of two sorted lists of non-overlapping [start, end] segments.
+    """
+    duration, i, j = 0.0, 0, 0
+    while i < len(segments) and j < len(other_segments):
+        start = max(segments[i][0], other_segments[j][0])
+        end = min(segments[i][1], other_segments[j][1])
+        if end > start:
+            duration += end - start
+        if segments[i][1] < other_segments[j][1]:
+            i += 1
+        else:
+            j += 1
+    return duration
+
+
 def vad_tune_threshold_on_dev(
     params: dict,
     vad_pred: str,
@@ -880,12 +1215,17 @@ def vad_tune_threshold_on_dev(
     vad_pred_method: str = "frame",
     focus_metric: str = "DetER",
     frame_length_in_sec: float = 0.01,
-    num_workers: int = 20,
+    num_workers: Optional[int] = None,
+    batch_size: int = 64,
 ) -> Tuple[dict, dict]:
     """
     Tune thresholds on dev set. Return best thresholds which gives the lowest
     detection error rate (DetER) in thresholds.
 
+    The predictions and the ground-truth segments are loaded once. For each combination of parameters,
+    the speech segments of batches of recordings are computed in memory with generate_vad_segment_table_batch
+    and compared to the ground-truth segments, without writing intermediate tables.
+
     Args:
         params (dict): dictionary of parameters to be tuned on.
         vad_pred_method (str): suffix of prediction file. Use to locate file.
@@ -893,19 +1233,42 @@ def vad_tune_threshold_on_dev(
         groundtruth_RTTM_dir (str): Directory of ground-truth rttm files or a file contains the paths of them.
         focus_metric (str): Metrics we care most when tuning threshold. Should be either in "DetER", "FA", "MISS"
         frame_length_in_sec (float): Frame length.
-        num_workers (int): Number of workers.
+        num_workers (int): Deprecated and ignored, recordings are post-processed in batches instead.
+        batch_size (int): Number of recordings post-processed together.
     Returns:
         best_threshold (float): Threshold that gives lowest DetER.
     """
+    if num_workers is not None:
+        logging.warning(
+            "The num_workers argument of vad_tune_threshold_on_dev is deprecated and ignored, "
+            "recordings are post-processed in batches of batch_size instead."
+        )
     min_score = 100
     all_perf = {}
     try:
         check_if_param_valid(params)
     except:
         raise ValueError("Please check if the parameters are valid")
+    assert (
+        focus_metric == "DetER" or focus_metric == "FA" or focus_metric == "MISS"
+    ), "Metric we care most should be only in 'DetER', 'FA' or 'MISS'!"
 
     paired_filenames, groundtruth_RTTM_dict, vad_pred_dict = pred_rttm_map(vad_pred, groundtruth_RTTM, vad_pred_method)
-    metric = detection.DetectionErrorRate()
+    references = {
+        filename: load_speech_segments_from_rttm(groundtruth_RTTM_dict[filename]) for filename in paired_filenames
+    }
+    total = sum(end - start for segments in references.values() for start, end in segments)
+    if total == 0:
+        raise ValueError(
+            f"No ground-truth speech found in the {len(paired_filenames)} recordings paired between {vad_pred} and "
+            f"{groundtruth_RTTM}, detection error rates cannot be computed."
+        )
+    batches = []
+    for filepaths in _length_sorted_batches([vad_pred_dict[filename] for filename in paired_filenames], batch_size):
+        sequences, lengths, _ = load_padded_tensors_from_files(filepaths)
+        names = [os.path.basename(filepath).rsplit(".", 1)[0] for filepath in filepaths]
+        batches.append((names, sequences, lengths))
+
     params_grid = get_parameter_grid(params)
 
     for param in params_grid:
@@ -913,39 +1276,30 @@ def vad_tune_threshold_on_dev(
             if type(param[i]) == np.float64 or type(param[i]) == np.int64:
                 param[i] = float(param[i])
         try:
-            # Generate speech segments by performing binarization on the VAD prediction according to param.
-            # Filter speech segments according to param and write the result to rttm-like table.
-            vad_table_dir = generate_vad_segment_table(
-                vad_pred, param, frame_length_in_sec=frame_length_in_sec, num_workers=num_workers
-            )
-            # add reference and hypothesis to metrics
-            for filename in paired_filenames:
-                groundtruth_RTTM_file = groundtruth_RTTM_dict[filename]
-                vad_table_filepath = os.path.join(vad_table_dir, filename + ".txt")
-                reference, hypothesis = vad_construct_pyannote_object_per_file(
-                    vad_table_filepath, groundtruth_RTTM_file
-                )
-                metric(reference, hypothesis)  # accumulation
-
-            # delete tmp table files
-            shutil.rmtree(vad_table_dir, ignore_errors=True)
-
-            report = metric.report(display=False)
-            DetER = report.iloc[[-1]][('detection error rate', '%')].item()
-            FA = report.iloc[[-1]][('false alarm', '%')].item()
-            MISS = report.iloc[[-1]][('miss', '%')].item()
+            # Generate speech segments by performing binarization on the VAD prediction according to param
+            # and filter them, then accumulate the detection errors of each recording
+            per_args = {"frame_length_in_sec": frame_length_in_sec, **param}
+            false_alarm, miss = 0.0, 0.0
+            for names, sequences, lengths in batches:
+                for filename, segments in zip(names, generate_vad_segment_table_batch(sequences, lengths, per_args)):
+                    # same rounding as the tables written by generate_vad_segment_table
+                    hypothesis = [[float(f"{start:.4f}"), float(f"{dur:.4f}")] for start, _, dur in segments.tolist()]
+                    hypothesis = merge_intervals([[start, start + dur] for start, dur in hypothesis if dur > 0])
+                    reference = references[filename]
+                    overlap = _intersection_duration(reference, hypothesis)
+                    false_alarm += sum(end - start for start, end in hypothesis) - overlap
+                    miss += sum(end - start for start, end in reference) - overlap
+
+            # same definitions as pyannote.metrics.detection.DetectionErrorRate
+            DetER = 100 * (false_alarm + miss) / total
+            FA = 100 * false_alarm / total
+            MISS = 100 * miss / total
 
-            assert (
-                focus_metric == "DetER" or focus_metric == "FA" or focus_metric == "MISS"
-            ), "Metric we care most should be only in 'DetER', 'FA' or 'MISS'!"
             all_perf[str(param)] = {'DetER (%)': DetER, 'FA (%)': FA, 'MISS (%)': MISS}
             logging.info(f"parameter {param}, {all_perf[str(param)] }")
 
             score = all_perf[str(param)][focus_metric + ' (%)']
 
-            del report
-            metric.reset()  # reset internal accumulator
-
             # save results for analysis
             with open(result_file + ".txt", "a", encoding='utf-8') as fp:
                 fp.write(f"{param}, {all_perf[str(param)] }\n")
@@ -958,8 +1312,6 @@ def vad_tune_threshold_on_dev(
 
         except RuntimeError as e:
             print(f"Pass {param}, with error {e}")
-        except pd.errors.EmptyDataError as e1:
-            print(f"Pass {param}, with error {e1}")
 
     return best_threshold, optimal_scores
 
@@ -1224,6 +1576,9 @@ def init_vad_model(model_path: str):
     """
     Initiate VAD model with model path
     """
+    # Imported here since the models import this module.
+    from nemo.collections.asr.models import EncDecClassificationModel
+
     if model_path.endswith('.nemo'):
         logging.info(f"Using local VAD model from {model_path}")
         vad_model = EncDecClassificationModel.restore_from(restore_path=model_path)
@@ -1239,6 +1594,9 @@ def init_frame_vad_model(model_path: str):
     """
     Initiate VAD model with model path
     """
+    # Imported here since the models import this module.
+    from nemo.collections.asr.models import EncDecFrameClassificationModel
+
     if model_path.endswith('.nemo'):
         logging.info(f"Using local VAD model from {model_path}")
         vad_model = EncDecFrameClassificationModel.restore_from(restore_path=model_path)
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import itertools
+import json
 import multiprocessing
 import os
 import random
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import h5py
 import librosa
@@ -684,16 +686,23 @@ class RIRCorpusGenerator(object):
         # Create absolute path
         logging.info('Output dir set to: %s', output_dir)
 
+        # Continue an interrupted run, keeping the rooms which were already simulated
+        resume = self.cfg.get('resume', False)
+
         # Generate all cases
         for subset, num_rooms in self.cfg.room.num.items():
 
             output_dir_subset = os.path.join(output_dir, subset)
+            manifest_filepath = os.path.join(output_dir, f'{subset}_manifest.json')
             examples = []
 
             if not os.path.exists(output_dir_subset):
                 logging.info('Creating output directory: %s', output_dir_subset)
                 os.makedirs(output_dir_subset)
-            elif os.path.isdir(output_dir_subset) and len(os.listdir(output_dir_subset)) > 0:
+            elif resume and os.path.isfile(manifest_filepath):
+                # Room parameters are still generated below to keep the random state of the following subsets
+                logging.info('Subset %s is already complete', subset)
+            elif not resume and os.path.isdir(output_dir_subset) and len(os.listdir(output_dir_subset)) > 0:
                 raise RuntimeError(f'Output directory {output_dir_subset} is not empty.')
 
             # Generate examples
@@ -720,24 +729,25 @@ class RIRCorpusGenerator(object):
                 }
                 examples.append(example)
 
+            if resume and os.path.isfile(manifest_filepath):
+                continue
+
             # Simulation
             if (num_workers := self.cfg.get('num_workers')) is None:
                 num_workers = os.cpu_count() - 1
 
-            if num_workers > 1:
-                logging.info(f'Simulate using {num_workers} workers')
-                with multiprocessing.Pool(processes=num_workers) as pool:
-                    metadata = list(tqdm(pool.imap(simulate_room_kwargs, examples), total=len(examples)))
-
-            else:
-                logging.info('Simulate using a single worker')
-                metadata = []
-                for example in tqdm(examples, total=len(examples)):
-                    metadata.append(simulate_room(**example))
+            progress_filepath = os.path.join(output_dir, f'{subset}_progress.jsonl')
+            metadata = run_simulations(
+                simulate_fn=simulate_room_kwargs,
+                examples=examples,
+                num_workers=num_workers,
+                progress_filepath=progress_filepath,
+                resume=resume,
+                output_filepath_key='room_filepath',
+                desc=f'Simulating {subset}',
+            )
 
             # Save manifest
-            manifest_filepath = os.path.join(output_dir, f'{subset}_manifest.json')
-
             if os.path.exists(manifest_filepath) and os.path.isfile(manifest_filepath):
                 raise RuntimeError(f'Manifest config file exists: {manifest_filepath}')
 
@@ -746,18 +756,19 @@ class RIRCorpusGenerator(object):
                 data['room_filepath'] = os.path.relpath(data['room_filepath'], start=output_dir)
 
             write_manifest(manifest_filepath, metadata)
+            os.remove(progress_filepath)
 
             # Generate plots with information about generated data
             plot_filepath = os.path.join(output_dir, f'{subset}_info.png')
 
-            if os.path.exists(plot_filepath) and os.path.isfile(plot_filepath):
+            if not resume and os.path.exists(plot_filepath) and os.path.isfile(plot_filepath):
                 raise RuntimeError(f'Plot file exists: {plot_filepath}')
 
             plot_rir_manifest_info(manifest_filepath, plot_filepath=plot_filepath)
 
         # Save used configuration for reference
         config_filepath = os.path.join(output_dir, 'config.yaml')
-        if os.path.exists(config_filepath) and os.path.isfile(config_filepath):
+        if not resume and os.path.exists(config_filepath) and os.path.isfile(config_filepath):
             raise RuntimeError(f'Output config file exists: {config_filepath}')
 
         OmegaConf.save(self.cfg, config_filepath, resolve=True)
@@ -779,6 +790,116 @@ def simulate_room_kwargs(kwargs: dict) -> dict:
     return simulate_room(**kwargs)
 
 
+def get_example_seed(random_seed: int, subset: str, index: int) -> int:
+    """Seed for the random number generator of a single example.
+
+    The seed depends only on the global seed, the subset name and the index of the example, so that
+    each example is simulated identically regardless of how examples are distributed across workers.
+
+    Args:
+        random_seed: global seed of the generator
+        subset: name of the subset
+        index: index of the example in the subset
+
+    Returns:
+        Seed for the example.
+    """
+    seed_sequence = np.random.SeedSequence([random_seed, zlib.crc32(subset.encode()), index])
+    return int(seed_sequence.generate_state(1)[0])
+
+
+def run_simulations(
+    simulate_fn: Callable[[Any], dict],
+    examples: List[Any],
+    num_workers: int,
+    progress_filepath: str,
+    resume: bool = False,
+    output_filepath_key: Optional[str] = None,
+    desc: Optional[str] = None,
+) -> List[dict]:
+    """Run `simulate_fn` for all examples, optionally using a pool of workers.
+
+    Metadata of each completed example is appended to `progress_filepath` as soon as it is available.
+    If `resume` is set, examples already recorded in `progress_filepath` by a previous run are not simulated again.
+
+    Args:
+        simulate_fn: function that simulates a single example and returns its metadata
+        examples: list of arguments for `simulate_fn`
+        num_workers: number of worker processes, a single process is used if not larger than 1
+        progress_filepath: path to a JSON lines file recording completed examples
+        resume: if True, skip examples recorded in `progress_filepath`
+        output_filepath_key: optional, key of an example dictionary with the path of its output file,
+                             or a list of paths if it has several output files.
+                             Output files of examples which are not complete are removed before the simulation.
+        desc: description for the progress bar
+
+    Returns:
+        List of metadata, in the same order as `examples`.
+    """
+    metadata = [None] * len(examples)
+
+    if resume and os.path.isfile(progress_filepath):
+        with open(progress_filepath, 'r') as f:
+            for line in f:
+                try:
+                    completed = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line may be incomplete if the previous run was interrupted
+                    continue
+                if completed['index'] < len(examples):
+                    metadata[completed['index']] = completed['metadata']
+
+    pending = [n for n in range(len(examples)) if metadata[n] is None]
+    logging.info('Simulating %d examples, %d already completed', len(pending), len(examples) - len(pending))
+
+    if output_filepath_key is not None:
+        for n in pending:
+            output_filepaths = examples[n][output_filepath_key]
+            if isinstance(output_filepaths, str):
+                output_filepaths = [output_filepaths]
+            for output_filepath in output_filepaths:
+                if os.path.exists(output_filepath):
+                    logging.debug('Removing incomplete output: %s', output_filepath)
+                    os.remove(output_filepath)
+
+    start_time = time.time()
+    with open(progress_filepath, 'w') as progress_f:
+        # Rewrite completed examples, dropping a possibly incomplete last line
+        for n, example_metadata in enumerate(metadata):
+            if example_metadata is not None:
+                progress_f.write(json.dumps({'index': n, 'metadata': example_metadata}) + '\n')
+
+        if num_workers > 1 and len(pending) > 1:
+            logging.info(f'Simulate using {num_workers} workers')
+            pool = multiprocessing.Pool(processes=num_workers)
+            results = pool.imap(simulate_fn, [examples[n] for n in pending])
+        else:
+            logging.info('Simulate using a single worker')
+            pool = None
+            results = map(simulate_fn, [examples[n] for n in pending])
+
+        try:
+            for n, example_metadata in zip(pending, tqdm(results, total=len(pending), desc=desc)):
+                metadata[n] = example_metadata
+                progress_f.write(json.dumps({'index': n, 'metadata': example_metadata}) + '\n')
+                progress_f.flush()
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    elapsed_time = time.time() - start_time
+    if pending:
+        logging.info(
+            'Simulated %d examples in %.1f s (%.2f examples/s, %d workers)',
+            len(pending),
+            elapsed_time,
+            len(pending) / elapsed_time,
+            max(num_workers, 1),
+        )
+
+    return metadata
+
+
 def simulate_room(
     room_params: dict,
     mic_array: ArrayGeometry,
@@ -1512,6 +1633,11 @@ class RIRMixGenerator(object):
         # Initialize
         self.random = default_rng(seed=self.cfg.random_seed)
 
+        # Audio signals for each example are selected in the workers, using a seed derived from this one
+        example_random_seed = self.cfg.random_seed
+        if example_random_seed is None:
+            example_random_seed = np.random.SeedSequence().entropy
+
         # Prepare output dir
         output_dir = self.cfg.output_dir
         if output_dir.endswith('.yaml'):
@@ -1520,16 +1646,23 @@ class RIRMixGenerator(object):
         # Create absolute path
         logging.info('Output dir set to: %s', output_dir)
 
+        # Continue an interrupted run, keeping the examples which were already simulated
+        resume = self.cfg.get('resume', False)
+
         # Generate all cases
         for subset in self.subsets:
 
             output_dir_subset = os.path.join(output_dir, subset)
+            manifest_filepath = os.path.join(output_dir, f'{os.path.basename(output_dir)}_{subset}.json')
             examples = []
 
             if not os.path.exists(output_dir_subset):
                 logging.info('Creating output directory: %s', output_dir_subset)
                 os.makedirs(output_dir_subset)
-            elif os.path.isdir(output_dir_subset) and len(os.listdir(output_dir_subset)) > 0:
+            elif resume and os.path.isfile(manifest_filepath):
+                # Examples are still prepared below to keep the random state of the following subsets
+                logging.info('Subset %s is already complete', subset)
+            elif not resume and os.path.isdir(output_dir_subset) and len(os.listdir(output_dir_subset)) > 0:
                 raise RuntimeError(f'Output directory {output_dir_subset} is not empty.')
 
             num_examples = self.cfg.mix[subset].num
@@ -1552,10 +1685,14 @@ class RIRMixGenerator(object):
                     'interference_cfg': interference_cfg,
                     'mix_cfg': mix_cfg,
                     'base_output_filepath': base_output_filepath,
+                    'random_seed': get_example_seed(example_random_seed, subset, n_example),
                 }
 
                 examples.append(example)
 
+            if resume and os.path.isfile(manifest_filepath):
+                continue
+
             # Audio data
             audio_metadata = {
                 'target': self.metadata[subset]['target'],
@@ -1576,26 +1713,28 @@ class RIRMixGenerator(object):
             if (num_workers := self.cfg.get('num_workers')) is None:
                 num_workers = os.cpu_count() - 1
 
-            if num_workers is not None and num_workers > 1:
-                logging.info(f'Simulate using {num_workers} workers')
-                examples_and_audio_metadata = zip(examples, itertools.repeat(audio_metadata, len(examples)))
-                with multiprocessing.Pool(processes=num_workers) as pool:
-                    metadata = list(
-                        tqdm(
-                            pool.imap(simulate_room_mix_helper, examples_and_audio_metadata),
-                            total=len(examples),
-                            desc=f'Simulating {subset}',
-                        )
-                    )
-            else:
-                logging.info('Simulate using a single worker')
-                metadata = []
-                for example in tqdm(examples, total=len(examples), desc=f'Simulating {subset}'):
-                    metadata.append(simulate_room_mix(**example, audio_metadata=audio_metadata))
+            progress_filepath = os.path.join(output_dir, f'{os.path.basename(output_dir)}_{subset}_progress.jsonl')
+            examples = [
+                {
+                    'example': example,
+                    'audio_metadata': audio_metadata,
+                    'output_filepaths': get_room_mix_output_filepaths(
+                        example['base_output_filepath'], example['mix_cfg']
+                    ),
+                }
+                for example in examples
+            ]
+            metadata = run_simulations(
+                simulate_fn=simulate_room_mix_helper,
+                examples=examples,
+                num_workers=num_workers,
+                progress_filepath=progress_filepath,
+                resume=resume,
+                output_filepath_key='output_filepaths',
+                desc=f'Simulating {subset}',
+            )
 
             # Save manifest
-            manifest_filepath = os.path.join(output_dir, f'{os.path.basename(output_dir)}_{subset}.json')
-
             if os.path.exists(manifest_filepath) and os.path.isfile(manifest_filepath):
                 raise RuntimeError(f'Manifest config file exists: {manifest_filepath}')
 
@@ -1606,18 +1745,19 @@ class RIRMixGenerator(object):
                         data[key] = os.path.relpath(val, start=output_dir)
 
             write_manifest(manifest_filepath, metadata)
+            os.remove(progress_filepath)
 
             # Generate plots with information about generated data
             plot_filepath = os.path.join(output_dir, f'{os.path.basename(output_dir)}_{subset}_info.png')
 
-            if os.path.exists(plot_filepath) and os.path.isfile(plot_filepath):
+            if not resume and os.path.exists(plot_filepath) and os.path.isfile(plot_filepath):
                 raise RuntimeError(f'Plot file exists: {plot_filepath}')
 
             plot_mix_manifest_info(manifest_filepath, plot_filepath=plot_filepath)
 
         # Save used configuration for reference
         config_filepath = os.path.join(output_dir, 'config.yaml')
-        if os.path.exists(config_filepath) and os.path.isfile(config_filepath):
+        if not resume and os.path.exists(config_filepath) and os.path.isfile(config_filepath):
             raise RuntimeError(f'Output config file exists: {config_filepath}')
 
         OmegaConf.save(self.cfg, config_filepath, resolve=True)
@@ -1807,6 +1947,7 @@ def prepare_source_signal(
     ref_signal: Optional[np.ndarray] = None,
     mic_positions: Optional[np.ndarray] = None,
     num_retries: int = 10,
+    rng: Optional[random.Random] = None,
 ) -> tuple:
     """Prepare an audio signal for a source.
 
@@ -1819,6 +1960,7 @@ def prepare_source_signal(
         ref_signal: Optional, used to determine the length of the signal
         mic_positions: Optional, used to prepare approximately diffuse signal
         num_retries: Number of retries when selecting the source files
+        rng: Optional, random number generator used to select the source files. Defaults to the global `random`.
 
     Returns:
         (audio_signal, metadata), where audio_signal is an ndarray and metadata is a dictionary
@@ -1827,6 +1969,9 @@ def prepare_source_signal(
     if signal_type not in ['point', 'diffuse']:
         raise ValueError(f'Unexpected signal type {signal_type}.')
 
+    if rng is None:
+        rng = random
+
     if audio_data is None:
         # No data to load
         return None
@@ -1841,7 +1986,7 @@ def prepare_source_signal(
 
         while samples_to_load > 0:
             # Select a random item and load the audio
-            item = random.choice(audio_data)
+            item = rng.choice(audio_data)
 
             audio_filepath = item['audio_filepath']
             if not os.path.isabs(audio_filepath) and audio_dir is not None:
@@ -1907,7 +2052,7 @@ def prepare_source_signal(
 
             while samples_to_load > 0:
                 # Select an audio file
-                item = random.choice(audio_data)
+                item = rng.choice(audio_data)
 
                 audio_filepath = item['audio_filepath']
                 if not os.path.isabs(audio_filepath) and audio_dir is not None:
@@ -1918,7 +2063,7 @@ def prepare_source_signal(
 
                 if (max_offset := item['duration'] - np.ceil(samples_to_load / sample_rate)) > 0:
                     # Load with a random offset if the example is longer than samples_to_load
-                    offset = random.uniform(0, max_offset)
+                    offset = rng.uniform(0, max_offset)
                     duration = -1
                 else:
                     # Load the whole file
@@ -1933,7 +2078,7 @@ def prepare_source_signal(
                     segment_samples = audio_segment.samples
                 else:
                     # Take a random channel
-                    selected_channel = random.choice(range(audio_segment.num_channels))
+                    selected_channel = rng.choice(range(audio_segment.num_channels))
                     segment_samples = audio_segment.samples[:, selected_channel]
 
                 source_signals_metadata['audio_filepath'].append(audio_filepath)
@@ -2008,6 +2153,10 @@ def check_min_sample_rate(filepath: str, sample_rate: float):
         )
 
 
+# Signals saved by `simulate_room_mix`, used as suffixes of the output files
+ROOM_MIX_SIGNALS = ('mic', 'target_reverberant', 'target_anechoic', 'target_early', 'noise', 'interference')
+
+
 def simulate_room_mix(
     sample_rate: int,
     target_cfg: dict,
@@ -2017,6 +2166,7 @@ def simulate_room_mix(
     base_output_filepath: str,
     max_amplitude: float = 0.999,
     eps: float = 1e-16,
+    random_seed: Optional[int] = None,
 ) -> dict:
     """Simulate mixture signal at the microphone, including target, noise and
     interference signals and mixed at specific RSNR and RSIR.
@@ -2036,6 +2186,7 @@ def simulate_room_mix(
                               adding a diffierent suffix for each component, e.g., _mic.wav.
         max_amplitude: Maximum amplitude of the mic signal, used to prevent clipping.
         eps: Small regularization constant.
+        random_seed: Optional, seed for selecting the audio signals. If not provided, the global `random` is used.
 
     Returns:
         Dictionary with metadata based on the mixture setup and
@@ -2114,6 +2265,9 @@ def simulate_room_mix(
     )
     target_rir_early = get_early_rir(rir=target_rir, rir_anechoic=target_rir_anechoic, sample_rate=sample_rate)
 
+    # Random selection of the source signals
+    rng = None if random_seed is None else random.Random(random_seed)
+
     # Target signals
     target_signal, target_metadata = prepare_source_signal(
         signal_type='point',
@@ -2121,6 +2275,7 @@ def simulate_room_mix(
         audio_data=audio_metadata['target'],
         audio_dir=audio_metadata['target_dir'],
         min_duration=mix_cfg['min_duration'],
+        rng=rng,
     )
     source_signals_metadata = {'target': target_metadata['source_signals']}
 
@@ -2137,6 +2292,7 @@ def simulate_room_mix(
         audio_data=audio_metadata['noise'],
         audio_dir=audio_metadata['noise_dir'],
         ref_signal=target_reverberant,
+        rng=rng,
     )
     source_signals_metadata['noise'] = noise_metadata['source_signals']
 
@@ -2155,6 +2311,7 @@ def simulate_room_mix(
                 audio_data=audio_metadata['interference'],
                 audio_dir=audio_metadata['interference_dir'],
                 ref_signal=target_signal,
+                rng=rng,
             )
             source_signals_metadata['interference'].append(i_metadata['source_signals'])
             # Load RIR from the same room as the target, but a difference source
@@ -2264,16 +2421,35 @@ def simulate_room_mix(
     return convert_numpy_to_serializable(metadata)
 
 
-def simulate_room_mix_helper(example_and_audio_metadata: tuple) -> dict:
+def get_room_mix_output_filepaths(base_output_filepath: str, mix_cfg: dict) -> List[str]:
+    """Paths of the audio files which may be saved by `simulate_room_mix`.
+
+    Args:
+        base_output_filepath: prefix of the output files, see `simulate_room_mix`
+        mix_cfg: mixture configuration, see `simulate_room_mix`
+
+    Returns:
+        List of paths, one for each signal.
+    """
+    format = mix_cfg['save'].get('format', 'wav')
+    return [f'{base_output_filepath}_{tag}.{format}' for tag in ROOM_MIX_SIGNALS]
+
+
+def simulate_room_mix_helper(example_and_audio_metadata: Union[tuple, dict]) -> dict:
     """Wrapper around `simulate_room_mix` for pool.imap.
 
     Args:
-        args: example and audio_metadata that are forwarded to `simulate_room_mix`
+        example_and_audio_metadata: example and audio_metadata that are forwarded to `simulate_room_mix`,
+                                    either as a tuple or as a dictionary with keys `example` and `audio_metadata`
 
     Returns:
         Dictionary with metadata, see `simulate_room_mix`
     """
-    example, audio_metadata = example_and_audio_metadata
+    if isinstance(example_and_audio_metadata, dict):
+        example = example_and_audio_metadata['example']
+        audio_metadata = example_and_audio_metadata['audio_metadata']
+    else:
+        example, audio_metadata = example_and_audio_metadata
     return simulate_room_mix(**example, audio_metadata=audio_metadata)
 
 
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import nemo.collections.common.callbacks
-from nemo.collections.common import data, losses, parts, tokenizers
+import importlib
+from typing import TYPE_CHECKING
+
 from nemo.package_info import __version__
 
+if TYPE_CHECKING:
+    from nemo.collections.common import callbacks, data, losses, metrics, parts, prompts, tokenizers, video_tokenizers
+
 # Set collection version equal to NeMo version.
 __version = __version__
 
@@ -24,3 +28,16 @@ __author__ = "NVIDIA Corporation"
 
 # Set collection name.
 __description__ = "Common collection"
+
+# Submodules are imported on first access (PEP 562), so that using one of them does not import all the others.
+_SUBMODULES = ("callbacks", "data", "losses", "metrics", "parts", "prompts", "tokenizers", "video_tokenizers")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
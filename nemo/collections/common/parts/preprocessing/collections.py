@@ -13,23 +13,162 @@
 # limitations under the License.
 
 import collections
+import collections.abc
 import json
+import multiprocessing
+import operator
 import os
 from itertools import combinations
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from nemo.collections.common.parts.preprocessing import manifest, parsers
 from nemo.collections.common.parts.preprocessing.manifest import get_full_path
+from nemo.collections.common.parts.preprocessing.manifest_cache import (
+    ManifestCache,
+    decode_string,
+    encode_optional_floats,
+    encode_ragged,
+    encode_strings,
+    intern_values,
+)
 from nemo.utils import logging, logging_mode
+from nemo.utils.data_utils import DataStoreObject
 
 
 class _Collection(collections.UserList):
     """List of parsed and preprocessed data."""
 
     OUTPUT_TYPE = None  # Single element output type.
+    # Optional mapping from `OUTPUT_TYPE` field names to column kinds supported by `ColumnarEntries`.
+    # Collections defining it can store their entries as flat arrays instead of a list of namedtuples.
+    COLUMNS = None
+
+    def _set_entries(self, data: List[Any], use_columnar_storage: bool = False):
+        """Sets the collection entries, converting them to `ColumnarEntries` if requested and possible."""
+        super().__init__()
+        if use_columnar_storage and self.COLUMNS is not None:
+            packed = ColumnarEntries.pack(data, self.COLUMNS)
+            if packed is None:
+                logging.warning(
+                    f"{type(self).__name__} entries cannot be stored as arrays, falling back to a list of entries."
+                )
+            else:
+                data = ColumnarEntries(self.OUTPUT_TYPE, self.COLUMNS, *packed)
+        self.data = data
+
+    def to_columns(self) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """Returns the entries as column arrays and metadata, or None if they cannot be represented as arrays."""
+        if isinstance(self.data, ColumnarEntries):
+            return self.data.columns, self.data.meta
+        if self.COLUMNS is None:
+            return None
+        return ColumnarEntries.pack(self.data, self.COLUMNS)
+
+
+class ColumnarEntries(collections.abc.Sequence):
+    """Read-only sequence of collection entries stored as a struct of flat NumPy arrays.
+
+    Storing millions of entries as namedtuples of Python objects costs hundreds of bytes per entry, and since
+    every access touches object reference counts, forked DataLoader workers gradually copy the whole list
+    (copy-on-write). Here each field is kept in a handful of arrays and the `OUTPUT_TYPE` namedtuple is only
+    built on access, so memory is flat and shared between workers (and between processes when the arrays are
+    memory-mapped from a `ManifestCache`).
+
+    Supported column kinds:
+
+        * ``int``: integer per entry.
+        * ``float``: optional float per entry, NaN encodes None.
+        * ``str``: string per entry, stored in a UTF-8 buffer with offsets.
+        * ``path``: string per entry with a table of unique values, for paths which repeat across entries.
+        * ``tokens``: list of integer token ids per entry, stored in a flat int32 buffer with offsets.
+        * ``value``: JSON-serializable value per entry with a table of unique values (e.g. speakers, languages).
+
+    Args:
+        output_type: namedtuple type of a single entry.
+        kinds: mapping from field names of `output_type` to column kinds.
+        columns: column arrays, as returned by `ColumnarEntries.pack`.
+        meta: JSON-serializable metadata (value tables), as returned by `ColumnarEntries.pack`.
+    """
+
+    KINDS = ('int', 'float', 'str', 'path', 'tokens', 'value')
+
+    def __init__(self, output_type, kinds: Dict[str, str], columns: Dict[str, np.ndarray], meta: Dict[str, Any]):
+        self.output_type = output_type
+        self.kinds = kinds
+        self.columns = columns
+        self.meta = meta
+        self._length = len(columns[output_type._fields[0]])
+
+    @staticmethod
+    def pack(entries: List[Any], kinds: Dict[str, str]) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """Converts a list of namedtuple entries to column arrays and metadata.
+
+        Returns:
+            A tuple of column arrays and JSON-serializable metadata,
+            or None if some entries cannot be represented with the given column kinds.
+        """
+        unsupported = set(kinds.values()) - set(ColumnarEntries.KINDS)
+        if unsupported:
+            raise ValueError(f"Unsupported column kinds {unsupported}, expected one of {ColumnarEntries.KINDS}")
+
+        columns, meta = {}, {}
+        try:
+            for name, kind in kinds.items():
+                values = [getattr(entity, name) for entity in entries]
+                if kind == 'int':
+                    columns[name] = np.array(values, dtype=np.int64)
+                elif kind == 'float':
+                    columns[name] = encode_optional_floats(values)
+                elif kind == 'str':
+                    if not all(isinstance(value, str) for value in values):
+                        return None
+                    columns[name], columns[f'{name}_offsets'] = encode_strings(values)
+                elif kind == 'path':
+                    if not all(isinstance(value, str) for value in values):
+                        return None
+                    columns[f'{name}_index'], table = intern_values(values)
+                    columns[name], columns[f'{name}_offsets'] = encode_strings(table)
+                elif kind == 'tokens':
+                    columns[name], columns[f'{name}_offsets'] = encode_ragged(values)
+                else:
+                    columns[name], meta[f'{name}_table'] = intern_values(values)
+                    json.dumps(meta[f'{name}_table'])
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return columns, meta
+
+    def field(self, index: int, name: str) -> Any:
+        """Returns a single field of the ``index``-th entry without building the whole entry."""
+        kind, columns = self.kinds[name], self.columns
+        if kind == 'int':
+            return int(columns[name][index])
+        if kind == 'float':
+            value = float(columns[name][index])
+            return None if np.isnan(value) else value
+        if kind == 'str':
+            return decode_string(columns[name], columns[f'{name}_offsets'], index)
+        if kind == 'path':
+            return decode_string(columns[name], columns[f'{name}_offsets'], columns[f'{name}_index'][index])
+        if kind == 'tokens':
+            offsets = columns[f'{name}_offsets']
+            return columns[name][offsets[index] : offsets[index + 1]].tolist()
+        return self.meta[f'{name}_table'][columns[name][index]]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        index = operator.index(index)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Index {index} out of range for {self._length} entries")
+        return self.output_type(*(self.field(index, name) for name in self.output_type._fields))
 
 
 class Text(_Collection):
@@ -90,6 +229,24 @@ class FromFileText(Text):
         return texts
 
 
+def tokenize_transcript(parser: Callable, text: Union[str, List[Dict[str, str]]], lang: Optional[str] = None):
+    """Tokenizes a transcript with a parser, handling empty transcripts and aggregate tokenizers.
+
+    Returns:
+        List of token ids, or None if the parser failed to process the transcript.
+    """
+    if text == '':
+        return []
+    if hasattr(parser, "is_aggregate") and parser.is_aggregate and isinstance(text, str):
+        if lang is not None:
+            return parser(text, lang)
+        # for future use if want to add language bypass to audio_to_text classes
+        # elif hasattr(parser, "lang") and parser.lang is not None:
+        #    return parser(text, parser.lang)
+        raise ValueError("lang required in manifest when using aggregate tokenizers")
+    return parser(text)
+
+
 class AudioText(_Collection):
     """List of audio-transcript text correspondence with preprocessing."""
 
@@ -97,6 +254,17 @@ class AudioText(_Collection):
         typename='AudioTextEntity',
         field_names='id audio_file duration text_tokens offset text_raw speaker orig_sr lang',
     )
+    COLUMNS = {
+        'id': 'int',
+        'audio_file': 'path',
+        'duration': 'float',
+        'text_tokens': 'tokens',
+        'offset': 'float',
+        'text_raw': 'str',
+        'speaker': 'value',
+        'orig_sr': 'value',
+        'lang': 'value',
+    }
 
     def __init__(
         self,
@@ -115,6 +283,7 @@ class AudioText(_Collection):
         max_number: Optional[int] = None,
         do_sort_by_duration: bool = False,
         index_by_file_id: bool = False,
+        use_columnar_storage: bool = True,
     ):
         """Instantiates audio-text manifest with filters and preprocessing.
 
@@ -133,6 +302,10 @@ class AudioText(_Collection):
             max_number: Maximum number of samples to collect.
             do_sort_by_duration: True if sort samples list by duration. Not compatible with index_by_file_id.
             index_by_file_id: If True, saves a mapping from filename base (ID) to index in data.
+            use_columnar_storage: If True, entries are stored as flat arrays (see `ColumnarEntries`)
+                instead of a list of namedtuples, which keeps memory low and shared across DataLoader workers.
+                The collection is then read-only: `append`, item assignment and other in-place list methods
+                are not supported.
         """
 
         output_type = self.OUTPUT_TYPE
@@ -160,19 +333,7 @@ class AudioText(_Collection):
             if token_labels is not None:
                 text_tokens = token_labels
             else:
-                if text != '':
-                    if hasattr(parser, "is_aggregate") and parser.is_aggregate and isinstance(text, str):
-                        if lang is not None:
-                            text_tokens = parser(text, lang)
-                        # for future use if want to add language bypass to audio_to_text classes
-                        # elif hasattr(parser, "lang") and parser.lang is not None:
-                        #    text_tokens = parser(text, parser.lang)
-                        else:
-                            raise ValueError("lang required in manifest when using aggregate tokenizers")
-                    else:
-                        text_tokens = parser(text)
-                else:
-                    text_tokens = []
+                text_tokens = tokenize_transcript(parser, text, lang)
 
                 if text_tokens is None:
                     duration_filtered += duration
@@ -202,7 +363,7 @@ class AudioText(_Collection):
         logging.info("%d files were filtered totalling %.2f hours", num_filtered, duration_filtered / 3600)
         if not all_has_duration:
             logging.info(f"Not all audios have duration information, the total number of hours is inaccurate.")
-        super().__init__(data)
+        self._set_entries(data, use_columnar_storage)
 
 
 class VideoText(_Collection):
@@ -212,6 +373,17 @@ class VideoText(_Collection):
         typename='AudioTextEntity',
         field_names='id video_file duration text_tokens offset text_raw speaker orig_sr lang',
     )
+    COLUMNS = {
+        'id': 'int',
+        'video_file': 'path',
+        'duration': 'float',
+        'text_tokens': 'tokens',
+        'offset': 'float',
+        'text_raw': 'str',
+        'speaker': 'value',
+        'orig_sr': 'value',
+        'lang': 'value',
+    }
 
     def __init__(
         self,
@@ -230,6 +402,7 @@ class VideoText(_Collection):
         max_number: Optional[int] = None,
         do_sort_by_duration: bool = False,
         index_by_file_id: bool = False,
+        use_columnar_storage: bool = True,
     ):
         """Instantiates video-text manifest with filters and preprocessing.
 
@@ -248,6 +421,10 @@ class VideoText(_Collection):
             max_number: Maximum number of samples to collect.
             do_sort_by_duration: True if sort samples list by duration. Not compatible with index_by_file_id.
             index_by_file_id: If True, saves a mapping from filename base (ID) to index in data.
+            use_columnar_storage: If True, entries are stored as flat arrays (see `ColumnarEntries`)
+                instead of a list of namedtuples, which keeps memory low and shared across DataLoader workers.
+                The collection is then read-only: `append`, item assignment and other in-place list methods
+                are not supported.
         """
 
         output_type = self.OUTPUT_TYPE
@@ -310,7 +487,7 @@ class VideoText(_Collection):
         logging.info("Dataset loaded with %d files totalling %.2f hours", len(data), total_duration / 3600)
         logging.info("%d files were filtered totalling %.2f hours", num_filtered, duration_filtered / 3600)
 
-        super().__init__(data)
+        self._set_entries(data, use_columnar_storage)
 
 
 class InstructionTuningAudioText(_Collection):
@@ -442,48 +619,313 @@ class InstructionTuningAudioText(_Collection):
             raise ValueError(f"Unknown field type {field_type}.")
 
 
+# Parse function, parser and transcripts shared with the workers of `parse_manifests_in_parallel` and
+# `tokenize_transcripts_in_parallel`. They are inherited through `fork` rather than pickled, as parsers are often
+# local classes wrapping tokenizers.
+_PARALLEL_PARSE_STATE = {}
+
+_AUDIO_TEXT_ITEM_KEYS = ('audio_file', 'duration', 'text', 'offset', 'speaker', 'orig_sr', 'token_labels', 'lang')
+
+
+def _parse_manifest_chunk(chunk: Tuple[str, str, int, int]) -> Dict[str, list]:
+    manifest_file, local_file, start, end = chunk
+    parse_func = _PARALLEL_PARSE_STATE['parse_func']
+
+    columns = {key: [] for key in _AUDIO_TEXT_ITEM_KEYS}
+    columns['num_lines'], columns['errors'] = 0, []
+    for line in manifest.iter_manifest_chunk(local_file, start, end):
+        columns['num_lines'] += 1
+        try:
+            item = parse_func(line, manifest_file)
+        except json.JSONDecodeError:
+            columns['errors'].append(line)
+            continue
+        for key in _AUDIO_TEXT_ITEM_KEYS:
+            columns[key].append(item[key])
+    return columns
+
+
+def _tokenize_transcripts(parser: Callable, texts: List[str], langs: List[Optional[str]]) -> List[Optional[List[int]]]:
+    """Tokenizes transcripts like :func:`tokenize_transcript`, in a single batch if the parser supports it."""
+    tokens = [[] if text == '' else None for text in texts]
+    to_tokenize = [i for i, text in enumerate(texts) if text != '']
+    batch_text_to_ids = getattr(parser, 'batch_text_to_ids', None)
+    if batch_text_to_ids is not None and not getattr(parser, 'is_aggregate', False):
+        for i, text_tokens in zip(to_tokenize, batch_text_to_ids([texts[i] for i in to_tokenize])):
+            tokens[i] = text_tokens
+    else:
+        for i in to_tokenize:
+            tokens[i] = tokenize_transcript(parser, texts[i], langs[i])
+    return tokens
+
+
+def _tokenize_transcripts_chunk(chunk: Tuple[int, int]) -> List[Optional[List[int]]]:
+    start, end = chunk
+    state = _PARALLEL_PARSE_STATE
+    return _tokenize_transcripts(state['parser'], state['texts'][start:end], state['langs'][start:end])
+
+
+def _map_in_workers(func: Callable, chunks: list, num_workers: int, **state) -> list:
+    """Maps `func` over `chunks` with a pool of `num_workers` forked processes, which inherit `state`."""
+    _PARALLEL_PARSE_STATE.update(state)
+    try:
+        if num_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            with multiprocessing.get_context('fork').Pool(processes=num_workers) as pool:
+                return pool.map(func, chunks, chunksize=1)
+        if num_workers > 1:
+            logging.warning("Parallel manifest parsing requires the `fork` start method, using a single process.")
+        return [func(chunk) for chunk in chunks]
+    finally:
+        _PARALLEL_PARSE_STATE.clear()
+
+
+def tokenize_transcripts_in_parallel(
+    parser: Callable,
+    texts: List[str],
+    langs: List[Optional[str]],
+    num_workers: int,
+    chunks_per_worker: int = 4,
+) -> List[Optional[List[int]]]:
+    """Tokenizes transcripts with a pool of worker processes.
+
+    Args:
+        parser: parser used to tokenize the transcripts.
+        texts: transcripts to tokenize.
+        langs: language of each transcript, used by aggregate tokenizers.
+        num_workers: Number of worker processes.
+        chunks_per_worker: Number of chunks per worker, for load balancing.
+
+    Returns:
+        List with the token ids of each transcript, or None if the parser failed to process it.
+    """
+    if len(texts) == 0:
+        return []
+    num_chunks = min(len(texts), num_workers * chunks_per_worker)
+    bounds = [len(texts) * i // num_chunks for i in range(num_chunks + 1)]
+    results = _map_in_workers(
+        _tokenize_transcripts_chunk,
+        list(zip(bounds[:-1], bounds[1:])),
+        num_workers,
+        parser=parser,
+        texts=texts,
+        langs=langs,
+    )
+    return [text_tokens for result in results for text_tokens in result]
+
+
+def parse_manifests_in_parallel(
+    manifests_files: Union[str, List[str]],
+    num_workers: int,
+    parse_func: Optional[Callable] = None,
+    chunks_per_worker: int = 4,
+) -> Dict[str, list]:
+    """Parses manifest files with a pool of worker processes.
+
+    Each manifest is split into byte ranges aligned to line boundaries, which are processed in parallel.
+    The results are concatenated in file order, so they are identical to those of :func:`manifest.item_iter`
+    (including the ``id`` of each item) regardless of the number of workers.
+
+    Args:
+        manifests_files: Either single string file or list of such - manifests to parse.
+        num_workers: Number of worker processes.
+        parse_func: Optional function to parse manifest entries.
+        chunks_per_worker: Number of chunks per manifest and per worker, for load balancing.
+
+    Returns:
+        Dictionary of lists with keys ``id``, ``audio_file``, ``duration``, ``text``, ``offset``, ``speaker``,
+        ``orig_sr``, ``token_labels`` and ``lang``.
+    """
+    if isinstance(manifests_files, str):
+        manifests_files = [manifests_files]
+
+    chunks = []
+    for manifest_file in manifests_files:
+        local_file = os.path.expanduser(str(DataStoreObject(manifest_file).get()))
+        for start, end in manifest.get_manifest_chunks(local_file, num_chunks=num_workers * chunks_per_worker):
+            chunks.append((manifest_file, local_file, start, end))
+
+    results = _map_in_workers(_parse_manifest_chunk, chunks, num_workers, parse_func=parse_func or manifest.parse_item)
+
+    errors = collections.defaultdict(list)
+    for (manifest_file, *_), result in zip(chunks, results):
+        errors[str(manifest_file)].extend(result['errors'])
+    errors = {filename: lines for filename, lines in errors.items() if lines}
+    if len(errors) > 0:
+        for filename, lines in errors.items():
+            logging.error("=============================================")
+            logging.error(f"Failed to parse {len(lines)} lines from manifest file: {filename}")
+            for line in lines:
+                logging.error(f"-- Failed to parse line: `{line}`")
+        raise RuntimeError("Failed to parse some lines from manifest files. See logs for more details.")
+
+    columns = {key: [] for key in ('id',) + _AUDIO_TEXT_ITEM_KEYS}
+    for result in results:
+        for key in _AUDIO_TEXT_ITEM_KEYS:
+            columns[key].extend(result[key])
+    columns['id'] = list(range(len(columns['audio_file'])))
+    return columns
+
+
 class ASRAudioText(AudioText):
     """`AudioText` collector from asr structured json files."""
 
-    def __init__(self, manifests_files: Union[str, List[str]], parse_func: Optional[Callable] = None, *args, **kwargs):
+    def __init__(
+        self,
+        manifests_files: Union[str, List[str]],
+        parse_func: Optional[Callable] = None,
+        *,
+        parser: parsers.CharParser,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        max_number: Optional[int] = None,
+        do_sort_by_duration: bool = False,
+        index_by_file_id: bool = False,
+        use_columnar_storage: bool = True,
+        cache_dir: Optional[str] = None,
+        num_workers: int = 0,
+    ):
         """Parse lists of audio files, durations and transcripts texts.
 
         Args:
             manifests_files: Either single string file or list of such -
                 manifests to yield items from.
-            *args: Args to pass to `AudioText` constructor.
-            **kwargs: Kwargs to pass to `AudioText` constructor.
+            parse_func: Optional function to parse manifest entries.
+            parser, min_duration, max_duration, max_number, do_sort_by_duration, index_by_file_id,
+                use_columnar_storage: See `AudioText`.
+            cache_dir: Optional directory of a persistent manifest cache. When set, the parsed and tokenized
+                entries are stored there on the first run and memory-mapped on the following runs, as long as
+                the manifest files, the parser and the collection settings are unchanged.
+                Note that relative audio paths are resolved when the cache is built.
+            num_workers: If greater than 0, manifests are parsed and transcripts are tokenized by this many
+                worker processes (see `parse_manifests_in_parallel` and `tokenize_transcripts_in_parallel`).
+                Only the transcripts of entries which pass the filters are tokenized, so the resulting entries
+                are identical to those of the default serial parsing.
         """
-
-        (
-            ids,
-            audio_files,
-            durations,
-            texts,
-            offsets,
-        ) = (
-            [],
-            [],
-            [],
-            [],
-            [],
+        settings = dict(
+            min_duration=min_duration,
+            max_duration=max_duration,
+            max_number=max_number,
+            do_sort_by_duration=do_sort_by_duration,
+            index_by_file_id=index_by_file_id,
         )
 
-        speakers, orig_srs, token_labels, langs = [], [], [], []
-        for item in manifest.item_iter(manifests_files, parse_func=parse_func):
-            ids.append(item['id'])
-            audio_files.append(item['audio_file'])
-            durations.append(item['duration'])
-            texts.append(item['text'])
-            offsets.append(item['offset'])
-            speakers.append(item['speaker'])
-            orig_srs.append(item['orig_sr'])
-            token_labels.append(item['token_labels'])
-            langs.append(item['lang'])
+        cache = None
+        if cache_dir is not None:
+            # Storage layout does not change the entries, so it is not part of the cache key.
+            cache = ManifestCache(cache_dir, manifests_files, parser=parser, parse_func=parse_func, **settings)
+            cached = cache.load()
+            if cached is not None:
+                self._init_from_cache(
+                    *cached, index_by_file_id=index_by_file_id, use_columnar_storage=use_columnar_storage
+                )
+                logging.info(f"Loaded manifest cache from {cache.path}")
+                return
+
+        if num_workers > 0:
+            items = parse_manifests_in_parallel(manifests_files, num_workers=num_workers, parse_func=parse_func)
+            # Transcripts are tokenized by the workers and passed to `AudioText` as token labels.
+            items = self._tokenize_in_parallel(items, parser, num_workers, **settings)
+        else:
+            items = {key: [] for key in ('id',) + _AUDIO_TEXT_ITEM_KEYS}
+            for item in manifest.item_iter(manifests_files, parse_func=parse_func):
+                for key in items:
+                    items[key].append(item[key])
+
         super().__init__(
-            ids, audio_files, durations, texts, offsets, speakers, orig_srs, token_labels, langs, *args, **kwargs
+            items['id'],
+            items['audio_file'],
+            items['duration'],
+            items['text'],
+            items['offset'],
+            items['speaker'],
+            items['orig_sr'],
+            items['token_labels'],
+            items['lang'],
+            parser=parser,
+            use_columnar_storage=use_columnar_storage,
+            **settings,
         )
 
+        if cache is not None:
+            cached = self.to_columns()
+            if cached is None:
+                logging.warning("Manifest entries cannot be stored as arrays, skipping the manifest cache.")
+            else:
+                cache.save(*cached)
+
+    @staticmethod
+    def _tokenize_in_parallel(
+        items: Dict[str, list],
+        parser: parsers.CharParser,
+        num_workers: int,
+        min_duration: Optional[float],
+        max_duration: Optional[float],
+        max_number: Optional[int],
+        **kwargs,
+    ) -> Dict[str, list]:
+        """Tokenizes the transcripts which `AudioText` would tokenize, i.e. those of the entries that pass the
+        duration filters, up to `max_number` entries. Entries whose transcript cannot be tokenized are removed."""
+        if max_number is not None and max_number <= 0:
+            max_number = None
+        token_labels = list(items['token_labels'])
+        candidates = [
+            i
+            for i, duration in enumerate(items['duration'])
+            if duration is None
+            or (
+                (min_duration is None or duration >= min_duration)
+                and (max_duration is None or duration <= max_duration)
+            )
+        ]
+
+        failed = set()
+        position, num_kept = 0, 0
+        while position < len(candidates) and (max_number is None or num_kept < max_number):
+            # Entries which cannot be tokenized are dropped, so more may be needed to reach max_number.
+            if max_number is None:
+                batch = candidates[position:]
+            else:
+                batch = candidates[position : position + max_number - num_kept]
+            position += len(batch)
+            to_tokenize = [i for i in batch if token_labels[i] is None]
+            tokens = tokenize_transcripts_in_parallel(
+                parser,
+                [items['text'][i] for i in to_tokenize],
+                [items['lang'][i] for i in to_tokenize],
+                num_workers=num_workers,
+            )
+            for i, text_tokens in zip(to_tokenize, tokens):
+                if text_tokens is None:
+                    failed.add(i)
+                token_labels[i] = text_tokens
+            num_kept += len(batch) - len(failed.intersection(batch))
+
+        items = dict(items, token_labels=token_labels)
+        if failed:
+            # `AudioText` would try to tokenize them again.
+            keep = [i for i in range(len(token_labels)) if i not in failed]
+            items = {key: [values[i] for i in keep] for key, values in items.items()}
+        return items
+
+    def _init_from_cache(
+        self,
+        columns: Dict[str, np.ndarray],
+        meta: Dict[str, Any],
+        index_by_file_id: bool,
+        use_columnar_storage: bool,
+    ):
+        entries = ColumnarEntries(self.OUTPUT_TYPE, self.COLUMNS, columns, meta)
+        if index_by_file_id:
+            self.mapping = {}
+            for index in range(len(entries)):
+                file_id, _ = os.path.splitext(os.path.basename(entries.field(index, 'audio_file')))
+                self.mapping.setdefault(file_id, []).append(index)
+
+        total_duration = np.nansum(columns['duration'])
+        logging.info("Dataset loaded with %d files totalling %.2f hours", len(entries), total_duration / 3600)
+        _Collection.__init__(self)
+        self.data = entries if use_columnar_storage else list(entries)
+
 
 class SpeechLLMAudioTextEntity(object):
     """Class for SpeechLLM dataloader instance."""
@@ -1926,6 +2368,18 @@ class FeatureText(_Collection):
         typename='FeatureTextEntity',
         field_names='id feature_file rttm_file duration text_tokens offset text_raw speaker orig_sr lang',
     )
+    COLUMNS = {
+        'id': 'int',
+        'feature_file': 'path',
+        'rttm_file': 'value',
+        'duration': 'float',
+        'text_tokens': 'tokens',
+        'offset': 'float',
+        'text_raw': 'str',
+        'speaker': 'value',
+        'orig_sr': 'value',
+        'lang': 'value',
+    }
 
     def __init__(
         self,
@@ -1945,6 +2399,7 @@ class FeatureText(_Collection):
         max_number: Optional[int] = None,
         do_sort_by_duration: bool = False,
         index_by_file_id: bool = False,
+        use_columnar_storage: bool = True,
     ):
         """Instantiates feature-text manifest with filters and preprocessing.
 
@@ -1964,6 +2419,10 @@ class FeatureText(_Collection):
             max_number: Maximum number of samples to collect.
             do_sort_by_duration: True if sort samples list by duration. Not compatible with index_by_file_id.
             index_by_file_id: If True, saves a mapping from filename base (ID) to index in data.
+            use_columnar_storage: If True, entries are stored as flat arrays (see `ColumnarEntries`)
+                instead of a list of namedtuples, which keeps memory low and shared across DataLoader workers.
+                The collection is then read-only: `append`, item assignment and other in-place list methods
+                are not supported.
         """
 
         output_type = self.OUTPUT_TYPE
@@ -2037,7 +2496,7 @@ class FeatureText(_Collection):
         logging.info("Dataset loaded with %d files totalling %.2f hours", len(data), total_duration / 3600)
         logging.info("%d files were filtered totalling %.2f hours", num_filtered, duration_filtered / 3600)
 
-        super().__init__(data)
+        self._set_entries(data, use_columnar_storage)
 
 
 class ASRFeatureText(FeatureText):
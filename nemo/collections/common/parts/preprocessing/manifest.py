@@ -17,7 +17,7 @@ import os
 import re
 from collections import defaultdict
 from os.path import expanduser
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from nemo.utils import logging
 from nemo.utils.data_utils import DataStoreObject, datastore_path_to_local_path, is_datastore_path
@@ -102,6 +102,44 @@ def item_iter(
         raise RuntimeError("Failed to parse some lines from manifest files. See logs for more details.")
 
 
+def get_manifest_chunks(manifest_file: str, num_chunks: int, min_chunk_size: int = 1 << 20) -> List[Tuple[int, int]]:
+    """Splits a manifest file into byte ranges aligned to line boundaries.
+
+    Args:
+        manifest_file: path to a local manifest file.
+        num_chunks: requested number of chunks. Fewer chunks are returned for small files.
+        min_chunk_size: minimal size of a chunk in bytes.
+
+    Returns:
+        List of ``(start, end)`` byte offsets covering the whole file, in order.
+    """
+    file_size = os.path.getsize(manifest_file)
+    num_chunks = max(1, min(num_chunks, file_size // max(min_chunk_size, 1)))
+    boundaries = [0]
+    with open(manifest_file, 'rb') as f:
+        for chunk_id in range(1, num_chunks):
+            position = max(file_size * chunk_id // num_chunks, boundaries[-1])
+            f.seek(position)
+            # Move to the beginning of the next line, unless we are already at one.
+            if position > 0:
+                f.seek(position - 1)
+                f.readline()
+            boundaries.append(min(f.tell(), file_size))
+    boundaries.append(file_size)
+    return [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+
+
+def iter_manifest_chunk(manifest_file: str, start: int, end: int) -> Iterator[str]:
+    """Yields the stripped, non-empty lines of a manifest file byte range created by :func:`get_manifest_chunks`."""
+    with open(manifest_file, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for line in data.decode('utf-8').splitlines():
+        line = line.strip()
+        if line:
+            yield line
+
+
 def __parse_item(line: str, manifest_file: str) -> Dict[str, Any]:
     item = json.loads(line)
 
@@ -201,6 +239,11 @@ def __parse_item(line: str, manifest_file: str) -> Dict[str, Any]:
     return item
 
 
+def parse_item(line: str, manifest_file: str) -> Dict[str, Any]:
+    """Parses a single manifest line with the default parser used by :func:`item_iter`."""
+    return __parse_item(line, manifest_file)
+
+
 def is_tarred_dataset(audio_file: str, manifest_file: Optional[str] = None) -> bool:
     if "/" in audio_file or manifest_file is None:
         # audio files in a tarred dataset don't have `/` in their paths
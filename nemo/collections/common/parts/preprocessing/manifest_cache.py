@@ -0,0 +1,134 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent columnar cache for parsed and tokenized manifests.
+
+This is the :class:`~nemo.utils.columnar_cache.ColumnarCache` of a manifest collection, keyed by the manifest files,
+the text parser and the collection settings. See :mod:`nemo.utils.columnar_cache` for the on-disk layout.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from nemo.utils.columnar_cache import PROBE_TEXT, ColumnarCache, decode_string, encode_ragged, encode_strings
+
+__all__ = [
+    'ManifestCache',
+    'decode_string',
+    'encode_optional_floats',
+    'encode_ragged',
+    'encode_strings',
+    'get_parser_fingerprint',
+    'intern_values',
+]
+
+
+def encode_optional_floats(values: Iterable[Optional[float]]) -> np.ndarray:
+    """Encodes optional floats into a ``float64`` array, using NaN to represent ``None``."""
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def intern_values(values: Iterable[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Replaces (usually low-cardinality) values such as speakers or languages by indices into a table of unique values.
+
+    Args:
+        values: JSON-serializable hashable values, ``None`` included.
+
+    Returns:
+        A tuple of ``int32`` indices and the list of unique values.
+    """
+    table, lookup = [], {}
+    indices = []
+    for value in values:
+        # Key on type as well so that e.g. ``1`` and ``True`` are not merged.
+        key = (type(value), value)
+        if key not in lookup:
+            lookup[key] = len(table)
+            table.append(value)
+        indices.append(lookup[key])
+    return np.array(indices, dtype=np.int32), table
+
+
+def get_parser_fingerprint(parser: Optional[Callable]) -> str:
+    """Returns a string that changes whenever the output of a text parser / tokenizer wrapper may change.
+
+    Parsers may define a ``fingerprint()`` method to take full control over this. Otherwise, the fingerprint is
+    built from the parser class, its public-ish configuration (labels, normalization flags), the vocabulary of a
+    wrapped tokenizer if any, and the tokenization of a fixed probe string.
+    """
+    if parser is None:
+        return 'none'
+    if hasattr(parser, 'fingerprint') and callable(parser.fingerprint):
+        return str(parser.fingerprint())
+
+    state = {'type': f'{type(parser).__module__}.{type(parser).__qualname__}'}
+    for attr in (
+        '_labels',
+        '_unk_id',
+        '_blank_id',
+        '_do_normalize',
+        '_do_lowercase',
+        '_do_tokenize',
+        'abbreviation_version',
+    ):
+        if hasattr(parser, attr):
+            state[attr] = repr(getattr(parser, attr))
+
+    tokenizer = getattr(parser, '_tokenizer', None)
+    if tokenizer is not None:
+        state['tokenizer'] = f'{type(tokenizer).__module__}.{type(tokenizer).__qualname__}'
+        state['vocab_size'] = repr(getattr(tokenizer, 'vocab_size', None))
+        vocab = getattr(tokenizer, 'vocab', None)
+        if vocab is not None:
+            state['vocab'] = hashlib.sha256(repr(vocab).encode('utf-8')).hexdigest()
+
+    try:
+        state['probe'] = repr(parser(PROBE_TEXT))
+    except Exception:
+        # e.g. aggregate tokenizers require a language argument
+        state['probe'] = None
+
+    return hashlib.sha256(json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class ManifestCache(ColumnarCache):
+    """On-disk columnar cache of a collection built from one or more manifest files.
+
+    Args:
+        cache_dir: directory holding cache entries.
+        manifests_files: either a single manifest file or a list of manifest files.
+        parser: text parser / tokenizer wrapper applied to the transcripts.
+        parse_func: optional custom manifest line parser.
+        **settings: JSON-serializable collection settings that affect the result (filters, sorting, ...).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        manifests_files: Union[str, List[str]],
+        parser: Optional[Callable] = None,
+        parse_func: Optional[Callable] = None,
+        **settings,
+    ):
+        super().__init__(
+            cache_dir,
+            manifests_files,
+            parser=get_parser_fingerprint(parser),
+            parse_func=None if parse_func is None else f'{parse_func.__module__}.{parse_func.__qualname__}',
+            **settings,
+        )
@@ -191,6 +191,12 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
         else:
             return self.tokenizer.encode_as_ids(text)
 
+    def batch_text_to_ids(self, texts: List[str]) -> List[List[int]]:
+        """Converts a list of texts to lists of ids, encoding them in a single SentencePiece call when possible."""
+        if self.legacy or (self.removed_extra_spaces and not self.ignore_extra_whitespaces):
+            return [self._text_to_ids(text) for text in texts]
+        return self.tokenizer.encode_as_ids(list(texts))
+
     def _text_to_ids_extra_space(self, text, sample_alpha=None):
         ids = []
         encoding_kwargs = {}
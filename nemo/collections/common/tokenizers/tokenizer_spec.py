@@ -48,6 +48,10 @@ class TokenizerSpec(ABC):
     def ids_to_text(self, ids):
         pass
 
+    def batch_text_to_ids(self, texts: List[str]) -> List[List[int]]:
+        """Converts a list of texts to lists of ids. Tokenizers may override it with a faster batched implementation."""
+        return [self.text_to_ids(text) for text in texts]
+
     def add_special_tokens(self, special_tokens: List[str]):
         raise NotImplementedError("To be implemented")
 
@@ -695,8 +695,14 @@ class GPTSFTPackedDataset(GPTSFTDataset):
         return {'input_ids': input_ids, 'seq_boundaries': seq_boundaries, 'loss_mask': loss_mask}
 
     def _load_dataset(self):
+        # Imported here since `packed_sequence` depends on this module.
+        from nemo.collections.llm.gpt.data.packed_sequence import PackedSequenceMemMap, is_memmap_packed_dataset
+
         try:
-            self.indexed_dataset = np.load(self.file_path, allow_pickle=True)
+            if is_memmap_packed_dataset(self.file_path):
+                self.indexed_dataset = PackedSequenceMemMap(self.file_path)
+            else:
+                self.indexed_dataset = np.load(self.file_path, allow_pickle=True)
         except Exception as e:
             logging.error(
                 f"Failed to load packed dataset. The dataset should be a `.npy` file. "
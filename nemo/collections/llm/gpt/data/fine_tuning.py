@@ -130,6 +130,8 @@ class FineTuningDataModule(pl.LightningDataModule):
                     max_seq_length=self.seq_length,
                     seed=self.seed,
                     output_metadata_path=self.pack_metadata,
+                    streaming=self.packed_sequence_specs.streaming_preparation,
+                    num_workers=self.packed_sequence_specs.preparation_num_workers,
                 )
 
             if not self.validation_path_packed.is_file():
@@ -141,6 +143,8 @@ class FineTuningDataModule(pl.LightningDataModule):
                     max_seq_length=self.seq_length,
                     seed=self.seed,
                     output_metadata_path=self.pack_metadata,
+                    streaming=self.packed_sequence_specs.streaming_preparation,
+                    num_workers=self.packed_sequence_specs.preparation_num_workers,
                 )
 
     def setup(self, stage: str):
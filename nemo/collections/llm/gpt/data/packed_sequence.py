@@ -11,17 +11,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
 import json
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple, Union
 
 import numpy as np
+from tqdm import tqdm
 
 from nemo.collections.common.tokenizers import TokenizerSpec
 from nemo.collections.llm.gpt.data.core import create_sft_dataset
 from nemo.utils import logging
-from nemo.utils.sequence_packing_utils import create_hist, create_packing_strategy, fill_packing_strategy
+from nemo.utils.sequence_packing_utils import (
+    assign_sequences_to_packs,
+    create_hist,
+    create_packing_strategy,
+    fill_packing_strategy,
+)
+
+# Layout of the token buffer of packed datasets prepared with `streaming=True`.
+PACKED_TOKEN_DTYPE = np.dtype([('input_ids', np.int32), ('loss_mask', np.bool_)])
+
+# Module-level state inherited by forked tokenization workers, so that the dataset is never pickled.
+_TOKENIZE_STATE = {}
 
 
 def tokenize_dataset(path: Path, tokenizer: TokenizerSpec, max_seq_length: int, seed: int):
@@ -48,6 +65,198 @@ def tokenize_dataset(path: Path, tokenizer: TokenizerSpec, max_seq_length: int,
     return np.array([dataset[i] for i in range(len(dataset))])
 
 
+def get_packed_index_paths(path: Union[str, Path]) -> Tuple[Path, Path]:
+    """
+    Returns the paths of the pack and sequence offsets stored next to the token buffer of a packed dataset
+    prepared with `streaming=True`, e.g. `training_2048.pack_idx.npy` and `training_2048.seq_idx.npy`
+    for `training_2048.npy`.
+    """
+    path = Path(path)
+    return path.with_suffix('.pack_idx.npy'), path.with_suffix('.seq_idx.npy')
+
+
+def is_memmap_packed_dataset(path: Union[str, Path]) -> bool:
+    """Whether the packed dataset at `path` was prepared with `streaming=True` and can be memory-mapped."""
+    with open(path, 'rb') as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            _, _, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            _, _, dtype = np.lib.format.read_array_header_2_0(f)
+    return dtype == PACKED_TOKEN_DTYPE
+
+
+class PackedSequenceMemMap:
+    """
+    Read-only, memory-mapped view of a packed dataset prepared with `streaming=True`.
+
+    The dataset is made of a flat buffer of (token, loss mask) pairs, the offsets of every sequence in that buffer
+    and the offsets of the first sequence of every pack. Items are dictionaries with the same keys as the items of
+    packed datasets stored as pickled `.npy` arrays ('input_ids', 'loss_mask' and 'seq_start_id'), with
+    'input_ids' and 'loss_mask' returned as NumPy arrays.
+
+    Args:
+        path: path to the token buffer (`.npy` file). The index files are found with `get_packed_index_paths`.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = str(path)
+        self._open()
+
+    def _open(self):
+        pack_idx_path, seq_idx_path = get_packed_index_paths(self.path)
+        self._tokens = np.load(self.path, mmap_mode='r')
+        self._pack_offsets = np.load(pack_idx_path, mmap_mode='r')
+        self._seq_offsets = np.load(seq_idx_path, mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self._pack_offsets) - 1
+
+    def __getitem__(self, idx: int) -> Dict:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Index {idx} out of range for a packed dataset of {len(self)} sequences")
+        seq_offsets = np.asarray(self._seq_offsets[self._pack_offsets[idx] : self._pack_offsets[idx + 1] + 1])
+        tokens = self._tokens[seq_offsets[0] : seq_offsets[-1]]
+        return {
+            'input_ids': tokens['input_ids'].astype(np.int64),
+            'loss_mask': np.array(tokens['loss_mask']),
+            'seq_start_id': (seq_offsets[:-1] - seq_offsets[0]).tolist(),
+        }
+
+    def __getstate__(self):
+        # Memory maps are reopened instead of being copied into dataloader worker processes.
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self._open()
+
+
+def _tokenize_chunk(bounds: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    dataset = _TOKENIZE_STATE['dataset']
+    items = [dataset[i] for i in range(*bounds)]
+    lengths = np.array([len(item['input_ids']) for item in items], dtype=np.int64)
+    answer_start_idx = np.array([item.get('answer_start_idx', 0) for item in items], dtype=np.int64)
+    tokens = np.fromiter(
+        itertools.chain.from_iterable(item['input_ids'] for item in items), dtype=np.int32, count=int(lengths.sum())
+    )
+    return tokens, lengths, answer_start_idx
+
+
+def _iter_tokenized_chunks(
+    dataset, chunk_size: int, num_workers: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Tokenizes a dataset in chunks of consecutive samples, in order, using a pool of forked workers if requested."""
+    chunks = [(start, min(start + chunk_size, len(dataset))) for start in range(0, len(dataset), chunk_size)]
+    _TOKENIZE_STATE['dataset'] = dataset
+    try:
+        if num_workers > 1 and 'fork' in mp.get_all_start_methods():
+            with mp.get_context('fork').Pool(num_workers) as pool:
+                yield from pool.imap(_tokenize_chunk, chunks)
+        else:
+            if num_workers > 1:
+                logging.warning("The 'fork' start method is not available, the dataset is tokenized serially.")
+            yield from map(_tokenize_chunk, chunks)
+    finally:
+        _TOKENIZE_STATE.clear()
+
+
+def _prepare_packed_sequence_data_streaming(
+    input_path: Path,
+    output_path: Path,
+    packed_sequence_size: int,
+    tokenizer: TokenizerSpec,
+    max_seq_length: int,
+    seed: Optional[int],
+    packing_algorithm: str,
+    num_workers: int,
+    chunk_size: int,
+) -> Dict[str, int]:
+    """
+    Out-of-core version of `prepare_packed_sequence_data`.
+
+    Tokenized samples are appended to a temporary flat token file chunk by chunk, so that only the sequence lengths
+    are kept in memory while packing. Packs are then gathered from the (memory-mapped) temporary file block by block
+    directly into the memory-mapped output buffer. For a given random state, the packs are the same as the ones
+    produced by `fill_packing_strategy`.
+
+    Returns:
+        The packing metadata.
+    """
+    dataset = create_sft_dataset(
+        path=input_path,
+        tokenizer=tokenizer,
+        seq_length=max_seq_length,
+        seed=seed,
+        is_test=True,
+    )
+    if len(dataset) == 0:
+        raise ValueError(f"Cannot prepare a packed dataset from {input_path}: the dataset is empty.")
+
+    output_path = Path(output_path)
+    pack_idx_path, seq_idx_path = get_packed_index_paths(output_path)
+    tmp_dir = tempfile.mkdtemp(dir=output_path.parent, prefix=f'.{output_path.stem}.')
+    try:
+        # Tokenize into a flat token file, keeping only per-sequence lengths and answer start indices in memory.
+        tokens_path = os.path.join(tmp_dir, 'tokens.bin')
+        lengths, answer_start_idx = [], []
+        with open(tokens_path, 'wb') as f:
+            for chunk_tokens, chunk_lengths, chunk_answer_start_idx in _iter_tokenized_chunks(
+                dataset, chunk_size, num_workers
+            ):
+                f.write(chunk_tokens.tobytes())
+                lengths.append(chunk_lengths)
+                answer_start_idx.append(chunk_answer_start_idx)
+        lengths = np.concatenate(lengths)
+        answer_start_idx = np.concatenate(answer_start_idx)
+
+        # Same histogram as `create_hist`.
+        seqlens = lengths - 1
+        if seqlens.max() > max_seq_length:
+            raise ValueError(f"Found a sequence of length {seqlens.max()} exceeding max_seq_length={max_seq_length}")
+        histogram = np.bincount(seqlens, minlength=max_seq_length + 1).tolist()
+        assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
+        sequence_ids, pack_offsets = assign_sequences_to_packs(assignments, seqlens, packed_sequence_size)
+        del assignments
+
+        token_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=token_offsets[1:])
+        packed_lengths = lengths[sequence_ids]
+        seq_offsets = np.zeros(len(sequence_ids) + 1, dtype=np.int64)
+        np.cumsum(packed_lengths, out=seq_offsets[1:])
+
+        source = np.memmap(tokens_path, dtype=np.int32, mode='r')
+        tmp_output_path = os.path.join(tmp_dir, 'packed.npy')
+        packed = np.lib.format.open_memmap(
+            tmp_output_path, mode='w+', dtype=PACKED_TOKEN_DTYPE, shape=(int(seq_offsets[-1]),)
+        )
+        for start in tqdm(range(0, len(sequence_ids), chunk_size), desc="Writing packed sequences"):
+            end = min(start + chunk_size, len(sequence_ids))
+            ids, block_lengths = sequence_ids[start:end], packed_lengths[start:end]
+            out_start, out_end = seq_offsets[start], seq_offsets[end]
+            position = np.arange(out_end - out_start) - np.repeat(seq_offsets[start:end] - out_start, block_lengths)
+            input_ids = source[np.repeat(token_offsets[ids], block_lengths) + position]
+            packed['input_ids'][out_start:out_end] = input_ids
+            packed['loss_mask'][out_start:out_end] = (position >= np.repeat(answer_start_idx[ids], block_lengths)) & (
+                input_ids != tokenizer.eos_id
+            )
+        packed.flush()
+        del packed, source
+
+        # The token buffer is moved last: its existence marks a complete dataset.
+        np.save(os.path.join(tmp_dir, 'pack_idx.npy'), pack_offsets)
+        np.save(os.path.join(tmp_dir, 'seq_idx.npy'), seq_offsets)
+        os.replace(os.path.join(tmp_dir, 'pack_idx.npy'), pack_idx_path)
+        os.replace(os.path.join(tmp_dir, 'seq_idx.npy'), seq_idx_path)
+        os.replace(tmp_output_path, output_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return packing_metadata
+
+
 def prepare_packed_sequence_data(
     input_path: Path,
     output_path: Path,
@@ -57,6 +266,9 @@ def prepare_packed_sequence_data(
     max_seq_length: int,
     seed: Optional[int] = 0,
     packing_algorithm: str = "first_fit_shuffle",
+    streaming: bool = False,
+    num_workers: int = 0,
+    chunk_size: int = 4096,
 ):
     """
     Prepares a packed sequence dataset from a given input file and saves it to an output file.
@@ -68,22 +280,42 @@ def prepare_packed_sequence_data(
         tokenizer (TokenizerSpec): The tokenizer to use for tokenization.
         max_seq_length (int): Maximum sequence length for the tokens.
         seed (Optional[int]): Random seed for shuffling (optional).
-        packing_algorithm (str): The algorithm used for packing sequences
-                currently supports "first_fit_shuffle" and "first_fit_decreasing".
+        packing_algorithm (str): The algorithm used for packing sequences,
+                one of `nemo.utils.sequence_packing_utils.PACKING_ALGOS`.
+        streaming (bool): If True, prepare the packed dataset out of core: samples are tokenized chunk by chunk,
+                and the packed sequences are written as a flat token buffer (`output_path`) with pack and sequence
+                offsets (see `get_packed_index_paths`), which `GPTSFTPackedDataset` memory-maps. Peak memory does
+                not grow with the number of tokens in the dataset. Otherwise, all packed sequences are built in
+                memory and saved as a pickled object array.
+        num_workers (int): Number of processes used to tokenize the dataset when `streaming` is True.
+        chunk_size (int): Number of samples tokenized, and of sequences written, at once when `streaming` is True.
 
     Returns:
         None: Saves the packed sequence data to the specified output path.
     """
 
     logging.info(f"Preparing packed sequence from {input_path}")
-    dataset = tokenize_dataset(input_path, tokenizer, max_seq_length, seed)
-    sequences, histogram = create_hist(dataset, max_seq_length)
+    if streaming:
+        packing_metadata = _prepare_packed_sequence_data_streaming(
+            input_path=input_path,
+            output_path=output_path,
+            packed_sequence_size=packed_sequence_size,
+            tokenizer=tokenizer,
+            max_seq_length=max_seq_length,
+            seed=seed,
+            packing_algorithm=packing_algorithm,
+            num_workers=num_workers,
+            chunk_size=chunk_size,
+        )
+    else:
+        dataset = tokenize_dataset(input_path, tokenizer, max_seq_length, seed)
+        sequences, histogram = create_hist(dataset, max_seq_length)
 
-    assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
-    output_data = fill_packing_strategy(assignments, sequences, packed_sequence_size, tokenizer.eos_id)
+        assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
+        output_data = fill_packing_strategy(assignments, sequences, packed_sequence_size, tokenizer.eos_id)
 
-    # save output data
-    np.save(output_path, output_data)
+        # save output data
+        np.save(output_path, output_data)
 
     # save packing metadata, packing_metadata is appended to the packing file if it exists
     if output_metadata_path is not None:
@@ -143,6 +375,17 @@ class PackedSequenceSpecs:
     If True, pad cu_seqlens to a constant size, which is required for use with cudagraphs.
     """
 
+    streaming_preparation: bool = False
+    """
+    If True, prepare the packed datasets out of core and store them as a flat token buffer with an index
+    that is memory-mapped during training, instead of a pickled array. Recommended for large datasets.
+    """
+
+    preparation_num_workers: int = 0
+    """
+    Number of processes used to tokenize the dataset when `streaming_preparation` is True.
+    """
+
     def __post_init__(self):
         if self.packed_train_data_path is not None:
             self.packed_train_data_path = Path(self.packed_train_data_path)
@@ -31,6 +31,7 @@
 # with some modifications.
 
 import collections
+import importlib.util
 import os
 import subprocess
 import time
@@ -87,6 +88,24 @@ def compile_helper():
         sys.exit(1)
 
 
+def use_compiled_helpers() -> bool:
+    """
+    Whether to use the C++ dataset helpers rather than their NumPy implementation in `numpy_helpers`,
+    which builds identical indices without compiling anything at runtime.
+
+    Set with the NEMO_DATASET_HELPERS environment variable:
+        - "auto" (default): use the C++ helpers if they are already built, the NumPy implementation otherwise.
+        - "cpp": compile the C++ helpers if needed and use them.
+        - "numpy": always use the NumPy implementation.
+    """
+    impl = os.environ.get('NEMO_DATASET_HELPERS', 'auto').lower()
+    if impl not in ('auto', 'cpp', 'numpy'):
+        raise ValueError(f"NEMO_DATASET_HELPERS must be one of 'auto', 'cpp' or 'numpy', got '{impl}'")
+    if impl == 'auto':
+        return importlib.util.find_spec('nemo.collections.nlp.data.language_modeling.megatron.helpers') is not None
+    return impl == 'cpp'
+
+
 def get_a_and_b_segments(sample, np_rng):
     """Divide sample into a and b segments."""
 
@@ -1314,15 +1333,18 @@ def get_samples_mapping(
         verbose = torch.distributed.get_rank() == 0
         start_time = time.time()
         logging.info(' > building samples index mapping for {} ...'.format(name))
-        # First compile and then import.
-        try:
-            if is_global_rank_zero():
-                compile_helper()
-            from nemo.collections.nlp.data.language_modeling.megatron import helpers
-        except ImportError:
-            raise ImportError(
-                f'Could not compile megatron dataset C++ helper functions and therefore cannot import helpers python file.'
-            )
+        if use_compiled_helpers():
+            # First compile and then import.
+            try:
+                if is_global_rank_zero():
+                    compile_helper()
+                from nemo.collections.nlp.data.language_modeling.megatron import helpers
+            except ImportError:
+                raise ImportError(
+                    f'Could not compile megatron dataset C++ helper functions and therefore cannot import helpers python file.'
+                )
+        else:
+            from nemo.collections.nlp.data.language_modeling.megatron import numpy_helpers as helpers
         samples_mapping = helpers.build_mapping(
             indexed_dataset.doc_idx,
             indexed_dataset.sizes,
@@ -651,19 +651,24 @@ def _build_index_mappings(
             )
             # sample-idx.
             start_time = time.time()
-            # Use C++ implementation for speed.
+            # Use C++ implementation for speed, or its vectorized NumPy equivalent.
             # First compile and then import.
             assert doc_idx.dtype == np.int32
             assert sizes.dtype == np.int32
-            try:
-                from nemo.collections.nlp.data.language_modeling.megatron.dataset_utils import compile_helper
-
-                compile_helper()
-                from nemo.collections.nlp.data.language_modeling.megatron import helpers
-            except ImportError:
-                raise ImportError(
-                    f'Could not compile megatron dataset C++ helper functions and therefore cannot import helpers python file.'
-                )
+            from nemo.collections.nlp.data.language_modeling.megatron.dataset_utils import use_compiled_helpers
+
+            if use_compiled_helpers():
+                try:
+                    from nemo.collections.nlp.data.language_modeling.megatron.dataset_utils import compile_helper
+
+                    compile_helper()
+                    from nemo.collections.nlp.data.language_modeling.megatron import helpers
+                except ImportError:
+                    raise ImportError(
+                        f'Could not compile megatron dataset C++ helper functions and therefore cannot import helpers python file.'
+                    )
+            else:
+                from nemo.collections.nlp.data.language_modeling.megatron import numpy_helpers as helpers
 
             sample_idx = helpers.build_sample_idx(
                 sizes, doc_idx, seq_length, num_epochs, tokens_per_epoch, drop_last, add_extra_token
@@ -30,6 +30,7 @@ from nemo.collections.nlp.data.language_modeling.megatron.dataset_utils import g
 from nemo.collections.nlp.data.language_modeling.text_memmap_dataset import JSONLMemMapDataset, OnlineSampleMapping
 from nemo.core.classes import Dataset
 from nemo.utils import logging
+from nemo.utils.columnar_cache import PROBE_TEXT, ColumnarCache, decode_string, encode_strings
 
 __all__ = ['GPTSFTDataset']
 
@@ -66,6 +67,7 @@ class GPTSFTDataset(Dataset):
         ceil_to_power_2: bool = False,
         get_attention_mask_from_fusion: bool = False,
         sanity_check_dist_workers: bool = True,
+        processed_cache_dir: Optional[str] = None,
     ):
         """
         file_path: Path to a JSONL GPT supervised fine-tuning dataset. Data is formatted as multiple JSON lines with each line formatted as follows. {'input': 'John von Neumann\nVon Neumann made fundamental contributions .... Q: What did the math of artificial viscosity do?', 'output': 'smoothed the shock transition without sacrificing basic physics'}
@@ -92,6 +94,7 @@ class GPTSFTDataset(Dataset):
         is_test: Whether this dataset is the test split.
         output_original_text (bool): if true, will keep the original text in the output alongside the tokenized ids.
         sanity_check_dist_workers (bool): if true, will run sanity check across workers when making mapping.
+        processed_cache_dir (str): if set, all examples are processed (templated, tokenized and truncated) once and stored as flat arrays in this directory, keyed by the data file, the tokenizer and the processing settings. The examples are split between all ranks, which should all construct the dataset. Examples are then sliced from the memory-mapped arrays instead of being processed again on every epoch and every run.
         """
         self.tokenizer = tokenizer
         self.file_path = file_path
@@ -121,6 +124,8 @@ class GPTSFTDataset(Dataset):
         self.ceil_to_power_2 = ceil_to_power_2
         self.get_attention_mask_from_fusion = get_attention_mask_from_fusion
         self.sanity_check_dist_workers = sanity_check_dist_workers
+        self.processed_cache_dir = processed_cache_dir
+        self.processed_examples = None
 
         if special_tokens is None:
             self.special_tokens = {
@@ -138,6 +143,9 @@ class GPTSFTDataset(Dataset):
         # Validate prompt template
         self._maybe_validate_prompt_template()
 
+        # Will be None after this call if `processed_cache_dir` is None
+        self._maybe_load_processed_examples()
+
         # Will be None after this call if `max_num_samples` is None
         self._build_samples_mapping()
 
@@ -228,6 +236,8 @@ class GPTSFTDataset(Dataset):
             auto_gen_idx = True
         else:
             auto_gen_idx = False
+        if self.processed_examples is not None:
+            return self._get_processed_example(idx, auto_gen_idx)
         try:
             example = self.indexed_dataset[idx]
             if auto_gen_idx:
@@ -237,6 +247,147 @@ class GPTSFTDataset(Dataset):
             raise e
         return self._process_example(example)
 
+    def _processed_cache(self):
+        tokenizer = self.tokenizer
+        return ColumnarCache(
+            self.processed_cache_dir,
+            self.file_path,
+            tokenizer=f'{type(tokenizer).__module__}.{type(tokenizer).__qualname__}',
+            tokenizer_probe=tokenizer.text_to_ids(PROBE_TEXT),
+            vocab_size=getattr(tokenizer, 'vocab_size', None),
+            bos_id=getattr(tokenizer, 'bos_id', None),
+            eos_id=getattr(tokenizer, 'eos_id', None),
+            space_sensitive=getattr(tokenizer, 'space_sensitive', False),
+            hf_dataset=self.hf_dataset,
+            prompt_template=self.prompt_template,
+            label_key=self.label_key,
+            truncation_fields=self.truncation_fields,
+            truncation_method=self.truncation_method,
+            max_seq_length=self.max_seq_length,
+            virtual_tokens=self.virtual_tokens,
+            tokens_to_generate=self.tokens_to_generate,
+            add_bos=self.add_bos,
+            add_eos=self.add_eos,
+            add_sep=self.add_sep,
+            sep_id=self.sep_id,
+            is_test=self.is_test,
+            output_original_text=self.output_original_text,
+        )
+
+    def _maybe_load_processed_examples(self):
+        if self.processed_cache_dir is None:
+            return
+        if type(self)._process_example is not GPTSFTDataset._process_example or (
+            type(self).__getitem__ is not GPTSFTDataset.__getitem__
+        ):
+            logging.warning(f"{type(self).__name__} does not support processed_cache_dir, it is ignored.")
+            return
+
+        cache = self._processed_cache()
+        self._build_processed_examples(cache)
+        loaded = cache.load()
+        if loaded is None:
+            raise RuntimeError(f"Failed to load the processed examples of {self.file_path} from {cache.path}")
+        self.processed_examples = loaded[0]
+        logging.info(f"Loaded {len(self.indexed_dataset)} processed examples from {cache.path}")
+
+    def _build_processed_examples(self, cache):
+        """
+        Builds the processed examples cache unless it exists. The examples are split between all ranks, and every
+        rank writes its own part of the cache. The parts are then merged into a single cache entry.
+        """
+        is_distributed = torch.distributed.is_available() and torch.distributed.is_initialized()
+        rank = torch.distributed.get_rank() if is_distributed else 0
+        world_size = torch.distributed.get_world_size() if is_distributed else 1
+        parts = [cache.part(index, world_size) for index in range(world_size)]
+
+        def barrier():
+            if is_distributed:
+                torch.distributed.barrier()
+
+        def save_part(index):
+            if not parts[index].exists():
+                parts[index].save(*self._process_examples(index, world_size))
+
+        if not cache.exists():
+            save_part(rank)
+        barrier()
+
+        # The ranks sharing the cache directory of this rank are those whose part is visible. If the cache directory
+        # is not shared by all nodes, the parts written by the other nodes are missing and are split between them.
+        peers = [index for index in range(world_size) if parts[index].exists()]
+        # every rank lists the visible parts before any missing part is written
+        barrier()
+        if not cache.exists() and rank in peers:
+            missing = [index for index in range(world_size) if index not in peers]
+            for index in missing[peers.index(rank) :: len(peers)]:
+                save_part(index)
+        barrier()
+
+        if not cache.exists() and (rank not in peers or rank == peers[0]):
+            # Parts left over from an interrupted run may be mistaken for peers, they are built here if still missing
+            for index in range(world_size):
+                save_part(index)
+            cache.merge(
+                parts,
+                offsets_columns=('input_ids_offsets', 'metadata_offsets'),
+                meta={'file_path': self.file_path, 'num_examples': len(self.indexed_dataset)},
+            )
+            cache.remove_parts()
+        barrier()
+
+    def _process_examples(self, index, num_parts):
+        """Processes the `index`-th of `num_parts` contiguous parts of the dataset, and returns them as flat columns."""
+        num_examples = len(self.indexed_dataset)
+        start, stop = num_examples * index // num_parts, num_examples * (index + 1) // num_parts
+        logging.info(f"Processing examples {start} to {stop} of {num_examples} from {self.file_path}")
+        input_ids, answer_start_idx, answer_length, metadata = [], [], [], []
+        for idx in range(start, stop):
+            processed_example = self._process_example(self.indexed_dataset[idx])
+            # store token ids compactly, the python lists of all examples would not fit in memory
+            input_ids.append(np.asarray(processed_example['input_ids'], dtype=np.int32))
+            answer_start_idx.append(processed_example['answer_start_idx'])
+            answer_length.append(len(processed_example['answer_ids']))
+            metadata.append(json.dumps(processed_example['metadata']))
+
+        input_ids_offsets = np.zeros(len(input_ids) + 1, dtype=np.int64)
+        np.cumsum([len(ids) for ids in input_ids], out=input_ids_offsets[1:])
+        metadata, metadata_offsets = encode_strings(metadata)
+        columns = {
+            'input_ids': np.concatenate(input_ids) if input_ids else np.zeros(0, dtype=np.int32),
+            'input_ids_offsets': input_ids_offsets,
+            'answer_start_idx': np.asarray(answer_start_idx, dtype=np.int64),
+            'answer_length': np.asarray(answer_length, dtype=np.int64),
+            'metadata': metadata,
+            'metadata_offsets': metadata_offsets,
+        }
+        return columns, {'file_path': self.file_path, 'start': start, 'stop': stop}
+
+    def _get_processed_example(self, idx, auto_gen_idx=False):
+        """Returns the same example as `_process_example`, sliced from the processed examples."""
+        columns = self.processed_examples
+        input_ids = columns['input_ids'][columns['input_ids_offsets'][idx] : columns['input_ids_offsets'][idx + 1]]
+        input_ids = input_ids.tolist()
+        answer_start_idx = int(columns['answer_start_idx'][idx])
+        context_ids = input_ids[:answer_start_idx]
+        answer_ids = input_ids[answer_start_idx : answer_start_idx + int(columns['answer_length'][idx])]
+
+        metadata = json.loads(decode_string(columns['metadata'], columns['metadata_offsets'], idx))
+        if auto_gen_idx:
+            metadata['__AUTOGENERATED__'] = True
+
+        processed_example = {
+            'input_ids': input_ids,
+            'answer_start_idx': answer_start_idx,
+            'context_ids': context_ids,
+            'context_length': len(context_ids),
+            'answer_ids': answer_ids,
+            'metadata': metadata,
+            'token_count': len(input_ids),
+        }
+
+        return processed_example
+
     def _separate_template(self, prompt_template_values: List[str]):
         """
         Combine contexts and label based on prompt_template into a list of strings and a list of keys.
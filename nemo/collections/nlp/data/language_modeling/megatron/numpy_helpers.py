@@ -0,0 +1,418 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+NumPy implementations of the index builders of helpers.cpp, with identical outputs.
+
+They are used when the C++ helpers are not built, so that datasets can be set up without compiling them at runtime,
+which needs a compiler and races across ranks. Random numbers are drawn from the same Mersenne Twister streams as
+`std::mt19937` and `std::mt19937_64`.
+"""
+
+import math
+
+import numpy as np
+
+from nemo.utils import logging
+
+__all__ = ['build_blending_indices', 'build_blocks_mapping', 'build_mapping', 'build_sample_idx']
+
+# Same constant as in helpers.cpp
+LONG_SENTENCE_LEN = 512
+
+# Number of random numbers drawn at once
+_RANDOM_BUFFER_SIZE = 1 << 16
+
+_MT64_N = 312
+_MT64_M = 156
+_MT64_MATRIX_A = np.uint64(0xB5026F5AA96619E9)
+_MT64_UPPER_MASK = np.uint64(0xFFFFFFFF80000000)
+_MT64_LOWER_MASK = np.uint64(0x7FFFFFFF)
+
+
+class _MT19937_64:
+    """64-bit Mersenne Twister, producing the same numbers as `std::mt19937_64`."""
+
+    def __init__(self, seed: int):
+        state = [seed & 0xFFFFFFFFFFFFFFFF]
+        for i in range(1, _MT64_N):
+            prev = state[-1]
+            state.append((6364136223846793005 * (prev ^ (prev >> 62)) + i) & 0xFFFFFFFFFFFFFFFF)
+        self.state = np.array(state, dtype=np.uint64)
+
+    def _twist(self):
+        mt = self.state
+        new = np.empty_like(mt)
+
+        def mix(upper, lower):
+            y = (upper & _MT64_UPPER_MASK) | (lower & _MT64_LOWER_MASK)
+            return (y >> np.uint64(1)) ^ np.where(y & np.uint64(1), _MT64_MATRIX_A, np.uint64(0))
+
+        # Each part only depends on words of the previous state or of an earlier part
+        n, m = _MT64_N, _MT64_M
+        new[: n - m] = mt[m:] ^ mix(mt[: n - m], mt[1 : n - m + 1])
+        new[n - m : n - 1] = new[: m - 1] ^ mix(mt[n - m : n - 1], mt[n - m + 1 :])
+        new[n - 1] = new[m - 1] ^ mix(mt[n - 1 : n], new[0:1])[0]
+        self.state = new
+
+    def random(self, size: int) -> np.ndarray:
+        """Returns the next `size` numbers of the stream, as uint64."""
+        blocks = []
+        for _ in range(-(-size // _MT64_N)):
+            self._twist()
+            x = self.state.copy()
+            x ^= (x >> np.uint64(29)) & np.uint64(0x5555555555555555)
+            x ^= (x << np.uint64(17)) & np.uint64(0x71D67FFFEDA60000)
+            x ^= (x << np.uint64(37)) & np.uint64(0xFFF7EEE000000000)
+            x ^= x >> np.uint64(43)
+            blocks.append(x)
+        # Numbers past `size` are dropped, the stream is only used once
+        return np.concatenate(blocks)[:size] if blocks else np.zeros(0, dtype=np.uint64)
+
+
+class _MT19937:
+    """32-bit Mersenne Twister, producing the same numbers as `std::mt19937`, one at a time."""
+
+    def __init__(self, seed: int):
+        # The legacy seeding of RandomState is the standard initialization of the Mersenne Twister
+        self._rng = np.random.RandomState(seed & 0xFFFFFFFF)
+        self._buffer = []
+
+    def __call__(self) -> int:
+        if not self._buffer:
+            buffer = self._rng.randint(0, 2**32, size=_RANDOM_BUFFER_SIZE, dtype=np.uint32)
+            self._buffer = buffer[::-1].tolist()
+        return self._buffer.pop()
+
+
+def build_blending_indices(dataset_index, dataset_sample_index, weights, num_datasets, size, verbose):
+    """
+    Given multiple datasets and a weighting array, build samples such that it follows those weights.
+
+    Each sample is drawn from the dataset whose number of samples is the furthest below its target. This choice
+    depends on all the previous ones, so samples are assigned one at a time.
+    """
+    if verbose:
+        logging.info("> building indices for blendable datasets ...")
+
+    weights = [float(weight) for weight in weights[:num_datasets]]
+    datasets = range(1, num_datasets)
+    current_samples = [0] * num_datasets
+    indices = [0] * size
+    sample_indices = [0] * size
+    for sample_idx in range(size):
+        # Determine where the max error in sampling is happening.
+        sample_idx_double = max(float(sample_idx), 1.0)
+        max_error_index = 0
+        max_error = weights[0] * sample_idx_double - current_samples[0]
+        for dataset_idx in datasets:
+            error = weights[dataset_idx] * sample_idx_double - current_samples[dataset_idx]
+            if error > max_error:
+                max_error = error
+                max_error_index = dataset_idx
+
+        # Populate the indices.
+        indices[sample_idx] = max_error_index
+        sample_indices[sample_idx] = current_samples[max_error_index]
+
+        # Update the total samples.
+        current_samples[max_error_index] += 1
+
+    dataset_index[:size] = indices
+    dataset_sample_index[:size] = sample_indices
+
+    if verbose:
+        logging.info(" > sample ratios:")
+        for dataset_idx in range(num_datasets):
+            ratio = current_samples[dataset_idx] / size
+            logging.info(f"   dataset {dataset_idx}, input: {weights[dataset_idx]}, achieved: {ratio}")
+
+
+def build_sample_idx(sizes, doc_idx, seq_length, num_epochs, tokens_per_epoch, drop_last=True, add_extra_token=1):
+    """
+    Sample index (sample_idx) is used for gpt2 like dataset for which the documents are flattened and the samples
+    are built based on this 1-D flatten array. It is a 2D array with sizes [number-of-samples + 1, 2] where [..., 0]
+    contains the index into `doc_idx` and [..., 1] is the starting offset in that document.
+
+    Sample i starts at token i * seq_length of the flattened documents, and ends add_extra_token tokens into the
+    next one. It is located in the document with a binary search over the cumulative document lengths.
+    """
+    assert seq_length > 1
+    assert num_epochs > 0
+    assert tokens_per_epoch > 1
+
+    num_tokens = num_epochs * tokens_per_epoch - add_extra_token
+    if drop_last:
+        num_samples = num_tokens // seq_length
+    else:
+        # Single precision, as in helpers.cpp
+        num_samples = int(np.ceil(np.float32(num_tokens) / np.float32(seq_length)))
+
+    logging.info(
+        f"    using:\n"
+        f"     number of documents:       {doc_idx.shape[0] // num_epochs}\n"
+        f"     number of epochs:          {num_epochs}\n"
+        f"     sequence length:           {seq_length}\n"
+        f"     total number of samples:   {num_samples}"
+    )
+
+    doc_lengths = sizes[doc_idx].astype(np.int64)
+    doc_ends = np.cumsum(doc_lengths)
+
+    # A sample ends in the first document which contains its last token, it is also where the next sample starts
+    sample_starts = np.arange(1, num_samples + 1, dtype=np.int64) * seq_length
+    doc_idx_index = np.searchsorted(doc_ends, sample_starts + add_extra_token, side='left')
+    # The last sample may end after the last document, it is then cut at the end of the last document
+    past_end = doc_idx_index == len(doc_ends)
+    doc_idx_index[past_end] = len(doc_ends) - 1
+    doc_offset = sample_starts - (doc_ends[doc_idx_index] - doc_lengths[doc_idx_index])
+    doc_offset[past_end] = doc_lengths[-1] - add_extra_token
+
+    sample_idx = np.zeros((num_samples + 1, 2), dtype=np.int32)
+    sample_idx[1:, 0] = doc_idx_index
+    sample_idx[1:, 1] = doc_offset
+    return sample_idx
+
+
+def _get_target_sample_len(short_seq_ratio, max_length, rand32_gen):
+    """Training sample length."""
+    if short_seq_ratio == 0:
+        return max_length
+    random_number = rand32_gen()
+    if (random_number % short_seq_ratio) == 0:
+        return 2 + random_number % (max_length - 1)
+    return max_length
+
+
+def build_mapping(
+    docs, sizes, num_epochs, max_num_samples, max_seq_length, short_seq_prob, seed, verbose, min_num_sent
+):
+    """
+    Build a mapping of (start-index, end-index, sequence-length) where start and end index are the indices of the
+    sentences in the sample and sequence-length is the target sequence length.
+
+    Instead of adding sentences one at a time, the end of each sample is found with a binary search over the
+    cumulative sentence lengths. Without short sequences, target lengths are not random, so every epoch produces
+    the same samples and only the first one is built.
+    """
+    assert num_epochs > 0
+    assert max_seq_length > 1
+    assert 0.0 <= short_seq_prob <= 1.0
+    assert seed > 0
+
+    docs = np.asarray(docs, dtype=np.int64)
+    sizes = np.asarray(sizes)
+    num_docs = docs.shape[0] - 1
+
+    # For efficiency, convert probability to ratio.
+    short_seq_ratio = 0
+    if short_seq_prob > 0:
+        # Halves are rounded away from zero, as in C++
+        short_seq_ratio = int(math.floor(1.0 / short_seq_prob + 0.5))
+
+    if verbose:
+        logging.info(
+            f"    using:\n"
+            f"     number of documents:            {num_docs}\n"
+            f"     sentences range:                [{docs[0]}, {docs[-1]})\n"
+            f"     total number of sentences:      {docs[-1] - docs[0]}\n"
+            f"     number of epochs:               {num_epochs}\n"
+            f"     maximum number of samples:      {max_num_samples}\n"
+            f"     maximum sequence length:        {max_seq_length}\n"
+            f"     short sequence probability:     {short_seq_prob}\n"
+            f"     short sequence ration (1/prob): {short_seq_ratio}\n"
+            f"     seed:                           {seed}"
+        )
+
+    # Cumulative sentence lengths, the sentences [i, j) have sentence_ends[j] - sentence_ends[i] tokens
+    sentence_ends = np.zeros(sizes.shape[0] + 1, dtype=np.int64)
+    np.cumsum(sizes, out=sentence_ends[1:])
+    num_sents = docs[1:] - docs[:-1]
+    # Detect documents with long sentences.
+    long_sents = np.zeros(sizes.shape[0] + 1, dtype=np.int64)
+    np.cumsum(sizes > LONG_SENTENCE_LEN, out=long_sents[1:])
+    contains_long_sentence = (num_sents > 1) & (long_sents[docs[1:]] > long_sents[docs[:-1]])
+    valid_docs = np.flatnonzero((num_sents >= min_num_sent) & ~contains_long_sentence).tolist()
+    docs_list = docs.tolist()
+
+    if verbose:
+        logging.info(
+            f"   number of empty documents: {int(np.sum(num_sents == 0))}\n"
+            f"   number of documents with one sentence: {int(np.sum(num_sents == 1))}\n"
+            f"   number of documents with long sentences: {int(np.sum(contains_long_sentence))}"
+        )
+
+    rand32_gen = _MT19937(seed)
+
+    def build_epoch(samples):
+        for doc in valid_docs:
+            # Document sentences are in [sent_index_first, sent_index_last)
+            sent_index_first, sent_index_last = docs_list[doc], docs_list[doc + 1]
+            prev_start_index = sent_index_first
+            target_seq_len = _get_target_sample_len(short_seq_ratio, max_seq_length, rand32_gen)
+            while prev_start_index < sent_index_last:
+                # First sentence at which the target length is reached, with at least min_num_sent sentences
+                sent_index = int(
+                    np.searchsorted(sentence_ends, sentence_ends[prev_start_index] + target_seq_len, side='left') - 1
+                )
+                sent_index = max(sent_index, prev_start_index + min_num_sent - 1)
+                # Unless it leaves a single sentence in the document, then the sample goes to the end
+                if sent_index_last - 1 - sent_index <= 1:
+                    sent_index = sent_index_last - 1
+
+                samples.append((prev_start_index, sent_index + 1, target_seq_len))
+                prev_start_index = sent_index + 1
+                target_seq_len = _get_target_sample_len(short_seq_ratio, max_seq_length, rand32_gen)
+
+    samples = []
+    for epoch in range(num_epochs):
+        if len(samples) >= max_num_samples:
+            if verbose:
+                logging.info(f"    reached {max_num_samples} samples after {epoch} epochs ...")
+            break
+        if short_seq_ratio == 0 and epoch > 0:
+            # Every epoch produces the samples of the first one
+            num_epoch_samples = len(samples)
+            if num_epoch_samples > 0:
+                num_epochs_used = min(num_epochs, -(-max_num_samples // num_epoch_samples))
+                samples = samples * num_epochs_used
+                if verbose and num_epochs_used < num_epochs:
+                    logging.info(f"    reached {max_num_samples} samples after {num_epochs_used} epochs ...")
+            break
+        build_epoch(samples)
+
+    num_samples = len(samples)
+    if verbose:
+        logging.info(f"   will create mapping for {num_samples} samples")
+
+    maps = _shuffled_mapping(samples, 3, sizes, seed, verbose)
+
+    if verbose:
+        logging.info(" > done building the mapping.")
+
+    return maps
+
+
+def _shuffled_mapping(samples, num_columns, sizes, seed, verbose):
+    """Mapping array of the samples, shuffled with the same swaps as helpers.cpp."""
+    num_samples = len(samples)
+    if sizes.size > np.iinfo(np.uint32).max:
+        if verbose:
+            logging.info("    using uint64 for data mapping...")
+        maps = np.array(samples, dtype=np.uint64).reshape(num_samples, num_columns)
+    else:
+        if verbose:
+            logging.info("    using uint32 for data mapping...")
+        maps = np.array(samples, dtype=np.uint32).reshape(num_samples, num_columns)
+
+    if num_samples > 1:
+        i = np.arange(num_samples - 1, 0, -1, dtype=np.uint64)
+        j = (_MT19937_64(seed + 1).random(num_samples - 1) % (i + np.uint64(1))).tolist()
+        permutation = list(range(num_samples))
+        for i, j in zip(range(num_samples - 1, 0, -1), j):
+            permutation[i], permutation[j] = permutation[j], permutation[i]
+        maps = maps[permutation]
+    return maps
+
+
+def build_blocks_mapping(
+    docs, sizes, titles_sizes, num_epochs, max_num_samples, max_seq_length, seed, verbose, use_one_sent_blocks
+):
+    """
+    Build a mapping of (start-index, end-index, document-index, block-id) where start and end index are the
+    indices of the sentences in the block, document-index is the document the block comes from (used for fetching
+    titles) and block-id is the unique id of the block within an epoch.
+
+    Blocks are found with the same binary search as in `build_mapping`. Target lengths only depend on the titles,
+    so every epoch produces the same blocks and only the first one is built.
+    """
+    assert num_epochs > 0
+    assert max_seq_length > 1
+    assert seed > 0
+
+    docs = np.asarray(docs, dtype=np.int64)
+    sizes = np.asarray(sizes)
+    titles_sizes = np.asarray(titles_sizes, dtype=np.int64)
+    num_docs = docs.shape[0] - 1
+
+    if verbose:
+        logging.info(
+            f"    using:\n"
+            f"     number of documents:            {num_docs}\n"
+            f"     sentences range:                [{docs[0]}, {docs[-1]})\n"
+            f"     total number of sentences:      {docs[-1] - docs[0]}\n"
+            f"     number of epochs:               {num_epochs}\n"
+            f"     maximum number of samples:      {max_num_samples}\n"
+            f"     maximum sequence length:        {max_seq_length}\n"
+            f"     seed:                           {seed}"
+        )
+
+    # Acceptable number of sentences per block.
+    min_num_sent = 1 if use_one_sent_blocks else 2
+
+    sentence_ends = np.zeros(sizes.shape[0] + 1, dtype=np.int64)
+    np.cumsum(sizes, out=sentence_ends[1:])
+    num_sents = docs[1:] - docs[:-1]
+    long_sents = np.zeros(sizes.shape[0] + 1, dtype=np.int64)
+    np.cumsum(sizes > LONG_SENTENCE_LEN, out=long_sents[1:])
+    contains_long_sentence = (num_sents >= min_num_sent) & (long_sents[docs[1:]] > long_sents[docs[:-1]])
+    valid_docs = np.flatnonzero((num_sents >= min_num_sent) & ~contains_long_sentence).tolist()
+    docs_list = docs.tolist()
+    target_seq_lens = (max_seq_length - titles_sizes[:num_docs]).tolist()
+
+    if verbose:
+        logging.info(
+            f"   number of empty documents: {int(np.sum(num_sents == 0))}\n"
+            f"   number of documents with one sentence: {int(np.sum(num_sents == 1))}\n"
+            f"   number of documents with long sentences: {int(np.sum(contains_long_sentence))}"
+        )
+
+    samples = []
+    block_id = 0
+    for doc in valid_docs:
+        sent_index_first, sent_index_last = docs_list[doc], docs_list[doc + 1]
+        prev_start_index = sent_index_first
+        target_seq_len = target_seq_lens[doc]
+        while prev_start_index < sent_index_last:
+            # First sentence at which the target length is reached, with at least min_num_sent sentences
+            sent_index = int(
+                np.searchsorted(sentence_ends, sentence_ends[prev_start_index] + target_seq_len, side='left') - 1
+            )
+            sent_index = max(sent_index, prev_start_index + min_num_sent - 1)
+            # Unless it leaves less than min_num_sent sentences in the document, then the block goes to the end
+            if sent_index_last - 1 - sent_index < min_num_sent:
+                sent_index = sent_index_last - 1
+
+            samples.append((prev_start_index, sent_index + 1, doc, block_id))
+            block_id += 1
+            prev_start_index = sent_index + 1
+
+    # Every epoch produces the blocks of the first one, with the same ids
+    num_epochs_used = num_epochs
+    if len(samples) > 0:
+        num_epochs_used = min(num_epochs, -(-max_num_samples // len(samples)))
+        if verbose and num_epochs_used < num_epochs:
+            logging.info(f"    reached {max_num_samples} samples after {num_epochs_used} epochs ...")
+    samples = samples * num_epochs_used
+
+    num_samples = len(samples)
+    if verbose:
+        logging.info(f"   will create mapping for {num_samples} samples")
+
+    maps = _shuffled_mapping(samples, 4, sizes, seed, verbose)
+
+    if verbose:
+        logging.info(" > done building the mapping.")
+
+    return maps
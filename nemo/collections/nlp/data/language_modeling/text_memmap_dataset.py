@@ -18,6 +18,7 @@ import multiprocessing as mp
 import os
 import pickle
 import time
+from collections import deque
 from functools import lru_cache, partial
 from typing import Callable, List, Optional, Type
 
@@ -32,33 +33,66 @@ __idx_version__ = "0.2"  # index file version
 __idx_suffix__ = "idx"  # index file suffix
 
 
-def _build_index_from_memdata(fn, newline_int):
+# Number of bytes of the memmap compared at once when searching for newlines, bounds the temporary memory used
+_INDEX_WINDOW_SIZE = 64 * 1024 * 1024
+# Number of bytes of a file indexed by a single worker, larger files are split across workers
+_INDEX_SEGMENT_SIZE = 1024 * 1024 * 1024
+
+
+def _find_newlines(fn, newline_int, start=0, end=None, window_size=_INDEX_WINDOW_SIZE):
     """
-    Build index of delimiter positions between samples in memmap.
-    Can be provided externally.
+    Find the positions of newline_int in the bytes [start, end) of a file.
+    The memmap is scanned one window at a time, so memory does not grow with the size of the file.
 
-    Returns a 1D array of ints.
+    Returns a 1D array of int64.
     """
     # use memmap to read file
     mdata = np.memmap(fn, dtype=np.uint8, mode="r")
-    # find newline positions
-    midx = np.where(mdata == newline_int)[0]
-    midx_dtype = midx.dtype
-    # make sure to account for all data
-    midx = midx.tolist()
-    # add last item in case there is no new-line at the end of the file
-    if (len(midx) == 0) or (midx[-1] + 1 != len(mdata)):
-        midx = midx + [len(mdata) + 1]
+    if end is None:
+        end = len(mdata)
 
-    # remove empty lines from end of file
-    while len(midx) > 1 and (midx[-1] - midx[-2]) < 2:
-        midx.pop(-1)
-    midx = np.asarray(midx, dtype=midx_dtype)
+    positions = [np.zeros(0, dtype=np.int64)]
+    for window_start in range(start, end, window_size):
+        window = mdata[window_start : min(window_start + window_size, end)]
+        positions.append(np.flatnonzero(window == newline_int).astype(np.int64) + window_start)
+        del window
 
     # free memmap
     mdata._mmap.close()
     del mdata
 
+    return np.concatenate(positions)
+
+
+def _num_index_lines(midx, data_size):
+    """
+    Returns the number of entries of the newline positions midx that are kept in the index of a file of data_size
+    bytes, and the position to append to them in case there is no new-line at the end of the file (or None).
+    """
+    num_lines = len(midx)
+    # add last item in case there is no new-line at the end of the file (the file does not end with empty lines then)
+    if (num_lines == 0) or (midx[-1] + 1 != data_size):
+        return num_lines, data_size + 1
+
+    # remove empty lines from end of file
+    while num_lines > 1 and (midx[num_lines - 1] - midx[num_lines - 2]) < 2:
+        num_lines -= 1
+    return num_lines, None
+
+
+def _build_index_from_memdata(fn, newline_int):
+    """
+    Build index of delimiter positions between samples in memmap.
+    Can be provided externally.
+
+    Returns a 1D array of ints.
+    """
+    midx = _find_newlines(fn, newline_int)
+    num_lines, last_idx = _num_index_lines(midx, os.path.getsize(fn))
+    midx = midx[:num_lines]
+    if last_idx is not None:
+        midx = np.append(midx, np.int64(last_idx))
+
     return midx
 
 
@@ -511,14 +545,138 @@ def _build_memmap_index_files(newline_int, build_index_fn, fn, index_mapping_dir
         return True
 
 
+def _find_newlines_in_segment(newline_int, window_size, segment):
+    """Helper function to find the newline positions of a segment (fn, start, end) of a file"""
+    fn, start, end = segment
+    return _find_newlines(fn, newline_int, start=start, end=end, window_size=window_size)
+
+
+def _imap_bounded(pool, func, items, max_in_flight):
+    """
+    Ordered equivalent of pool.imap, which submits a new item only once the result of an earlier one is consumed,
+    so that at most max_in_flight results are held in memory.
+    """
+    in_flight = deque()
+    for item in items:
+        in_flight.append(pool.apply_async(func, (item,)))
+        if len(in_flight) >= max_in_flight:
+            yield in_flight.popleft().get()
+    while in_flight:
+        yield in_flight.popleft().get()
+
+
+class _IndexFileWriter:
+    """
+    Writes the index file of a data file incrementally, from the newline positions of its consecutive segments.
+
+    Positions are appended to a temporary raw file, which is copied into the .npy index file once all the
+    segments are written, so the index is never fully loaded in memory.
+    """
+
+    def __init__(self, fn: str, idx_fn: str):
+        self.fn = fn
+        self.idx_fn = idx_fn
+        self._tmp_fn = idx_fn + ".npy.tmp"
+        self._fp = open(self._tmp_fn, "wb")
+        self._num_positions = 0
+
+    def write(self, positions: np.ndarray):
+        """Appends the newline positions of the next segment of the file"""
+        positions.astype(np.int64, copy=False).tofile(self._fp)
+        self._num_positions += len(positions)
+
+    def abort(self):
+        """Removes the temporary file, when the index cannot be built"""
+        self._fp.close()
+        os.remove(self._tmp_fn)
+
+    def close(self, newline_int: int):
+        """Writes the .npy index file and its metadata file"""
+        self._fp.close()
+        if self._num_positions > 0:
+            positions = np.memmap(self._tmp_fn, dtype=np.int64, mode="r")
+        else:
+            positions = np.zeros(0, dtype=np.int64)
+        num_lines, last_idx = _num_index_lines(positions, os.path.getsize(self.fn))
+
+        # save index as numpy array to enable memmap reading
+        logging.info(f"Saving idx file = {self.idx_fn}.npy")
+        midx = np.lib.format.open_memmap(
+            self.idx_fn + ".npy", mode="w+", dtype=np.int64, shape=(num_lines + (last_idx is not None),)
+        )
+        chunk_size = _INDEX_WINDOW_SIZE // midx.itemsize
+        for start in range(0, num_lines, chunk_size):
+            end = min(start + chunk_size, num_lines)
+            midx[start:end] = positions[start:end]
+        if last_idx is not None:
+            midx[num_lines] = last_idx
+        midx.flush()
+        del midx, positions
+        os.remove(self._tmp_fn)
+
+        # create e metadata file
+        data = dict(newline_int=newline_int, version=__idx_version__)
+        logging.info(f"Saving metadata file = {self.idx_fn}.info")
+        with open(self.idx_fn + ".info", "wb") as fp:
+            pickle.dump(data, fp)
+
+
+def _build_memmap_index_files_in_segments(
+    pool, dataset_paths, newline_int, workers, index_mapping_dir: str, segment_size: Optional[int]
+):
+    """
+    Helper function to build the index files with the default newline search.
+
+    Files are split into segments of segment_size bytes which are searched in parallel, so that a single large
+    file is spread across workers. The index of each file is written incrementally, as its segments complete.
+    """
+    build_status = []
+    files = []
+    segments = []
+    for fn in dataset_paths:
+        idx_fn = _index_fn(fn, index_mapping_dir)
+        build_status.append(not _index_file_exists(idx_fn))
+        if not build_status[-1]:
+            continue
+
+        data_size = os.path.getsize(fn)
+        # an empty file still gets a segment, which raises the same error as indexing it in a single pass
+        file_segment_size = segment_size or max(data_size, 1)
+        starts = range(0, max(data_size, 1), file_segment_size)
+        files.append((fn, idx_fn, len(starts)))
+        segments.extend((fn, start, min(start + file_segment_size, data_size)) for start in starts)
+
+    results = _imap_bounded(
+        pool, partial(_find_newlines_in_segment, newline_int, _INDEX_WINDOW_SIZE), segments, 2 * workers
+    )
+    for fn, idx_fn, num_segments in files:
+        logging.info(f"Building indexing for fn = {fn}")
+        writer = _IndexFileWriter(fn, idx_fn)
+        try:
+            for _ in range(num_segments):
+                writer.write(next(results))
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close(newline_int)
+
+    return build_status
+
+
 def build_index_files(
     dataset_paths,
     newline_int,
     workers=None,
     build_index_fn=_build_index_from_memdata,
     index_mapping_dir: str = None,
+    segment_size: Optional[int] = _INDEX_SEGMENT_SIZE,
 ):
-    """Auxiliary method to build multiple index files"""
+    """
+    Auxiliary method to build multiple index files
+
+    With the default build_index_fn, files larger than segment_size bytes are split across workers
+    (None to index each file with a single worker), and index files are written with bounded memory.
+    """
     if len(dataset_paths) < 1:
         raise ValueError("files_list must contain at leat one file name")
 
@@ -530,15 +688,20 @@ def build_index_files(
     start_time = time.time()
     ctx = mp.get_context("fork")
     with ctx.Pool(workers) as p:
-        build_status = p.map(
-            partial(
-                _build_memmap_index_files,
-                newline_int,
-                build_index_fn,
-                index_mapping_dir=index_mapping_dir,
-            ),
-            dataset_paths,
-        )
+        if build_index_fn is _build_index_from_memdata:
+            build_status = _build_memmap_index_files_in_segments(
+                p, dataset_paths, newline_int, workers, index_mapping_dir, segment_size
+            )
+        else:
+            build_status = p.map(
+                partial(
+                    _build_memmap_index_files,
+                    newline_int,
+                    build_index_fn,
+                    index_mapping_dir=index_mapping_dir,
+                ),
+                dataset_paths,
+            )
 
     logging.info(
         f"Time building {sum(build_status)} / {len(build_status)} mem-mapped files: {datetime.timedelta(seconds=time.time() - start_time)}"
@@ -320,6 +320,9 @@ class MegatronGPTSFTModel(NLPAdapterModelMixin, MegatronGPTModel):
                     'chat_prompt_tokens', None
                 ),  # special tokens for the chat prompts, a dictionary of {token_type: token}. Default: {'system_turn_start': '<extra_id_0>', 'turn_start': '<extra_id_1>', 'label_start': '<extra_id_2>', 'end_of_turn': '\n', "end_of_name": "\n"}
                 is_test=not is_train,
+                processed_cache_dir=data_cfg.get(
+                    'processed_cache_dir', None
+                ),  # Directory to cache the processed (templated, tokenized and truncated) examples in.
                 **dataset_kwargs,
             )
             datasets.append(dataset)
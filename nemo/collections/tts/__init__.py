@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.tts import data, losses, models, modules
+import importlib
+from typing import TYPE_CHECKING
+
 from nemo.package_info import __version__
 
+if TYPE_CHECKING:
+    from nemo.collections.tts import data, g2p, losses, models, modules, parts, torch
+
 # Set collection version equal to NeMo version.
 __version = __version__
 
@@ -23,3 +28,16 @@ __author__ = "NVIDIA Corporation"
 
 # Set collection name.
 __description__ = "Text to Speech collection"
+
+# Submodules are imported on first access (PEP 562), so that using one of them does not import all the others.
+_SUBMODULES = ("data", "g2p", "losses", "models", "modules", "parts", "torch")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import json
 import math
+import multiprocessing
 import os
 import pickle
 import random
@@ -36,6 +38,8 @@ from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import (
 )
 from nemo.collections.tts.parts.utils.tts_dataset_utils import (
     BetaBinomialInterpolator,
+    FeatureStore,
+    FeatureStoreWriter,
     beta_binomial_prior_distribution,
     general_padding,
     get_base_dir,
@@ -77,6 +81,22 @@ WINDOW_FN_SUPPORTED = {
     'none': None,
 }
 
+# Supplementary data types computed from audio which TTSDataset.precompute_sup_data() can write to feature stores.
+PRECOMPUTABLE_SUP_DATA_TYPES = [LogMel, Pitch, Voiced_mask, P_voiced, Energy]
+SUP_DATA_STORE_NAME = "sup_data_store"
+
+# Dataset shared with forked precompute workers, so that it does not need to be pickled for every task.
+_PRECOMPUTE_DATASET = None
+
+
+def _init_precompute_worker():
+    torch.set_num_threads(1)
+
+
+def _precompute_sup_data_worker(index):
+    text_id, features = _PRECOMPUTE_DATASET.compute_sup_data(index)
+    return text_id, {name: feature.numpy() for name, feature in features.items()}
+
 
 class TTSDataset(Dataset):
     def __init__(
@@ -114,6 +134,8 @@ class TTSDataset(Dataset):
         """Dataset which can be used for training spectrogram generators and end-to-end TTS models.
         It loads main data types (audio, text) and specified supplementary data types (log mel, durations, align prior matrix, pitch, energy, speaker id).
         Some supplementary data types will be computed on the fly and saved in the sup_data_path if they did not exist before.
+        They can also be computed ahead of time with precompute_sup_data(), which stores each type in a single
+        memory mapped file that is read instead of the per-utterance files.
         Saved folder can be changed for some supplementary data types (see keyword args section).
         Arguments for supplementary data should be also specified in this class, and they will be used from kwargs (see keyword args section).
         Args:
@@ -345,6 +367,8 @@ class TTSDataset(Dataset):
 
         self.pad_multiple = pad_multiple
 
+        self.load_sup_data_stores()
+
     @staticmethod
     def filter_files(data, ignore_file, min_duration, max_duration, total_duration):
         if ignore_file:
@@ -519,6 +543,134 @@ class TTSDataset(Dataset):
             log_mel = torch.log(torch.clamp(mel, min=torch.finfo(mel.dtype).tiny))
         return log_mel
 
+    def get_voiced_features(self, audio):
+        pitch, voiced_mask, p_voiced = librosa.pyin(
+            audio.numpy(),
+            fmin=self.pitch_fmin,
+            fmax=self.pitch_fmax,
+            frame_length=self.win_length,
+            sr=self.sample_rate,
+            fill_na=0.0,
+        )
+        return (
+            torch.from_numpy(pitch).float(),
+            torch.from_numpy(voiced_mask).float(),
+            torch.from_numpy(p_voiced).float(),
+        )
+
+    def get_energy(self, audio):
+        spec = self.get_spec(audio)
+        return torch.linalg.norm(spec.squeeze(0), axis=0).float()
+
+    def _get_rel_audio_path_as_text_id(self, sample):
+        # Let's keep audio name and all internal directories in rel_audio_path_as_text_id to avoid any collisions
+        rel_audio_path = Path(sample["audio_filepath"]).relative_to(self.base_data_dir).with_suffix("")
+        return str(rel_audio_path).replace("/", "_")
+
+    def _get_sup_data_store_path(self, data_type):
+        return Path(getattr(self, f"{data_type.name}_folder")) / SUP_DATA_STORE_NAME
+
+    def _get_stored_sup_data(self, data_type, rel_audio_path_as_text_id):
+        store = self.sup_data_stores.get(data_type)
+        if store is None:
+            return None
+        return store.get(rel_audio_path_as_text_id)
+
+    def load_sup_data_stores(self):
+        """Opens the feature stores written by precompute_sup_data() for the requested supplementary data types."""
+        self.sup_data_stores = {}
+        for data_type in PRECOMPUTABLE_SUP_DATA_TYPES:
+            if data_type in self.sup_data_types_set:
+                store_path = self._get_sup_data_store_path(data_type)
+                if FeatureStore.exists(store_path):
+                    self.sup_data_stores[data_type] = FeatureStore(store_path)
+                    logging.info(f"Loaded {len(self.sup_data_stores[data_type])} {data_type.name} from {store_path}.")
+
+    def compute_sup_data(self, index):
+        """
+        Computes all precomputable supplementary data types for the sample at the given index.
+
+        Returns:
+            The text id of the sample, and a dictionary mapping the name of each data type to its feature.
+        """
+        sample = self.data[index]
+        rel_audio_path_as_text_id = self._get_rel_audio_path_as_text_id(sample)
+        audio = self.featurizer.process(
+            sample["audio_filepath"],
+            trim=self.trim,
+            trim_ref=self.trim_ref,
+            trim_top_db=self.trim_top_db,
+            trim_frame_length=self.trim_frame_length,
+            trim_hop_length=self.trim_hop_length,
+        )
+        audio = self._pad_wav_to_multiple(audio)
+
+        features = {}
+        if LogMel in self.sup_data_types_set:
+            features[LogMel.name] = self.get_log_mel(audio)
+
+        # pyin computes all voiced features at once, whichever of them are requested
+        voiced_types = [Pitch, Voiced_mask, P_voiced]
+        if any(data_type in self.sup_data_types_set for data_type in voiced_types):
+            for data_type, feature in zip(voiced_types, self.get_voiced_features(audio)):
+                if data_type in self.sup_data_types_set:
+                    features[data_type.name] = feature
+
+        if Energy in self.sup_data_types_set:
+            features[Energy.name] = self.get_energy(audio)
+
+        return rel_audio_path_as_text_id, features
+
+    def precompute_sup_data(self, num_workers: int = 1, chunksize: int = 8):
+        """
+        Computes log mel, pitch, voiced mask, p_voiced and energy (whichever are in sup_data_types) for the whole
+        dataset, and writes each type into a single feature store in its supplementary data folder. The stores are
+        read by __getitem__ before falling back to the per-utterance .pt files. Existing stores are overwritten.
+
+        Args:
+            num_workers: Number of worker processes. Samples are computed in the current process if num_workers <= 1.
+            chunksize: Number of samples sent to a worker at a time.
+        """
+        global _PRECOMPUTE_DATASET
+
+        data_types = [data_type for data_type in PRECOMPUTABLE_SUP_DATA_TYPES if data_type in self.sup_data_types_set]
+        if not data_types:
+            logging.warning("None of the requested supplementary data types can be precomputed.")
+            return
+
+        if self.segment_max_duration is not None:
+            raise ValueError("Supplementary data cannot be precomputed for randomly segmented audio.")
+
+        # Workers are forked so that they inherit the dataset instead of unpickling it, which the stft lambda prevents.
+        _PRECOMPUTE_DATASET = self
+        try:
+            with contextlib.ExitStack() as stack:
+                writers = {
+                    data_type: stack.enter_context(FeatureStoreWriter(self._get_sup_data_store_path(data_type)))
+                    for data_type in data_types
+                }
+
+                if num_workers > 1:
+                    pool = stack.enter_context(
+                        multiprocessing.get_context("fork").Pool(num_workers, initializer=_init_precompute_worker)
+                    )
+                    results = pool.imap(_precompute_sup_data_worker, range(len(self)), chunksize=chunksize)
+                else:
+                    results = map(_precompute_sup_data_worker, range(len(self)))
+
+                stored_ids = set()
+                for rel_audio_path_as_text_id, features in tqdm(results, total=len(self)):
+                    # The same audio file can appear several times in a manifest, it only needs to be stored once.
+                    if rel_audio_path_as_text_id in stored_ids:
+                        continue
+                    stored_ids.add(rel_audio_path_as_text_id)
+                    for data_type in data_types:
+                        writers[data_type].add(rel_audio_path_as_text_id, features[data_type.name])
+        finally:
+            _PRECOMPUTE_DATASET = None
+
+        self.load_sup_data_stores()
+
     def pitch_shift(self, audio, sr, rel_audio_path_as_text_id):
         audio_shifted_path = Path(self.sup_data_path) / f"{rel_audio_path_as_text_id}_pitch_shift.pt"
         if audio_shifted_path.exists() and self.cache_pitch_augment:
@@ -545,10 +697,7 @@ class TTSDataset(Dataset):
 
     def __getitem__(self, index):
         sample = self.data[index]
-
-        # Let's keep audio name and all internal directories in rel_audio_path_as_text_id to avoid any collisions
-        rel_audio_path = Path(sample["audio_filepath"]).relative_to(self.base_data_dir).with_suffix("")
-        rel_audio_path_as_text_id = str(rel_audio_path).replace("/", "_")
+        rel_audio_path_as_text_id = self._get_rel_audio_path_as_text_id(sample)
 
         if (
             self.segment_max_duration is not None
@@ -607,6 +756,8 @@ class TTSDataset(Dataset):
 
             if mel_path is not None and Path(mel_path).exists():
                 log_mel = torch.load(mel_path)
+            elif self._get_stored_sup_data(LogMel, rel_audio_path_as_text_id) is not None:
+                log_mel = self._get_stored_sup_data(LogMel, rel_audio_path_as_text_id)
             else:
                 mel_path = self.log_mel_folder / f"{rel_audio_path_as_text_id}.pt"
 
@@ -627,7 +778,8 @@ class TTSDataset(Dataset):
         # Load alignment prior matrix if needed
         align_prior_matrix = None
         if AlignPriorMatrix in self.sup_data_types_set:
-            mel_len = self.get_log_mel(audio).shape[2]
+            # Number of STFT frames (center=True), without computing the spectrogram.
+            mel_len = audio_length.item() // self.hop_len + 1
             if self.use_beta_binomial_interpolator:
                 align_prior_matrix = torch.from_numpy(self.beta_binomial_interpolator(mel_len, text_length.item()))
             else:
@@ -639,22 +791,18 @@ class TTSDataset(Dataset):
             if voiced_item in self.sup_data_types_set:
                 voiced_folder = getattr(self, f"{voiced_item.name}_folder")
                 voiced_filepath = voiced_folder / f"{rel_audio_path_as_text_id}.pt"
-                if voiced_filepath.exists():
+                stored_voiced = self._get_stored_sup_data(voiced_item, rel_audio_path_as_text_id)
+                if stored_voiced is not None:
+                    my_var.__setitem__(voiced_item.name, stored_voiced)
+                elif voiced_filepath.exists():
                     my_var.__setitem__(voiced_item.name, torch.load(voiced_filepath).float())
                 else:
                     non_exist_voiced_index.append((i, voiced_item.name, voiced_filepath))
 
         if len(non_exist_voiced_index) != 0:
-            voiced_tuple = librosa.pyin(
-                audio.numpy(),
-                fmin=self.pitch_fmin,
-                fmax=self.pitch_fmax,
-                frame_length=self.win_length,
-                sr=self.sample_rate,
-                fill_na=0.0,
-            )
+            voiced_tuple = self.get_voiced_features(audio)
             for i, voiced_name, voiced_filepath in non_exist_voiced_index:
-                my_var.__setitem__(voiced_name, torch.from_numpy(voiced_tuple[i]).float())
+                my_var.__setitem__(voiced_name, voiced_tuple[i])
                 torch.save(my_var.get(voiced_name), voiced_filepath)
 
         pitch = my_var.get('pitch', None)
@@ -681,7 +829,8 @@ class TTSDataset(Dataset):
                 else:
                     raise ValueError("Missing statistics for pitch normalization.")
 
-                pitch -= sample_pitch_mean
+                # Not in place, pitch may be a view of a feature store.
+                pitch = pitch - sample_pitch_mean
                 pitch[pitch == -sample_pitch_mean] = 0.0  # Zero out values that were previously zero
                 pitch /= sample_pitch_std
 
@@ -689,12 +838,14 @@ class TTSDataset(Dataset):
         energy, energy_length = None, None
         if Energy in self.sup_data_types_set:
             energy_path = self.energy_folder / f"{rel_audio_path_as_text_id}.pt"
+            stored_energy = self._get_stored_sup_data(Energy, rel_audio_path_as_text_id)
 
-            if energy_path.exists():
+            if stored_energy is not None:
+                energy = stored_energy
+            elif energy_path.exists():
                 energy = torch.load(energy_path).float()
             else:
-                spec = self.get_spec(audio)
-                energy = torch.linalg.norm(spec.squeeze(0), axis=0).float()
+                energy = self.get_energy(audio)
                 torch.save(energy, energy_path)
 
             energy_length = torch.tensor(len(energy)).long()
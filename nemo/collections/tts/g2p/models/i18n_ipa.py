@@ -15,7 +15,7 @@
 import pathlib
 import random
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 from nemo.collections.common.tokenizers.text_to_speech.ipa_lexicon import validate_locale
@@ -53,6 +53,7 @@ class IpaG2p(BaseG2p):
         grapheme_case: Optional[str] = GRAPHEME_CASE_UPPER,
         grapheme_prefix: Optional[str] = "",
         mapping_file: Optional[str] = None,
+        word_cache_size: int = 10000,
     ) -> None:
         """
         Generic IPA G2P module. This module converts words from graphemes to International Phonetic Alphabet
@@ -92,6 +93,11 @@ class IpaG2p(BaseG2p):
                 from phonemes because there may be overlaps between the two set. It is suggested to choose a prefix that
                 is not used or preserved somewhere else. "#" could be a good candidate. Default to "".
             TODO @borisfom: add docstring for newly added `mapping_file` argument.
+            word_cache_size (int): Maximum number of words whose dictionary lookup results are kept in an LRU cache,
+                so that frequent words do not go through the suffix and contraction rules again. The random choice
+                made by `phoneme_probability` is applied before the cache and is never cached. Call
+                `clear_word_cache()` after modifying `phoneme_dict`, `heteronyms` or `apply_to_oov_word` directly.
+                Set to 0 to disable the cache. Defaults to 10000.
         """
         self.use_stresses = use_stresses
         self.grapheme_case = grapheme_case
@@ -99,6 +105,8 @@ class IpaG2p(BaseG2p):
         self.phoneme_probability = phoneme_probability
         self.locale = locale
         self._rng = random.Random()
+        self.word_cache_size = word_cache_size
+        self._word_cache = OrderedDict()
 
         if locale is not None:
             validate_locale(locale)
@@ -224,6 +232,7 @@ class IpaG2p(BaseG2p):
         Replace model's phoneme dictionary with a custom one
         """
         self.phoneme_dict = self._parse_phoneme_dict(phoneme_dict)
+        self.clear_word_cache()
 
     @staticmethod
     def _parse_file_by_lines(p: Union[str, pathlib.Path]) -> List[str]:
@@ -339,10 +348,15 @@ class IpaG2p(BaseG2p):
             self.phoneme_dict.update(replacement_dict)
 
         self.symbols = new_symbols
+        self.clear_word_cache()
 
     def is_unique_in_phoneme_dict(self, word: str) -> bool:
         return len(self.phoneme_dict[word]) == 1
 
+    def clear_word_cache(self):
+        """Drops all cached word pronunciations."""
+        self._word_cache.clear()
+
     def parse_one_word(self, word: str) -> Tuple[List[str], bool]:
         """Returns parsed `word` and `status` (bool: False if word wasn't handled, True otherwise).
         """
@@ -356,6 +370,22 @@ class IpaG2p(BaseG2p):
         if self.phoneme_probability is not None and self._rng.random() > self.phoneme_probability:
             return self._prepend_prefix_for_one_word(word), True
 
+        if self.word_cache_size <= 0:
+            return self._lookup_one_word(word)
+
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            self._word_cache.move_to_end(word)
+            return cached
+
+        result = self._lookup_one_word(word)
+        self._word_cache[word] = result
+        if len(self._word_cache) > self.word_cache_size:
+            self._word_cache.popitem(last=False)
+        return result
+
+    def _lookup_one_word(self, word: str) -> Tuple[List[str], bool]:
+        """Deterministic part of `parse_one_word`, for a word that is not punctuation and was already cased."""
         # Heteronyms
         if self.heteronyms and word in self.heteronyms:
             return self._prepend_prefix_for_one_word(word), True
@@ -458,6 +488,32 @@ class IpaG2p(BaseG2p):
             except Exception as e:
                 logging.warning(f"Heteronym model failed {e}, skipping")
 
+        return self._text_to_phonemes(text)
+
+    def batch_call(self, texts: List[str], heteronym_batch_size: int = 32) -> List[List[str]]:
+        """
+        Converts a list of texts, equivalent to calling this module on each of them. Heteronyms of all texts are
+        disambiguated by the heteronym model (if any) in batches of `heteronym_batch_size` sentences, instead of
+        running the model once per sentence.
+
+        Args:
+            texts: Texts to convert.
+            heteronym_batch_size: Batch size used for heteronym model inference.
+
+        Returns:
+            List of phoneme (or grapheme) sequences, one per text.
+        """
+        texts = [normalize_unicode_text(text) for text in texts]
+
+        if self.heteronym_model is not None and texts:
+            try:
+                texts = self.heteronym_model.disambiguate(sentences=texts, batch_size=heteronym_batch_size)[1]
+            except Exception as e:
+                logging.warning(f"Heteronym model failed {e}, skipping")
+
+        return [self._text_to_phonemes(text) for text in texts]
+
+    def _text_to_phonemes(self, text: str) -> List[str]:
         words_list_of_tuple = self.word_tokenize_func(text)
 
         prons = []
@@ -358,3 +358,119 @@ def sample_audio(
         audio = normalize_volume(audio)
 
     return audio, audio_filepath_abs, audio_filepath_rel
+
+
+class FeatureStoreWriter:
+    """
+    Writes variable length feature arrays of a single supplementary data type (e.g. pitch) into one flat binary
+    file, along with an index of the offset and shape of each entry, so they can be read back by FeatureStore
+    without deserializing one file per utterance.
+
+    Entries must all have the same dtype and number of dimensions. Data is written to temporary files which are only
+    moved into place by close(), so an interrupted run never leaves a partial store behind.
+
+    Args:
+        store_path: Path prefix of the store. Data is written to <store_path>.bin and the index to
+            <store_path>.idx.npz.
+        dtype: Data type to store the features as.
+    """
+
+    def __init__(self, store_path: Path, dtype: np.dtype = np.float32):
+        self.store_path = Path(store_path)
+        self.dtype = np.dtype(dtype)
+        self.keys = []
+        self.offsets = []
+        self.shapes = []
+        self.num_elements = 0
+        self._data_file = open(f"{self.store_path}.bin.tmp", "wb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._data_file.close()
+            os.remove(f"{self.store_path}.bin.tmp")
+
+    def add(self, key: str, feature: np.ndarray):
+        feature = np.ascontiguousarray(feature, dtype=self.dtype)
+        if self.shapes and feature.ndim != len(self.shapes[0]):
+            raise ValueError(f"Expected a {len(self.shapes[0])}-d feature for {key}, got shape {feature.shape}.")
+
+        self._data_file.write(feature.tobytes())
+        self.keys.append(key)
+        self.offsets.append(self.num_elements)
+        self.shapes.append(feature.shape)
+        self.num_elements += feature.size
+
+    def close(self):
+        self._data_file.close()
+        os.replace(f"{self.store_path}.bin.tmp", f"{self.store_path}.bin")
+        with open(f"{self.store_path}.idx.npz.tmp", "wb") as index_file:
+            np.savez(
+                index_file,
+                keys=np.array(self.keys, dtype=str),
+                offsets=np.array(self.offsets, dtype=np.int64),
+                shapes=np.array(self.shapes, dtype=np.int64).reshape(len(self.keys), -1),
+                dtype=np.array(self.dtype.str),
+            )
+        os.replace(f"{self.store_path}.idx.npz.tmp", f"{self.store_path}.idx.npz")
+
+
+class FeatureStore:
+    """
+    Reads features written by FeatureStoreWriter. The data file is memory mapped on first access, and every
+    returned tensor is a view of the mapping so no data is copied until it is modified. The mapping is
+    copy-on-write, so modifying a returned tensor does not change the file, but the change is visible to
+    later lookups of the same key in the same process.
+
+    Args:
+        store_path: Path prefix of the store, as given to FeatureStoreWriter.
+    """
+
+    def __init__(self, store_path: Path):
+        self.store_path = Path(store_path)
+        index = np.load(f"{self.store_path}.idx.npz")
+        self.dtype = np.dtype(str(index["dtype"]))
+        self.offsets = index["offsets"]
+        self.shapes = index["shapes"]
+        self.key_to_index = {key: i for i, key in enumerate(index["keys"].tolist())}
+        self._data = None
+
+    @staticmethod
+    def exists(store_path: Path) -> bool:
+        return Path(f"{store_path}.bin").exists() and Path(f"{store_path}.idx.npz").exists()
+
+    def __getstate__(self):
+        # Memory maps cannot be pickled, each dataloader worker maps the file again on first access.
+        state = self.__dict__.copy()
+        state["_data"] = None
+        return state
+
+    def __len__(self):
+        return len(self.key_to_index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.key_to_index
+
+    def get(self, key: str) -> Optional[torch.Tensor]:
+        """
+        Returns the feature stored for the given key, or None if the store does not contain it.
+        """
+        index = self.key_to_index.get(key)
+        if index is None:
+            return None
+
+        if self._data is None:
+            if os.path.getsize(f"{self.store_path}.bin") == 0:
+                # np.memmap cannot map empty files, which only happens if every stored feature is empty.
+                self._data = np.empty(0, dtype=self.dtype)
+            else:
+                self._data = np.memmap(f"{self.store_path}.bin", dtype=self.dtype, mode="c")
+
+        shape = self.shapes[index]
+        start = self.offsets[index]
+        feature = self._data[start : start + int(np.prod(shape))].reshape(shape)
+        return torch.from_numpy(feature)
@@ -50,6 +50,10 @@ __all__ = ['Typing', 'FileIO', 'Model', 'Serialization', 'typecheck', 'Pretraine
 
 _TYPECHECK_ENABLED = True
 _TYPECHECK_SEMANTIC_CHECK_ENABLED = True
+# Upper bound on the number of validation plans kept by each typecheck decorator,
+# and on the number of cached comparison results kept by each plan.
+_TYPECHECK_MAX_CACHED_PLANS = 64
+_TYPECHECK_MAX_CACHED_COMPARISONS = 256
 # TODO @blisc: Remove _HAS_HYDRA
 _HAS_HYDRA = True
 
@@ -155,6 +159,77 @@ class TypecheckMetadata:
         }
 
 
+def _neural_type_signature(type_val):
+    """
+    Hashable summary of a (possibly nested) NeuralType definition, which holds everything that is used when
+    validating arguments against it. Two definitions with equal signatures validate in exactly the same way.
+    """
+    if isinstance(type_val, (list, tuple)):
+        return tuple(_neural_type_signature(val) for val in type_val)
+
+    if type_val.axes is None:
+        axes = None
+    else:
+        # Axis kinds are enum members, which live as long as the process, their id identifies them
+        axes = tuple((id(axis.kind), axis.size, axis.is_list) for axis in type_val.axes)
+    elements_type = type_val.elements_type
+    return (
+        axes,
+        type(elements_type),
+        tuple(elements_type.type_parameters.items()),
+        elements_type.fields,
+        type_val.optional,
+    )
+
+
+class TypecheckPlan:
+    """
+    Validation plan for the input or output types of a method decorated with `typecheck`.
+
+    It is built once for a given set of types, and then reused for every call of the method with those types.
+    This avoids recomputing the `TypecheckMetadata` on every call, and lets argument checks be reduced to
+    cheap structural checks (name, number and rank of the arguments) with cached semantic comparisons.
+
+    Args:
+        types: Dictionary of input or output neural types.
+        ignore_collections: For backward compatibility, container support can be disabled explicitly
+            using this flag. When set to True, all nesting is ignored and nest-depth checks are skipped.
+    """
+
+    def __init__(self, types: Dict[str, NeuralType], ignore_collections: bool = False):
+        self.types = types
+        self.metadata = TypecheckMetadata(original_types=types, ignore_collections=ignore_collections)
+        self.num_mandatory_types = len(self.metadata.mandatory_types)
+        # Expected number of dimensions of each argument, None if the axes are not specified
+        self.ranks = {
+            type_key: None if type_val.axes is None else len(type_val.axes)
+            for type_key, type_val in self.metadata.base_types.items()
+        }
+        self._comparisons = {}
+
+    def is_compatible(self, name: str, neural_type: NeuralType) -> bool:
+        """
+        Returns whether `neural_type` is SAME or GREATER than the type of argument `name`.
+
+        Results are cached by identity of `neural_type`. Tensors returned by typed methods carry the types of the
+        plans of these methods, so the same few objects are compared on every call.
+        """
+        cache_key = (name, id(neural_type))
+        cached = self._comparisons.get(cache_key)
+        # The compared type is kept alive in the cache, so its id cannot be reused by another object
+        if cached is not None and cached[0] is neural_type:
+            return cached[1]
+
+        result = self.metadata.base_types[name].compare(neural_type) in (
+            NeuralTypeComparisonResult.SAME,
+            NeuralTypeComparisonResult.GREATER,
+        )
+        if len(self._comparisons) >= _TYPECHECK_MAX_CACHED_COMPARISONS:
+            self._comparisons.clear()
+        self._comparisons[cache_key] = (neural_type, result)
+        return result
+
+
 class Typing(ABC):
     """
     An interface which endows module with neural types
@@ -258,7 +333,45 @@ class Typing(ABC):
                         """
                         self.__check_neural_type(val, metadata, depth=1, name=key)
 
-    def _attach_and_validate_output_types(self, out_objects, ignore_collections=False, output_types=None):
+    def _validate_input_types_with_plan(self, plan: TypecheckPlan, kwargs: dict):
+        """
+        Performs the same checks as `_validate_input_types`, using a precomputed validation plan.
+
+        Only the number, names and ranks of the arguments are checked here, and the semantic comparisons
+        are cached by the plan. If any of these checks fails, `_validate_input_types` is run to raise
+        the appropriate error.
+
+        Args:
+            plan: TypecheckPlan of the input types.
+            kwargs: Dictionary of argument_name:argument_value pairs passed to the wrapped
+                function upon call.
+        """
+        metadata = plan.metadata
+        if plan.num_mandatory_types <= len(kwargs) <= len(plan.types):
+            semantic_check = is_semantic_typecheck_enabled()
+            for key, value in kwargs.items():
+                if key not in plan.ranks:
+                    break
+
+                if semantic_check and hasattr(value, 'neural_type') and not plan.is_compatible(key, value.neural_type):
+                    break
+
+                if hasattr(value, 'shape'):
+                    rank = plan.ranks[key]
+                    if rank is not None and len(value.shape) != rank:
+                        break
+
+                elif isinstance(value, list) or isinstance(value, tuple):
+                    for val in value:
+                        self.__check_neural_type(val, metadata, depth=1, name=key)
+            else:
+                return
+
+        self._validate_input_types(input_types=plan.types, ignore_collections=metadata.ignore_collections, **kwargs)
+
+    def _attach_and_validate_output_types(
+        self, out_objects, ignore_collections=False, output_types=None, metadata: TypecheckMetadata = None
+    ):
         """
         This function does a few things.
 
@@ -277,11 +390,13 @@ class Typing(ABC):
             ignore_collections: For backward compatibility, container support can be disabled explicitly
                 using this flag. When set to True, all nesting is ignored and nest-depth checks are skipped.
             out_objects: The outputs of the wrapped function.
+            metadata: Optional precomputed TypecheckMetadata of `output_types`.
         """
         # TODO: Properly implement this
         if output_types is not None:
             # Precompute metadata
-            metadata = TypecheckMetadata(original_types=output_types, ignore_collections=ignore_collections)
+            if metadata is None:
+                metadata = TypecheckMetadata(original_types=output_types, ignore_collections=ignore_collections)
             out_types_list = list(metadata.base_types.items())
             mandatory_out_types_list = list(metadata.mandatory_types.items())
 
@@ -983,6 +1098,11 @@ class typecheck:
 
         When you call this function, all arguments must be passed using kwargs only.
 
+    3) The validation plan of the types (see :class:`TypecheckPlan`) is built on the first call and reused.
+
+        Class level types are still read on every call, as they may depend on the state of the instance,
+        and a new plan is only built when they change.
+
     """
 
     class TypeState(Enum):
@@ -1014,10 +1134,37 @@ class typecheck:
             self.output_override = True
 
         self.ignore_collections = ignore_collections
+        self._plans = {}
+        self._checked_classes = set()
 
     def __call__(self, wrapped):
         return self.wrapped_call(wrapped)
 
+    def _get_plan(self, kind: str, instance: Typing, types: Dict[str, NeuralType], override: bool) -> TypecheckPlan:
+        """
+        Returns the validation plan of the input or output `types`, building it if it does not exist yet.
+
+        Overridden types never change, so they have a single plan. Plans of class level types are looked up by
+        class and by signature of the types.
+        """
+        if override:
+            plan_key = (kind,)
+        else:
+            try:
+                plan_key = (kind, type(instance), tuple((k, _neural_type_signature(v)) for k, v in types.items()))
+                hash(plan_key)
+            except (AttributeError, TypeError):
+                # Types which cannot be summarized are validated without caching their plan
+                return TypecheckPlan(types, ignore_collections=self.ignore_collections)
+
+        plan = self._plans.get(plan_key)
+        if plan is None:
+            plan = TypecheckPlan(types, ignore_collections=self.ignore_collections)
+            if len(self._plans) >= _TYPECHECK_MAX_CACHED_PLANS:
+                self._plans.clear()
+            self._plans[plan_key] = plan
+        return plan
+
     def unwrapped_call(self, wrapped):
         return wrapped
 
@@ -1039,14 +1186,18 @@ class typecheck:
         if instance is None:
             raise RuntimeError("Only classes which inherit nemo.core.Typing can use this decorator !")
 
-        if not isinstance(instance, Typing):
-            raise RuntimeError("Only classes which inherit nemo.core.Typing can use this decorator !")
+        # These checks only depend on the class, they are done once per class
+        if type(instance) not in self._checked_classes:
+            if not isinstance(instance, Typing):
+                raise RuntimeError("Only classes which inherit nemo.core.Typing can use this decorator !")
 
-        if hasattr(instance, 'input_ports') or hasattr(instance, 'output_ports'):
-            raise RuntimeError(
-                "Typing requires override of `input_types()` and `output_types()`, "
-                "not `input_ports() and `output_ports()`"
-            )
+            if hasattr(instance, 'input_ports') or hasattr(instance, 'output_ports'):
+                raise RuntimeError(
+                    "Typing requires override of `input_types()` and `output_types()`, "
+                    "not `input_ports() and `output_ports()`"
+                )
+
+            self._checked_classes.add(type(instance))
 
         # Preserve type information
         if self.input_types is typecheck.TypeState.UNINITIALIZED:
@@ -1075,14 +1226,22 @@ class typecheck:
             raise TypeError("All arguments must be passed by kwargs only for typed methods")
 
         # Perform rudimentary input checks here
-        instance._validate_input_types(input_types=input_types, ignore_collections=self.ignore_collections, **kwargs)
+        if input_types is not None:
+            input_plan = self._get_plan('input', instance, input_types, self.input_override)
+            instance._validate_input_types_with_plan(input_plan, kwargs)
 
         # Call the method - this can be forward, or any other callable method
         outputs = wrapped(*args, **kwargs)
 
-        instance._attach_and_validate_output_types(
-            output_types=output_types, ignore_collections=self.ignore_collections, out_objects=outputs
-        )
+        if output_types is not None:
+            # Attach the types of the plan, which are the same objects on every call
+            output_plan = self._get_plan('output', instance, output_types, self.output_override)
+            instance._attach_and_validate_output_types(
+                output_types=output_plan.types,
+                ignore_collections=self.ignore_collections,
+                out_objects=outputs,
+                metadata=output_plan.metadata,
+            )
 
         return outputs
 
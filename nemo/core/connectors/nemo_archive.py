@@ -0,0 +1,459 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Random-access reading and parallel writing of uncompressed ``.nemo`` archives.
+
+``.nemo`` files written by NeMo 1.7.0 and above are uncompressed tarballs, so the data of every member is stored
+contiguously at a known offset. :class:`NemoArchiveIndex` scans the tar headers once (without reading the data)
+and keeps a table of member offsets, which allows reading the model config and artifacts, or loading the model
+weights with ``torch.load``, directly from the archive instead of extracting it to disk first.
+
+Conversely, :func:`write_nemo_archive` computes the layout of the archive upfront and writes all members
+concurrently at their final offsets. Model weights can be streamed into the archive in the safetensors format
+(:class:`SafetensorsPayload`) tensor by tensor, without serializing the state dict to a temporary file first, and
+loaded back with :func:`load_safetensors` as tensors backed by a memory map of the archive.
+"""
+
+import io
+import json
+import mmap
+import os
+import shutil
+import struct
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import torch
+
+from nemo.utils import logging
+
+__all__ = [
+    'NemoArchiveIndex',
+    'SafetensorsPayload',
+    'TarMember',
+    'load_safetensors',
+    'save_safetensors',
+    'write_nemo_archive',
+]
+
+# Size of the chunks copied by each write job.
+_CHUNK_SIZE = 64 << 20
+_SEEK_LOCK = threading.Lock()
+
+_SAFETENSORS_DTYPES = {
+    torch.float64: 'F64',
+    torch.float32: 'F32',
+    torch.float16: 'F16',
+    torch.bfloat16: 'BF16',
+    torch.int64: 'I64',
+    torch.int32: 'I32',
+    torch.int16: 'I16',
+    torch.int8: 'I8',
+    torch.uint8: 'U8',
+    torch.bool: 'BOOL',
+}
+for _name, _code in (('float8_e4m3fn', 'F8_E4M3'), ('float8_e5m2', 'F8_E5M2')):
+    if hasattr(torch, _name):
+        _SAFETENSORS_DTYPES[getattr(torch, _name)] = _code
+_TORCH_DTYPES = {code: dtype for dtype, code in _SAFETENSORS_DTYPES.items()}
+
+
+class TarMember(NamedTuple):
+    """Location of the data of a regular file in a tarball."""
+
+    name: str
+    offset: int
+    size: int
+
+
+class _TarMemberFile(io.RawIOBase):
+    """Read-only, seekable file object over a byte range of a memory-mapped file."""
+
+    def __init__(self, path: str, offset: int, size: int):
+        super().__init__()
+        self._size = size
+        self._position = 0
+        self._mmap = None
+        self._view = memoryview(b'')
+        if size > 0:
+            with open(path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)[offset : offset + size]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        start = min(self._position, self._size)
+        end = min(start + len(buffer), self._size)
+        memoryview(buffer).cast('B')[: end - start] = self._view[start:end]
+        self._position = end
+        return end - start
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        super().close()
+
+
+class NemoArchiveIndex:
+    """
+    Table of the members of an uncompressed ``.nemo`` tarball, used to read members without extracting the archive.
+
+    Member names are normalized, i.e. ``./model_config.yaml`` is stored as ``model_config.yaml``.
+    Use :meth:`from_path` to share indexes of unchanged archives within a process.
+
+    Args:
+        path: path to an uncompressed tarball.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.members: Dict[str, TarMember] = {}
+        with tarfile.open(self.path, 'r:') as tar:
+            for info in tar:
+                if info.isreg() and not info.issparse():
+                    name = os.path.normpath(info.name)
+                    self.members[name] = TarMember(name=name, offset=info.offset_data, size=info.size)
+
+    @classmethod
+    def from_path(cls, path: str) -> 'NemoArchiveIndex':
+        """Returns the (cached) index of an archive. The cache is invalidated when the archive is modified."""
+        stat = os.stat(path)
+        return cls._cached(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _cached(cls, path: str, size: int, mtime_ns: int) -> 'NemoArchiveIndex':
+        return cls(path)
+
+    @staticmethod
+    def is_indexable(path: str) -> bool:
+        """Whether ``path`` is an uncompressed tarball, i.e. whether its members can be read in place."""
+        if not os.path.isfile(path):
+            return False
+        try:
+            with tarfile.open(path, 'r:'):
+                return True
+        except tarfile.ReadError:
+            return False
+
+    def names(self, filter_fn: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Returns the names of all regular files of the archive, optionally filtered by a function."""
+        return [name for name in self.members if filter_fn is None or filter_fn(name)]
+
+    def __contains__(self, name: str) -> bool:
+        return os.path.normpath(name) in self.members
+
+    def open(self, name: str) -> io.BufferedReader:
+        """Opens a member for reading. The returned file object is backed by a memory map of the archive."""
+        member = self.members[os.path.normpath(name)]
+        return io.BufferedReader(_TarMemberFile(self.path, member.offset, member.size))
+
+    def read_bytes(self, name: str) -> bytes:
+        with self.open(name) as f:
+            return f.read()
+
+    def extract(self, names: Iterable[str], out_folder: str) -> List[str]:
+        """
+        Copies members to ``out_folder``, keeping their relative paths.
+
+        Returns:
+            The paths of the extracted files.
+        """
+        paths = []
+        for name in names:
+            name = os.path.normpath(name)
+            if os.path.isabs(name) or '..' in name.split(os.sep):
+                raise ValueError(f"Unsafe member name in {self.path}: {name}")
+            path = os.path.join(out_folder, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self.open(name) as src, open(path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+            paths.append(path)
+        return paths
+
+    def torch_load(self, name: str, map_location=None, **kwargs):
+        """Loads a member saved with ``torch.save`` directly from the archive."""
+        with self.open(name) as f:
+            return torch.load(f, map_location=map_location, **kwargs)
+
+    def load_safetensors(self, name: str) -> Dict[str, torch.Tensor]:
+        """Loads a safetensors member as CPU tensors backed by a memory map of the archive, see `load_safetensors`."""
+        return load_safetensors(self.path, offset=self.members[os.path.normpath(name)].offset)
+
+
+def _write_all(fd: int, data, offset: int):
+    """Writes a whole buffer at a given offset of a file, which is safe to call concurrently from several threads."""
+    view = memoryview(data).cast('B')
+    if not hasattr(os, 'pwrite'):
+        # e.g. on Windows: serialize seek + write
+        with _SEEK_LOCK:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while len(view) > 0:
+                view = view[os.write(fd, view) :]
+        return
+    while len(view) > 0:
+        written = os.pwrite(fd, view, offset)
+        view, offset = view[written:], offset + written
+
+
+def _copy_file_job(path: str, fd: int, offset: int) -> Callable[[], None]:
+    def job():
+        position = offset
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                _write_all(fd, chunk, position)
+                position += len(chunk)
+
+    return job
+
+
+class SafetensorsPayload:
+    """
+    A state dict laid out in the safetensors format (https://github.com/huggingface/safetensors), which is written
+    tensor by tensor at its final location instead of being serialized in memory first.
+
+    Tensors are sorted by decreasing element size so that all of them are aligned, assuming the payload starts at
+    an offset that is a multiple of 8 bytes (e.g. a tar member). The result can be read with the `safetensors`
+    library, or with :func:`load_safetensors`.
+
+    Args:
+        state_dict: a flat dictionary of tensors.
+        metadata: optional string-to-string metadata stored in the header.
+
+    Raises:
+        ValueError: if the state dict contains values that are not tensors, or tensors of an unsupported dtype.
+    """
+
+    def __init__(self, state_dict: Dict[str, torch.Tensor], metadata: Optional[Dict[str, str]] = None):
+        for name, tensor in state_dict.items():
+            if not isinstance(tensor, torch.Tensor):
+                raise ValueError(f"Cannot save {name} in the safetensors format: {type(tensor)} is not a tensor.")
+            if tensor.dtype not in _SAFETENSORS_DTYPES:
+                raise ValueError(f"Cannot save {name} in the safetensors format: unsupported dtype {tensor.dtype}.")
+
+        names = sorted(state_dict, key=lambda name: -state_dict[name].element_size())
+        header = {'__metadata__': {'format': 'pt', **(metadata or {})}}
+        self._tensors = []
+        data_size = 0
+        for name in names:
+            tensor = state_dict[name]
+            nbytes = tensor.numel() * tensor.element_size()
+            header[name] = {
+                'dtype': _SAFETENSORS_DTYPES[tensor.dtype],
+                'shape': list(tensor.shape),
+                'data_offsets': [data_size, data_size + nbytes],
+            }
+            self._tensors.append((tensor, data_size, nbytes))
+            data_size += nbytes
+
+        header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        header += b' ' * (-len(header) % 8)
+        self._prefix = struct.pack('<Q', len(header)) + header
+        self.size = len(self._prefix) + data_size
+
+    def jobs(self, fd: int, offset: int) -> List[Callable[[], None]]:
+        """Returns write jobs (one per tensor, plus the header) writing the payload at `offset` of a file."""
+
+        def write_header():
+            _write_all(fd, self._prefix, offset)
+
+        def write_tensor(tensor: torch.Tensor, position: int, nbytes: int):
+            if nbytes == 0:
+                return
+            data = tensor.detach().to('cpu').contiguous().reshape(-1).view(torch.uint8).numpy()
+            for start in range(0, nbytes, _CHUNK_SIZE):
+                _write_all(fd, data[start : start + _CHUNK_SIZE], position + start)
+
+        data_offset = offset + len(self._prefix)
+        jobs = [write_header]
+        for tensor, position, nbytes in self._tensors:
+            jobs.append(partial(write_tensor, tensor, data_offset + position, nbytes))
+        return jobs
+
+    def save(self, path: str, num_workers: Optional[int] = None):
+        """Writes the payload to a standalone safetensors file."""
+        fd = _create_file(path, self.size)
+        try:
+            _run_jobs(self.jobs(fd, 0), num_workers)
+        finally:
+            os.close(fd)
+
+
+def _run_jobs(jobs: List[Callable[[], None]], num_workers: Optional[int]):
+    num_workers = num_workers or min(8, os.cpu_count() or 1)
+    if num_workers <= 1:
+        for job in jobs:
+            job()
+        return
+    with ThreadPoolExecutor(num_workers) as executor:
+        # Iterating over the results re-raises the first exception, if any.
+        for _ in executor.map(lambda job: job(), jobs):
+            pass
+
+
+def _create_file(path: str, size: int) -> int:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    os.ftruncate(fd, size)
+    return fd
+
+
+def save_safetensors(
+    state_dict: Dict[str, torch.Tensor],
+    path: str,
+    metadata: Optional[Dict[str, str]] = None,
+    num_workers: Optional[int] = None,
+):
+    """Saves a state dict to a safetensors file, writing tensors concurrently."""
+    SafetensorsPayload(state_dict, metadata=metadata).save(path, num_workers=num_workers)
+
+
+def load_safetensors(path: str, offset: int = 0) -> Dict[str, torch.Tensor]:
+    """
+    Loads a safetensors file, or a safetensors payload stored at `offset` of a file (e.g. an uncompressed tarball).
+
+    Tensors are created on CPU, without copy, from a private (copy-on-write) memory map of the file,
+    so only the pages that are actually accessed are read from disk.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        (header_size,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_size))
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    header.pop('__metadata__', None)
+    data_offset = offset + 8 + header_size
+    state_dict = {}
+    for name, info in header.items():
+        dtype = _TORCH_DTYPES[info['dtype']]
+        begin, end = info['data_offsets']
+        if end == begin:
+            state_dict[name] = torch.empty(info['shape'], dtype=dtype)
+            continue
+        tensor = torch.frombuffer(buffer, dtype=torch.uint8, count=end - begin, offset=data_offset + begin)
+        state_dict[name] = tensor.view(dtype).reshape(info['shape'])
+    return state_dict
+
+
+def _iter_folder(source_dir: str, arcname: str):
+    """Yields `(path, arcname)` pairs in the same order as `tarfile.TarFile.add(source_dir, arcname)`."""
+    yield source_dir, arcname
+    if os.path.isdir(source_dir) and not os.path.islink(source_dir):
+        for name in sorted(os.listdir(source_dir)):
+            yield from _iter_folder(os.path.join(source_dir, name), os.path.join(arcname, name))
+
+
+def write_nemo_archive(
+    filename: str,
+    source_dir: str,
+    payloads: Optional[Dict[str, SafetensorsPayload]] = None,
+    num_workers: Optional[int] = None,
+):
+    """
+    Writes an uncompressed tarball with the content of `source_dir` (like `tar.add(source_dir, arcname=".")`)
+    followed by the given payloads.
+
+    The position of every member is computed upfront, then the tar headers are written and the data of all members
+    (files and tensors) is copied concurrently at its final offset by a pool of threads. The archive is written
+    to a temporary file which is renamed when complete.
+
+    Args:
+        filename: path of the archive.
+        source_dir: folder whose content is added to the archive.
+        payloads: mapping from member names (relative to the root of the archive) to payloads.
+        num_workers: number of writing threads, defaults to `min(8, os.cpu_count())`.
+    """
+    entries = []  # (tar info, data source)
+    for path, arcname in _iter_folder(source_dir, "."):
+        stat = os.stat(path)
+        info = tarfile.TarInfo(arcname)
+        info.mtime, info.uid, info.gid = int(stat.st_mtime), stat.st_uid, stat.st_gid
+        info.mode = stat.st_mode & 0o7777
+        if os.path.isdir(path):
+            info.type = tarfile.DIRTYPE
+            entries.append((info, None))
+        elif os.path.isfile(path):
+            info.size = stat.st_size
+            entries.append((info, path))
+        else:
+            logging.warning(f"Skipping {path} which is neither a file nor a folder")
+    for name, payload in (payloads or {}).items():
+        info = tarfile.TarInfo(os.path.join(".", name))
+        info.size, info.mode, info.mtime = payload.size, 0o644, int(time.time())
+        entries.append((info, payload))
+
+    headers, data_offsets, offset = [], [], 0
+    for info, _ in entries:
+        header = info.tobuf(tarfile.DEFAULT_FORMAT, tarfile.ENCODING, 'surrogateescape')
+        headers.append((header, offset))
+        offset += len(header)
+        data_offsets.append(offset)
+        offset += -(-info.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+    # End-of-archive marker (two zero blocks), padded to a multiple of the record size like `tarfile` does.
+    offset += 2 * tarfile.BLOCKSIZE
+    offset += -offset % tarfile.RECORDSIZE
+
+    dirname = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(dirname, exist_ok=True)
+    tmp_filename = os.path.join(dirname, f'.{os.path.basename(filename)}.{os.getpid()}.tmp')
+    fd = _create_file(tmp_filename, offset)
+    try:
+        def write_headers():
+            for header, position in headers:
+                _write_all(fd, header, position)
+
+        jobs = [write_headers]
+        for (info, source), data_offset in zip(entries, data_offsets):
+            if isinstance(source, str):
+                jobs.append(_copy_file_job(source, fd, data_offset))
+            elif source is not None:
+                jobs.extend(source.jobs(fd, data_offset))
+        _run_jobs(jobs, num_workers)
+    except BaseException:
+        os.close(fd)
+        os.remove(tmp_filename)
+        raise
+    os.close(fd)
+    os.replace(tmp_filename, filename)
@@ -28,6 +28,7 @@ from omegaconf import DictConfig, OmegaConf
 from omegaconf.omegaconf import open_dict
 
 from nemo.core import classes as nemo_classes  # to avoid circular import do not import ModelPT directly
+from nemo.core.connectors.nemo_archive import NemoArchiveIndex, SafetensorsPayload, load_safetensors, write_nemo_archive
 from nemo.utils import logging, model_utils
 from nemo.utils.app_state import AppState
 from nemo.utils.get_rank import is_global_rank_zero
@@ -40,6 +41,8 @@ class SaveRestoreConnector:
         self._model_weights_ckpt = "model_weights.ckpt"
         self._model_extracted_dir = None
         self._pack_nemo_file = True
+        self._restore_in_place = True
+        self._state_dict_format = "torch"
 
     def save_to(self, model: "nemo_classes.ModelPT", save_path: str):
         """
@@ -49,6 +52,7 @@ class SaveRestoreConnector:
         .nemo file is an archive (tar.gz) with the following:
             model_config.yaml - model configuration in .yaml format. You can deserialize this into cfg argument for model's constructor
             model_wights.ckpt - model checkpoint
+                (or model_weights.safetensors if `state_dict_format` is "safetensors")
 
         Args:
             model: ModelPT object to be saved.
@@ -70,10 +74,23 @@ class SaveRestoreConnector:
                     self._handle_artifacts(model, nemo_file_folder=tmpdir)
                     # We should not update self._cfg here - the model can still be in use
                     self._update_artifact_paths(model, path2yaml_file=config_yaml)
-                self._save_state_dict_to_disk(model.state_dict(), model_weights)
+
+                state_dict = model.state_dict()
+                payload = None
+                if self.state_dict_format == "safetensors":
+                    payload = self._make_safetensors_payload(state_dict)
+                if payload is None:
+                    self._save_state_dict_to_disk(state_dict, model_weights)
+                elif not self.pack_nemo_file:
+                    payload.save(os.path.join(tmpdir, self.model_weights_safetensors))
 
                 # Check if we are packing the folder into a nemo file
-                if self.pack_nemo_file:
+                if self.pack_nemo_file and payload is not None:
+                    # The weights are written into the archive directly, concurrently with the other files
+                    write_nemo_archive(
+                        filename=save_path, source_dir=tmpdir, payloads={self.model_weights_safetensors: payload}
+                    )
+                elif self.pack_nemo_file:
                     self._make_nemo_file_from_folder(filename=save_path, source_dir=tmpdir)
                 else:
                     # Get the folder path from the save_path and move all values inside the tmpdir to the folder
@@ -128,6 +145,7 @@ class SaveRestoreConnector:
                 map_location = torch.device('cpu')
 
         app_state = AppState()
+        archive = None
         with tempfile.TemporaryDirectory() as tmpdir:
             try:
                 # Check if self.model_extracted_dir is set, and is a valid path
@@ -141,12 +159,19 @@ class SaveRestoreConnector:
                     tmpdir = self.model_extracted_dir
 
                 else:
-                    # Extract the nemo file into the temporary directory
                     filter_fn = None
                     if return_config:
                         filter_fn = lambda name: '.yaml' in name
-                    members = self._filtered_tar_info(restore_path, filter_fn=filter_fn)
-                    self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir, members=members)
+                    archive = self._get_nemo_archive_index(restore_path)
+                    if archive is not None:
+                        # Only extract the config and artifacts, model weights are loaded from the archive in place
+                        if filter_fn is None:
+                            filter_fn = lambda name: name not in (self.model_weights_ckpt, self.model_weights_safetensors)
+                        archive.extract(archive.names(filter_fn=filter_fn), out_folder=tmpdir)
+                    else:
+                        # Extract the nemo file into the temporary directory
+                        members = self._filtered_tar_info(restore_path, filter_fn=filter_fn)
+                        self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir, members=members)
 
                 # Change current working directory to
                 os.chdir(tmpdir)
@@ -184,7 +209,10 @@ class SaveRestoreConnector:
                 # add load_state_dict override
                 if app_state.model_parallel_size is not None and app_state.model_parallel_size > 1:
                     model_weights = self._inject_model_parallel_rank_for_ckpt(tmpdir, self.model_weights_ckpt)
-                state_dict = self._load_state_dict_from_disk(model_weights, map_location=map_location)
+                if archive is not None:
+                    state_dict = self._load_state_dict_from_archive(archive)
+                else:
+                    state_dict = self._load_state_dict_from_folder(tmpdir, model_weights, map_location=map_location)
             finally:
                 os.chdir(cwd)
 
@@ -327,7 +355,7 @@ class SaveRestoreConnector:
                 self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir)
                 os.chdir(tmpdir)
                 model_weights = os.path.join(tmpdir, self.model_weights_ckpt)
-                state_dict = self._load_state_dict_from_disk(model_weights)
+                state_dict = self._load_state_dict_from_folder(tmpdir, model_weights)
 
                 if not split_by_module:
                     filepath = os.path.join(save_dir, self.model_weights_ckpt)
@@ -584,6 +612,49 @@ class SaveRestoreConnector:
         model_weights = inject_model_parallel_rank(model_weights)
         return model_weights
 
+    def _get_nemo_archive_index(self, restore_path: str) -> Optional[NemoArchiveIndex]:
+        """
+        Returns the member index of a .nemo file if the model can be restored without extracting the archive,
+        i.e. if the .nemo file is an uncompressed tarball and the model weights are either a safetensors payload
+        or a single checkpoint loaded with the default `_load_state_dict_from_disk`. Returns None otherwise.
+        """
+        if not self.restore_in_place:
+            return None
+        app_state = AppState()
+        if app_state.model_parallel_size is not None and app_state.model_parallel_size > 1:
+            return None
+        if not NemoArchiveIndex.is_indexable(restore_path):
+            return None
+        archive = NemoArchiveIndex.from_path(restore_path)
+        if self.model_weights_safetensors in archive:
+            return archive
+        if type(self)._load_state_dict_from_disk is not SaveRestoreConnector._load_state_dict_from_disk:
+            return None
+        if self.model_weights_ckpt not in archive:
+            return None
+        return archive
+
+    def _load_state_dict_from_archive(self, archive: NemoArchiveIndex):
+        """Loads the model weights from an uncompressed .nemo file without extracting them."""
+        if self.model_weights_safetensors in archive:
+            return archive.load_safetensors(self.model_weights_safetensors)
+        return archive.torch_load(self.model_weights_ckpt, map_location='cpu', weights_only=False)
+
+    def _load_state_dict_from_folder(self, folder: str, model_weights: str, map_location=None):
+        """Loads the model weights from an extracted .nemo file, saved either with torch or as safetensors."""
+        model_weights_safetensors = os.path.join(folder, self.model_weights_safetensors)
+        if not os.path.exists(model_weights) and os.path.isfile(model_weights_safetensors):
+            return load_safetensors(model_weights_safetensors)
+        return self._load_state_dict_from_disk(model_weights, map_location=map_location)
+
+    def _make_safetensors_payload(self, state_dict) -> Optional[SafetensorsPayload]:
+        """Lays out the state dict in the safetensors format, or returns None if the state dict is not supported."""
+        try:
+            return SafetensorsPayload(state_dict)
+        except ValueError as e:
+            logging.warning(f"{e} The model weights will be saved with torch.save instead.")
+            return None
+
     @staticmethod
     def _make_nemo_file_from_folder(filename, source_dir):
         dirname = os.path.dirname(filename)
@@ -702,6 +773,26 @@ class SaveRestoreConnector:
     def model_weights_ckpt(self, path: str):
         self._model_weights_ckpt = path
 
+    @property
+    def model_weights_safetensors(self) -> str:
+        """Name of the model weights in .nemo files saved with `state_dict_format="safetensors"`."""
+        return os.path.splitext(self.model_weights_ckpt)[0] + ".safetensors"
+
+    @property
+    def state_dict_format(self) -> str:
+        """
+        Format of the model weights in saved .nemo files: "torch" (`torch.save`, the default) or "safetensors".
+        Safetensors weights are written into the archive in parallel without an intermediate file,
+        and restored without copy from a memory map of the archive.
+        """
+        return getattr(self, '_state_dict_format', "torch")
+
+    @state_dict_format.setter
+    def state_dict_format(self, state_dict_format: str):
+        if state_dict_format not in ("torch", "safetensors"):
+            raise ValueError(f"Unsupported state dict format: {state_dict_format}. Use 'torch' or 'safetensors'.")
+        self._state_dict_format = state_dict_format
+
     @property
     def model_extracted_dir(self) -> Optional[str]:
         return self._model_extracted_dir
@@ -717,3 +808,15 @@ class SaveRestoreConnector:
     @pack_nemo_file.setter
     def pack_nemo_file(self, save_nemo_file: bool):
         self._pack_nemo_file = save_nemo_file
+
+    @property
+    def restore_in_place(self) -> bool:
+        """
+        Whether to restore models from uncompressed .nemo files without extracting the model weights,
+        which are read directly from the archive instead. Only the config and artifacts are extracted.
+        """
+        return getattr(self, '_restore_in_place', True)
+
+    @restore_in_place.setter
+    def restore_in_place(self, restore_in_place: bool):
+        self._restore_in_place = restore_in_place
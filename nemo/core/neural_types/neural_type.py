@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 import torch
 
@@ -28,6 +29,13 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _axes_from_str(axes: Tuple[str, ...]) -> Tuple[AxisType, ...]:
+    """Parses a short string-based axes definition. Neural types are often built on every call of a typed method,
+    so the parsed axes are cached and shared by all the types with the same definition."""
+    return tuple(AxisType(AxisKind.from_str(axis), None) for axis in axes)
+
+
 class NeuralType:
     """This is the main class which would represent neural type concept.
     It is used to represent *the types* of inputs and outputs.
@@ -74,7 +82,9 @@ class NeuralType:
                 "Did you pass a class instead?"
             )
         self.elements_type = elements_type
-        if axes is not None:
+        if axes is not None and all(isinstance(axis, str) for axis in axes):
+            self.axes = _axes_from_str(tuple(axes))
+        elif axes is not None:
             NeuralType.__check_sanity(axes)
             axes_list = []
             for axis in axes:
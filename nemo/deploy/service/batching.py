@@ -0,0 +1,217 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple
+
+import numpy as np
+
+from nemo.deploy.utils import str_list2numpy
+
+use_pytriton = True
+try:
+    from pytriton.client import ModelClient
+except Exception:
+    use_pytriton = False
+
+
+class CompletionParams(NamedTuple):
+    """Request parameters that must be identical for completion requests to be sent to Triton in the same batch."""
+
+    model: str
+    max_tokens: int
+    temperature: float
+    top_p: float
+    top_k: int
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests into batches for a blocking inference function.
+
+    Requests are grouped by key (e.g. model and sampling parameters). A group is sent to `infer_fn` once it holds
+    `max_batch_size` requests, or `max_wait_ms` after its first request arrived, whichever comes first. `infer_fn`
+    runs in `executor` so the event loop is never blocked, and the number of batches in flight is bounded by the
+    number of executor workers.
+
+    Args:
+        infer_fn: Function called as infer_fn(key, items) that returns a dictionary of arrays whose first dimension
+            is the batch dimension. Each request receives the slice of every array at its position in the batch.
+        max_batch_size: Maximum number of requests in a batch. 1 disables batching.
+        max_wait_ms: Maximum time a request waits for other requests to join its batch.
+        executor: Executor used to run infer_fn. Defaults to the event loop default executor.
+    """
+
+    def __init__(
+        self,
+        infer_fn: Callable[[Hashable, List[Any]], Dict[str, np.ndarray]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        executor: Executor = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}.")
+
+        self.infer_fn = infer_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.executor = executor
+        self._pending = {}
+        self._timers = {}
+        self._tasks = set()
+
+    async def submit(self, key: Hashable, item: Any) -> Dict[str, np.ndarray]:
+        """Adds a request to the batch for `key` and waits for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((item, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.max_wait_ms / 1000, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: Hashable):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(key, batch))
+            # The event loop only keeps weak references to tasks.
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, key: Hashable, batch: List):
+        items = [item for item, _ in batch]
+        try:
+            outputs = await asyncio.get_running_loop().run_in_executor(self.executor, self.infer_fn, key, items)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for i, (_, future) in enumerate(batch):
+            # Requests whose client went away are cancelled, their result is dropped.
+            if not future.done():
+                future.set_result({name: value[i : i + 1] for name, value in outputs.items()})
+
+
+class TritonLLMBackend:
+    """
+    Sends batches of completion requests to a Triton server. Clients are kept in a per-model pool and reused across
+    requests, instead of connecting and fetching the model config for every request as NemoQueryLLM does. A pytriton
+    client is not thread safe, so each one serves a single batch at a time and the pool grows to the number of
+    threads calling the backend concurrently. Batches larger than the max_batch_size of the model config are split
+    into several Triton requests.
+
+    Args:
+        url: Triton server url.
+        init_timeout: Timeout for the initial connection of each client.
+        output_generation_logits: Whether to also return the generation logits.
+    """
+
+    def __init__(self, url: str, init_timeout: float = 60.0, output_generation_logits: bool = False):
+        self.url = url
+        self.init_timeout = init_timeout
+        self.output_generation_logits = output_generation_logits
+        self._clients = defaultdict(queue.SimpleQueue)
+
+    def _acquire_client(self, model: str):
+        try:
+            return self._clients[model].get_nowait()
+        except queue.Empty:
+            if not use_pytriton:
+                raise ImportError("pytriton is required to query a Triton server.")
+            return ModelClient(self.url, model, init_timeout_s=self.init_timeout)
+
+    def __call__(self, params: CompletionParams, prompts: List[str]) -> Dict[str, np.ndarray]:
+        prompts = str_list2numpy(prompts)
+        inputs = {
+            "prompts": prompts,
+            "max_output_len": np.full(prompts.shape, params.max_tokens, dtype=np.int_),
+            "top_k": np.full(prompts.shape, params.top_k, dtype=np.int_),
+            "top_p": np.full(prompts.shape, params.top_p, dtype=np.single),
+            "temperature": np.full(prompts.shape, params.temperature, dtype=np.single),
+            "output_context_logits": np.full(prompts.shape, False, dtype=np.bool_),
+            "output_generation_logits": np.full(prompts.shape, self.output_generation_logits, dtype=np.bool_),
+        }
+
+        client = self._acquire_client(params.model)
+        try:
+            model_config = client.model_config
+            # Triton rejects batches larger than the max_batch_size of the model, 0 means the model does not batch.
+            max_batch_size = model_config.max_batch_size if model_config.max_batch_size > 0 else len(prompts)
+            result_dicts = [
+                client.infer_batch(**{name: value[start : start + max_batch_size] for name, value in inputs.items()})
+                for start in range(0, len(prompts), max_batch_size)
+            ]
+        except Exception:
+            # The connection may be broken, do not hand this client out again.
+            client.close()
+            raise
+        self._clients[params.model].put(client)
+
+        if len(result_dicts) == 1:
+            result_dict = result_dicts[0]
+        else:
+            result_dict = {name: np.concatenate([result[name] for result in result_dicts]) for name in result_dicts[0]}
+
+        if model_config.outputs[0].dtype == np.bytes_:
+            output = result_dict["outputs"] if "outputs" in result_dict else result_dict["sentences"]
+            outputs = {"sentences": np.char.decode(output.astype("bytes"), "utf-8")}
+        else:
+            outputs = {"outputs": result_dict["outputs"]}
+        if self.output_generation_logits:
+            outputs["generation_logits"] = result_dict["generation_logits"]
+        return outputs
+
+
+class LocalLLMBackend:
+    """
+    Stand-in for TritonLLMBackend that needs no server, to load test the REST service. Each call sleeps for
+    `batch_latency_ms` plus `prompt_latency_ms` per prompt, which roughly models a model whose cost is dominated by a
+    fixed per-batch overhead, and completes each prompt by repeating its last word.
+
+    Args:
+        batch_latency_ms: Simulated latency of a batch.
+        prompt_latency_ms: Simulated additional latency of each prompt in a batch.
+    """
+
+    def __init__(self, batch_latency_ms: float = 50.0, prompt_latency_ms: float = 1.0):
+        self.batch_latency_ms = batch_latency_ms
+        self.prompt_latency_ms = prompt_latency_ms
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def __call__(self, params: CompletionParams, prompts: List[str]) -> Dict[str, np.ndarray]:
+        time.sleep((self.batch_latency_ms + self.prompt_latency_ms * len(prompts)) / 1000)
+        with self._lock:
+            self.batch_sizes.append(len(prompts))
+
+        sentences = []
+        for prompt in prompts:
+            words = prompt.split()
+            sentences.append(" ".join(words[-1:] * params.max_tokens))
+        return {"sentences": np.array(sentences)[..., np.newaxis]}
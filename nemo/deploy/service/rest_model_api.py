@@ -8,7 +8,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import requests
 
@@ -16,7 +20,7 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
-from nemo.deploy.nlp import NemoQueryLLM
+from nemo.deploy.service.batching import CompletionParams, LocalLLMBackend, MicroBatcher, TritonLLMBackend
 from nemo.utils import logging
 
 
@@ -33,6 +37,10 @@ class TritonSettings(BaseSettings):
             self._triton_request_timeout = int(os.environ.get('TRITON_REQUEST_TIMEOUT', 60))
             self._openai_format_response = os.environ.get('OPENAI_FORMAT_RESPONSE', 'False').lower() == 'true'
             self._output_generation_logits = os.environ.get('OUTPUT_GENERATION_LOGITS', 'False').lower() == 'true'
+            self._max_batch_size = int(os.environ.get('REST_MAX_BATCH_SIZE', 8))
+            self._max_batch_wait_ms = float(os.environ.get('REST_MAX_BATCH_WAIT_MS', 5))
+            self._client_pool_size = int(os.environ.get('REST_CLIENT_POOL_SIZE', 4))
+            self._use_local_backend = os.environ.get('REST_USE_LOCAL_BACKEND', 'False').lower() == 'true'
         except Exception as error:
             logging.error("An exception occurred trying to retrieve set args in TritonSettings class. Error:", error)
             return
@@ -63,10 +71,54 @@ class TritonSettings(BaseSettings):
         """
         return self._output_generation_logits
 
+    @property
+    def max_batch_size(self):
+        """
+        Maximum number of concurrent completion requests sent to Triton in one batch.
+        """
+        return self._max_batch_size
+
+    @property
+    def max_batch_wait_ms(self):
+        """
+        Maximum time a completion request waits for other requests to join its batch.
+        """
+        return self._max_batch_wait_ms
+
+    @property
+    def client_pool_size(self):
+        """
+        Maximum number of batches sent to Triton concurrently, each through its own pooled client.
+        """
+        return self._client_pool_size
+
+    @property
+    def use_local_backend(self):
+        """
+        Serves completions from a local stand-in backend instead of Triton if set to True, for load testing.
+        """
+        return self._use_local_backend
+
 
 app = FastAPI()
 triton_settings = TritonSettings()
 
+if triton_settings.use_local_backend:
+    backend = LocalLLMBackend()
+else:
+    backend = TritonLLMBackend(
+        url=triton_settings.triton_service_ip + ":" + str(triton_settings.triton_service_port),
+        init_timeout=triton_settings.triton_request_timeout,
+        output_generation_logits=triton_settings.output_generation_logits,
+    )
+# Triton clients are blocking, they run in a thread pool so that the event loop keeps accepting requests.
+batcher = MicroBatcher(
+    backend,
+    max_batch_size=triton_settings.max_batch_size,
+    max_wait_ms=triton_settings.max_batch_wait_ms,
+    executor=ThreadPoolExecutor(max_workers=triton_settings.client_pool_size),
+)
+
 
 class CompletionRequest(BaseModel):
     model: str
@@ -96,7 +148,9 @@ async def check_triton_health():
     )
     logging.info(f"Attempting to connect to Triton server at: {triton_url}")
     try:
-        response = requests.get(triton_url, timeout=5)
+        response = await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(requests.get, triton_url, timeout=5)
+        )
         if response.status_code == 200:
             return {"status": "Triton server is reachable and ready"}
         else:
@@ -106,26 +160,39 @@ async def check_triton_health():
 
 
 @app.post("/v1/completions/")
-def completions_v1(request: CompletionRequest):
+async def completions_v1(request: CompletionRequest):
     try:
-        url = triton_settings.triton_service_ip + ":" + str(triton_settings.triton_service_port)
-        nq = NemoQueryLLM(url=url, model_name=request.model)
-        output = nq.query_llm(
-            prompts=[request.prompt],
-            max_output_len=request.max_tokens,
-            # when these below params are passed as None
-            top_k=request.top_k,
-            top_p=request.top_p,
+        # Concurrent requests with the same model and sampling parameters are sent to Triton as one batch.
+        params = CompletionParams(
+            model=request.model,
+            max_tokens=request.max_tokens,
             temperature=request.temperature,
-            init_timeout=triton_settings.triton_request_timeout,
-            openai_format_response=triton_settings.openai_format_response,
-            output_generation_logits=triton_settings.output_generation_logits,
+            top_p=request.top_p,
+            top_k=request.top_k,
         )
+        output = await batcher.submit(params, request.prompt)
+        if "sentences" not in output:
+            # The model does not output text, its raw outputs are returned.
+            if triton_settings.openai_format_response:
+                return output["outputs"].tolist()
+            else:
+                return {
+                    "output": output["outputs"][0][0].tolist(),
+                }
         if triton_settings.openai_format_response:
-            return output
+            openai_response = {
+                "id": f"cmpl-{int(time.time())}",
+                "object": "text_completion",
+                "created": int(time.time()),
+                "model": request.model,
+                "choices": [{"text": output["sentences"].tolist()}],
+            }
+            if "generation_logits" in output:
+                openai_response["choices"][0]["generation_logits"] = output["generation_logits"].tolist()
+            return openai_response
         else:
             return {
-                "output": output[0][0],
+                "output": output["sentences"][0][0],
             }
     except Exception as error:
         logging.error("An exception occurred with the post request to /v1/completions/ endpoint:", error)
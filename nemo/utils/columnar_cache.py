@@ -0,0 +1,250 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent columnar cache of preprocessed data.
+
+Parsing and tokenizing a large dataset is repeated by every rank of every training job. The helpers below store the
+result of that work as a directory of flat NumPy arrays (one ``.npy`` file per column) which is later loaded with
+``mmap_mode='r'``, so that loading is close to free and all processes on a node share a single copy of the data
+through the page cache.
+
+The cache directory name is a content hash of the source files (path, size and modification time) and of the
+settings the data was preprocessed with, so a stale cache is never picked up after any of these change.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from nemo.utils import logging
+from nemo.utils.data_utils import DataStoreObject, is_datastore_path
+
+__all__ = [
+    'ColumnarCache',
+    'PROBE_TEXT',
+    'decode_string',
+    'encode_ragged',
+    'encode_strings',
+]
+
+# Bump when the on-disk layout of the cache changes.
+CACHE_VERSION = 2
+
+_META_FILENAME = 'meta.json'
+# A fixed string tokenized as part of cache keys, which catches tokenizer changes
+# that are not visible through the tokenizer attributes.
+PROBE_TEXT = "the quick brown fox jumps over the lazy dog 0123456789"
+
+
+def encode_strings(values: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encodes a sequence of strings into a flat UTF-8 byte buffer and an offsets array.
+
+    Args:
+        values: strings to encode.
+
+    Returns:
+        A tuple of ``uint8`` buffer and ``int64`` offsets of length ``len(values) + 1``,
+        such that the i-th string is ``buffer[offsets[i]:offsets[i + 1]]``.
+    """
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buffer, offsets
+
+
+def decode_string(buffer: np.ndarray, offsets: np.ndarray, index: int) -> str:
+    """Decodes the ``index``-th string from a buffer created by :func:`encode_strings`."""
+    return buffer[offsets[index] : offsets[index + 1]].tobytes().decode('utf-8')
+
+
+def encode_ragged(sequences: Sequence[Sequence[int]], dtype=np.int32) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenates integer sequences of different lengths into a flat array and an offsets array.
+
+    Args:
+        sequences: integer sequences to encode.
+        dtype: dtype of the flat array.
+
+    Returns:
+        A tuple of flat values and ``int64`` offsets of length ``len(sequences) + 1``.
+    """
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(sequence) for sequence in sequences], out=offsets[1:])
+    flat = np.fromiter((value for sequence in sequences for value in sequence), dtype=dtype, count=int(offsets[-1]))
+    return flat, offsets
+
+
+def _file_state(path: str) -> Dict[str, Any]:
+    local_file = DataStoreObject(path).get() if is_datastore_path(path) else path
+    local_file = os.path.abspath(os.path.expanduser(local_file))
+    stat = os.stat(local_file)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class ColumnarCache:
+    """On-disk columnar cache of data preprocessed from one or more source files.
+
+    Each cache entry is a directory named after the cache key under ``cache_dir`` which contains one ``.npy`` file
+    per column and a ``meta.json`` file with JSON-serializable metadata. Entries are written to a temporary
+    directory first and atomically renamed, so concurrent writers (e.g. several ranks on a node sharing a cache
+    directory) never observe partially written entries.
+
+    Large entries can be built in parts, e.g. one per rank, with :meth:`part` and then concatenated with
+    :meth:`merge`.
+
+    Args:
+        cache_dir: directory holding cache entries.
+        files: either a single source file or a list of source files.
+        **settings: settings that affect the result, compared through their ``repr``.
+    """
+
+    def __init__(self, cache_dir: str, files: Union[str, List[str]], **settings):
+        if isinstance(files, str):
+            files = [files]
+
+        key_state = {
+            'version': CACHE_VERSION,
+            'files': [_file_state(path) for path in files],
+            'settings': {name: repr(value) for name, value in settings.items()},
+        }
+        self.key = hashlib.sha256(json.dumps(key_state, sort_keys=True).encode('utf-8')).hexdigest()
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, self.key)
+
+    def exists(self) -> bool:
+        return os.path.isfile(os.path.join(self.path, _META_FILENAME))
+
+    def load(self, mmap: bool = True) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """Loads the cached columns, memory-mapped by default.
+
+        Returns:
+            A tuple of a dictionary of column arrays and the metadata dictionary,
+            or None if the cache entry does not exist or cannot be read.
+        """
+        if not self.exists():
+            return None
+        try:
+            with open(os.path.join(self.path, _META_FILENAME), 'r') as f:
+                meta = json.load(f)
+            columns = {
+                name: np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r' if mmap else None)
+                for name in meta['columns']
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Failed to load cache from {self.path}, it will be rebuilt: {e}")
+            return None
+        return columns, meta
+
+    def save(self, columns: Dict[str, np.ndarray], meta: Optional[Dict[str, Any]] = None) -> None:
+        """Writes the columns and metadata as a new cache entry, unless another process already did."""
+
+        def write_columns(tmp_path):
+            for name, values in columns.items():
+                np.save(os.path.join(tmp_path, f'{name}.npy'), np.ascontiguousarray(values))
+
+        self._write(write_columns, columns.keys(), meta)
+
+    def merge(
+        self,
+        parts: Sequence['ColumnarCache'],
+        offsets_columns: Iterable[str] = (),
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Writes the concatenation of the columns of ``parts`` as a new cache entry, unless another process already did.
+
+        Columns are copied part by part, so the whole entry is never held in memory.
+
+        Args:
+            parts: cache entries with the same columns, e.g. created with :meth:`part`.
+            offsets_columns: names of offsets columns, as created by :func:`encode_strings` or :func:`encode_ragged`.
+                Their leading zero is dropped and they are shifted by the total size of the previous parts.
+            meta: metadata of the new entry.
+        """
+        loaded = [part.load() for part in parts]
+        missing = [part.path for part, part_loaded in zip(parts, loaded) if part_loaded is None]
+        if missing:
+            raise FileNotFoundError(f"Cannot merge cache entries, some parts are missing: {missing}")
+        names = loaded[0][1]['columns']
+        offsets_columns = set(offsets_columns)
+
+        def write_columns(tmp_path):
+            for name in names:
+                arrays = [columns[name] for columns, _ in loaded]
+                is_offsets = name in offsets_columns
+                length = sum(len(array) - is_offsets for array in arrays) + is_offsets
+                merged = np.lib.format.open_memmap(
+                    os.path.join(tmp_path, f'{name}.npy'),
+                    mode='w+',
+                    dtype=arrays[0].dtype,
+                    shape=(length,) + arrays[0].shape[1:],
+                )
+                position, shift = 0, 0
+                if is_offsets:
+                    merged[0] = 0
+                    position = 1
+                for array in arrays:
+                    if is_offsets:
+                        merged[position : position + len(array) - 1] = array[1:] + shift
+                        shift += array[-1]
+                        position += len(array) - 1
+                    else:
+                        merged[position : position + len(array)] = array
+                        position += len(array)
+                merged.flush()
+                del merged
+
+        self._write(write_columns, names, meta)
+
+    def part(self, index: int, num_parts: int) -> 'ColumnarCache':
+        """Returns the cache entry holding the ``index``-th of ``num_parts`` parts of this entry, see :meth:`merge`."""
+        part = copy.copy(self)
+        part.cache_dir = f'{self.path}.parts'
+        part.key = f'{index}-of-{num_parts}'
+        part.path = os.path.join(part.cache_dir, part.key)
+        return part
+
+    def remove_parts(self) -> None:
+        """Removes all the parts of this entry created with :meth:`part`."""
+        shutil.rmtree(f'{self.path}.parts', ignore_errors=True)
+
+    def _write(self, write_columns: Callable[[str], None], names: Iterable[str], meta: Optional[Dict[str, Any]]):
+        if self.exists():
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta = dict(meta or {})
+        meta['columns'] = sorted(names)
+        meta['version'] = CACHE_VERSION
+
+        tmp_path = tempfile.mkdtemp(dir=self.cache_dir, prefix=f'.{self.key}.')
+        try:
+            write_columns(tmp_path)
+            with open(os.path.join(tmp_path, _META_FILENAME), 'w') as f:
+                json.dump(meta, f)
+            try:
+                os.rename(tmp_path, self.path)
+            except OSError:
+                # Another process has written the same entry in the meantime.
+                if not self.exists():
+                    raise
+        finally:
+            if os.path.exists(tmp_path):
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        logging.info(f"Saved cache to {self.path}")
@@ -13,14 +13,62 @@
 # limitations under the License.
 
 import collections
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 from tqdm import tqdm
 
 from nemo.utils import logging
 
-PACKING_ALGOS = ['first_fit_decreasing', 'first_fit_shuffle']
+PACKING_ALGOS = [
+    'first_fit_decreasing',
+    'first_fit_shuffle',
+    'fast_first_fit_decreasing',
+    'fast_first_fit_shuffle',
+    'best_fit_decreasing',
+]
+
+
+class _MaxSegmentTree:
+    """
+    Array-based segment tree over non-negative integer values supporting point updates and
+    "leftmost position at or after `start` whose value is at least `threshold`" queries in O(log n).
+    """
+
+    def __init__(self, size: int):
+        self.size = 1
+        while self.size < max(size, 1):
+            self.size *= 2
+        self.tree = [0] * (2 * self.size)
+
+    def update(self, position: int, value: int):
+        node = position + self.size
+        self.tree[node] = value
+        node //= 2
+        while node >= 1:
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def find_first(self, threshold: int, start: int = 0) -> int:
+        """Returns the leftmost position >= `start` with a value >= `threshold`, or -1 if there is none."""
+        if start >= self.size:
+            return -1
+        tree = self.tree
+        node = start + self.size
+        if tree[node] >= threshold:
+            return start
+        # Walk up until a right sibling subtree contains a large enough value.
+        while True:
+            if node == 1:
+                return -1
+            if node % 2 == 0 and tree[node + 1] >= threshold:
+                node += 1
+                break
+            node //= 2
+        # Descend into the leftmost large enough leaf.
+        while node < self.size:
+            node = 2 * node if tree[2 * node] >= threshold else 2 * node + 1
+        return node - self.size
 
 
 def find_first_bin_that_fits(bins: List[List[int]], s: int, bin_size: int) -> int:
@@ -62,6 +110,71 @@ def first_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
     return res
 
 
+def fast_first_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the First-Fit algorithm in O(n log n).
+
+    The remaining capacities of the bins are kept in a segment tree, so finding the first bin that fits
+    takes logarithmic time instead of a scan over all bins. The result is identical to that of `first_fit`.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    res = []
+    # There can never be more bins than sequences.
+    remaining = _MaxSegmentTree(len(seqlens))
+    for s in seqlens:
+        first_bin = remaining.find_first(s)
+        if first_bin == -1 or first_bin >= len(res):  # open a new bin
+            first_bin = len(res)
+            res.append([s])
+            remaining.update(first_bin, pack_size - s)
+        else:
+            res[first_bin].append(s)
+            remaining.update(first_bin, remaining.tree[remaining.size + first_bin] - s)
+    return res
+
+
+def best_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the Best-Fit algorithm in O(n log pack_size).
+
+    Each sequence goes into the bin with the smallest remaining capacity that can still fit it
+    (ties are broken in favor of the bin which most recently reached that capacity), which usually
+    leaves less fragmented space than First-Fit.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    res = []
+    # Bins indexed by their remaining capacity, and a segment tree over capacities counting them.
+    bins_by_capacity = collections.defaultdict(list)
+    num_bins = _MaxSegmentTree(pack_size + 1)
+    for s in seqlens:
+        capacity = num_bins.find_first(1, start=s) if s <= pack_size else -1
+        if capacity == -1:  # open a new bin
+            bin_id = len(res)
+            res.append([s])
+            new_capacity = pack_size - s
+        else:
+            bin_id = bins_by_capacity[capacity].pop()
+            num_bins.update(capacity, len(bins_by_capacity[capacity]))
+            res[bin_id].append(s)
+            new_capacity = capacity - s
+        if new_capacity >= 0:
+            bins_by_capacity[new_capacity].append(bin_id)
+            num_bins.update(new_capacity, len(bins_by_capacity[new_capacity]))
+    return res
+
+
 def first_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
     """
     Packs sequences of varying lengths into bins using the First-Fit Decreasing algorithm.
@@ -97,6 +210,54 @@ def first_fit_shuffle(seqlens: List[int], pack_size: int) -> List[List[int]]:
     return first_fit(shuffled_seqlens, pack_size)
 
 
+def fast_first_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Same as `first_fit_decreasing`, using the O(n log n) `fast_first_fit` implementation.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    sorted_seqlens = sorted(seqlens, reverse=True)
+    return fast_first_fit(sorted_seqlens, pack_size)
+
+
+def fast_first_fit_shuffle(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Same as `first_fit_shuffle`, using the O(n log n) `fast_first_fit` implementation.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    shuffled_seqlens = seqlens[:]
+    np.random.shuffle(shuffled_seqlens)
+    return fast_first_fit(shuffled_seqlens, pack_size)
+
+
+def best_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the Best-Fit Decreasing algorithm.
+
+    This is a variation of the Best-Fit algorithm where the sequences are sorted by decreasing length before packing.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    sorted_seqlens = sorted(seqlens, reverse=True)
+    return best_fit(sorted_seqlens, pack_size)
+
+
 def create_hist(dataset: np.array, truncate_seq_len: int):
     """
     Creates a histogram of sequence lengths from a tokenized dataset.
@@ -148,7 +309,7 @@ def create_packing_strategy(
     Args:
           histogram: A list representing the histogram data (number of sequences for each length).
           pack_size: The maximum capacity of each bin.
-          packing_algorithm: One of the supported packing algorithms from ['first_fit_decreasing', 'first_fit_shuffle']
+          packing_algorithm: One of the supported packing algorithms from `PACKING_ALGOS`
 
     Returns:
           assignments: A list of lists, where each inner list represents a bin and contains the indices of the
@@ -180,6 +341,60 @@ def create_packing_strategy(
     return assignments, packing_metadata
 
 
+def assign_sequences_to_packs(
+    assignments: List[List[int]], seqlens: np.ndarray, pack_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matches each entry of the packing strategy with the index of an actual sequence, without accessing the sequence data.
+
+    Sequences of each length are shuffled exactly like in 'fill_packing_strategy', so that for a given random state,
+    the packs are made of the same sequences in the same order. This allows packing datasets that do not fit
+    in memory: only the sequence lengths are needed here, and the tokens can be gathered from disk afterwards.
+
+    Args:
+          assignments: A list of lists, where each inner list represents a bin and contains the indices of the
+                        sequence lengths assigned to that bin (output of 'create_packing_strategy').
+          seqlens: The length of every sequence of the dataset, computed as in 'create_hist' (number of tokens - 1).
+          pack_size: The maximum capacity of each bin.
+
+    Returns:
+          sequence_ids: The indices of the sequences of all bins, concatenated.
+          bin_offsets: An array of size `len(assignments) + 1` such that the sequences of the i-th bin are
+                        `sequence_ids[bin_offsets[i]:bin_offsets[i + 1]]`.
+    """
+    seqlens = np.asarray(seqlens, dtype=np.int64)
+    # Indices of the sequences of each length, in dataset order.
+    ids_by_len = np.argsort(seqlens, kind='stable')
+    len_starts = np.searchsorted(seqlens[ids_by_len], np.arange(pack_size + 2))
+
+    bin_sizes = np.array([len(assignment) for assignment in assignments], dtype=np.int64)
+    entry_lens = np.fromiter(
+        (seq_len for assignment in assignments for seq_len in assignment), dtype=np.int64, count=int(bin_sizes.sum())
+    )
+    order = np.argsort(entry_lens, kind='stable')
+    unique_lens, group_starts, group_counts = np.unique(entry_lens[order], return_index=True, return_counts=True)
+
+    available = {
+        seq_len: int(len_starts[seq_len + 1] - len_starts[seq_len])
+        for seq_len in range(pack_size + 1)
+        if len_starts[seq_len + 1] > len_starts[seq_len]
+    }
+    requested = dict(zip(unique_lens.tolist(), group_counts.tolist()))
+    for seq_len, count in requested.items():
+        if available.get(seq_len, 0) < count:
+            raise ValueError(f"Error: Not enough sequences of length {seq_len} to fill the assignment")
+    assert requested == available, "Error: There are items left over from the assignment"
+
+    sequence_ids = np.empty(len(entry_lens), dtype=np.int64)
+    for seq_len, start, count in zip(unique_lens.tolist(), group_starts.tolist(), group_counts.tolist()):
+        ids = ids_by_len[len_starts[seq_len] : len_starts[seq_len + 1]]
+        sequence_ids[order[start : start + count]] = ids[np.random.permutation(len(ids))][::-1]
+
+    bin_offsets = np.zeros(len(assignments) + 1, dtype=np.int64)
+    np.cumsum(bin_sizes, out=bin_offsets[1:])
+    return sequence_ids, bin_offsets
+
+
 def fill_packing_strategy(
     assignments: List[List[int]], sequences: Dict[int, List[Dict]], pack_size: int, pad_id: int
 ) -> List[Dict]:
@@ -187,9 +402,10 @@ def fill_packing_strategy(
     Fills the packing strategy with actual sequence data based on assignments and sequence information.
 
     This function takes the assignments generated by the packing algorithm (containing sequence length indices),
-    the original sequences data, and the pack size. It iterates through the assignments, retrieves the corresponding
-    sequences from the sequences dictionary, and constructs the final output data structure with input IDs, loss masks
-    (if available), and starting indices for each sequence in a packed sequence.
+    the original sequences data, and the pack size. Sequences of each length are shuffled, stacked into a 2D array
+    and their loss masks are computed with array operations. Each entry of the assignments is then matched with
+    a sequence of the corresponding length, and all packed sequences are gathered into a flat token buffer at once,
+    so that no Python loop runs over individual tokens.
 
     Args:
           assignments: A list of lists, where each inner list represents a bin and contains the indices of the
@@ -203,45 +419,60 @@ def fill_packing_strategy(
           output_data: A list of dictionaries, where each dictionary represents a packed sequence with its input IDs,
                         loss mask (if available), and starting indices.
     """
-    ifile_handles = dict()
-    for seq_len in tqdm(range(pack_size + 1)):
-        per_seq_data = sequences[seq_len]
+    # Shuffle the sequences of each length. Rows are reversed, as sequences used to be popped from the end
+    # of the shuffled lists, which keeps the output identical for a given random state.
+    shuffled = {}
+    for seq_len in range(pack_size + 1):
+        per_seq_data = sequences.get(seq_len, [])
         if len(per_seq_data) > 0:
             perm = np.random.permutation(len(per_seq_data))
-            input_ids = np.array([x['input_ids'] for x in per_seq_data])[perm].tolist()
-            try:
-                loss_mask = np.array(
-                    [
-                        [
-                            idx >= x['answer_start_idx'] and x['input_ids'][idx] != pad_id
-                            for idx in range(len(x['input_ids']))
-                        ]
-                        for x in per_seq_data
-                    ]
-                )[perm].tolist()
-            except KeyError:
-                loss_mask = None
-            ifile_handles[seq_len] = (input_ids, loss_mask)
-
-    input_ids, loss_mask, seq_start_id = {}, {}, {}
-
-    for oindex, assignment in tqdm(enumerate(assignments), total=len(assignments)):
-        _input_ids, _loss_mask, _seq_start_id = [], [], [0]
-
-        for seq_length in assignment:
-            _input_ids.extend(ifile_handles[seq_length][0].pop())
-            _loss_mask.extend(ifile_handles[seq_length][1].pop())
-            _seq_start_id.append(len(_input_ids))
-
-        input_ids[oindex] = _input_ids
-        loss_mask[oindex] = _loss_mask
-        seq_start_id[oindex] = _seq_start_id[:-1]
-
+            input_ids = np.array([x['input_ids'] for x in per_seq_data]).reshape(len(per_seq_data), -1)
+            answer_start_idx = np.array([x.get('answer_start_idx', 0) for x in per_seq_data])
+            loss_mask = (np.arange(input_ids.shape[1])[None, :] >= answer_start_idx[:, None]) & (input_ids != pad_id)
+            shuffled[seq_len] = (input_ids[perm][::-1], loss_mask[perm][::-1])
+
+    # Flatten the assignments and group the entries by length, keeping their order within each group.
+    bin_sizes = np.array([len(assignment) for assignment in assignments], dtype=np.int64)
+    entry_lens = np.fromiter(
+        (seq_len for assignment in assignments for seq_len in assignment), dtype=np.int64, count=int(bin_sizes.sum())
+    )
+    order = np.argsort(entry_lens, kind='stable')
+    unique_lens, group_starts, group_counts = np.unique(entry_lens[order], return_index=True, return_counts=True)
+
+    groups = list(zip(unique_lens.tolist(), group_starts.tolist(), group_counts.tolist()))
+    available = {seq_len: len(input_ids) for seq_len, (input_ids, _) in shuffled.items()}
+    requested = {seq_len: count for seq_len, _, count in groups}
+    for seq_len, count in requested.items():
+        if available.get(seq_len, 0) < count:
+            raise ValueError(f"Error: Not enough sequences of length {seq_len} to fill the assignment")
+    assert requested == available, "Error: There are items left over from the assignment"
+
+    # Gather the tokens of all packed sequences into flat buffers.
+    entry_widths = np.zeros(len(entry_lens), dtype=np.int64)
+    for seq_len, start, count in groups:
+        entry_widths[order[start : start + count]] = shuffled[seq_len][0].shape[1]
+    entry_offsets = np.zeros(len(entry_lens) + 1, dtype=np.int64)
+    np.cumsum(entry_widths, out=entry_offsets[1:])
+    flat_input_ids = np.empty(entry_offsets[-1], dtype=np.int64)
+    flat_loss_mask = np.empty(entry_offsets[-1], dtype=bool)
+    for seq_len, start, count in groups:
+        input_ids, loss_mask = shuffled[seq_len]
+        entries = order[start : start + count]
+        positions = entry_offsets[entries][:, None] + np.arange(input_ids.shape[1])[None, :]
+        flat_input_ids[positions] = input_ids[:count]
+        flat_loss_mask[positions] = loss_mask[:count]
+
+    bin_offsets = np.zeros(len(assignments) + 1, dtype=np.int64)
+    np.cumsum(bin_sizes, out=bin_offsets[1:])
     output_data = []
-    for i in range(len(input_ids)):
-        item_dict = {'input_ids': input_ids[i], 'loss_mask': loss_mask[i], 'seq_start_id': seq_start_id[i]}
+    for oindex in tqdm(range(len(assignments)), total=len(assignments)):
+        first_entry, last_entry = bin_offsets[oindex], bin_offsets[oindex + 1]
+        start, end = entry_offsets[first_entry], entry_offsets[last_entry]
+        item_dict = {
+            'input_ids': flat_input_ids[start:end].tolist(),
+            'loss_mask': flat_loss_mask[start:end].tolist(),
+            'seq_start_id': (entry_offsets[first_entry:last_entry] - start).tolist(),
+        }
         output_data.append(item_dict)
 
-    assert all(not seq[0] for seq in ifile_handles.values()), "Error: There are items left over from the assignment"
-    assert all(not seq[1] for seq in ifile_handles.values()), "Error: There are items left over from the assignment"
     return output_data
@@ -0,0 +1,167 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the n-gram LM scoring used for shallow fusion in beam search: scores of all the tokens after all the
+hypotheses of a beam, computed token by token (like `BeamRNNTInfer.compute_ngram_score`, with KenLM if installed)
+vs. with a single `NGramGPULanguageModel.advance` call.
+
+# Usage
+    # Synthetic 3-gram model with 1024 subword tokens
+    python benchmark_ngram_lm_fusion.py --vocab_size 1024 --num_bigrams 500000 --num_trigrams 1000000
+
+    # Existing ARPA model of a subword model (see train_kenlm.py)
+    python benchmark_ngram_lm_fusion.py --arpa lm.arpa --vocab_size 1024 --beam_size 8 --device cuda
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import torch
+
+from nemo.collections.asr.parts.submodules.ctc_beam_decoding import DEFAULT_TOKEN_OFFSET
+from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
+from nemo.utils import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-token vs. batched n-gram LM scoring.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--arpa", default=None, help="ARPA model of a subword model. Synthetic model if not set.")
+    parser.add_argument("--vocab_size", type=int, default=1024, help="Number of tokens of the ASR model.")
+    parser.add_argument("--num_bigrams", type=int, default=200000, help="Bigrams of the synthetic model.")
+    parser.add_argument("--num_trigrams", type=int, default=400000, help="Trigrams of the synthetic model.")
+    parser.add_argument("--beam_size", type=int, default=8, help="Number of hypotheses scored at each step.")
+    parser.add_argument("--num_steps", type=int, default=20, help="Number of decoding steps.")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def write_synthetic_arpa(path: str, vocab_size: int, num_bigrams: int, num_trigrams: int, seed: int):
+    rng = np.random.default_rng(seed)
+    words = np.array([chr(i + DEFAULT_TOKEN_OFFSET) for i in range(vocab_size)] + ["</s>"])
+    bigrams = np.unique(rng.integers(0, vocab_size, size=(num_bigrams, 2)), axis=0)
+    # trigrams (a, b, c) such that (b, c) is a bigram, for the suffix closure of the model
+    first = rng.integers(0, vocab_size, size=num_trigrams)
+    suffixes = bigrams[rng.integers(0, len(bigrams), size=num_trigrams)]
+    trigrams = np.unique(np.column_stack([first, suffixes]), axis=0)
+    # prefixes of the trigrams must be bigrams too
+    bigrams = np.unique(np.concatenate([bigrams, trigrams[:, :2]]), axis=0)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"\\data\\\nngram 1={vocab_size + 3}\nngram 2={len(bigrams)}\nngram 3={len(trigrams)}\n")
+        f.write("\n\\1-grams:\n")
+        f.write(f"-99\t<s>\t{-rng.uniform():.4f}\n{-rng.uniform(4, 6):.4f}\t<unk>\n")
+        for word in words:
+            f.write(f"{-rng.uniform(1, 5):.4f}\t{word}\t{-rng.uniform():.4f}\n")
+        f.write("\n\\2-grams:\n")
+        for a, b in bigrams:
+            f.write(f"{-rng.uniform(0.1, 3):.4f}\t{words[a]} {words[b]}\t{-rng.uniform():.4f}\n")
+        f.write("\n\\3-grams:\n")
+        for a, b, c in trigrams:
+            f.write(f"{-rng.uniform(0.1, 2):.4f}\t{words[a]} {words[b]} {words[c]}\n")
+        f.write("\n\\end\\\n")
+
+
+def per_token_scores(score_fn, states, vocab_size):
+    return [[score_fn(state, token) for token in range(vocab_size)] for state in states]
+
+
+def main():
+    args = parse_args()
+    device = torch.device(args.device)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        arpa_path = args.arpa
+        if arpa_path is None:
+            arpa_path = os.path.join(tmp_dir, "lm.arpa")
+            write_synthetic_arpa(arpa_path, args.vocab_size, args.num_bigrams, args.num_trigrams, args.seed)
+        start = time.perf_counter()
+        lm = NGramGPULanguageModel.from_arpa(arpa_path, args.vocab_size, token_offset=DEFAULT_TOKEN_OFFSET)
+        load_seconds = time.perf_counter() - start
+        lm = lm.to(device)
+
+        kenlm_model = None
+        try:
+            import kenlm
+
+            kenlm_model = kenlm.Model(arpa_path)
+        except (ImportError, ModuleNotFoundError):
+            logging.warning("KenLM is not installed, the per-token baseline uses `NGramGPULanguageModel`")
+
+    # random walk in the model to get realistic states
+    rng = torch.Generator().manual_seed(args.seed)
+    tokens = torch.randint(0, args.vocab_size, (args.num_steps, args.beam_size), generator=rng).to(device)
+    states = lm.get_init_states(args.beam_size)
+    all_states = []
+    for step in range(args.num_steps):
+        all_states.append(states)
+        states = lm.advance(states)[1][torch.arange(args.beam_size, device=device), tokens[step]]
+
+    rows = []
+    if kenlm_model is not None:
+        kenlm_states = []
+        for b in range(args.beam_size):
+            state = kenlm.State()
+            kenlm_model.BeginSentenceWrite(state)
+            kenlm_states.append(state)
+
+        def kenlm_score(state, token):
+            next_state = kenlm.State()
+            return kenlm_model.BaseScore(state, chr(token + DEFAULT_TOKEN_OFFSET), next_state)
+
+        start = time.perf_counter()
+        for _ in range(args.num_steps):
+            per_token_scores(kenlm_score, kenlm_states, args.vocab_size)
+        rows.append(("KenLM, per token", time.perf_counter() - start))
+    else:
+
+        def tensor_score(state, token):
+            score, next_state = lm.score_labels(torch.tensor(state, device=device), torch.tensor(token, device=device))
+            return score.item(), next_state.item()
+
+        # the per-token baseline is very slow, a few steps are enough
+        num_steps = min(args.num_steps, 2)
+        start = time.perf_counter()
+        for step in range(num_steps):
+            per_token_scores(tensor_score, all_states[step].tolist(), args.vocab_size)
+        rows.append(("tensors, per token", (time.perf_counter() - start) * args.num_steps / num_steps))
+
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for step in range(args.num_steps):
+        scores, next_states = lm.advance(all_states[step])
+        scores.tolist()
+    rows.append(("tensors, batched (advance)", time.perf_counter() - start))
+
+    print(
+        f"{lm.order}-gram model: {lm.num_states} states, {lm.arc_keys.shape[0]} arcs, loaded in {load_seconds:.1f} s"
+    )
+    print(f"{args.num_steps} steps of {args.beam_size} hypotheses x {args.vocab_size} tokens on {device}")
+    print(f"{'mode':<28}{'ms / step':>12}{'speedup':>10}")
+    baseline = rows[0][1]
+    for name, seconds in rows:
+        print(f"{name:<28}{seconds * 1000 / args.num_steps:>12.2f}{baseline / seconds:>10.1f}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
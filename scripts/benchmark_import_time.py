@@ -0,0 +1,151 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the time it takes to import NeMo modules, each in a fresh interpreter, using `python -X importtime`.
+
+For each module, reports the import time (best of several runs), the number of modules it imports, and the packages
+that contribute the most to it. The results can be saved as a baseline, and later runs compared against it: the
+script exits with an error if a module takes noticeably longer to import than in the baseline.
+
+# Usage
+python scripts/benchmark_import_time.py \
+    --modules nemo.collections.asr nemo.collections.asr.parts.utils.manifest_utils \
+    --save_baseline import_time.json
+
+python scripts/benchmark_import_time.py --baseline import_time.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+
+DEFAULT_MODULES = [
+    "nemo.collections.common",
+    "nemo.collections.asr",
+    "nemo.collections.audio",
+    "nemo.collections.nlp",
+    "nemo.collections.tts",
+    "nemo.collections.common.tokenizers",
+    "nemo.collections.asr.parts.utils.manifest_utils",
+    "nemo.collections.asr.models",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description="Measure the import time of NeMo modules.",
+    )
+    parser.add_argument("--modules", type=str, nargs="+", default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of runs per module, the best one is kept")
+    parser.add_argument("--top", type=int, default=5, help="Number of most expensive packages shown per module")
+    parser.add_argument("--baseline", type=str, default=None, help="JSON file of import times to compare against")
+    parser.add_argument("--save_baseline", type=str, default=None, help="Save the import times to this JSON file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed relative increase of import time over the baseline"
+    )
+    parser.add_argument(
+        "--min_regression_s", type=float, default=0.2, help="Import time increases below this are never reported"
+    )
+    return parser.parse_args()
+
+
+def run_importtime(statement):
+    """Runs `statement` in a fresh interpreter and returns the (name, self_us, cumulative_us, depth) of each import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"`{statement}` failed:\n{result.stderr}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def package_of(name):
+    """Groups NeMo modules by collection (e.g. nemo.collections.asr) and other modules by top-level package."""
+    parts = name.split(".")
+    if parts[0] == "nemo":
+        return ".".join(parts[:3])
+    return parts[0]
+
+
+def measure(module, repeats, startup_modules):
+    """Returns the best import time of `module` in seconds, the number of imported modules and the time per package."""
+    best = None
+    for _ in range(repeats):
+        imports = [i for i in run_importtime(f"import {module}") if i[0] not in startup_modules]
+        total_us = sum(cumulative_us for _, _, cumulative_us, depth in imports if depth == 0)
+        if best is None or total_us < best[0]:
+            best = (total_us, imports)
+
+    total_us, imports = best
+    per_package = defaultdict(int)
+    for name, self_us, _, _ in imports:
+        per_package[package_of(name)] += self_us
+    return total_us / 1e6, len(imports), {name: us / 1e6 for name, us in per_package.items()}
+
+
+def main():
+    args = parse_args()
+
+    # Modules imported by the interpreter itself are not part of the cost of importing NeMo.
+    startup_modules = {name for name, _, _, _ in run_importtime("pass")}
+    baseline = {}
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    regressions = []
+    width = max(len(module) for module in args.modules)
+    print(f"{'module':<{width}} {'import s':>9} {'baseline s':>11} {'modules':>8}  most expensive packages")
+    for module in args.modules:
+        try:
+            seconds, num_modules, per_package = measure(module, args.repeats, startup_modules)
+        except RuntimeError as error:
+            print(f"{module:<{width}} import failed: {str(error).strip().splitlines()[-1]}")
+            continue
+        results[module] = seconds
+
+        top = sorted(per_package.items(), key=lambda item: -item[1])[: args.top]
+        top = ", ".join(f"{name} {package_seconds:.2f}" for name, package_seconds in top)
+        baseline_seconds = f"{baseline[module]:.2f}" if module in baseline else "-"
+        print(f"{module:<{width}} {seconds:>9.2f} {baseline_seconds:>11} {num_modules:>8}  {top}")
+
+        if module in baseline:
+            allowed = max(baseline[module] * (1 + args.tolerance), baseline[module] + args.min_regression_s)
+            if seconds > allowed:
+                regressions.append(f"{module}: {seconds:.2f} s, baseline {baseline[module]:.2f} s")
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if regressions:
+        print("Import time regressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the overhead of `typecheck` on the forward call of a small module, with type checks enabled, with semantic
+checks disabled, and with type checks disabled.
+
+The module is a chain of tiny typed layers, similar to the modules called on every step of streaming inference, so
+the cost of the call is dominated by the type checks rather than by the computation.
+
+# Usage
+python scripts/benchmark_typecheck_overhead.py --num_layers 4 --batch_size 1 --num_calls 2000
+"""
+
+import argparse
+import time
+
+import torch
+
+from nemo.core.classes import NeuralModule, typecheck
+from nemo.core.neural_types import AcousticEncodedRepresentation, LengthsType, NeuralType
+
+
+class TypedLayer(NeuralModule):
+    def __init__(self, hidden_size: int):
+        super().__init__()
+        self.linear = torch.nn.Linear(hidden_size, hidden_size)
+
+    @property
+    def input_types(self):
+        return {
+            "x": NeuralType(('B', 'T', 'D'), AcousticEncodedRepresentation()),
+            "lengths": NeuralType(('B',), LengthsType()),
+        }
+
+    @property
+    def output_types(self):
+        return {
+            "y": NeuralType(('B', 'T', 'D'), AcousticEncodedRepresentation()),
+            "lengths": NeuralType(('B',), LengthsType()),
+        }
+
+    @typecheck()
+    def forward(self, x, lengths):
+        return self.linear(x), lengths
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description="Measure the overhead of typecheck on forward calls.",
+    )
+    parser.add_argument("--num_layers", type=int, default=4, help="Number of typed layers called in a chain")
+    parser.add_argument("--batch_size", type=int, default=1, help="Batch size of the inputs")
+    parser.add_argument("--num_frames", type=int, default=4, help="Number of frames of the inputs")
+    parser.add_argument("--hidden_size", type=int, default=64, help="Hidden size of the layers")
+    parser.add_argument("--num_calls", type=int, default=2000, help="Number of timed calls of the chain")
+    parser.add_argument("--warmup", type=int, default=100, help="Number of untimed calls before timing")
+    return parser.parse_args()
+
+
+def run_chain(layers, x, lengths):
+    for layer in layers:
+        x, lengths = layer(x=x, lengths=lengths)
+    return x
+
+
+def time_chain(layers, x, lengths, num_calls: int, warmup: int) -> float:
+    """Returns the average time of a call of the chain, in microseconds."""
+    with torch.inference_mode():
+        for _ in range(warmup):
+            run_chain(layers, x, lengths)
+        start = time.perf_counter()
+        for _ in range(num_calls):
+            run_chain(layers, x, lengths)
+        end = time.perf_counter()
+    return (end - start) / num_calls * 1e6
+
+
+def main():
+    args = parse_args()
+    layers = [TypedLayer(args.hidden_size).eval() for _ in range(args.num_layers)]
+    x = torch.randn(args.batch_size, args.num_frames, args.hidden_size)
+    lengths = torch.full((args.batch_size,), args.num_frames, dtype=torch.long)
+
+    results = {"enabled": time_chain(layers, x, lengths, args.num_calls, args.warmup)}
+    with typecheck.disable_semantic_checks():
+        results["semantic disabled"] = time_chain(layers, x, lengths, args.num_calls, args.warmup)
+    with typecheck.disable_checks():
+        results["disabled"] = time_chain(layers, x, lengths, args.num_calls, args.warmup)
+
+    baseline = results["disabled"]
+    print(f"{'typecheck':<20}{'us/call':>12}{'us/layer':>12}{'overhead':>12}")
+    for name, elapsed in results.items():
+        overhead = (elapsed - baseline) / args.num_layers
+        print(f"{name:<20}{elapsed:>12.1f}{elapsed / args.num_layers:>12.1f}{overhead:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -68,6 +68,14 @@ CFG_NAME2FUNC = {
 @hydra_runner(config_path='ljspeech/ds_conf', config_name='ds_for_fastpitch_align')
 def main(cfg):
     dataset = instantiate(cfg.dataset)
+
+    # Optionally compute supplementary data with a process pool and store it in one file per data type first, the
+    # dataloader below then only reads it back to compute the pitch statistics.
+    precompute_num_workers = cfg.get("precompute_num_workers", None)
+    if precompute_num_workers:
+        print(f"Precomputing supplementary data with {precompute_num_workers} workers:")
+        dataset.precompute_sup_data(num_workers=precompute_num_workers)
+
     dataloader = torch.utils.data.DataLoader(
         dataset=dataset,
         batch_size=1,
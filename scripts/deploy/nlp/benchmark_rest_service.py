@@ -0,0 +1,99 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Load tests the /v1/completions/ endpoint of the REST service (nemo/deploy/service/rest_model_api.py) with the local
+stand-in backend, for several micro-batching configurations. The service runs in-process, no Triton server is needed.
+
+# Usage
+python scripts/deploy/nlp/benchmark_rest_service.py \
+    --num_requests 512 \
+    --concurrency 64 \
+    --max_batch_sizes 1 8 32
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
+
+os.environ["REST_USE_LOCAL_BACKEND"] = "True"
+
+from nemo.deploy.service import rest_model_api  # noqa: E402
+from nemo.deploy.service.batching import LocalLLMBackend, MicroBatcher  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description="Load test the REST service with a local stand-in backend.",
+    )
+    parser.add_argument("--num_requests", type=int, default=512, help="Number of requests to send")
+    parser.add_argument("--concurrency", type=int, default=64, help="Number of requests in flight")
+    parser.add_argument("--max_batch_sizes", type=int, nargs="+", default=[1, 8, 32], help="Batch sizes to test")
+    parser.add_argument("--max_batch_wait_ms", type=float, default=5.0, help="Max time a request waits for a batch")
+    parser.add_argument("--client_pool_size", type=int, default=4, help="Number of batches in flight")
+    parser.add_argument("--batch_latency_ms", type=float, default=50.0, help="Simulated latency of a batch")
+    parser.add_argument("--prompt_latency_ms", type=float, default=1.0, help="Simulated latency of each prompt")
+    return parser.parse_args()
+
+
+async def run_load(num_requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def send(client, i):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/v1/completions/", json={"model": "local", "prompt": f"request {i}", "max_tokens": 4}
+            )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    transport = httpx.ASGITransport(app=rest_model_api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://rest") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(send(client, i) for i in range(num_requests)))
+        elapsed = time.perf_counter() - start
+    return elapsed, np.array(latencies)
+
+
+def main():
+    args = parse_args()
+
+    print(
+        f"{'max batch':>10} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'mean batch':>11} "
+        f"(requests={args.num_requests}, concurrency={args.concurrency})"
+    )
+    for max_batch_size in args.max_batch_sizes:
+        backend = LocalLLMBackend(batch_latency_ms=args.batch_latency_ms, prompt_latency_ms=args.prompt_latency_ms)
+        with ThreadPoolExecutor(max_workers=args.client_pool_size) as executor:
+            rest_model_api.batcher = MicroBatcher(
+                backend, max_batch_size=max_batch_size, max_wait_ms=args.max_batch_wait_ms, executor=executor
+            )
+            elapsed, latencies = asyncio.run(run_load(args.num_requests, args.concurrency))
+
+        print(
+            f"{max_batch_size:>10} {args.num_requests / elapsed:>10.1f} {np.percentile(latencies, 50) * 1000:>10.1f} "
+            f"{np.percentile(latencies, 99) * 1000:>10.1f} {np.mean(backend.batch_sizes):>11.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the build time of the Megatron dataset index builders, between the C++ helpers and their NumPy
+implementation, on a synthetic corpus. Outputs of both implementations are checked to be identical.
+
+The C++ helpers are compiled first unless --skip_cpp is set, and the time it takes is reported as well.
+
+# Usage
+python scripts/nlp_language_modeling/benchmark_dataset_index_builders.py --num_tokens 1000000000 --seq_length 2048
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from nemo.collections.nlp.data.language_modeling.megatron import numpy_helpers
+from nemo.collections.nlp.data.language_modeling.megatron.dataset_utils import compile_helper
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+        description="Benchmark the Megatron dataset index builders.",
+    )
+    parser.add_argument("--num_tokens", type=int, default=1_000_000_000, help="Number of tokens of the corpus")
+    parser.add_argument("--mean_doc_length", type=int, default=1000, help="Mean number of tokens per document")
+    parser.add_argument("--mean_sentence_length", type=int, default=30, help="Mean number of tokens per sentence")
+    parser.add_argument("--seq_length", type=int, default=2048, help="Sequence length of the samples")
+    parser.add_argument("--num_epochs", type=int, default=1, help="Number of epochs")
+    parser.add_argument("--num_datasets", type=int, default=4, help="Number of blended datasets")
+    parser.add_argument("--num_blended_samples", type=int, default=1_000_000, help="Number of blended samples")
+    parser.add_argument("--short_seq_prob", type=float, default=0.1, help="Short sequence probability of the mapping")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed")
+    parser.add_argument("--skip_cpp", action="store_true", help="Only time the NumPy implementation")
+    return parser.parse_args()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    helpers = None
+    if not args.skip_cpp:
+        _, compile_time = timed(compile_helper)
+        from nemo.collections.nlp.data.language_modeling.megatron import helpers
+
+        print(f"compiling C++ helpers: {compile_time:.2f} s")
+
+    num_docs = max(1, args.num_tokens // args.mean_doc_length)
+    sizes = rng.integers(1, 2 * args.mean_doc_length, size=num_docs, dtype=np.int32)
+    tokens_per_epoch = int(sizes.sum(dtype=np.int64))
+    doc_idx = np.concatenate([rng.permutation(num_docs).astype(np.int32) for _ in range(args.num_epochs)])
+
+    num_sentences = max(1, args.num_tokens // args.mean_sentence_length)
+    sentence_sizes = rng.integers(1, 2 * args.mean_sentence_length, size=num_sentences, dtype=np.int32)
+    sentences_per_doc = max(1, args.mean_doc_length // args.mean_sentence_length)
+    docs = np.arange(0, num_sentences + 1, sentences_per_doc, dtype=np.int64)
+    docs[-1] = num_sentences
+
+    weights = rng.random(args.num_datasets)
+    weights /= weights.sum()
+
+    def blending_indices(module):
+        dataset_index = np.zeros(args.num_blended_samples, dtype=np.uint8)
+        dataset_sample_index = np.zeros(args.num_blended_samples, dtype=np.int64)
+        module.build_blending_indices(
+            dataset_index, dataset_sample_index, weights, args.num_datasets, args.num_blended_samples, False
+        )
+        return dataset_index, dataset_sample_index
+
+    builders = {
+        "build_sample_idx": lambda module: module.build_sample_idx(
+            sizes, doc_idx, args.seq_length, args.num_epochs, tokens_per_epoch, True, 1
+        ),
+        "build_blending_indices": blending_indices,
+        "build_mapping": lambda module: module.build_mapping(
+            docs, sentence_sizes, args.num_epochs, 2**63 - 2, args.seq_length, args.short_seq_prob, args.seed, False, 2
+        ),
+    }
+
+    print(f"{'builder':<26}{'numpy (s)':>12}{'c++ (s)':>12}{'identical':>12}")
+    for name, build in builders.items():
+        numpy_result, numpy_time = timed(build, numpy_helpers)
+        if helpers is None:
+            print(f"{name:<26}{numpy_time:>12.2f}{'-':>12}{'-':>12}")
+            continue
+        cpp_result, cpp_time = timed(build, helpers)
+        if not isinstance(cpp_result, tuple):
+            cpp_result, numpy_result = (cpp_result,), (numpy_result,)
+        identical = all(np.array_equal(a, b) for a, b in zip(cpp_result, numpy_result))
+        print(f"{name:<26}{numpy_time:>12.2f}{cpp_time:>12.2f}{str(identical):>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the sequence packing algorithms of `nemo.utils.sequence_packing_utils` on synthetic sequence lengths:
+packing time, number of packs and packing efficiency of each algorithm, and time to fill the packs with tokens.
+
+The quadratic `first_fit_*` algorithms are only run when the number of sequences is at most `--max_quadratic_samples`.
+
+# Usage
+    python benchmark_sequence_packing.py --num_sequences 100000 --pack_size 4096
+    python benchmark_sequence_packing.py --num_sequences 5000000 --pack_size 8192 --algorithms best_fit_decreasing
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from nemo.utils import logging
+from nemo.utils.sequence_packing_utils import PACKING_ALGOS, create_packing_strategy, fill_packing_strategy
+
+QUADRATIC_ALGOS = ['first_fit_decreasing', 'first_fit_shuffle']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark sequence packing algorithms.", formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--num_sequences", type=int, default=100000, help="Number of synthetic sequences.")
+    parser.add_argument("--pack_size", type=int, default=4096, help="Packed sequence size.")
+    parser.add_argument("--mean_length", type=float, default=600.0, help="Mean of the log-normal sequence lengths.")
+    parser.add_argument("--algorithms", nargs="+", default=PACKING_ALGOS, choices=PACKING_ALGOS)
+    parser.add_argument(
+        "--max_quadratic_samples",
+        type=int,
+        default=200000,
+        help="Skip the quadratic first-fit implementations above this number of sequences.",
+    )
+    parser.add_argument(
+        "--fill_sequences", type=int, default=20000, help="Number of sequences used to benchmark the fill stage."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def synthetic_histogram(num_sequences: int, pack_size: int, mean_length: float, seed: int):
+    rng = np.random.default_rng(seed)
+    sigma = 0.8
+    lengths = rng.lognormal(mean=np.log(mean_length) - sigma**2 / 2, sigma=sigma, size=num_sequences)
+    lengths = np.clip(lengths.astype(np.int64), 1, pack_size)
+    return np.bincount(lengths, minlength=pack_size + 1).tolist()
+
+
+def benchmark_fill(num_sequences: int, pack_size: int, mean_length: float, seed: int):
+    rng = np.random.default_rng(seed)
+    histogram = synthetic_histogram(num_sequences, pack_size, mean_length, seed)
+    sequences = {}
+    for seq_len, count in enumerate(histogram):
+        if count > 0:
+            sequences[seq_len] = [
+                {'input_ids': rng.integers(1, 32000, size=seq_len + 1).tolist(), 'answer_start_idx': seq_len // 2}
+                for _ in range(count)
+            ]
+    assignments, _ = create_packing_strategy(histogram, pack_size, 'best_fit_decreasing')
+    start = time.perf_counter()
+    fill_packing_strategy(assignments, sequences, pack_size, pad_id=0)
+    return time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    histogram = synthetic_histogram(args.num_sequences, args.pack_size, args.mean_length, args.seed)
+    total_tokens = sum(seq_len * count for seq_len, count in enumerate(histogram))
+    lower_bound = int(np.ceil(total_tokens / args.pack_size))
+
+    rows = []
+    for algorithm in args.algorithms:
+        if algorithm in QUADRATIC_ALGOS and args.num_sequences > args.max_quadratic_samples:
+            rows.append((algorithm, None, None, None))
+            continue
+        np.random.seed(args.seed)
+        start = time.perf_counter()
+        assignments, _ = create_packing_strategy(histogram, args.pack_size, algorithm)
+        seconds = time.perf_counter() - start
+        efficiency = total_tokens / (len(assignments) * args.pack_size)
+        rows.append((algorithm, seconds, len(assignments), efficiency))
+
+    print(f"{args.num_sequences} sequences, {total_tokens} tokens, pack size {args.pack_size}")
+    print(f"lower bound on the number of packs: {lower_bound}")
+    print(f"{'algorithm':<28}{'time [s]':>10}{'packs':>10}{'efficiency':>12}")
+    for algorithm, seconds, num_packs, efficiency in rows:
+        if seconds is None:
+            print(f"{algorithm:<28}{'skipped':>10}")
+        else:
+            print(f"{algorithm:<28}{seconds:>10.2f}{num_packs:>10}{efficiency * 100:>11.2f}%")
+
+    if args.fill_sequences > 0:
+        seconds = benchmark_fill(args.fill_sequences, args.pack_size, args.mean_length, args.seed)
+        print(f"fill_packing_strategy on {args.fill_sequences} sequences: {seconds:.2f} s")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
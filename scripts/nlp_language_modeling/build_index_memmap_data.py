@@ -35,6 +35,12 @@ def main():
         default=None,
         help='Number of workers to parse files in parallel (default: max(cpu num // 2, 1)',
     )
+    parser.add_argument(
+        '--segment_size',
+        type=int,
+        default=1024 * 1024 * 1024,
+        help='Files larger than this number of bytes are split across workers (default: 1 GiB)',
+    )
     args = parser.parse_args()
 
     # expand all dataset_paths
@@ -44,7 +50,10 @@ def main():
 
     # build index files in parallel
     build_index_files(
-        dataset_paths=dataset_paths, newline_int=args.newline_int, workers=args.workers,
+        dataset_paths=dataset_paths,
+        newline_int=args.newline_int,
+        workers=args.workers,
+        segment_size=args.segment_size,
     )
 
 
@@ -0,0 +1,134 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark offline speaker clustering on synthetic multi-scale embeddings of long sessions: the dense affinity
+matrices of `SpeakerClustering` vs. the sparse k-nearest-neighbor affinity graphs with LOBPCG
+(`sparse_affinity=True`). Speakers take turns of random durations, and the embeddings of a speaker are noisy
+versions of a random speaker embedding. The dense mode is skipped for the sessions with more than
+`--max_dense_segments` base-scale segments.
+
+# Usage
+    python benchmark_offline_clustering.py --durations 600 3600 36000 --num_speakers 4
+    python benchmark_offline_clustering.py --durations 600 3600 --knn_size 32 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from nemo.collections.asr.parts.utils.offline_clustering import SpeakerClustering
+from nemo.collections.asr.parts.utils.online_clustering import stitch_cluster_labels
+from nemo.utils import logging
+
+MS_WINDOW = [1.5, 1.0, 0.5]
+MS_SHIFT = [0.75, 0.5, 0.25]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark dense vs. sparse offline speaker clustering.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--durations", type=float, nargs="+", default=[600, 3600, 36000], help="Seconds.")
+    parser.add_argument("--num_speakers", type=int, default=4)
+    parser.add_argument("--emb_dim", type=int, default=192)
+    parser.add_argument("--noise", type=float, default=1.0, help="Std of the noise relative to the speakers.")
+    parser.add_argument("--mean_turn", type=float, default=10.0, help="Mean duration of the turns in seconds.")
+    parser.add_argument("--knn_size", type=int, default=64)
+    parser.add_argument("--max_dense_segments", type=int, default=8000)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def generate_session(duration, num_speakers, emb_dim, noise, mean_turn, generator):
+    """
+    Multi-scale embeddings and timestamps in the format of `SpeakerClustering.forward_infer`,
+    with the speaker labels of the base scale.
+    """
+    speaker_embs = torch.randn(num_speakers, emb_dim, generator=generator)
+    # speaker turns, each one with a different speaker than the previous one
+    turn_ends, turn_speakers = [], []
+    end, speaker = 0.0, 0
+    while end < duration:
+        end += float(torch.empty(1).exponential_(1.0 / mean_turn, generator=generator)) + 1.0
+        speaker = (speaker + int(torch.randint(1, num_speakers, (1,), generator=generator))) % num_speakers
+        turn_ends.append(end)
+        turn_speakers.append(speaker)
+    turn_ends, turn_speakers = torch.tensor(turn_ends), torch.tensor(turn_speakers)
+
+    embeddings, timestamps, counts = [], [], []
+    for window, shift in zip(MS_WINDOW, MS_SHIFT):
+        starts = torch.arange(0, duration - window + 1e-6, shift)
+        segment_speakers = turn_speakers[torch.searchsorted(turn_ends, starts + window / 2)]
+        embeddings.append(
+            speaker_embs[segment_speakers] + noise * torch.randn(len(starts), emb_dim, generator=generator)
+        )
+        timestamps.append(torch.stack([starts, starts + window], dim=1))
+        counts.append(len(starts))
+    return torch.cat(embeddings), torch.cat(timestamps), torch.tensor(counts), segment_speakers
+
+
+def timed(fn, device):
+    start = time.perf_counter()
+    result = fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    device = torch.device(args.device)
+    generator = torch.Generator().manual_seed(args.seed)
+    cuda = device.type == "cuda"
+    models = {
+        "dense": SpeakerClustering(cuda=cuda),
+        "sparse": SpeakerClustering(cuda=cuda, sparse_affinity=True, knn_size=args.knn_size),
+    }
+
+    print(f"{args.num_speakers} speakers, kNN size {args.knn_size} on {device}")
+    print(f"{'duration':>10}{'segments':>10}{'mode':>8}{'time [s]':>10}{'affinity [MB]':>15}{'accuracy':>10}")
+    for duration in args.durations:
+        embeddings, timestamps, counts, labels = generate_session(
+            duration, args.num_speakers, args.emb_dim, args.noise, args.mean_turn, generator
+        )
+        num_segments = labels.shape[0]
+        for mode, model in models.items():
+            if mode == "dense" and num_segments > args.max_dense_segments:
+                continue
+            predicted, seconds = timed(
+                lambda: model.forward_infer(
+                    embeddings_in_scales=embeddings,
+                    timestamps_in_scales=timestamps,
+                    multiscale_segment_counts=counts,
+                    multiscale_weights=torch.ones(1, len(MS_WINDOW)),
+                    max_num_speakers=8,
+                ),
+                device,
+            )
+            # float32 N x N matrix, or int64 indices of the neighbors
+            affinity_size = num_segments**2 * 4 if mode == "dense" else num_segments * args.knn_size * 8
+            accuracy = (stitch_cluster_labels(Y_old=labels, Y_new=predicted.cpu()) == labels).float().mean()
+            print(
+                f"{duration / 60:>8.0f}mn{num_segments:>10}{mode:>8}{seconds:>10.2f}"
+                f"{affinity_size / 2**20:>15.1f}{accuracy:>10.1%}"
+            )
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
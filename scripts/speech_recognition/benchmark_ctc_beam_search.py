@@ -0,0 +1,114 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark CTC beam search: the built-in batched prefix beam search of `BeamCTCInfer` (`beam_batch` strategy)
+on whole batches vs. utterance by utterance, and vs. pyctcdecode if it is installed. Greedy decoding is given
+as a reference. The log probabilities are random (peaky, like the outputs of a trained model).
+
+# Usage
+    python benchmark_ctc_beam_search.py --batch_size 32 --num_frames 400 --beam_size 8
+    python benchmark_ctc_beam_search.py --vocab_size 1024 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from nemo.collections.asr.parts.submodules.ctc_decoding import CTCDecoding, CTCDecodingConfig
+from nemo.utils import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark batched vs. per-utterance CTC beam search.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--vocab_size", type=int, default=128, help="Number of tokens, without blank.")
+    parser.add_argument("--batch_size", type=int, default=16)
+    parser.add_argument("--num_frames", type=int, default=200, help="Maximum number of frames.")
+    parser.add_argument("--beam_size", type=int, default=4)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def get_decoding(strategy, vocabulary, beam_size):
+    cfg = CTCDecodingConfig(strategy=strategy)
+    cfg.beam.beam_size = beam_size
+    # no LM, to compare the search itself
+    cfg.beam.beam_alpha = 0.0
+    return CTCDecoding(decoding_cfg=cfg, vocabulary=vocabulary)
+
+
+def timed(fn, device):
+    start = time.perf_counter()
+    result = fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    device = torch.device(args.device)
+    # single characters, so that all the strategies support the vocabulary
+    vocabulary = [chr(ord('a') + i) for i in range(args.vocab_size)]
+
+    generator = torch.Generator().manual_seed(args.seed)
+    log_probs = (
+        torch.randn(args.batch_size, args.num_frames, args.vocab_size + 1, generator=generator) * 4
+    ).log_softmax(dim=-1)
+    lengths = torch.randint(args.num_frames // 2, args.num_frames + 1, (args.batch_size,), generator=generator)
+    log_probs, lengths = log_probs.to(device), lengths.to(device)
+
+    def decode_batch(decoding):
+        return [hyp.text for hyp in decoding.ctc_decoder_predictions_tensor(log_probs, lengths)]
+
+    def decode_per_utterance(decoding):
+        texts = []
+        for b in range(args.batch_size):
+            length = lengths[b : b + 1]
+            texts.extend(
+                hyp.text for hyp in decoding.ctc_decoder_predictions_tensor(log_probs[b : b + 1, :length], length)
+            )
+        return texts
+
+    rows = []
+    greedy = get_decoding("greedy_batch", vocabulary, args.beam_size)
+    rows.append(("greedy_batch",) + timed(lambda: decode_batch(greedy), device))
+    beam = get_decoding("beam_batch", vocabulary, args.beam_size)
+    rows.append(("beam_batch, per utterance",) + timed(lambda: decode_per_utterance(beam), device))
+    rows.append(("beam_batch, batched",) + timed(lambda: decode_batch(beam), device))
+    try:
+        pyctcdecode = get_decoding("pyctcdecode", vocabulary, args.beam_size)
+        rows.append(("pyctcdecode",) + timed(lambda: decode_batch(pyctcdecode), device))
+    except (ImportError, ModuleNotFoundError):
+        logging.warning("pyctcdecode is not installed, skipping it")
+
+    reference = rows[2][1]
+    print(
+        f"batch of {args.batch_size} utterances, up to {args.num_frames} frames, beam size {args.beam_size}, "
+        f"vocabulary of {args.vocab_size} tokens on {device}"
+    )
+    print(f"{'decoding':<28}{'time [s]':>10}{'same text as beam_batch':>25}")
+    for name, texts, seconds in rows:
+        same = sum(text == reference_text for text, reference_text in zip(texts, reference)) / len(texts)
+        print(f"{name:<28}{seconds:>10.2f}{same:>25.0%}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
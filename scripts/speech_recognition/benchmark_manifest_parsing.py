@@ -0,0 +1,128 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the construction of `ASRAudioText` collections from NeMo manifests:
+serial parsing, parallel parsing with an increasing number of workers and loading from the manifest cache.
+
+# Usage
+    # Synthetic manifest with 1M utterances and a character parser
+    python benchmark_manifest_parsing.py --num_utterances 1000000 --num_workers 1 2 4 8 16
+
+    # Existing manifest(s) with a SentencePiece tokenizer
+    python benchmark_manifest_parsing.py --manifest train_1.json train_2.json --tokenizer_model tokenizer.model
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import tempfile
+import time
+
+from nemo.collections.common.parts.preprocessing import collections, parsers
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark serial vs. parallel vs. cached construction of ASR manifest collections.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--manifest", nargs="+", default=None, help="Manifest files. Synthetic data if not set.")
+    parser.add_argument("--num_utterances", type=int, default=200000, help="Size of the synthetic manifest.")
+    parser.add_argument("--num_workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to test.")
+    parser.add_argument("--tokenizer_model", default=None, help="SentencePiece model, a char parser if not set.")
+    parser.add_argument("--skip_serial", action="store_true", help="Do not run the serial baseline.")
+    return parser.parse_args()
+
+
+def write_synthetic_manifest(path: str, num_utterances: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(5000)]
+    with open(path, "w") as f:
+        for i in range(num_utterances):
+            entry = {
+                "audio_filepath": f"/data/audio/{i // 1000}/{i}.wav",
+                "duration": round(rng.uniform(0.5, 20.0), 2),
+                "text": ' '.join(rng.choices(words, k=rng.randint(3, 40))),
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def build_parser(tokenizer_model):
+    if tokenizer_model is None:
+        return parsers.make_parser(labels=list(" " + string.ascii_lowercase + "'"), name="en")
+
+    from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer
+
+    class _Parser:
+        def __init__(self, tokenizer):
+            self._tokenizer = tokenizer
+
+        def __call__(self, text):
+            return self._tokenizer.text_to_ids(text)
+
+        def batch_text_to_ids(self, texts):
+            return self._tokenizer.batch_text_to_ids(texts)
+
+    return _Parser(SentencePieceTokenizer(tokenizer_model))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    parser = build_parser(args.tokenizer_model)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifests = args.manifest
+        if manifests is None:
+            manifests = [os.path.join(tmp_dir, "manifest.json")]
+            write_synthetic_manifest(manifests[0], args.num_utterances)
+        size_mb = sum(os.path.getsize(path) for path in manifests) / 2**20
+
+        results = []
+        reference = None
+        if not args.skip_serial:
+            reference, seconds = timed(lambda: collections.ASRAudioText(manifests, parser=parser))
+            results.append(("serial", seconds))
+
+        for num_workers in args.num_workers:
+            collection, seconds = timed(
+                lambda: collections.ASRAudioText(manifests, parser=parser, num_workers=num_workers)
+            )
+            if reference is not None and list(collection) != list(reference):
+                raise RuntimeError(f"Parallel parsing with {num_workers} workers differs from serial parsing.")
+            results.append((f"parallel, {num_workers} workers", seconds))
+
+        cache_dir = os.path.join(tmp_dir, "cache")
+        _, seconds = timed(lambda: collections.ASRAudioText(manifests, parser=parser, cache_dir=cache_dir))
+        results.append(("serial + cache write", seconds))
+        collection, seconds = timed(lambda: collections.ASRAudioText(manifests, parser=parser, cache_dir=cache_dir))
+        results.append(("cache load", seconds))
+
+    baseline = results[0][1]
+    print(f"{len(collection)} utterances, {size_mb:.1f} MB of manifests")
+    print(f"{'mode':<28}{'time [s]':>10}{'speedup':>10}")
+    for name, seconds in results:
+        print(f"{name:<28}{seconds:>10.2f}{baseline / seconds:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark saving and restoring `.nemo` files with the `torch` (pickled `model_weights.ckpt`) and `safetensors`
+(`model_weights.safetensors`, written concurrently and restored through mmap) state dict formats of
+`SaveRestoreConnector`.
+
+# Usage
+    # Synthetic model with ~500M parameters
+    python benchmark_nemo_save_restore.py --num_params 500000000
+
+    # Existing model
+    python benchmark_nemo_save_restore.py --nemo_file stt_en_fastconformer_transducer_large.nemo
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import torch
+from omegaconf import DictConfig, OmegaConf
+
+from nemo.core import ModelPT
+from nemo.core.connectors.save_restore_connector import SaveRestoreConnector
+from nemo.utils import logging
+
+
+class SyntheticModel(ModelPT):
+    """Stack of linear layers with the requested number of parameters."""
+
+    def __init__(self, cfg: DictConfig, trainer=None):
+        super().__init__(cfg=cfg, trainer=trainer)
+        num_layers = max(1, cfg.num_params // (cfg.hidden_size * cfg.hidden_size))
+        self.layers = torch.nn.ModuleList(
+            [torch.nn.Linear(cfg.hidden_size, cfg.hidden_size, bias=False) for _ in range(num_layers)]
+        )
+
+    def setup_training_data(self, train_data_config):
+        self._train_dl = None
+
+    def setup_validation_data(self, val_data_config):
+        self._validation_dl = None
+
+    @classmethod
+    def list_available_models(cls):
+        return []
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark .nemo save and restore with the torch and safetensors state dict formats.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--nemo_file", default=None, help="Model to benchmark. A synthetic model if not set.")
+    parser.add_argument("--num_params", type=int, default=100_000_000, help="Size of the synthetic model.")
+    parser.add_argument("--hidden_size", type=int, default=2048, help="Layer size of the synthetic model.")
+    parser.add_argument("--formats", nargs="+", default=["torch", "safetensors"], choices=["torch", "safetensors"])
+    parser.add_argument("--repeats", type=int, default=1, help="Number of timed runs, the best one is reported.")
+    parser.add_argument("--output_dir", default=None, help="Where to write the .nemo files. A temp dir if not set.")
+    return parser.parse_args()
+
+
+def timed(fn, repeats):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    args = parse_args()
+    if args.nemo_file is None:
+        cfg = OmegaConf.create({"num_params": args.num_params, "hidden_size": args.hidden_size})
+        model_cls, model = SyntheticModel, SyntheticModel(cfg=cfg)
+    else:
+        model = ModelPT.restore_from(args.nemo_file, map_location="cpu")
+        model_cls = type(model)
+    model = model.cpu().eval()
+    num_params = sum(p.numel() for p in model.parameters())
+
+    with tempfile.TemporaryDirectory(dir=args.output_dir) as tmp_dir:
+        rows = []
+        for state_dict_format in args.formats:
+            connector = SaveRestoreConnector()
+            connector.state_dict_format = state_dict_format
+            model._save_restore_connector = connector
+            save_path = os.path.join(tmp_dir, f"{state_dict_format}.nemo")
+            _, save_seconds = timed(lambda: model.save_to(save_path), args.repeats)
+
+            def restore():
+                return model_cls.restore_from(
+                    save_path, map_location="cpu", save_restore_connector=SaveRestoreConnector()
+                )
+
+            restored, restore_seconds = timed(restore, args.repeats)
+            for name, tensor in model.state_dict().items():
+                if not torch.equal(restored.state_dict()[name], tensor):
+                    raise RuntimeError(f"Restored tensor {name} differs with the {state_dict_format} format.")
+            rows.append((state_dict_format, save_seconds, restore_seconds, os.path.getsize(save_path) / 2**20))
+
+    print(f"{model_cls.__name__}: {num_params / 1e6:.1f}M parameters")
+    print(f"{'format':<16}{'save [s]':>10}{'restore [s]':>13}{'size [MB]':>12}")
+    for state_dict_format, save_seconds, restore_seconds, size_mb in rows:
+        print(f"{state_dict_format:<16}{save_seconds:>10.2f}{restore_seconds:>13.2f}{size_mb:>12.1f}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
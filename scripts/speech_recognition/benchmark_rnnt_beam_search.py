@@ -0,0 +1,117 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark RNNT beam search: the per-utterance mAES and ALSD strategies of `BeamRNNTInfer` vs. the batched
+`BeamBatchedRNNTInfer`, which decodes the beams of all the utterances of a batch at once. Reports the decoding
+time and the fraction of utterances for which both give the same best hypothesis.
+
+The decoder and joint are those of a .nemo RNNT model, or randomly initialized with the sizes of a
+Conformer-Transducer model. The encoder output is random in both cases.
+
+# Usage
+    python benchmark_rnnt_beam_search.py --batch_size 32 --num_frames 200 --beam_size 4
+    python benchmark_rnnt_beam_search.py --model stt_en_conformer_transducer_large.nemo --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from nemo.collections.asr.modules import RNNTDecoder, RNNTJoint
+from nemo.collections.asr.parts.submodules.rnnt_batched_beam_decoding import BeamBatchedRNNTInfer
+from nemo.collections.asr.parts.submodules.rnnt_beam_decoding import BeamRNNTInfer
+from nemo.utils import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-utterance vs. batched RNNT beam search.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--model", default=None, help="RNNT .nemo model. Random decoder and joint if not set.")
+    parser.add_argument("--vocab_size", type=int, default=1024, help="Vocabulary size of the random model.")
+    parser.add_argument("--batch_size", type=int, default=16)
+    parser.add_argument("--num_frames", type=int, default=100, help="Maximum number of encoder frames.")
+    parser.add_argument("--beam_size", type=int, default=4)
+    parser.add_argument("--search_types", nargs="+", default=["maes", "alsd"], choices=["maes", "alsd"])
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def load_decoder_and_joint(args):
+    if args.model is not None:
+        from nemo.collections.asr.models import ASRModel
+
+        model = ASRModel.restore_from(args.model, map_location="cpu")
+        return model.decoder, model.joint, model.joint.encoder_hidden
+    torch.manual_seed(args.seed)
+    decoder = RNNTDecoder(prednet={'pred_hidden': 640, 'pred_rnn_layers': 1}, vocab_size=args.vocab_size)
+    joint = RNNTJoint(
+        {'encoder_hidden': 512, 'pred_hidden': 640, 'joint_hidden': 640, 'activation': 'relu'}, args.vocab_size
+    )
+    return decoder, joint, 512
+
+
+def timed(fn, device):
+    start = time.perf_counter()
+    result = fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return result, time.perf_counter() - start
+
+
+def main():
+    args = parse_args()
+    device = torch.device(args.device)
+    decoder, joint, encoder_hidden = load_decoder_and_joint(args)
+    decoder, joint = decoder.to(device).eval(), joint.to(device).eval()
+
+    generator = torch.Generator().manual_seed(args.seed)
+    # peaky random encoder outputs, so that the hypotheses are not only made of blanks
+    encoder_output = torch.randn(args.batch_size, encoder_hidden, args.num_frames, generator=generator) * 4
+    encoded_lengths = torch.randint(args.num_frames // 2, args.num_frames + 1, (args.batch_size,), generator=generator)
+    encoded_lengths[0] = args.num_frames
+    encoder_output, encoded_lengths = encoder_output.to(device), encoded_lengths.to(device)
+
+    rows = []
+    for search_type in args.search_types:
+        kwargs = dict(beam_size=args.beam_size, search_type=search_type)
+        per_utterance = BeamRNNTInfer(decoder, joint, **kwargs)
+        batched = BeamBatchedRNNTInfer(decoder, joint, **kwargs)
+        expected, serial = timed(
+            lambda: per_utterance(encoder_output=encoder_output, encoded_lengths=encoded_lengths)[0], device
+        )
+        hyps, batched_seconds = timed(
+            lambda: batched(encoder_output=encoder_output, encoded_lengths=encoded_lengths)[0], device
+        )
+        same = sum(
+            hyp.y_sequence.tolist() == expected_hyp.y_sequence.tolist() for hyp, expected_hyp in zip(hyps, expected)
+        )
+        rows.append((search_type, serial, batched_seconds, same / len(hyps)))
+
+    print(
+        f"batch of {args.batch_size} utterances, up to {args.num_frames} frames, beam size {args.beam_size}, "
+        f"vocabulary of {decoder.vocab_size} tokens on {device}"
+    )
+    print(f"{'search':<8}{'per utterance [s]':>19}{'batched [s]':>13}{'speedup':>10}{'same best':>11}")
+    for name, serial, batched_seconds, same in rows:
+        print(f"{name:<8}{serial:>19.2f}{batched_seconds:>13.2f}{serial / batched_seconds:>10.1f}{same:>11.0%}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
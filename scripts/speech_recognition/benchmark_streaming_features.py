@@ -0,0 +1,92 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the feature extraction of buffered streaming: CPU time per streamed second of audio when the
+preprocessor is run over the whole sliding audio buffer for every new chunk (as `StreamingFeatureBufferer` does
+by default) vs. the incremental `FilterbankFeatures.forward_streaming`, which only computes the new frames.
+
+# Usage
+    python benchmark_streaming_features.py --chunk_len 0.16 --buffer_len 4.0 --duration 60
+    python benchmark_streaming_features.py --chunk_len 1.6 --buffer_len 4.0 --batch_size 32 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from nemo.collections.asr.parts.preprocessing.features import FilterbankFeatures
+from nemo.utils import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark sliding-buffer vs. incremental feature extraction for streaming ASR.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--chunk_len", type=float, default=0.16, help="Duration of the streamed chunks, seconds.")
+    parser.add_argument("--buffer_len", type=float, default=4.0, help="Duration of the audio buffer, seconds.")
+    parser.add_argument("--duration", type=float, default=60.0, help="Duration of the streamed audio, seconds.")
+    parser.add_argument("--batch_size", type=int, default=1, help="Number of streams processed in lockstep.")
+    parser.add_argument("--sample_rate", type=int, default=16000)
+    parser.add_argument("--features", type=int, default=80, help="Number of mel filters.")
+    parser.add_argument("--device", default="cpu")
+    return parser.parse_args()
+
+
+def sliding_buffer(featurizer, audio, chunk_samples, buffer_samples):
+    buffer = audio.new_zeros(audio.shape[0], buffer_samples)
+    buffer_len = torch.full((audio.shape[0],), buffer_samples, device=audio.device)
+    for start in range(0, audio.shape[1], chunk_samples):
+        chunk = audio[:, start : start + chunk_samples]
+        buffer = torch.cat([buffer[:, chunk.shape[1] :], chunk], dim=1)
+        featurizer(buffer, buffer_len)
+
+
+def incremental(featurizer, audio, chunk_samples, buffer_samples):
+    featurizer.reset_streaming_state()
+    for start in range(0, audio.shape[1], chunk_samples):
+        featurizer.forward_streaming(audio[:, start : start + chunk_samples], start + chunk_samples >= audio.shape[1])
+
+
+def main():
+    args = parse_args()
+    featurizer = FilterbankFeatures(
+        sample_rate=args.sample_rate, nfilt=args.features, normalize=None, pad_to=0, dither=0.0
+    ).eval()
+    featurizer.to(args.device)
+    audio = torch.randn(args.batch_size, int(args.duration * args.sample_rate), device=args.device)
+    chunk_samples, buffer_samples = int(args.chunk_len * args.sample_rate), int(args.buffer_len * args.sample_rate)
+
+    print(
+        f"{args.batch_size} stream(s) of {args.duration:.0f} s, chunk {args.chunk_len} s, buffer {args.buffer_len} s"
+    )
+    print(f"{'mode':<16}{'CPU time [s]':>14}{'wall time [s]':>15}{'CPU ms / streamed s':>22}")
+    for name, fn in (("sliding buffer", sliding_buffer), ("incremental", incremental)):
+        fn(featurizer, audio[:, : 10 * chunk_samples], chunk_samples, buffer_samples)  # warmup
+        if audio.is_cuda:
+            torch.cuda.synchronize()
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        fn(featurizer, audio, chunk_samples, buffer_samples)
+        if audio.is_cuda:
+            torch.cuda.synchronize()
+        cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+        per_second = 1000 * cpu / (args.duration * args.batch_size)
+        print(f"{name:<16}{cpu:>14.3f}{wall:>15.3f}{per_second:>22.3f}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
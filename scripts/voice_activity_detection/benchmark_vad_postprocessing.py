@@ -0,0 +1,172 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the VAD post-processing of `nemo.collections.asr.parts.utils.vad_utils` on synthetic frame predictions:
+per-recording vs. batched smoothing and segment tables, and a threshold grid search scored with pyannote on
+per-recording tables vs. `vad_tune_threshold_on_dev`.
+
+# Usage
+    python benchmark_vad_postprocessing.py --num_recordings 200 --max_duration 120 --grid_size 2
+    python benchmark_vad_postprocessing.py --num_recordings 50 --grid_size 4 --batch_size 16
+"""
+
+import argparse
+import copy
+import os
+import tempfile
+import time
+
+import numpy as np
+import torch
+from pyannote.core import Annotation, Segment
+from pyannote.metrics import detection
+
+from nemo.collections.asr.parts.utils.vad_utils import (
+    generate_overlap_vad_seq_batch,
+    generate_overlap_vad_seq_per_tensor,
+    generate_vad_segment_table_batch,
+    generate_vad_segment_table_per_tensor,
+    get_parameter_grid,
+    load_speech_segments_from_rttm,
+    prepare_gen_segment_table,
+    vad_tune_threshold_on_dev,
+)
+from nemo.utils import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-recording vs. batched VAD post-processing.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("--num_recordings", type=int, default=50, help="Number of synthetic recordings.")
+    parser.add_argument("--max_duration", type=float, default=60.0, help="Maximum duration of a recording [s].")
+    parser.add_argument("--batch_size", type=int, default=64, help="Batch size of the batched post-processing.")
+    parser.add_argument("--grid_size", type=int, default=3, help="Number of values of each tuned parameter.")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def synthetic_predictions(num_recordings: int, max_duration: float, seed: int):
+    generator = torch.Generator().manual_seed(seed)
+    max_frames = int(max_duration / 0.01)
+    lengths = torch.randint(max_frames // 4, max_frames + 1, (num_recordings,), generator=generator)
+    frames = torch.zeros(num_recordings, max_frames)
+    for i, length in enumerate(lengths.tolist()):
+        walk = torch.cumsum(torch.randn(length, generator=generator) * 0.1, dim=0)
+        frames[i, :length] = torch.sigmoid(walk - walk.mean())
+    return frames, lengths
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def per_recording_grid_search(frames, lengths, params, rttm_dir):
+    """Grid search as done before the batched post-processing: one table and one pyannote object per recording."""
+    references = []
+    for i in range(len(lengths)):
+        reference = Annotation()
+        for start, end in load_speech_segments_from_rttm(os.path.join(rttm_dir, f"rec{i}.rttm")):
+            reference[Segment(start, end)] = 'speech'
+        references.append(reference)
+
+    scores = {}
+    for param in get_parameter_grid(params):
+        param = {key: float(value) for key, value in param.items()}
+        metric = detection.DetectionErrorRate()
+        for i, length in enumerate(lengths.tolist()):
+            _, per_args_float = prepare_gen_segment_table(frames[i, :length], copy.deepcopy(param))
+            table = generate_vad_segment_table_per_tensor(frames[i, :length], per_args_float)
+            hypothesis = Annotation()
+            for start, _, dur in table.reshape(-1, 3).tolist():
+                hypothesis[Segment(float(f"{start:.4f}"), float(f"{start:.4f}") + float(f"{dur:.4f}"))] = 'speech'
+            metric(references[i], hypothesis)
+        scores[str(param)] = abs(metric)
+    return scores
+
+
+def main():
+    args = parse_args()
+    frames, lengths = synthetic_predictions(args.num_recordings, args.max_duration, args.seed)
+    smoothing_args = {'overlap': 0.875, 'window_length_in_sec': 0.63, 'shift_length_in_sec': 0.08}
+    table_args = {'onset': 0.6, 'offset': 0.4, 'min_duration_on': 0.2, 'min_duration_off': 0.2}
+    batches = [
+        (frames[start : start + args.batch_size], lengths[start : start + args.batch_size])
+        for start in range(0, len(lengths), args.batch_size)
+    ]
+
+    rows = []
+    for smoothing_method in ('mean', 'median'):
+        _, serial = timed(
+            lambda: [
+                generate_overlap_vad_seq_per_tensor(frames[i, :length], smoothing_args, smoothing_method)
+                for i, length in enumerate(lengths.tolist())
+            ]
+        )
+        _, batched = timed(
+            lambda: [generate_overlap_vad_seq_batch(*batch, smoothing_args, smoothing_method) for batch in batches]
+        )
+        rows.append((f"{smoothing_method} smoothing", serial, batched))
+
+    def serial_tables():
+        for i, length in enumerate(lengths.tolist()):
+            _, per_args_float = prepare_gen_segment_table(frames[i, :length], copy.deepcopy(table_args))
+            generate_vad_segment_table_per_tensor(frames[i, :length], per_args_float)
+
+    _, serial = timed(serial_tables)
+    _, batched = timed(lambda: [generate_vad_segment_table_batch(*batch, table_args) for batch in batches])
+    rows.append(("segment tables", serial, batched))
+
+    grid = np.linspace(0.3, 0.7, args.grid_size)
+    params = {'onset': grid, 'offset': grid - 0.1, 'min_duration_on': [0.0, 0.2], 'min_duration_off': [0.0, 0.2]}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pred_dir, rttm_dir = os.path.join(tmp_dir, "pred"), os.path.join(tmp_dir, "rttm")
+        os.makedirs(pred_dir)
+        os.makedirs(rttm_dir)
+        ground_truth = generate_vad_segment_table_batch(frames, lengths, {'onset': 0.5, 'offset': 0.5})
+        for i, length in enumerate(lengths.tolist()):
+            with open(os.path.join(pred_dir, f"rec{i}.frame"), "w") as f:
+                f.write("".join(f"{value:.4f}\n" for value in frames[i, :length].tolist()))
+            with open(os.path.join(rttm_dir, f"rec{i}.rttm"), "w") as f:
+                for start, _, dur in ground_truth[i].tolist():
+                    f.write(f"SPEAKER rec{i} 1 {start:.2f} {dur:.2f} <NA> <NA> speech <NA> <NA>\n")
+        # use the rounded predictions that the grid search reads from the files
+        frames = torch.round(frames * 1e4) / 1e4
+
+        _, serial = timed(lambda: per_recording_grid_search(frames, lengths, params, rttm_dir))
+        _, batched = timed(
+            lambda: vad_tune_threshold_on_dev(
+                copy.deepcopy(params),
+                pred_dir,
+                rttm_dir,
+                result_file=os.path.join(tmp_dir, "result"),
+                batch_size=args.batch_size,
+            )
+        )
+        rows.append((f"grid search, {len(get_parameter_grid(params))} params", serial, batched))
+
+    duration = lengths.sum().item() * 0.01 / 3600
+    print(f"{args.num_recordings} recordings, {duration:.2f} h of frame predictions, batch size {args.batch_size}")
+    print(f"{'stage':<28}{'serial [s]':>12}{'batched [s]':>13}{'speedup':>10}")
+    for name, serial, batched in rows:
+        print(f"{name:<28}{serial:>12.2f}{batched:>13.2f}{serial / batched:>10.1f}")
+
+
+if __name__ == '__main__':
+    logging.setLevel(logging.WARNING)
+    main()
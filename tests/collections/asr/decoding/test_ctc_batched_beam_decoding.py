@@ -0,0 +1,183 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+import torch
+
+from nemo.collections.asr.parts.submodules.ctc_beam_decoding import BatchedBeamConfig, BeamCTCInfer
+from nemo.collections.asr.parts.submodules.ctc_decoding import CTCDecoding, CTCDecodingConfig
+from nemo.collections.asr.parts.submodules.hotword_boosting import HotwordBoostingTree
+
+VOCABULARY = [' ', 'a', 'b', 'c', 'd', 'e', 'f', '.']
+BLANK_ID = len(VOCABULARY)
+
+
+def get_log_probs(batch_size=4, max_time=12, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    logits = torch.randn(batch_size, max_time, len(VOCABULARY) + 1, generator=generator) * 2
+    lengths = torch.tensor([max_time, max_time - 3, 2, 1][:batch_size])
+    return logits.log_softmax(dim=-1), lengths
+
+
+def reference_prefix_beam_search(log_probs, beam_size):
+    """CTC prefix beam search of a single utterance, with Python dicts of prefixes."""
+    beam = {(): (0.0, -math.inf, [])}
+    for t, frame in enumerate(log_probs.tolist()):
+        candidates = {}
+
+        def add(prefix, blank_score, non_blank_score, timestamps):
+            old_blank, old_non_blank, old_timestamps = candidates.get(prefix, (-math.inf, -math.inf, timestamps))
+            candidates[prefix] = (
+                torch.logaddexp(torch.tensor(old_blank), torch.tensor(blank_score)).item(),
+                torch.logaddexp(torch.tensor(old_non_blank), torch.tensor(non_blank_score)).item(),
+                old_timestamps,
+            )
+
+        # prefixes of the beam keep their timestamps when they are also extensions of another prefix
+        for prefix, (blank_score, non_blank_score, timestamps) in beam.items():
+            prefix_score = torch.logaddexp(torch.tensor(blank_score), torch.tensor(non_blank_score)).item()
+            add(prefix, prefix_score + frame[BLANK_ID], -math.inf, timestamps)
+            if prefix:
+                add(prefix, -math.inf, non_blank_score + frame[prefix[-1]], timestamps)
+        for prefix, (blank_score, non_blank_score, timestamps) in beam.items():
+            prefix_score = torch.logaddexp(torch.tensor(blank_score), torch.tensor(non_blank_score)).item()
+            for label in range(len(VOCABULARY)):
+                score = blank_score if prefix and label == prefix[-1] else prefix_score
+                add(prefix + (label,), -math.inf, score + frame[label], timestamps + [t])
+        ranked = sorted(candidates.items(), key=lambda item: -torch.logaddexp(*map(torch.tensor, item[1][:2])).item())
+        beam = dict(ranked[:beam_size])
+    return [
+        (list(prefix), torch.logaddexp(torch.tensor(blank), torch.tensor(non_blank)).item(), timestamps)
+        for prefix, (blank, non_blank, timestamps) in beam.items()
+    ]
+
+
+def get_beam(**kwargs):
+    beam = BeamCTCInfer(blank_id=BLANK_ID, search_type="batched", **kwargs)
+    beam.set_vocabulary(VOCABULARY)
+    beam.set_decoding_type('char')
+    return beam
+
+
+class TestHotwordBoostingTree:
+    @pytest.mark.unit
+    def test_bonus_of_complete_hotwords(self):
+        tree = HotwordBoostingTree.from_token_sequences([[1, 2, 3], [1, 2], [4]], vocab_size=8, weight=1.0)
+
+        def total_bonus(tokens):
+            states = tree.get_init_states(1)
+            total = 0.0
+            for token in tokens:
+                scores, next_states = tree.advance(states)
+                total += scores[0, token].item()
+                states = next_states[:, token]
+            return total + tree.get_final(states).item()
+
+        assert total_bonus([1, 2, 3]) == 3.0
+        assert total_bonus([1, 2]) == 2.0
+        # unfinished hotwords are not boosted
+        assert total_bonus([1]) == 0.0
+        assert total_bonus([1, 5]) == 0.0
+        assert total_bonus([1, 2, 5]) == 2.0
+        # mismatch restarting a hotword
+        assert total_bonus([1, 4]) == 1.0
+        assert total_bonus([1, 1, 2]) == 2.0
+        assert total_bonus([4, 4, 0]) == 2.0
+
+
+class TestBatchedBeamCTC:
+    @pytest.mark.unit
+    def test_same_results_as_reference(self):
+        log_probs, lengths = get_log_probs()
+        beam = get_beam(beam_size=4, return_best_hypothesis=False)
+        results = beam(decoder_output=log_probs, decoder_lengths=lengths)[0]
+        for b, nbest in enumerate(results):
+            expected = reference_prefix_beam_search(log_probs[b, : lengths[b]], beam_size=4)
+            expected = sorted(expected, key=lambda item: -item[1])
+            assert len(nbest.n_best_hypotheses) == len(expected)
+            for hyp, (labels, score, timestamps) in zip(nbest.n_best_hypotheses, expected):
+                assert hyp.y_sequence.tolist() == labels
+                assert hyp.score == pytest.approx(score, abs=1e-4)
+                assert hyp.timestamp == timestamps
+                assert hyp.length == lengths[b]
+
+    @pytest.mark.unit
+    def test_batch_invariance(self):
+        log_probs, lengths = get_log_probs()
+        beam = get_beam(beam_size=3)
+        hyps = beam(decoder_output=log_probs, decoder_lengths=lengths)[0]
+        for b, hyp in enumerate(hyps):
+            length = lengths[b : b + 1]
+            (single_hyp,) = beam(decoder_output=log_probs[b : b + 1, :length], decoder_lengths=length)[0]
+            assert hyp.y_sequence.tolist() == single_hyp.y_sequence.tolist()
+            assert hyp.score == pytest.approx(single_hyp.score, abs=1e-4)
+
+    @pytest.mark.unit
+    def test_ngram_lm(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        with open(arpa_path, "w") as f:
+            f.write(f"\\data\\\nngram 1={len(VOCABULARY) + 2}\n\n\\1-grams:\n-99\t<s>\n-1.0\t</s>\n")
+            for char in VOCABULARY[1:]:
+                f.write(f"{-0.1 if char == 'f' else -3.0}\t{char}\n")
+            f.write("\n\\end\\\n")
+        log_probs, lengths = get_log_probs()
+        expected = get_beam(beam_size=4)(decoder_output=log_probs, decoder_lengths=lengths)[0]
+
+        hyps = get_beam(beam_size=4, kenlm_path=str(arpa_path), beam_alpha=0.0)(
+            decoder_output=log_probs, decoder_lengths=lengths
+        )[0]
+        for hyp, expected_hyp in zip(hyps, expected):
+            assert hyp.y_sequence.tolist() == expected_hyp.y_sequence.tolist()
+            assert hyp.score == pytest.approx(expected_hyp.score, abs=1e-4)
+
+        # the LM only likes 'f'
+        hyps = get_beam(beam_size=4, kenlm_path=str(arpa_path), beam_alpha=2.0)(
+            decoder_output=log_probs, decoder_lengths=lengths
+        )[0]
+        num_f = sum(hyp.y_sequence.tolist().count(6) for hyp in hyps)
+        assert num_f > sum(hyp.y_sequence.tolist().count(6) for hyp in expected)
+
+    @pytest.mark.unit
+    def test_hotwords(self):
+        log_probs, lengths = get_log_probs()
+        expected = get_beam(beam_size=4)(decoder_output=log_probs, decoder_lengths=lengths)[0]
+        hyps = get_beam(beam_size=4, batched_beam_cfg=BatchedBeamConfig(hotwords=["fe"], hotword_weight=10.0))(
+            decoder_output=log_probs, decoder_lengths=lengths
+        )[0]
+        for hyp, expected_hyp in zip(hyps, expected):
+            text = "".join(VOCABULARY[label] for label in hyp.y_sequence.tolist())
+            expected_text = "".join(VOCABULARY[label] for label in expected_hyp.y_sequence.tolist())
+            assert text.count("fe") >= expected_text.count("fe")
+        assert hyps[0].y_sequence.tolist() != expected[0].y_sequence.tolist()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("timestamps", [False, True])
+    def test_decoding_strategy(self, timestamps):
+        log_probs, lengths = get_log_probs()
+        cfg = CTCDecodingConfig(strategy='beam_batch', compute_timestamps=timestamps)
+        cfg.beam.beam_size = 4
+        decoding = CTCDecoding(decoding_cfg=cfg, vocabulary=VOCABULARY)
+        hyps = decoding.ctc_decoder_predictions_tensor(log_probs, lengths, return_hypotheses=True)
+        expected = get_beam(beam_size=4)(decoder_output=log_probs, decoder_lengths=lengths)[0]
+        for hyp, expected_hyp in zip(hyps, expected):
+            assert hyp.text == "".join(VOCABULARY[label] for label in expected_hyp.y_sequence.tolist())
+            if timestamps:
+                assert hyp.timestamp['timestep'] == expected_hyp.timestamp
+                # punctuation marks get the offsets of the previous token
+                end_offsets = [offset['end_offset'] for offset in hyp.timestamp['char'] if offset['char'] != '.']
+                assert end_offsets == [
+                    frame for frame, label in zip(expected_hyp.timestamp, expected_hyp.y_sequence) if label != 7
+                ]
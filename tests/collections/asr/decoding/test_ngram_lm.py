@@ -0,0 +1,176 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import random
+
+import pytest
+import torch
+
+from nemo.collections.asr.modules import RNNTDecoder, RNNTJoint
+from nemo.collections.asr.parts.submodules import rnnt_beam_decoding
+from nemo.collections.asr.parts.submodules.ngram_lm import NGramGPULanguageModel
+
+VOCAB_SIZE = 12
+TOKEN_OFFSET = 100
+
+
+def write_random_arpa(path, vocab_size=VOCAB_SIZE, order=3, with_unk=True, seed=0):
+    """
+    Writes a random (not normalized) ARPA model over the words `chr(i + TOKEN_OFFSET)` with an out-of-vocabulary
+    word and two tokens missing from the model. Returns the log10 probabilities and backoffs of the n-grams.
+    """
+    rng = random.Random(seed)
+    words = [chr(i + TOKEN_OFFSET) for i in range(vocab_size - 2)] + ["oov"]
+    ngrams = [{}] + [dict() for _ in range(order)]
+    for word in words + ["</s>"]:
+        ngrams[1][(word,)] = -rng.uniform(0.5, 3.0)
+    ngrams[1][("<s>",)] = -99.0
+    if with_unk:
+        ngrams[1][("<unk>",)] = -rng.uniform(3.0, 5.0)
+    for n in range(2, order + 1):
+        for context in list(ngrams[n - 1]):
+            if context[-1] in ("</s>", "<unk>"):
+                continue
+            for word in rng.sample(words + ["</s>"], 4):
+                ngram = context + (word,)
+                # suffix closure of the n-grams
+                if n == 2 or ngram[1:] in ngrams[n - 1]:
+                    ngrams[n][ngram] = -rng.uniform(0.1, 2.0)
+    probs, backoffs = {}, {}
+    with open(path, "w") as f:
+        f.write("\\data\\\n")
+        for n in range(1, order + 1):
+            f.write(f"ngram {n}={len(ngrams[n])}\n")
+        for n in range(1, order + 1):
+            f.write(f"\n\\{n}-grams:\n")
+            for ngram, prob in ngrams[n].items():
+                probs[ngram] = prob
+                line = f"{prob:.6f}\t{' '.join(ngram)}"
+                if n < order and ngram[-1] != "</s>":
+                    backoffs[ngram] = -rng.uniform(0.0, 1.0)
+                    line += f"\t{backoffs[ngram]:.6f}"
+                f.write(line + "\n")
+        f.write("\n\\end\\\n")
+    probs = {ngram: float(f"{prob:.6f}") for ngram, prob in probs.items()}
+    backoffs = {ngram: float(f"{backoff:.6f}") for ngram, backoff in backoffs.items()}
+    return probs, backoffs
+
+
+def reference_score(probs, backoffs, history, word, order=3):
+    """Log10 probability of `word` after `history` with the backoff rules of ARPA models."""
+    history = tuple(history[len(history) - (order - 1) :])
+    score = 0.0
+    for start in range(len(history) + 1):
+        context = history[start:]
+        if context + (word,) in probs:
+            return score + probs[context + (word,)]
+        score += backoffs.get(context, 0.0)
+    return score + probs.get(("<unk>",), -100.0)
+
+
+class TestNGramGPULanguageModel:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("with_unk", [True, False])
+    def test_scores_match_arpa_backoff(self, tmp_path, with_unk):
+        arpa_path = tmp_path / "lm.arpa"
+        probs, backoffs = write_random_arpa(arpa_path, with_unk=with_unk)
+        lm = NGramGPULanguageModel.from_arpa(str(arpa_path), vocab_size=VOCAB_SIZE, token_offset=TOKEN_OFFSET)
+        assert lm.order == 3
+
+        rng = random.Random(1)
+        batch_size, length = 16, 12
+        sequences = [[rng.randrange(VOCAB_SIZE) for _ in range(length)] for _ in range(batch_size)]
+        states = lm.get_init_states(batch_size)
+        for step in range(length):
+            scores, next_states = lm.advance(states)
+            assert scores.shape == next_states.shape == (batch_size, VOCAB_SIZE)
+            for b, sequence in enumerate(sequences):
+                history = ["<s>"] + [chr(token + TOKEN_OFFSET) for token in sequence[:step]]
+                for token in range(VOCAB_SIZE):
+                    expected = reference_score(probs, backoffs, history, chr(token + TOKEN_OFFSET)) * math.log(10)
+                    assert scores[b, token].item() == pytest.approx(expected, abs=1e-4)
+            tokens = torch.tensor([sequence[step] for sequence in sequences])
+            states = next_states[torch.arange(batch_size), tokens]
+
+        final = lm.get_final(states)
+        for b, sequence in enumerate(sequences):
+            history = ["<s>"] + [chr(token + TOKEN_OFFSET) for token in sequence]
+            expected = reference_score(probs, backoffs, history, "</s>") * math.log(10)
+            assert final[b].item() == pytest.approx(expected, abs=1e-4)
+
+    @pytest.mark.unit
+    def test_score_labels_broadcast(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        write_random_arpa(arpa_path)
+        lm = NGramGPULanguageModel.from_arpa(str(arpa_path), vocab_size=VOCAB_SIZE, token_offset=TOKEN_OFFSET)
+        states = torch.arange(lm.num_states)
+        scores, next_states = lm.advance(states)
+        for token in range(VOCAB_SIZE):
+            token_scores, token_next_states = lm.score_labels(states, torch.tensor(token))
+            assert torch.equal(token_scores, scores[:, token])
+            assert torch.equal(token_next_states, next_states[:, token])
+
+    @pytest.mark.unit
+    def test_vocabulary(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        write_random_arpa(arpa_path)
+        vocabulary = [chr(i + TOKEN_OFFSET) for i in range(VOCAB_SIZE)]
+        lm = NGramGPULanguageModel.from_arpa(str(arpa_path), vocab_size=VOCAB_SIZE, vocabulary=vocabulary)
+        expected = NGramGPULanguageModel.from_arpa(str(arpa_path), vocab_size=VOCAB_SIZE, token_offset=TOKEN_OFFSET)
+        states = expected.get_init_states(2)
+        assert torch.equal(lm.advance(states)[0], expected.advance(states)[0])
+        with pytest.raises(ValueError):
+            NGramGPULanguageModel.from_arpa(str(arpa_path), vocab_size=VOCAB_SIZE + 1, vocabulary=vocabulary)
+
+    @pytest.mark.unit
+    def test_maes_beam_search(self, tmp_path):
+        arpa_path = tmp_path / "lm.arpa"
+        write_random_arpa(arpa_path)
+
+        torch.manual_seed(0)
+        decoder = RNNTDecoder(prednet={'pred_hidden': 8, 'pred_rnn_layers': 1}, vocab_size=VOCAB_SIZE)
+        joint = RNNTJoint({'encoder_hidden': 8, 'pred_hidden': 8, 'joint_hidden': 8, 'activation': 'relu'}, VOCAB_SIZE)
+        encoder_output = torch.randn(2, 8, 20)
+        encoded_lengths = torch.tensor([20, 15])
+
+        def decode(**kwargs):
+            beam = rnnt_beam_decoding.BeamRNNTInfer(
+                decoder,
+                joint,
+                beam_size=2,
+                search_type="maes",
+                maes_num_steps=2,
+                maes_expansion_beta=2,
+                return_best_hypothesis=False,
+                **kwargs,
+            )
+            beam.set_decoding_type('subword')
+            return beam, beam(encoder_output=encoder_output, encoded_lengths=encoded_lengths)[0]
+
+        _, expected = decode()
+        beam, hyps = decode(ngram_lm_model=str(arpa_path), ngram_lm_alpha=0.0)
+        assert isinstance(beam.ngram_lm, NGramGPULanguageModel)
+        for nbest, expected_nbest in zip(hyps, expected):
+            for hyp, expected_hyp in zip(nbest.n_best_hypotheses, expected_nbest.n_best_hypotheses):
+                assert hyp.y_sequence.tolist() == expected_hyp.y_sequence.tolist()
+                assert hyp.score == pytest.approx(expected_hyp.score)
+
+        beam, hyps = decode(ngram_lm_model=str(arpa_path), ngram_lm_alpha=0.5)
+        assert all(len(nbest.n_best_hypotheses) > 0 for nbest in hyps)
+        # the state of the hypotheses is an integer, scored for single labels by compute_ngram_score
+        lm_score, lm_state = beam.compute_ngram_score(beam.ngram_lm.bos_state, 3)
+        scores, next_states = beam.ngram_lm.advance(beam.ngram_lm.get_init_states(1))
+        assert lm_score == scores[0, 3].item()
+        assert lm_state == next_states[0, 3].item()
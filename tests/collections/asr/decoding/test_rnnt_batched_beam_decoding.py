@@ -0,0 +1,145 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from nemo.collections.asr.modules import RNNTDecoder, RNNTJoint
+from nemo.collections.asr.parts.submodules import rnnt_batched_beam_decoding, rnnt_beam_decoding
+from nemo.collections.asr.parts.submodules.rnnt_decoding import RNNTDecoding, RNNTDecodingConfig
+from nemo.collections.asr.parts.utils import rnnt_utils
+
+VOCAB_SIZE = 10
+
+
+def get_model():
+    torch.manual_seed(0)
+    decoder = RNNTDecoder(prednet={'pred_hidden': 16, 'pred_rnn_layers': 1}, vocab_size=VOCAB_SIZE)
+    joint = RNNTJoint({'encoder_hidden': 8, 'pred_hidden': 16, 'joint_hidden': 16, 'activation': 'relu'}, VOCAB_SIZE)
+    encoder_output = torch.randn(4, 8, 16) * 2
+    encoded_lengths = torch.tensor([16, 12, 5, 1])
+    return decoder, joint, encoder_output, encoded_lengths
+
+
+def write_bigram_arpa(path):
+    words = [chr(i + 100) for i in range(VOCAB_SIZE)]
+    with open(path, "w") as f:
+        f.write(f"\\data\\\nngram 1={VOCAB_SIZE + 3}\nngram 2={VOCAB_SIZE}\n\n\\1-grams:\n")
+        f.write("-99\t<s>\t-0.5\n-1.5\t</s>\n-3.0\t<unk>\n")
+        for i, word in enumerate(words):
+            f.write(f"{-0.5 - 0.2 * i:.4f}\t{word}\t-0.3\n")
+        f.write("\n\\2-grams:\n")
+        for i, word in enumerate(words):
+            f.write(f"-0.1000\t{word} {words[(i * 3) % VOCAB_SIZE]}\n")
+        f.write("\n\\end\\\n")
+
+
+class TestBatchedBeamHyps:
+    @pytest.mark.unit
+    def test_add_results_and_recombine(self):
+        hyps = rnnt_utils.BatchedBeamHyps(batch_size=2, beam_size=3, init_length=1, blank_index=VOCAB_SIZE)
+        hyps = hyps.select(torch.zeros([2, 3], dtype=torch.long))
+        hyps.add_results_(torch.tensor([[1, 2, VOCAB_SIZE], [3, 3, 3]]), 0, torch.tensor([[-1.0, -2.0, -3.0]] * 2))
+        hyps.add_results_(
+            torch.tensor([[2, VOCAB_SIZE, 1], [2, VOCAB_SIZE, 2]]), torch.tensor([[1, 1, 2]] * 2), hyps.scores
+        )
+        # storage is reallocated
+        assert hyps.transcript.shape[-1] == 2
+        assert hyps.current_lengths.tolist() == [[2, 1, 1], [2, 1, 2]]
+        assert hyps.transcript[0, 2, :1].tolist() == [1]
+        assert hyps.timestamps[0, 2, :1].tolist() == [2]
+
+        same = hyps.same_transcripts()
+        assert same[0].int().tolist() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        assert same[1].int().tolist() == [[1, 0, 1], [0, 1, 0], [1, 0, 1]]
+        hyps.recombine_()
+        assert hyps.scores[0].tolist() == [-1.0, -2.0, -3.0]
+        assert hyps.scores[1, 0].item() == pytest.approx(
+            torch.logaddexp(torch.tensor(-1.0), torch.tensor(-3.0)).item()
+        )
+        assert hyps.scores[1, 1:].tolist() == [-2.0, float('-inf')]
+
+        nbest = hyps.to_nbest_hyps_list(score_norm=False)
+        assert [hyp.y_sequence.tolist() for hyp in nbest[1].n_best_hypotheses] == [[VOCAB_SIZE, 3, 2], [VOCAB_SIZE, 3]]
+        assert hyps.to_hyps_list(score_norm=False)[0].y_sequence.tolist() == [VOCAB_SIZE, 1, 2]
+
+
+class TestBeamBatchedRNNTInfer:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("search_type", ["maes", "alsd"])
+    def test_same_results_as_per_utterance_search(self, search_type):
+        decoder, joint, encoder_output, encoded_lengths = get_model()
+        kwargs = dict(beam_size=4, search_type=search_type, return_best_hypothesis=False)
+        expected = rnnt_beam_decoding.BeamRNNTInfer(decoder, joint, **kwargs)(
+            encoder_output=encoder_output, encoded_lengths=encoded_lengths
+        )[0]
+        results = rnnt_batched_beam_decoding.BeamBatchedRNNTInfer(decoder, joint, **kwargs)(
+            encoder_output=encoder_output, encoded_lengths=encoded_lengths
+        )[0]
+        for nbest, expected_nbest in zip(results, expected):
+            hyp, expected_hyp = nbest.n_best_hypotheses[0], expected_nbest.n_best_hypotheses[0]
+            assert hyp.y_sequence.tolist() == expected_hyp.y_sequence.tolist()
+            assert hyp.score == pytest.approx(expected_hyp.score, abs=1e-4)
+            if search_type == "maes":
+                assert hyp.timestamp.tolist() == list(expected_hyp.timestamp)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("search_type", ["maes", "alsd"])
+    def test_batch_invariance(self, search_type):
+        decoder, joint, encoder_output, encoded_lengths = get_model()
+        beam = rnnt_batched_beam_decoding.BeamBatchedRNNTInfer(decoder, joint, beam_size=4, search_type=search_type)
+        hyps = beam(encoder_output=encoder_output, encoded_lengths=encoded_lengths)[0]
+        for i, hyp in enumerate(hyps):
+            length = encoded_lengths[i : i + 1]
+            (single_hyp,) = beam(encoder_output=encoder_output[i : i + 1, :, :length], encoded_lengths=length)[0]
+            assert hyp.y_sequence.tolist() == single_hyp.y_sequence.tolist()
+            assert hyp.score == pytest.approx(single_hyp.score, abs=1e-4)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("search_type", ["maes", "alsd"])
+    def test_ngram_lm(self, tmp_path, search_type):
+        arpa_path = tmp_path / "lm.arpa"
+        write_bigram_arpa(arpa_path)
+        decoder, joint, encoder_output, encoded_lengths = get_model()
+
+        def decode(**kwargs):
+            beam = rnnt_batched_beam_decoding.BeamBatchedRNNTInfer(
+                decoder, joint, beam_size=3, search_type=search_type, **kwargs
+            )
+            beam.set_decoding_type('subword')
+            return beam(encoder_output=encoder_output, encoded_lengths=encoded_lengths)[0]
+
+        expected = decode()
+        hyps = decode(ngram_lm_model=str(arpa_path), ngram_lm_alpha=0.0)
+        for hyp, expected_hyp in zip(hyps, expected):
+            assert hyp.y_sequence.tolist() == expected_hyp.y_sequence.tolist()
+            assert hyp.score == pytest.approx(expected_hyp.score, abs=1e-4)
+        hyps = decode(ngram_lm_model=str(arpa_path), ngram_lm_alpha=2.0)
+        assert [hyp.y_sequence.tolist() for hyp in hyps] != [hyp.y_sequence.tolist() for hyp in expected]
+
+    @pytest.mark.unit
+    def test_decoding_strategy(self):
+        decoder, joint, encoder_output, encoded_lengths = get_model()
+        vocabulary = [chr(ord('a') + i) for i in range(VOCAB_SIZE)]
+        texts = {}
+        for strategy in ["maes", "maes_batch"]:
+            cfg = RNNTDecodingConfig(strategy=strategy)
+            cfg.beam.beam_size = 3
+            decoding = RNNTDecoding(decoding_cfg=cfg, decoder=decoder, joint=joint, vocabulary=vocabulary)
+            hyps = decoding.rnnt_decoder_predictions_tensor(encoder_output, encoded_lengths)
+            texts[strategy] = [hyp.text for hyp in hyps]
+        assert isinstance(decoding.decoding, rnnt_batched_beam_decoding.BeamBatchedRNNTInfer)
+        # same default as the maes strategy
+        assert decoding.decoding.ngram_lm_alpha == 0.3
+        assert texts["maes_batch"] == texts["maes"]
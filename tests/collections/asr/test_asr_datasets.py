@@ -16,6 +16,7 @@ import filecmp
 import json
 import os
 import shutil
+import tarfile
 import tempfile
 from unittest import mock
 
@@ -32,6 +33,8 @@ from nemo.collections.asr.data.audio_to_text import (
     TarredAudioToBPEDataset,
     TarredAudioToCharDataset,
     cache_datastore_manifests,
+    prefetch_tar_shards,
+    threaded_map,
 )
 from nemo.collections.asr.data.audio_to_text_dali import (
     __DALI_MINIMUM_VERSION__,
@@ -152,6 +155,62 @@ class TestASRDatasets:
             count += 1
         assert count == 5  # file ending with sub is not part of tar ball
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        'prefetch_shards, prefetch_max_bytes, decode_num_threads',
+        [(2, None, 0), (1, 1, 0), (0, None, 3), (3, None, 2)],
+    )
+    def test_tarred_dataset_prefetch(self, tmpdir, prefetch_shards, prefetch_max_bytes, decode_num_threads):
+        """Prefetching shards and decoding in threads must not change the samples or their order."""
+        rng = np.random.default_rng(seed=42)
+        sample_rate = 16000
+        num_shards = 3
+        num_examples_per_shard = 4
+
+        manifest = []
+        for shard_id in range(num_shards):
+            with tarfile.open(os.path.join(tmpdir, f'audio_{shard_id}.tar'), 'w') as tar:
+                for n in range(num_examples_per_shard):
+                    audio_filename = f'audio_{shard_id}_{n}.wav'
+                    duration = rng.uniform(0.1, 0.5)
+                    audio_filepath = os.path.join(tmpdir, audio_filename)
+                    sf.write(audio_filepath, rng.uniform(-1, 1, int(duration * sample_rate)), sample_rate)
+                    tar.add(audio_filepath, arcname=audio_filename)
+                    manifest.append(
+                        {'audio_filepath': audio_filename, 'duration': duration, 'text': f'{shard_id} {n}'}
+                    )
+        manifest_filepath = os.path.join(tmpdir, 'manifest.json')
+        write_manifest(manifest_filepath, manifest)
+
+        def load(**kwargs):
+            dataset = TarredAudioToCharDataset(
+                audio_tar_filepaths=os.path.join(tmpdir, 'audio__OP_0..2_CL_.tar'),
+                manifest_filepath=manifest_filepath,
+                labels=self.labels + [str(i) for i in range(10)],
+                sample_rate=sample_rate,
+                **kwargs,
+            )
+            return dataset, list(dataset)
+
+        _, ref_samples = load()
+        dataset, samples = load(
+            prefetch_shards=prefetch_shards,
+            prefetch_max_bytes=prefetch_max_bytes,
+            decode_num_threads=decode_num_threads,
+        )
+
+        assert len(samples) == len(ref_samples) == num_shards * num_examples_per_shard
+        for sample, ref_sample in zip(samples, ref_samples):
+            for value, ref_value in zip(sample, ref_sample):
+                assert torch.equal(value, ref_value)
+
+        assert dataset.io_stats.num_samples == len(samples)
+        if prefetch_shards > 0:
+            assert dataset.io_stats.num_shards == num_shards
+            assert dataset.io_stats.bytes_read == sum(
+                os.path.getsize(os.path.join(tmpdir, f'audio_{i}.tar')) for i in range(num_shards)
+            )
+
     @pytest.mark.unit
     def test_mismatch_in_model_dataloader_config(self, caplog):
         logging._logger.propagate = True
@@ -861,3 +920,29 @@ class TestUtilityFunctions:
             for f_store in store_files_to_compare:
                 f_cache = os.path.join(test_cache_dir, os.path.relpath(f_store, test_store_dir))
                 assert filecmp.cmp(f_store, f_cache, shallow=False), f'Files {f_store} and {f_cache} do not match.'
+
+    @pytest.mark.unit
+    def test_prefetch_tar_shards(self, tmpdir):
+        shard_sizes = [10, 20, 30]
+        urls = []
+        for i, size in enumerate(shard_sizes):
+            urls.append(os.path.join(tmpdir, f'shard_{i}.tar'))
+            with open(urls[-1], 'wb') as f:
+                f.write(bytes([i]) * size)
+
+        shards = list(prefetch_tar_shards(iter([{'url': url} for url in urls]), num_shards=2, max_bytes=15))
+        assert [shard['url'] for shard in shards] == urls
+        assert [shard['stream'].read() for shard in shards] == [
+            bytes([i]) * size for i, size in enumerate(shard_sizes)
+        ]
+
+        # Errors when reading a shard are raised by the consumer
+        with pytest.raises(FileNotFoundError):
+            list(prefetch_tar_shards(iter([{'url': urls[0]}, {'url': os.path.join(tmpdir, 'missing.tar')}]), 2))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('num_threads', [0, 1, 4])
+    def test_threaded_map(self, num_threads):
+        assert list(threaded_map(iter(range(50)), lambda x: x * x, num_threads=num_threads)) == [
+            x * x for x in range(50)
+        ]
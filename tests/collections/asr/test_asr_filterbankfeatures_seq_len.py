@@ -97,3 +97,23 @@ class TestFilterbankFeatures:
             assert (
                 fb_spec.shape[2] == audio_length // hop_size
             ), f"{fb_spec.shape}, {nfft}, {window_size}, {hop_size}, {audio_length}, {audio_length // hop_size}"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("exact_pad", [False, True])
+    @pytest.mark.parametrize("chunk_size", [100, 1600, 7777])
+    def test_forward_streaming(self, exact_pad, chunk_size):
+        fb_module = FilterbankFeatures(exact_pad=exact_pad, pad_to=0, normalize=None, dither=0.0).eval()
+        audio = torch.randn(2, 3 * 16000 + 123)
+        fb_spec, fb_len = fb_module(audio.clone(), torch.tensor([audio.shape[1]] * 2))
+
+        # the state is reset at the end of each stream, so the module can be reused
+        for _ in range(2):
+            chunks, lengths = [], 0
+            for start in range(0, audio.shape[1], chunk_size):
+                is_last = start + chunk_size >= audio.shape[1]
+                chunk_spec, chunk_len = fb_module.forward_streaming(audio[:, start : start + chunk_size], is_last)
+                assert chunk_spec.shape[2] == chunk_len[0]
+                chunks.append(chunk_spec)
+                lengths += chunk_len
+            assert torch.equal(lengths, fb_len)
+            assert torch.allclose(torch.cat(chunks, dim=2), fb_spec, atol=1e-5)
@@ -0,0 +1,180 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import string
+
+import numpy as np
+import pytest
+import soundfile as sf
+import torch
+from omegaconf import DictConfig, OmegaConf
+
+from nemo.collections.asr.models import EncDecCTCModel
+from nemo.collections.asr.parts.utils.streaming_utils import (
+    FrameBatchASR,
+    MultiStreamFrameBatchASR,
+    StreamingFeatureBufferer,
+)
+from nemo.collections.asr.parts.utils.transcribe_utils import get_buffered_pred_feat
+
+VOCABULARY = list(" " + string.ascii_lowercase + "'")
+
+
+class _CharTokenizer:
+    def ids_to_text(self, ids):
+        return ''.join(VOCABULARY[i] for i in ids)
+
+
+@pytest.fixture(scope="module")
+def asr_model():
+    torch.manual_seed(0)
+    cfg = DictConfig(
+        {
+            'sample_rate': 16000,
+            'preprocessor': {
+                '_target_': 'nemo.collections.asr.modules.AudioToMelSpectrogramPreprocessor',
+                'features': 64,
+                'window_stride': 0.01,
+                'normalize': 'per_feature',
+            },
+            'encoder': {
+                '_target_': 'nemo.collections.asr.modules.ConvASREncoder',
+                'feat_in': 64,
+                'activation': 'relu',
+                'conv_mask': True,
+                'jasper': [
+                    {
+                        'filters': 64,
+                        'repeat': 1,
+                        'kernel': [11],
+                        'stride': [2],
+                        'dilation': [1],
+                        'dropout': 0.0,
+                        'residual': False,
+                        'separable': True,
+                    }
+                ],
+            },
+            'decoder': {
+                '_target_': 'nemo.collections.asr.modules.ConvASRDecoder',
+                'feat_in': 64,
+                'num_classes': len(VOCABULARY),
+                'vocabulary': VOCABULARY,
+            },
+        }
+    )
+    model = EncDecCTCModel(cfg=cfg).eval()
+    model.tokenizer = _CharTokenizer()
+    return model
+
+
+@pytest.fixture(scope="module")
+def audio_files(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("audio")
+    rng = np.random.default_rng(0)
+    paths = []
+    # lengths around the frame length, including an exact multiple of it
+    for i, duration in enumerate([0.3, 1.6, 2.5, 4.8, 7.3, 3.2, 0.9]):
+        path = str(tmp_path / f"{i}.wav")
+        sf.write(path, rng.uniform(-0.5, 0.5, int(duration * 16000)).astype(np.float32), 16000)
+        paths.append(path)
+    return paths
+
+
+def _buffered_params(model_stride_in_secs=0.02, chunk_len=1.6, total_buffer=4.0):
+    tokens_per_chunk = math.ceil(chunk_len / model_stride_in_secs)
+    delay = math.ceil((chunk_len + (total_buffer - chunk_len) / 2) / model_stride_in_secs)
+    return tokens_per_chunk, delay, model_stride_in_secs
+
+
+class TestMultiStreamFrameBatchASR:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("batch_size, max_active_streams", [(4, None), (3, 5), (16, 2)])
+    def test_matches_frame_batch_asr(self, asr_model, audio_files, batch_size, max_active_streams):
+        tokens_per_chunk, delay, model_stride_in_secs = _buffered_params()
+
+        frame_asr = FrameBatchASR(asr_model, frame_len=1.6, total_buffer=4.0, batch_size=batch_size)
+        expected = []
+        for path in audio_files:
+            frame_asr.reset()
+            frame_asr.read_audio_file(path, delay, model_stride_in_secs)
+            expected.append(frame_asr.transcribe(tokens_per_chunk, delay, keep_logits=True))
+
+        asr = MultiStreamFrameBatchASR(
+            asr_model, frame_len=1.6, total_buffer=4.0, batch_size=batch_size, max_active_streams=max_active_streams
+        )
+        for path in audio_files:
+            asr.add_audio_file(path, delay, model_stride_in_secs)
+        results = asr.transcribe(tokens_per_chunk, delay, keep_logits=True)
+
+        assert sorted(results) == list(range(len(audio_files)))
+        assert asr.num_streams == 0
+        for i, (hypothesis, logits) in enumerate(expected):
+            assert results[i][0] == hypothesis
+            assert torch.allclose(results[i][1], logits, atol=1e-4)
+
+    @pytest.mark.unit
+    def test_streams_are_retired_and_admitted(self, asr_model, audio_files):
+        tokens_per_chunk, delay, model_stride_in_secs = _buffered_params()
+        asr = MultiStreamFrameBatchASR(asr_model, frame_len=1.6, total_buffer=4.0, batch_size=2, max_active_streams=2)
+        for path in audio_files:
+            asr.add_audio_file(path, delay, model_stride_in_secs, stream_id=path)
+
+        finished = []
+        while asr.num_streams > 0:
+            finished.extend(stream_id for stream_id, _ in asr.step(tokens_per_chunk, delay))
+            assert len(asr.active_streams) <= 2
+        assert sorted(finished) == sorted(audio_files)
+        # a short file finishes before a longer one that was added before it
+        assert finished.index(audio_files[5]) < finished.index(audio_files[4])
+        assert asr.step(tokens_per_chunk, delay) == []
+
+    @pytest.mark.unit
+    def test_get_buffered_pred_feat(self, asr_model, audio_files):
+        tokens_per_chunk, delay, model_stride_in_secs = _buffered_params()
+        kwargs = dict(
+            frame_len=1.6,
+            tokens_per_chunk=tokens_per_chunk,
+            delay=delay,
+            preprocessor_cfg=OmegaConf.create(OmegaConf.to_container(asr_model.cfg.preprocessor)),
+            model_stride_in_secs=model_stride_in_secs,
+            device='cpu',
+            filepaths=audio_files,
+        )
+        expected = get_buffered_pred_feat(FrameBatchASR(asr_model, frame_len=1.6, batch_size=4), **kwargs)
+        asr = MultiStreamFrameBatchASR(asr_model, frame_len=1.6, batch_size=4, max_active_streams=3)
+        hyps = get_buffered_pred_feat(asr, **kwargs)
+        assert [hyp.text for hyp in hyps] == [hyp.text for hyp in expected]
+
+
+class TestStreamingFeatureBufferer:
+    @pytest.mark.unit
+    def test_incremental_features(self, asr_model):
+        bufferer = StreamingFeatureBufferer(asr_model, chunk_size=0.5, buffer_size=2.0, incremental_features=True)
+        featurizer = bufferer.raw_preprocessor.featurizer
+        audio = torch.rand(4 * 16000) - 0.5
+        features, _ = featurizer(audio.unsqueeze(0), torch.tensor([audio.shape[0]]))
+
+        for _ in range(2):
+            bufferer.reset()
+            num_frames = 0
+            for start in range(0, audio.shape[0], bufferer.n_chunk_samples):
+                bufferer.update_feature_buffer(audio[start : start + bufferer.n_chunk_samples])
+                num_frames = (start + bufferer.n_chunk_samples + 256 - 512) // 160 + 1
+                # the buffer holds the last frames whose STFT window is complete
+                expected = features[0, :, max(0, num_frames - bufferer.feature_buffer_len) : num_frames]
+                buffer = bufferer.get_raw_feature_buffer()
+                assert torch.allclose(buffer[:, buffer.shape[1] - expected.shape[1] :], expected, atol=1e-5)
+            assert num_frames > bufferer.feature_buffer_len
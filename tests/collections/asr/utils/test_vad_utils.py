@@ -12,19 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+from unittest import mock
+
 import numpy as np
 import pytest
+import torch
 from pyannote.core import Annotation, Segment
 
+from nemo.collections.asr.parts.utils import vad_utils
 from nemo.collections.asr.parts.utils.vad_utils import (
     align_labels_to_frames,
     convert_labels_to_speech_segments,
     frame_vad_construct_pyannote_object_per_file,
+    generate_overlap_vad_seq_batch,
+    generate_overlap_vad_seq_per_tensor,
+    generate_vad_segment_table_batch,
+    generate_vad_segment_table_per_tensor,
     get_frame_labels,
     get_nonspeech_segments,
+    load_padded_tensors_from_files,
     load_speech_overlap_segments_from_rttm,
     load_speech_segments_from_rttm,
+    prepare_gen_segment_table,
     read_rttm_as_pyannote_object,
+    vad_construct_pyannote_object_per_file,
+    vad_tune_threshold_on_dev,
 )
 
 
@@ -54,6 +67,17 @@ def get_simple_rttm_with_silence(rttm_file="test3.rttm"):
     return rttm_file, speech_segments, silence_segments
 
 
+def get_random_frame_predictions(num_recordings, min_length=50, max_length=400, seed=0):
+    generator = torch.Generator().manual_seed(seed)
+    lengths = torch.randint(min_length, max_length, (num_recordings,), generator=generator)
+    frames = torch.zeros(num_recordings, int(lengths.max()))
+    for i, length in enumerate(lengths.tolist()):
+        # smooth random walk in [0, 1], so that there are speech segments of various durations
+        walk = torch.cumsum(torch.randn(length, generator=generator) * 0.15, dim=0)
+        frames[i, :length] = torch.sigmoid(walk - walk.mean())
+    return frames, lengths
+
+
 class TestVADUtils:
     @pytest.mark.parametrize(["logits_len", "labels_len"], [(20, 10), (20, 11), (20, 9), (10, 21), (10, 19)])
     @pytest.mark.unit
@@ -124,3 +148,99 @@ class TestVADUtils:
         assert speech_segments_new == speech_segments
         ref, hyp = frame_vad_construct_pyannote_object_per_file(frame_labels, frame_labels, 0.02)
         assert ref == hyp == pyannote_object_gt
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("smoothing_method", ["mean", "median"])
+    @pytest.mark.parametrize("overlap", [0.5, 0.875])
+    def test_generate_overlap_vad_seq_batch(self, smoothing_method, overlap):
+        frames, lengths = get_random_frame_predictions(num_recordings=6)
+        per_args = {'overlap': overlap, 'window_length_in_sec': 0.63, 'shift_length_in_sec': 0.08}
+        preds, preds_lengths = generate_overlap_vad_seq_batch(frames, lengths, per_args, smoothing_method)
+        for i, length in enumerate(lengths.tolist()):
+            expected = generate_overlap_vad_seq_per_tensor(frames[i, :length], per_args, smoothing_method)
+            assert preds_lengths[i] == len(expected)
+            assert torch.equal(preds[i, : preds_lengths[i]], expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "per_args",
+        [
+            {'onset': 0.5, 'offset': 0.5},
+            {'onset': 0.6, 'offset': 0.4, 'min_duration_on': 0.1, 'min_duration_off': 0.2},
+            {'onset': 0.7, 'offset': 0.3, 'min_duration_on': 0.2, 'filter_speech_first': False},
+            {'onset': 0.5, 'offset': 0.2, 'min_duration_off': 0.3, 'scale': 'relative'},
+            {'onset': 60, 'offset': 40, 'min_duration_on': 0.05, 'scale': 'percentile'},
+        ],
+    )
+    def test_generate_vad_segment_table_batch(self, per_args):
+        frames, lengths = get_random_frame_predictions(num_recordings=8)
+        tables = generate_vad_segment_table_batch(frames, lengths, per_args)
+        assert len(tables) == len(lengths)
+        for i, length in enumerate(lengths.tolist()):
+            _, per_args_float = prepare_gen_segment_table(frames[i, :length], copy.deepcopy(per_args))
+            expected = generate_vad_segment_table_per_tensor(frames[i, :length], per_args_float)
+            assert tables[i].shape == expected.reshape(-1, 3).shape
+            assert torch.allclose(tables[i], expected.reshape(-1, 3), atol=1e-5)
+
+    @pytest.mark.unit
+    def test_vad_tune_threshold_on_dev(self, tmp_path):
+        frames, lengths = get_random_frame_predictions(num_recordings=4, min_length=200)
+        pred_dir, rttm_dir, table_dir = tmp_path / "pred", tmp_path / "rttm", tmp_path / "table"
+        for directory in (pred_dir, rttm_dir, table_dir):
+            directory.mkdir()
+        # ground truth close to the predictions, so that the detection error rates are below 100%
+        ground_truth = generate_vad_segment_table_batch(frames, lengths, {'onset': 0.55, 'offset': 0.45})
+        for i, length in enumerate(lengths.tolist()):
+            with open(pred_dir / f"rec{i}.frame", "w") as f:
+                f.write("".join(f"{value:.4f}\n" for value in frames[i, :length].tolist()))
+            with open(rttm_dir / f"rec{i}.rttm", "w") as f:
+                for start, _, dur in ground_truth[i].tolist():
+                    f.write(f"SPEAKER rec{i} 1 {start:.2f} {dur:.2f} <NA> <NA> speech <NA> <NA>\n")
+
+        params = {'onset': [0.4, 0.6], 'offset': [0.3, 0.5], 'min_duration_on': [0.0, 0.1]}
+        best_params, best_scores = vad_tune_threshold_on_dev(
+            params, str(pred_dir), str(rttm_dir), result_file=str(tmp_path / "result"), focus_metric="DetER"
+        )
+
+        # scores computed with pyannote on the segment tables of the best parameters
+        from pyannote.metrics import detection
+
+        metric = detection.DetectionErrorRate()
+        sequences, lengths, names = load_padded_tensors_from_files(
+            [str(pred_dir / f"rec{i}.frame") for i in range(len(lengths))]
+        )
+        tables = generate_vad_segment_table_batch(sequences, lengths, {**best_params, 'frame_length_in_sec': 0.01})
+        for name, table in zip(names, tables):
+            table_path = table_dir / f"{name}.txt"
+            with open(table_path, "w") as f:
+                f.write("".join(f"{start:.4f} {dur:.4f} speech\n" for start, _, dur in table.tolist()))
+            reference, hypothesis = vad_construct_pyannote_object_per_file(
+                str(table_path), str(rttm_dir / f"{name}.rttm")
+            )
+            metric(reference, hypothesis)
+        report = metric.report(display=False)
+        assert best_scores['DetER (%)'] == pytest.approx(report.iloc[-1]['detection error rate']['%'])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_recordings", [0, 2])
+    def test_vad_tune_threshold_on_dev_without_speech(self, tmp_path, num_recordings):
+        pred_dir, rttm_dir = tmp_path / "pred", tmp_path / "rttm"
+        for directory in (pred_dir, rttm_dir):
+            directory.mkdir()
+        for i in range(num_recordings):
+            with open(pred_dir / f"rec{i}.frame", "w") as f:
+                f.write("0.9000\n" * 100)
+            # ground truth without any speech
+            with open(rttm_dir / f"rec{i}.rttm", "w") as f:
+                f.write(f"SPEAKER rec{i} 1 0.50 0.00 <NA> <NA> speech <NA> <NA>\n")
+
+        with pytest.raises(ValueError, match="No ground-truth speech"):
+            vad_tune_threshold_on_dev(
+                {'onset': [0.5], 'offset': [0.5]}, str(pred_dir), str(rttm_dir), result_file=str(tmp_path / "result")
+            )
+
+    @pytest.mark.unit
+    def test_vad_tune_threshold_on_dev_num_workers_deprecated(self, tmp_path):
+        with mock.patch.object(vad_utils.logging, "warning") as warning, pytest.raises(ValueError):
+            vad_tune_threshold_on_dev({'onset': [0.5], 'offset': [0.5]}, str(tmp_path), str(tmp_path), num_workers=4)
+        assert any("num_workers" in str(call) for call in warning.call_args_list)
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
 import tempfile
 from typing import List, Type, Union
@@ -25,11 +26,20 @@ from nemo.collections.audio.data.data_simulation import (
     check_angle,
     convert_placement_to_range,
     convert_rir_to_multichannel,
+    get_example_seed,
+    get_room_mix_output_filepaths,
+    run_simulations,
     simulate_room_mix,
     wrap_to_180,
 )
 
 
+def simulate_random_example(example: dict) -> dict:
+    """Stand-in for a simulation, depending only on the example seed."""
+    rng = default_rng(example['random_seed'])
+    return {'index': example['index'], 'value': rng.uniform()}
+
+
 class TestDataSimulationUtils:
     @pytest.mark.unit
     def test_check_angle(self):
@@ -396,3 +406,112 @@ class TestRoomSimulation:
             assert mix_uut.duration == mix_golden.duration
             max_diff = np.max(np.abs(mix_uut_samples - mix_golden.samples))
             assert max_diff < self.max_diff_tol
+
+
+class TestRunSimulations:
+    @pytest.mark.unit
+    def test_get_example_seed(self):
+        seeds = [get_example_seed(42, subset, n) for subset in ['train', 'test'] for n in range(100)]
+        assert len(set(seeds)) == len(seeds)
+        assert seeds == [get_example_seed(42, subset, n) for subset in ['train', 'test'] for n in range(100)]
+        assert get_example_seed(42, 'train', 0) != get_example_seed(43, 'train', 0)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('num_workers', [1, 3])
+    def test_run_simulations(self, num_workers: int):
+        """Results do not depend on the number of workers."""
+        examples = [{'index': n, 'random_seed': get_example_seed(0, 'train', n)} for n in range(20)]
+        golden = [simulate_random_example(example) for example in examples]
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            progress_filepath = os.path.join(output_dir, 'progress.jsonl')
+            metadata = run_simulations(
+                simulate_random_example, examples, num_workers=num_workers, progress_filepath=progress_filepath
+            )
+            assert metadata == golden
+
+            with open(progress_filepath, 'r') as f:
+                assert len(f.readlines()) == len(examples)
+
+    @pytest.mark.unit
+    def test_run_simulations_resume(self):
+        """Only examples missing from the progress file are simulated."""
+        examples = [{'index': n, 'random_seed': get_example_seed(0, 'train', n)} for n in range(10)]
+        golden = [simulate_random_example(example) for example in examples]
+        simulated = []
+
+        def simulate_fn(example):
+            simulated.append(example['index'])
+            return simulate_random_example(example)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            progress_filepath = os.path.join(output_dir, 'progress.jsonl')
+            # Interrupted run: a few examples completed and the last line was not fully written
+            with open(progress_filepath, 'w') as f:
+                for n in [0, 1, 4]:
+                    f.write(json.dumps({'index': n, 'metadata': golden[n]}) + '\n')
+                f.write('{"index": 5, "meta')
+
+            metadata = run_simulations(
+                simulate_fn, examples, num_workers=1, progress_filepath=progress_filepath, resume=True
+            )
+            assert metadata == golden
+            assert simulated == [2, 3, 5, 6, 7, 8, 9]
+
+            # Nothing left to simulate
+            simulated.clear()
+            metadata = run_simulations(
+                simulate_fn, examples, num_workers=1, progress_filepath=progress_filepath, resume=True
+            )
+            assert metadata == golden
+            assert simulated == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('several_outputs', [False, True])
+    def test_run_simulations_resume_removes_incomplete_outputs(self, several_outputs: bool):
+        """Output files of examples which are not recorded as completed are removed before resuming."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            examples = []
+            for n in range(4):
+                base_output_filepath = os.path.join(output_dir, f'example_{n}')
+                if several_outputs:
+                    mix_cfg = {'save': {'format': 'flac'}}
+                    output_filepaths = get_room_mix_output_filepaths(base_output_filepath, mix_cfg)
+                else:
+                    output_filepaths = base_output_filepath + '.h5'
+                examples.append(
+                    {'index': n, 'random_seed': get_example_seed(0, 'train', n), 'output_filepaths': output_filepaths}
+                )
+
+            def outputs(example):
+                filepaths = example['output_filepaths']
+                return [filepaths] if isinstance(filepaths, str) else filepaths
+
+            # Interrupted run: outputs of all examples were written, but only example 1 completed
+            for example in examples:
+                for output_filepath in outputs(example):
+                    with open(output_filepath, 'w') as f:
+                        f.write('incomplete')
+            progress_filepath = os.path.join(output_dir, 'progress.jsonl')
+            with open(progress_filepath, 'w') as f:
+                f.write(json.dumps({'index': 1, 'metadata': simulate_random_example(examples[1])}) + '\n')
+
+            outputs_removed = []
+
+            def simulate_fn(example):
+                outputs_removed.append(all(not os.path.exists(filepath) for filepath in outputs(example)))
+                return simulate_random_example(example)
+
+            run_simulations(
+                simulate_fn,
+                examples,
+                num_workers=1,
+                progress_filepath=progress_filepath,
+                resume=True,
+                output_filepath_key='output_filepaths',
+            )
+            assert outputs_removed == [True, True, True]
+            assert all(os.path.exists(filepath) for filepath in outputs(examples[1]))
+            if several_outputs:
+                assert outputs(examples[0])[0] == os.path.join(output_dir, 'example_0_mic.flac')
+                assert len(outputs(examples[0])) == 6
@@ -0,0 +1,80 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+
+def run_in_fresh_interpreter(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+class TestLazyImports:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "collection, submodules",
+        [
+            ("asr", ["data", "losses", "models", "modules"]),
+            ("audio", ["data", "losses", "metrics", "models", "modules"]),
+            ("common", ["callbacks", "data", "losses", "parts", "tokenizers"]),
+            ("nlp", ["data", "losses", "models", "modules"]),
+            ("tts", ["data", "losses", "models", "modules"]),
+        ],
+    )
+    def test_collection_submodules_are_lazy(self, collection, submodules):
+        run_in_fresh_interpreter(
+            f"""
+import sys
+import nemo.collections.{collection} as collection
+
+assert not [name for name in sys.modules if name.startswith("nemo.collections.{collection}.")]
+assert set({submodules}) <= set(dir(collection))
+assert collection.__description__
+"""
+        )
+
+    @pytest.mark.unit
+    def test_submodule_imported_on_access(self):
+        run_in_fresh_interpreter(
+            """
+import sys
+import nemo.collections.common as nemo_common
+
+assert nemo_common.tokenizers is sys.modules["nemo.collections.common.tokenizers"]
+assert nemo_common.tokenizers.TokenizerSpec
+assert "nemo.collections.common.losses" not in sys.modules
+
+try:
+    nemo_common.not_a_submodule
+except AttributeError:
+    pass
+else:
+    raise AssertionError("Expected an AttributeError")
+"""
+        )
+
+    @pytest.mark.unit
+    def test_from_import(self):
+        run_in_fresh_interpreter(
+            """
+from nemo.collections.asr import models
+from nemo.collections.common import tokenizers
+
+assert models.EncDecCTCModel
+assert tokenizers.TokenizerSpec
+"""
+        )
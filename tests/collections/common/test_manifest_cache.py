@@ -0,0 +1,117 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from nemo.collections.common.parts.preprocessing import collections, manifest, parsers
+from nemo.collections.common.parts.preprocessing.manifest_cache import (
+    ManifestCache,
+    decode_string,
+    encode_ragged,
+    encode_strings,
+    intern_values,
+)
+
+
+@pytest.fixture()
+def manifest_file(tmp_path):
+    path = tmp_path / "manifest.json"
+    entries = [
+        {"audio_filepath": "/data/a.wav", "duration": 2.0, "text": "hello world", "speaker": 1, "lang": "en"},
+        {"audio_filepath": "/data/b.wav", "duration": 1.0, "text": "abc", "offset": 0.5, "speaker": 2},
+        {"audio_filepath": "/data/c.wav", "duration": 3.5, "text": "", "orig_sample_rate": 8000},
+        {"audio_filepath": "/data/dir/ż.wav", "duration": 0.1, "text": "żółw"},
+    ]
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return str(path)
+
+
+class TestManifestCacheEncoders:
+    @pytest.mark.unit
+    def test_strings_roundtrip(self):
+        values = ["", "abc", "żółw", "/a/b/c.wav"]
+        buffer, offsets = encode_strings(values)
+        assert [decode_string(buffer, offsets, i) for i in range(len(values))] == values
+
+    @pytest.mark.unit
+    def test_ragged_roundtrip(self):
+        values = [[1, 2, 3], [], [4]]
+        flat, offsets = encode_ragged(values)
+        assert flat.dtype == np.int32
+        assert [flat[offsets[i] : offsets[i + 1]].tolist() for i in range(len(values))] == values
+
+    @pytest.mark.unit
+    def test_intern_values(self):
+        indices, table = intern_values([None, "en", "de", "en", None, 1, True])
+        assert [table[i] for i in indices] == [None, "en", "de", "en", None, 1, True]
+        assert len(table) == 5
+
+
+class TestASRAudioTextCache:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("index_by_file_id", [False, True])
+    def test_cache_roundtrip(self, manifest_file, tmp_path, monkeypatch, index_by_file_id):
+        parser = parsers.make_parser(labels=list(" abcdefghijklmnopqrstuvwxyz"), name="base")
+        cache_dir = str(tmp_path / "cache")
+        reference = collections.ASRAudioText(manifest_file, parser=parser, index_by_file_id=index_by_file_id)
+        built = collections.ASRAudioText(
+            manifest_file, parser=parser, index_by_file_id=index_by_file_id, cache_dir=cache_dir
+        )
+        assert len(os.listdir(cache_dir)) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("The manifest should not be parsed when the cache is valid.")
+
+        monkeypatch.setattr(manifest, "item_iter", _fail)
+        loaded = collections.ASRAudioText(
+            manifest_file, parser=parser, index_by_file_id=index_by_file_id, cache_dir=cache_dir
+        )
+
+        assert list(reference) == list(built) == list(loaded)
+        assert isinstance(loaded.data, collections.ColumnarEntries)
+        assert isinstance(loaded.data.columns["text_tokens"], np.memmap)
+        if index_by_file_id:
+            assert reference.mapping == loaded.mapping
+
+    @pytest.mark.unit
+    def test_cache_key_changes(self, manifest_file, tmp_path):
+        parser = parsers.make_parser(labels=list(" abc"), name="base")
+        cache_dir = str(tmp_path / "cache")
+        key = ManifestCache(cache_dir, manifest_file, parser=parser, max_number=None).key
+
+        assert ManifestCache(cache_dir, manifest_file, parser=parser, max_number=None).key == key
+        assert ManifestCache(cache_dir, manifest_file, parser=parser, max_number=2).key != key
+        other_parser = parsers.make_parser(labels=list(" abcd"), name="base")
+        assert ManifestCache(cache_dir, manifest_file, parser=other_parser, max_number=None).key != key
+
+        with open(manifest_file, "a") as f:
+            f.write(json.dumps({"audio_filepath": "/data/d.wav", "duration": 1.0, "text": "d"}) + "\n")
+        os.utime(manifest_file, ns=(0, 0))
+        assert ManifestCache(cache_dir, manifest_file, parser=parser, max_number=None).key != key
+
+    @pytest.mark.unit
+    def test_filters_are_part_of_the_key(self, manifest_file, tmp_path):
+        parser = parsers.make_parser(labels=list(" abcdefghijklmnopqrstuvwxyz"), name="base")
+        cache_dir = str(tmp_path / "cache")
+        full = collections.ASRAudioText(manifest_file, parser=parser, cache_dir=cache_dir)
+        filtered = collections.ASRAudioText(manifest_file, parser=parser, min_duration=1.5, cache_dir=cache_dir)
+        assert len(full) == 4
+        assert [entity.audio_file for entity in filtered] == ["/data/a.wav", "/data/c.wav"]
+        assert len(os.listdir(cache_dir)) == 2
@@ -0,0 +1,162 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+
+import pytest
+
+from nemo.collections.common.parts.preprocessing import collections, manifest, parsers
+
+
+def _audio_text_inputs():
+    return dict(
+        ids=[0, 1, 2, 3],
+        audio_files=["/data/a.wav", "/data/long.wav", "/data/long.wav", "/data/ż.wav"],
+        durations=[2.0, 1.0, 3.5, 0.1],
+        texts=["hello world", "abc", "", "żółw"],
+        offsets=[None, 0.0, 1.0, None],
+        speakers=[1, "spk2", None, 1],
+        orig_sampling_rates=[None, 8000, 8000, None],
+        token_labels=[None, None, None, None],
+        langs=["en", None, "en", "pl"],
+    )
+
+
+class TestColumnarEntries:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("do_sort_by_duration", [False, True])
+    def test_audio_text_same_entries(self, do_sort_by_duration):
+        parser = parsers.make_parser(labels=list(" abcdefghijklmnopqrstuvwxyz"), name="base")
+        reference = collections.AudioText(
+            **_audio_text_inputs(),
+            parser=parser,
+            do_sort_by_duration=do_sort_by_duration,
+            use_columnar_storage=False,
+        )
+        columnar = collections.AudioText(
+            **_audio_text_inputs(), parser=parser, do_sort_by_duration=do_sort_by_duration
+        )
+
+        assert isinstance(reference.data, list)
+        assert isinstance(columnar.data, collections.ColumnarEntries)
+        assert len(columnar) == len(reference) == 4
+        assert list(columnar) == list(reference)
+        assert [columnar[i] for i in range(-4, 4)] == [reference[i] for i in range(-4, 4)]
+        assert columnar.data[1:3] == reference.data[1:3]
+        assert columnar[1].text_tokens == reference[1].text_tokens
+        with pytest.raises(IndexError):
+            columnar[4]
+
+    @pytest.mark.unit
+    def test_paths_are_interned(self):
+        parser = parsers.make_parser(labels=list(" abcdefghijklmnopqrstuvwxyz"), name="base")
+        columnar = collections.AudioText(**_audio_text_inputs(), parser=parser)
+        columns = columnar.data.columns
+        assert len(columns["audio_file_offsets"]) == 4  # three unique paths
+        assert columns["text_tokens"].dtype.name == "int32"
+
+    @pytest.mark.unit
+    def test_fallback_to_list(self):
+        # A parser which does not tokenize returns strings, which cannot be stored as token ids.
+        parser = parsers.make_parser(labels=list(" abc"), name="base", do_tokenize=False)
+        collection = collections.AudioText(**_audio_text_inputs(), parser=parser)
+        assert isinstance(collection.data, list)
+        assert collection[0].text_tokens == "hello world"
+
+    @pytest.mark.unit
+    def test_unsupported_kind(self):
+        with pytest.raises(ValueError):
+            collections.ColumnarEntries.pack([], {"id": "bytes"})
+
+
+class _RecordingParser:
+    """Character parser which records the transcripts it tokenizes, and fails on those starting with "abc abc"."""
+
+    def __init__(self):
+        self.parser = parsers.make_parser(labels=list(" abc"), name="base")
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        if text.startswith("abc abc"):
+            return None
+        return self.parser(text)
+
+
+class TestParallelManifestParsing:
+    @pytest.fixture()
+    def manifest_files(self, tmp_path):
+        paths = []
+        for manifest_id in range(2):
+            path = tmp_path / f"manifest_{manifest_id}.json"
+            with open(path, "w") as f:
+                for i in range(50):
+                    entry = {"audio_filepath": f"/data/{manifest_id}_{i}.wav", "duration": (i * 7) % 11 + 0.5}
+                    if i % 5 != 0:
+                        entry["text"] = "abc " * (i % 4) + "żółw"
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    if i % 13 == 0:
+                        f.write("\n")
+            paths.append(str(path))
+        return paths
+
+    @pytest.mark.unit
+    def test_chunks_are_line_aligned(self, manifest_files):
+        with open(manifest_files[0], "rb") as f:
+            data = f.read()
+        chunks = manifest.get_manifest_chunks(manifest_files[0], num_chunks=7, min_chunk_size=1)
+        assert len(chunks) == 7
+        assert chunks[0][0] == 0 and chunks[-1][1] == len(data)
+        for (_, end), (start, _) in zip(chunks[:-1], chunks[1:]):
+            assert end == start and data[start - 1 : start] == b"\n"
+        lines = [line for start, end in chunks for line in manifest.iter_manifest_chunk(manifest_files[0], start, end)]
+        assert lines == [line.strip() for line in data.decode("utf-8").splitlines() if line.strip()]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 3])
+    @pytest.mark.parametrize(
+        "settings", [{}, {"min_duration": 2.0, "max_number": 40}, {"do_sort_by_duration": True, "max_duration": 9.0}]
+    )
+    def test_same_as_serial(self, manifest_files, monkeypatch, num_workers, settings):
+        parser = parsers.make_parser(labels=list(" abc"), name="base")
+        reference = collections.ASRAudioText(manifest_files, parser=parser, **settings)
+
+        monkeypatch.setattr(
+            manifest, "get_manifest_chunks", functools.partial(manifest.get_manifest_chunks, min_chunk_size=64)
+        )
+        parallel = collections.ASRAudioText(manifest_files, parser=parser, num_workers=num_workers, **settings)
+        assert list(parallel) == list(reference)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "settings",
+        [{}, {"min_duration": 2.0, "max_duration": 9.0}, {"max_number": 10}, {"min_duration": 4.0, "max_number": 20}],
+    )
+    def test_same_transcripts_are_tokenized(self, manifest_files, settings):
+        serial_parser, parallel_parser = _RecordingParser(), _RecordingParser()
+        reference = collections.ASRAudioText(manifest_files, parser=serial_parser, **settings)
+        parallel = collections.ASRAudioText(manifest_files, parser=parallel_parser, num_workers=1, **settings)
+
+        assert list(parallel) == list(reference)
+        assert parallel_parser.texts == serial_parser.texts
+        if settings:
+            assert len(serial_parser.texts) < 80
+
+    @pytest.mark.unit
+    def test_parse_errors(self, manifest_files):
+        with open(manifest_files[1], "a") as f:
+            f.write("{not json\n")
+        with pytest.raises(RuntimeError):
+            collections.parse_manifests_in_parallel(manifest_files, num_workers=2)
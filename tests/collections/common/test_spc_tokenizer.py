@@ -159,6 +159,13 @@ class TestSentencePieceTokenizer:
         assert tokens.count(tokenizer.token_to_id("<sep>")) == 0
         assert tokens.count(tokenizer.token_to_id("</s>")) == 0
 
+    @pytest.mark.unit
+    def test_batch_text_to_ids(self, test_data_dir):
+        tokenizer = SentencePieceTokenizer(test_data_dir + self.model_name)
+
+        texts = ["<cls> a b c <sep> e f g h i </s>", "", "a  b"]
+        assert tokenizer.batch_text_to_ids(texts) == [tokenizer.text_to_ids(text) for text in texts]
+
     @pytest.mark.unit
     def test_ids_to_text(self, test_data_dir):
         tokenizer = SentencePieceTokenizer(test_data_dir + self.model_name)
@@ -0,0 +1,130 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pickle
+import random
+import string
+
+import numpy as np
+import pytest
+
+from nemo.collections.common.tokenizers import TokenizerSpec
+from nemo.collections.llm.gpt.data.core import create_sft_dataset
+from nemo.collections.llm.gpt.data.packed_sequence import (
+    PackedSequenceMemMap,
+    get_packed_index_paths,
+    is_memmap_packed_dataset,
+    prepare_packed_sequence_data,
+)
+
+
+class _CharTokenizer(TokenizerSpec):
+    """Character-level tokenizer, so that the tests do not depend on any tokenizer model."""
+
+    pad_id = 0
+    eos_id = 1
+    bos_id = 2
+
+    def text_to_ids(self, text):
+        return [3 + string.printable.index(c) for c in text]
+
+    def text_to_tokens(self, text):
+        return list(text)
+
+    def ids_to_text(self, ids):
+        return ''.join(string.printable[i - 3] for i in ids if i >= 3)
+
+    def tokens_to_ids(self, tokens):
+        return self.text_to_ids(''.join(tokens))
+
+    def ids_to_tokens(self, ids):
+        return list(self.ids_to_text(ids))
+
+    def tokens_to_text(self, tokens):
+        return ''.join(tokens)
+
+
+@pytest.fixture()
+def sft_file(tmp_path):
+    rng = random.Random(0)
+    path = tmp_path / "training.jsonl"
+    with open(path, "w") as f:
+        for _ in range(200):
+            sample = {
+                "input": ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 40))),
+                "output": ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 20))),
+            }
+            f.write(json.dumps(sample) + "\n")
+    return path
+
+
+def _prepare(sft_file, output_path, **kwargs):
+    np.random.seed(1234)
+    prepare_packed_sequence_data(
+        input_path=sft_file,
+        output_path=output_path,
+        output_metadata_path=output_path.with_suffix('.json'),
+        packed_sequence_size=128,
+        tokenizer=_CharTokenizer(),
+        max_seq_length=64,
+        **kwargs,
+    )
+    with open(output_path.with_suffix('.json')) as f:
+        return json.load(f)
+
+
+class TestStreamingPackedSequence:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [0, 2])
+    def test_matches_in_memory_preparation(self, sft_file, tmp_path, num_workers):
+        legacy_path, streaming_path = tmp_path / "legacy.npy", tmp_path / "streaming.npy"
+        legacy_metadata = _prepare(sft_file, legacy_path)
+        streaming_metadata = _prepare(sft_file, streaming_path, streaming=True, num_workers=num_workers, chunk_size=16)
+        assert streaming_metadata == legacy_metadata
+
+        assert not is_memmap_packed_dataset(legacy_path)
+        assert is_memmap_packed_dataset(streaming_path)
+        assert all(path.is_file() for path in get_packed_index_paths(streaming_path))
+        # temporary files are cleaned up
+        assert not any(path.name.startswith('.streaming') for path in tmp_path.iterdir())
+
+        legacy = np.load(legacy_path, allow_pickle=True)
+        packed = PackedSequenceMemMap(streaming_path)
+        assert len(packed) == len(legacy)
+        for expected, item in zip(legacy, [packed[i] for i in range(len(packed))]):
+            assert item['input_ids'].tolist() == expected['input_ids']
+            assert item['loss_mask'].tolist() == expected['loss_mask']
+            assert item['seq_start_id'] == expected['seq_start_id']
+        assert packed[-1]['seq_start_id'] == legacy[-1]['seq_start_id']
+        with pytest.raises(IndexError):
+            packed[len(packed)]
+
+        restored = pickle.loads(pickle.dumps(packed))
+        assert restored[0]['input_ids'].tolist() == legacy[0]['input_ids']
+
+    @pytest.mark.unit
+    def test_packed_dataset_loads_memmap(self, sft_file, tmp_path):
+        legacy_path, streaming_path = tmp_path / "legacy.npy", tmp_path / "streaming.npy"
+        _prepare(sft_file, legacy_path)
+        _prepare(sft_file, streaming_path, streaming=True)
+
+        datasets = [
+            create_sft_dataset(path, tokenizer=_CharTokenizer(), seq_length=128)
+            for path in (legacy_path, streaming_path)
+        ]
+        assert isinstance(datasets[1].indexed_dataset, PackedSequenceMemMap)
+        batches = [dataset.collate_fn([dataset[0], dataset[1]]) for dataset in datasets]
+        for name in ('tokens', 'labels', 'loss_mask', 'position_ids', 'cu_seqlens'):
+            assert batches[0][name].tolist() == batches[1][name].tolist()
@@ -0,0 +1,206 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import json
+import os
+import random
+import string
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from nemo.collections.common.tokenizers import TokenizerSpec
+from nemo.collections.nlp.data.language_modeling.megatron import gpt_sft_dataset
+from nemo.collections.nlp.data.language_modeling.megatron.gpt_sft_dataset import GPTSFTDataset
+
+
+class _CharTokenizer(TokenizerSpec):
+    """Character-level tokenizer, so that the tests do not depend on any tokenizer model."""
+
+    pad_id = 0
+    eos_id = 1
+    bos_id = 2
+
+    def __init__(self, offset: int = 3):
+        self.offset = offset
+        self.vocab_size = offset + len(string.printable)
+
+    def text_to_ids(self, text):
+        return [self.offset + string.printable.index(c) for c in text]
+
+    def text_to_tokens(self, text):
+        return list(text)
+
+    def ids_to_text(self, ids):
+        return ''.join(string.printable[i - self.offset] for i in ids if i >= self.offset)
+
+    def tokens_to_ids(self, tokens):
+        return self.text_to_ids(''.join(tokens))
+
+    def ids_to_tokens(self, ids):
+        return list(self.ids_to_text(ids))
+
+    def tokens_to_text(self, tokens):
+        return ''.join(tokens)
+
+
+@pytest.fixture()
+def sft_file(tmp_path):
+    rng = random.Random(0)
+    path = tmp_path / "training.jsonl"
+    with open(path, "w") as f:
+        for i in range(50):
+            sample = {
+                "input": ''.join(rng.choices(string.ascii_lowercase + ' ', k=rng.randint(1, 60))),
+                "output": ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 20))),
+                "id": i,
+            }
+            f.write(json.dumps(sample) + "\n")
+    return str(path)
+
+
+def _make_dataset(sft_file, tokenizer=None, **kwargs):
+    kwargs = {
+        'max_seq_length': 48,
+        'prompt_template': "Q: {input}\n\nA: {output}",
+        'label_key': 'output',
+        'truncation_field': 'input',
+        'memmap_workers': 1,
+        **kwargs,
+    }
+    return GPTSFTDataset(file_path=sft_file, tokenizer=tokenizer or _CharTokenizer(), **kwargs)
+
+
+def _all_examples(dataset):
+    return [dataset[idx] for idx in range(len(dataset))]
+
+
+class TestGPTSFTDatasetProcessedCache:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kwargs", [{}, {'add_bos': True, 'add_sep': True, 'sep_id': 4}, {'is_test': True}])
+    def test_processed_examples_match(self, sft_file, tmp_path, kwargs):
+        reference = _make_dataset(sft_file, **kwargs)
+        cached = _make_dataset(sft_file, processed_cache_dir=str(tmp_path / "cache"), **kwargs)
+
+        assert reference.processed_examples is None
+        assert cached.processed_examples is not None
+        assert len(cached) == len(reference)
+        assert _all_examples(cached) == _all_examples(reference)
+
+    @pytest.mark.unit
+    def test_autogenerated_index(self, sft_file, tmp_path):
+        reference = _make_dataset(sft_file)
+        cached = _make_dataset(sft_file, processed_cache_dir=str(tmp_path / "cache"))
+
+        example = cached[-1]
+        assert example == reference[-1]
+        assert example['metadata']['__AUTOGENERATED__'] is True
+        assert '__AUTOGENERATED__' not in cached[len(cached) - 1]['metadata']
+
+    @pytest.mark.unit
+    def test_cache_is_reused(self, sft_file, tmp_path, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        expected = _all_examples(_make_dataset(sft_file, processed_cache_dir=cache_dir))
+        assert len(os.listdir(cache_dir)) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("The examples should not be processed when the cache is valid.")
+
+        monkeypatch.setattr(GPTSFTDataset, '_process_example', _fail)
+        assert _all_examples(_make_dataset(sft_file, processed_cache_dir=cache_dir)) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {'tokenizer': _CharTokenizer(offset=5)},
+            {'prompt_template': "{input} {output}"},
+            {'truncation_method': 'left'},
+            {'max_seq_length': 32},
+            {'add_eos': False},
+        ],
+    )
+    def test_cache_invalidation(self, sft_file, tmp_path, kwargs):
+        cache_dir = str(tmp_path / "cache")
+        _make_dataset(sft_file, processed_cache_dir=cache_dir)
+
+        cached = _make_dataset(sft_file, processed_cache_dir=cache_dir, **kwargs)
+        assert len(os.listdir(cache_dir)) == 2
+        assert _all_examples(cached) == _all_examples(_make_dataset(sft_file, **kwargs))
+
+    @pytest.mark.unit
+    def test_cache_invalidation_on_data_change(self, sft_file, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        _make_dataset(sft_file, processed_cache_dir=cache_dir)
+        with open(sft_file, "a") as f:
+            f.write(json.dumps({"input": "appended", "output": "example", "id": 50}) + "\n")
+        # the memmap index of the data file is not rebuilt automatically
+        for index_file in glob.glob(f"{sft_file}.idx*"):
+            os.remove(index_file)
+
+        cached = _make_dataset(sft_file, processed_cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 2
+        assert len(cached) == 51
+        assert cached[50]['metadata']['id'] == 50
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_parts", [1, 3, 64])
+    def test_merged_parts_match(self, sft_file, tmp_path, num_parts):
+        dataset = _make_dataset(sft_file, processed_cache_dir=str(tmp_path / "cache"))
+        reference = dataset._processed_cache().load()[0]
+
+        dataset.processed_cache_dir = str(tmp_path / "parts")
+        cache = dataset._processed_cache()
+        parts = [cache.part(index, num_parts) for index in range(num_parts)]
+        for index, part in enumerate(parts):
+            part.save(*dataset._process_examples(index, num_parts))
+        cache.merge(parts, offsets_columns=('input_ids_offsets', 'metadata_offsets'))
+
+        merged = cache.load()[0]
+        assert merged.keys() == reference.keys()
+        for name in reference:
+            np.testing.assert_array_equal(merged[name], reference[name])
+
+    @pytest.mark.unit
+    def test_build_removes_parts(self, sft_file, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        dataset = _make_dataset(sft_file, processed_cache_dir=cache_dir)
+        assert os.listdir(cache_dir) == [dataset._processed_cache().key]
+
+    @pytest.mark.unit
+    def test_unsupported_subclass_warns(self, sft_file, tmp_path):
+        class _UpperCaseDataset(GPTSFTDataset):
+            def _process_example(self, example):
+                example = {key: value.upper() if isinstance(value, str) else value for key, value in example.items()}
+                return super()._process_example(example)
+
+        cache_dir = str(tmp_path / "cache")
+        with mock.patch.object(gpt_sft_dataset.logging, 'warning') as warning:
+            dataset = _UpperCaseDataset(
+                file_path=sft_file,
+                tokenizer=_CharTokenizer(),
+                max_seq_length=48,
+                prompt_template="Q: {input}\n\nA: {output}",
+                label_key='output',
+                truncation_field='input',
+                memmap_workers=1,
+                processed_cache_dir=cache_dir,
+            )
+
+        assert any('does not support processed_cache_dir' in str(call) for call in warning.call_args_list)
+        assert dataset.processed_examples is None
+        assert not os.path.exists(cache_dir)
+        assert dataset[0]['metadata']['id'] == 0
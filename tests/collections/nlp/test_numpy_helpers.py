@@ -0,0 +1,145 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nemo.collections.nlp.data.language_modeling.megatron import dataset_utils, numpy_helpers
+
+# The expected outputs below were produced by the C++ helpers (helpers.cpp) on the same inputs.
+
+SIZES = np.array([5, 3, 7, 2, 4], dtype=np.int32)
+DOC_IDX = np.array([0, 1, 2, 3, 4, 2, 0, 4, 1, 3], dtype=np.int32)
+
+# Documents of 3, 1, 4 and 2 sentences
+DOCS = np.array([0, 3, 4, 8, 10], dtype=np.int64)
+SENTENCE_SIZES = np.array([4, 6, 3, 9, 2, 5, 1, 7, 8, 2], dtype=np.int32)
+TITLES_SIZES = np.array([2, 0, 3, 1], dtype=np.int32)
+
+
+class TestNumpyHelpers:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "drop_last, add_extra_token, expected",
+        [
+            (
+                True,
+                1,
+                [[0, 0], [0, 4], [2, 0], [2, 4], [3, 1], [4, 3], [5, 3], [6, 0], [6, 4], [7, 3], [9, 0]],
+            ),
+            (
+                False,
+                0,
+                [[0, 0], [0, 4], [1, 3], [2, 4], [3, 1], [4, 3], [5, 3], [5, 7], [6, 4], [7, 3], [8, 3], [9, 2]],
+            ),
+        ],
+    )
+    def test_build_sample_idx(self, drop_last, add_extra_token, expected):
+        sample_idx = numpy_helpers.build_sample_idx(SIZES, DOC_IDX, 4, 2, int(SIZES.sum()), drop_last, add_extra_token)
+        assert sample_idx.dtype == np.int32
+        assert sample_idx.tolist() == expected
+
+    @pytest.mark.unit
+    def test_build_blending_indices(self):
+        dataset_index = np.zeros(10, dtype=np.uint8)
+        dataset_sample_index = np.zeros(10, dtype=np.int64)
+        weights = np.array([0.5, 0.3, 0.2])
+        numpy_helpers.build_blending_indices(dataset_index, dataset_sample_index, weights, 3, 10, False)
+        assert dataset_index.tolist() == [0, 1, 2, 0, 1, 0, 2, 0, 1, 0]
+        assert dataset_sample_index.tolist() == [0, 0, 0, 1, 1, 2, 1, 3, 2, 4]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "short_seq_prob, min_num_sent, expected",
+        [
+            (0.0, 2, [[8, 10, 10], [4, 8, 10], [0, 3, 10], [8, 10, 10], [4, 8, 10], [0, 3, 10]]),
+            (
+                0.5,
+                1,
+                [[0, 3, 10], [3, 4, 5], [3, 4, 10], [8, 10, 10], [0, 3, 10], [4, 8, 10], [4, 8, 9], [8, 10, 8]],
+            ),
+        ],
+    )
+    def test_build_mapping(self, short_seq_prob, min_num_sent, expected):
+        maps = numpy_helpers.build_mapping(DOCS, SENTENCE_SIZES, 2, 100, 10, short_seq_prob, 1234, False, min_num_sent)
+        assert maps.dtype == np.uint32
+        assert maps.tolist() == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "use_one_sent_blocks, expected",
+        [
+            (
+                False,
+                [[0, 3, 0, 0], [4, 6, 2, 1], [4, 6, 2, 1], [8, 10, 3, 3], [0, 3, 0, 0], [6, 8, 2, 2], [6, 8, 2, 2]]
+                + [[8, 10, 3, 3]],
+            ),
+            (
+                True,
+                [[8, 10, 3, 5], [4, 6, 2, 3], [6, 8, 2, 4], [3, 4, 1, 2], [3, 4, 1, 2], [2, 3, 0, 1], [2, 3, 0, 1]]
+                + [[8, 10, 3, 5], [0, 2, 0, 0], [6, 8, 2, 4], [0, 2, 0, 0], [4, 6, 2, 3]],
+            ),
+        ],
+    )
+    def test_build_blocks_mapping(self, use_one_sent_blocks, expected):
+        maps = numpy_helpers.build_blocks_mapping(
+            DOCS, SENTENCE_SIZES, TITLES_SIZES, 2, 100, 10, 1234, False, use_one_sent_blocks
+        )
+        assert maps.dtype == np.uint32
+        assert maps.tolist() == expected
+
+    @pytest.mark.unit
+    def test_build_blocks_mapping_skips_long_sentences(self):
+        sizes = SENTENCE_SIZES.copy()
+        sizes[5] = numpy_helpers.LONG_SENTENCE_LEN + 1
+        maps = numpy_helpers.build_blocks_mapping(DOCS, sizes, TITLES_SIZES, 1, 100, 10, 7, False, False)
+        assert maps.tolist() == [[0, 3, 0, 0], [8, 10, 3, 1]]
+
+    @pytest.mark.unit
+    def test_max_num_samples(self):
+        # Epochs are only started while there are less than max_num_samples samples
+        maps = numpy_helpers.build_mapping(DOCS, SENTENCE_SIZES, 3, 5, 10, 0.0, 1234, False, 2)
+        assert maps.shape == (6, 3)
+        maps = numpy_helpers.build_blocks_mapping(DOCS, SENTENCE_SIZES, TITLES_SIZES, 3, 5, 10, 1234, False, False)
+        assert maps.shape == (8, 4)
+
+
+class TestUseCompiledHelpers:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "value, compiled, expected",
+        [
+            (None, True, True),
+            (None, False, False),
+            ("auto", True, True),
+            ("AUTO", False, False),
+            ("cpp", False, True),
+            ("Cpp", True, True),
+            ("numpy", True, False),
+            ("numpy", False, False),
+        ],
+    )
+    def test_selection(self, monkeypatch, value, compiled, expected):
+        if value is None:
+            monkeypatch.delenv("NEMO_DATASET_HELPERS", raising=False)
+        else:
+            monkeypatch.setenv("NEMO_DATASET_HELPERS", value)
+        monkeypatch.setattr(dataset_utils.importlib.util, "find_spec", lambda *args: object() if compiled else None)
+        assert dataset_utils.use_compiled_helpers() is expected
+
+    @pytest.mark.unit
+    def test_invalid_value(self, monkeypatch):
+        monkeypatch.setenv("NEMO_DATASET_HELPERS", "fortran")
+        with pytest.raises(ValueError, match="NEMO_DATASET_HELPERS"):
+            dataset_utils.use_compiled_helpers()
@@ -0,0 +1,130 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+from nemo.collections.nlp.data.language_modeling.text_memmap_dataset import (
+    _build_index_from_memdata,
+    _build_memmap_index_files,
+    _index_fn,
+    build_index_files,
+)
+
+NEWLINE_INT = ord("\n")
+
+CONTENTS = {
+    "no_trailing_newline": b"abc\ndef\nghi",
+    "trailing_newline": b"abc\ndef\nghi\n",
+    "empty_lines": b"\n\nab\n\n\ncd\n\n\n",
+    "only_newlines": b"\n\n\n",
+    "single_line": b"abcdefghijklmnop",
+    "segment_boundaries": b"abcd\nefgh\nijkl\nmnop\n",
+}
+
+
+def _reference_index(data: bytes):
+    """Single pass index of the data, as built before files could be split into segments."""
+    midx = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == NEWLINE_INT).tolist()
+    if (len(midx) == 0) or (midx[-1] + 1 != len(data)):
+        midx = midx + [len(data) + 1]
+    while len(midx) > 1 and (midx[-1] - midx[-2]) < 2:
+        midx.pop(-1)
+    return np.asarray(midx, dtype=np.int64)
+
+
+def _write(path, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def _read_index_files(fn, index_mapping_dir):
+    idx_fn = _index_fn(fn, index_mapping_dir)
+    with open(idx_fn + ".npy", "rb") as f_npy, open(idx_fn + ".info", "rb") as f_info:
+        return f_npy.read(), f_info.read()
+
+
+def _assert_identical_to_single_pass(fns, tmp_path, workers, segment_size):
+    segmented_dir, single_pass_dir = str(tmp_path / "segmented"), str(tmp_path / "single_pass")
+    build_index_files(fns, NEWLINE_INT, workers=workers, index_mapping_dir=segmented_dir, segment_size=segment_size)
+    for fn in fns:
+        _build_memmap_index_files(NEWLINE_INT, _build_index_from_memdata, fn, single_pass_dir)
+        assert _read_index_files(fn, segmented_dir) == _read_index_files(fn, single_pass_dir)
+
+        with open(fn, "rb") as f:
+            expected = _reference_index(f.read())
+        np.testing.assert_array_equal(np.load(_index_fn(fn, segmented_dir) + ".npy"), expected)
+
+
+class TestSegmentedIndexFiles:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", list(CONTENTS))
+    def test_build_index_from_memdata(self, tmp_path, name):
+        fn = _write(tmp_path / f"{name}.txt", CONTENTS[name])
+        np.testing.assert_array_equal(_build_index_from_memdata(fn, NEWLINE_INT), _reference_index(CONTENTS[name]))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", list(CONTENTS))
+    def test_all_segment_sizes(self, tmp_path, name):
+        # segment sizes smaller than a line, ending right before, on or after a newline, and larger than the file
+        data = CONTENTS[name]
+        fn = _write(tmp_path / f"{name}.txt", data)
+        for segment_size in [None] + list(range(1, len(data) + 2)):
+            _assert_identical_to_single_pass([fn], tmp_path / f"segment_size_{segment_size}", 2, segment_size)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("segment_size", [4, 5, 6])
+    def test_newline_on_segment_boundary(self, tmp_path, segment_size):
+        # newlines are at positions 4, 9, 14 and 19, i.e. at the last byte, first byte or middle of a segment
+        fn = _write(tmp_path / "data.txt", CONTENTS["segment_boundaries"])
+        _assert_identical_to_single_pass([fn], tmp_path, 2, segment_size)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 3, 8])
+    def test_single_file_split_across_workers(self, tmp_path, workers):
+        rng = random.Random(0)
+        lines = [''.join(rng.choices("abc \n", k=rng.randint(0, 300))) for _ in range(2000)]
+        fn = _write(tmp_path / "data.txt", "\n".join(lines).encode("utf-8"))
+        assert os.path.getsize(fn) > 64 * 1024
+        _assert_identical_to_single_pass([fn], tmp_path, workers, 1024)
+
+    @pytest.mark.unit
+    def test_several_files(self, tmp_path):
+        fns = [_write(tmp_path / f"{name}.txt", data) for name, data in CONTENTS.items()]
+        _assert_identical_to_single_pass(fns, tmp_path, 3, 3)
+
+    @pytest.mark.unit
+    def test_existing_index_is_kept(self, tmp_path):
+        fn = _write(tmp_path / "data.txt", CONTENTS["trailing_newline"])
+        index_mapping_dir = str(tmp_path / "index")
+        build_index_files([fn], NEWLINE_INT, workers=1, index_mapping_dir=index_mapping_dir, segment_size=2)
+        index_files = _read_index_files(fn, index_mapping_dir)
+
+        _write(tmp_path / "data.txt", CONTENTS["empty_lines"])
+        build_index_files([fn], NEWLINE_INT, workers=1, index_mapping_dir=index_mapping_dir, segment_size=2)
+        assert _read_index_files(fn, index_mapping_dir) == index_files
+        assert not os.path.exists(_index_fn(fn, index_mapping_dir) + ".npy.tmp")
+
+    @pytest.mark.unit
+    def test_empty_file(self, tmp_path):
+        fn = _write(tmp_path / "empty.txt", b"")
+        with pytest.raises(ValueError):
+            _build_index_from_memdata(fn, NEWLINE_INT)
+        with pytest.raises(ValueError):
+            build_index_files([fn], NEWLINE_INT, workers=1, index_mapping_dir=str(tmp_path), segment_size=4)
+        assert not os.path.exists(_index_fn(fn, str(tmp_path)) + ".npy.tmp")
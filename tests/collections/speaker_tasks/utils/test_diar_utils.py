@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import os
+import shutil
+
 import numpy as np
 import pytest
 import torch
@@ -22,9 +24,20 @@ from nemo.collections.asr.data.audio_to_label import repeat_signal
 from nemo.collections.asr.parts.utils.longform_clustering import LongFormSpeakerClustering
 from nemo.collections.asr.parts.utils.offline_clustering import (
     SpeakerClustering,
+    get_argmin_mat,
+    get_argmin_mat_sorted,
     get_scale_interpolated_embs,
+    getAffinityGraphMat,
     getCosAffinityMatrix,
     getKneighborsConnections,
+    getLaplacian,
+    getMultiScaleCosAffinityKNN,
+    getMultiScaleCosAffinityMatrix,
+    getSparseAffinityGraph,
+    getSparseLaplacian,
+    isGraphFullyConnected,
+    isSparseGraphFullyConnected,
+    sparseEigDecompose,
     split_input_data,
 )
 from nemo.collections.asr.parts.utils.online_clustering import (
@@ -40,8 +53,10 @@ from nemo.collections.asr.parts.utils.optimization_utils import LinearSumAssignm
 from nemo.collections.asr.parts.utils.optimization_utils import linear_sum_assignment as nemo_linear_sum_assignment
 from nemo.collections.asr.parts.utils.speaker_utils import (
     OnlineSegmentor,
+    SpeakerEmbeddingStore,
     check_ranges,
     fl2int,
+    get_model_checksum,
     get_new_cursor_for_update,
     get_online_segments_from_slices,
     get_online_subsegments_from_buffer,
@@ -484,6 +499,67 @@ class TestGetSubsegments:
         assert result == [[0.0, 0.25]]
 
 
+class TestSpeakerEmbeddingStore:
+    @staticmethod
+    def get_subsegments(audio_filepath, window=1.5, shift=0.75, duration=3.0):
+        return [
+            {"audio_filepath": audio_filepath, "offset": offset, "duration": dur, "label": "UNK", "uniq_id": None}
+            for offset, dur in get_subsegments_scriptable(offset=0.0, window=window, shift=shift, duration=duration)
+        ]
+
+    @pytest.mark.unit
+    def test_lookup_and_add(self, tmp_path):
+        audio_filepath = str(tmp_path / "audio.wav")
+        with open(audio_filepath, "wb") as f:
+            f.write(os.urandom(1000))
+        store = SpeakerEmbeddingStore(str(tmp_path / "store"), model_checksum="model")
+        subsegments = self.get_subsegments(audio_filepath)
+        embeddings = torch.randn(len(subsegments), 8)
+        assert store.lookup(subsegments, 1.5, 0.75) == [None] * len(subsegments)
+
+        store.add(subsegments[:2], embeddings[:2], 1.5, 0.75)
+        cached = store.lookup(subsegments, 1.5, 0.75)
+        assert torch.equal(torch.stack(cached[:2]), embeddings[:2])
+        assert cached[2:] == [None] * (len(subsegments) - 2)
+        store.add(subsegments[1:], embeddings[1:], 1.5, 0.75)
+        assert torch.equal(torch.stack(store.lookup(subsegments, 1.5, 0.75)), embeddings)
+
+        # other scales and models are stored separately
+        assert store.lookup(subsegments, 1.0, 0.5) == [None] * len(subsegments)
+        other_store = SpeakerEmbeddingStore(str(tmp_path / "store"), model_checksum="other_model")
+        assert other_store.lookup(subsegments, 1.5, 0.75) == [None] * len(subsegments)
+
+    @pytest.mark.unit
+    def test_content_addressed(self, tmp_path):
+        audio_filepath = str(tmp_path / "audio.wav")
+        with open(audio_filepath, "wb") as f:
+            f.write(os.urandom(1000))
+        store = SpeakerEmbeddingStore(str(tmp_path / "store"), model_checksum="model")
+        subsegments = self.get_subsegments(audio_filepath)
+        embeddings = torch.randn(len(subsegments), 8)
+        store.add(subsegments, embeddings, 1.5, 0.75)
+
+        # same content under another path
+        copied_filepath = str(tmp_path / "copy.wav")
+        shutil.copy(audio_filepath, copied_filepath)
+        cached = store.lookup(self.get_subsegments(copied_filepath), 1.5, 0.75)
+        assert torch.equal(torch.stack(cached), embeddings)
+
+        # new content under the same path
+        with open(audio_filepath, "wb") as f:
+            f.write(os.urandom(1000))
+        assert store.lookup(subsegments, 1.5, 0.75) == [None] * len(subsegments)
+
+    @pytest.mark.unit
+    def test_model_checksum(self):
+        model = torch.nn.Linear(4, 2)
+        checksum = get_model_checksum(model)
+        assert checksum == get_model_checksum(model)
+        with torch.no_grad():
+            model.weight[0, 0] += 1.0
+        assert checksum != get_model_checksum(model)
+
+
 class TestDiarizationSegmentationUtils:
     """
     Test segmentation util functions
@@ -707,6 +783,51 @@ class TestClusteringUtilFunctions:
         elif mask_method == 'drop':
             assert all(binarized_affinity_mat.sum(dim=0) <= float(p_value))
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks, spk_dur", [(2, 10), (3, 20)])
+    @pytest.mark.parametrize("knn_size, chunk_size", [(8, 7), (20, 256)])
+    def test_multiscale_cos_affinity_knn(self, n_spks, spk_dur, knn_size, chunk_size):
+        em, ts, mc, mw, _, _ = generate_toy_data(n_spks=n_spks, spk_dur=spk_dur, perturb_sigma=0.1)
+        embeddings_in_scales, timestamps_in_scales = split_input_data(em, ts, mc)
+        for mapping, expected_mapping in zip(
+            get_argmin_mat_sorted(timestamps_in_scales), get_argmin_mat(timestamps_in_scales)
+        ):
+            assert torch.equal(mapping, expected_mapping)
+
+        # different weights for each scale
+        mw = torch.tensor([[0.5, 1.0, 1.5]])
+        mat = getMultiScaleCosAffinityMatrix(mw, embeddings_in_scales, timestamps_in_scales)
+        knn_values, knn_indices = getMultiScaleCosAffinityKNN(
+            mw, embeddings_in_scales, timestamps_in_scales, knn_size=knn_size, chunk_size=chunk_size
+        )
+        assert knn_indices.shape == (mc[-1], knn_size)
+        # the dense matrix is calculated from half precision embeddings
+        assert torch.allclose(knn_values, mat.topk(knn_size, dim=1)[0], atol=1e-2)
+        assert torch.allclose(knn_values, mat.gather(1, knn_indices), atol=1e-2)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("p_value", [1, 2, 5, 15])
+    @pytest.mark.parametrize("N", [30, 200])
+    def test_sparse_affinity_graph(self, p_value, N, knn_size=16, seed=0):
+        torch.manual_seed(seed)
+        emb = torch.randn(N, 16)
+        mat = getCosAffinityMatrix(emb)
+        knn_indices = mat.topk(knn_size, dim=1)[1]
+        dense_laplacian = getLaplacian(getAffinityGraphMat(mat, p_value).float())
+
+        affinity_graph = getSparseAffinityGraph(knn_indices, p_value)
+        laplacian = getSparseLaplacian(affinity_graph)
+        assert torch.allclose(laplacian.to_dense(), dense_laplacian)
+        assert isSparseGraphFullyConnected(affinity_graph) == bool(
+            isGraphFullyConnected(getAffinityGraphMat(mat, p_value), device=torch.device('cpu'))
+        )
+        lambdas, diffusion_map = sparseEigDecompose(laplacian, num_eigs=6)
+        expected_lambdas = torch.linalg.eigvalsh(dense_laplacian)
+        assert torch.allclose(lambdas, expected_lambdas[:6], atol=1e-3)
+        assert torch.allclose(dense_laplacian @ diffusion_map, diffusion_map * lambdas, atol=1e-2)
+        max_lambda, _ = sparseEigDecompose(laplacian, num_eigs=1, largest=True)
+        assert torch.allclose(max_lambda, expected_lambdas[-1:], atol=1e-3)
+
     @pytest.mark.unit
     @pytest.mark.parametrize("Y_aggr", [torch.tensor([0, 1, 0, 1])])
     @pytest.mark.parametrize("chunk_cluster_count, embeddings_per_chunk", [(2, 50)])
@@ -801,6 +922,38 @@ class TestSpeakerClustering:
     def test_offline_speaker_clustering_cpu(self, n_spks, total_sec, SSV, perturb_sigma, seed, jit_script, cuda=False):
         self.test_offline_speaker_clustering(n_spks, total_sec, SSV, perturb_sigma, seed, jit_script, cuda=cuda)
 
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [1, 2, 4, 7])
+    @pytest.mark.parametrize("total_sec, SSV, perturb_sigma, seed", [(200, 10, 0.1, 0)])
+    @pytest.mark.parametrize("jit_script", [False, True])
+    def test_offline_speaker_clustering_sparse_cpu(self, n_spks, total_sec, SSV, perturb_sigma, seed, jit_script):
+        spk_dur = total_sec / n_spks
+        em, ts, mc, mw, spk_ts, gt = generate_toy_data(
+            n_spks=n_spks, spk_dur=spk_dur, perturb_sigma=perturb_sigma, torch_seed=seed
+        )
+        offline_speaker_clustering = SpeakerClustering(sparse_affinity=True, knn_size=32, cuda=False)
+        # longer than `nme_mat_size` segments, to use the sparse affinity graphs
+        assert mc[-1] > offline_speaker_clustering.nme_mat_size
+        if jit_script:
+            offline_speaker_clustering = torch.jit.script(offline_speaker_clustering)
+
+        Y_out = offline_speaker_clustering.forward_infer(
+            embeddings_in_scales=em,
+            timestamps_in_scales=ts,
+            multiscale_segment_counts=mc,
+            multiscale_weights=mw,
+            oracle_num_speakers=-1,
+            max_num_speakers=8,
+            sparse_search_volume=SSV,
+            max_rp_threshold=0.15,
+            fixed_thres=-1.0,
+        )
+        permuted_Y = stitch_cluster_labels(Y_old=gt, Y_new=Y_out)
+        assert len(set(permuted_Y.tolist())) == n_spks
+        assert Y_out.shape[0] == mc[-1]
+        assert all(permuted_Y == gt)
+
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
     @pytest.mark.parametrize("n_spks", [1])
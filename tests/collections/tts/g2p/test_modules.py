@@ -38,6 +38,7 @@ class TestIpaG2p:
         phoneme_probability=None,
         grapheme_case=GRAPHEME_CASE_UPPER,
         grapheme_prefix="",
+        word_cache_size=10000,
     ):
         return IpaG2p(
             phoneme_dict,
@@ -47,6 +48,7 @@ class TestIpaG2p:
             phoneme_probability=phoneme_probability,
             grapheme_case=grapheme_case,
             grapheme_prefix=grapheme_prefix,
+            word_cache_size=word_cache_size,
         )
 
     @pytest.mark.run_only_on('CPU')
@@ -406,3 +408,61 @@ class TestIpaG2p:
 
         phonemes = g2p(input_text)
         assert phonemes == expected_output
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_batch_call(self):
+        input_texts = ["Hello world.", "Hello Kitty!", "", "NVIDIA's airports"]
+        g2p = self._create_g2p(locale="en-US")
+
+        assert g2p.batch_call(input_texts) == [g2p(text) for text in input_texts]
+        assert g2p.batch_call([]) == []
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_batch_call_with_heteronym_model(self):
+        class HeteronymModel:
+            def __init__(self):
+                self.num_calls = 0
+
+            def disambiguate(self, sentences, batch_size=4):
+                self.num_calls += 1
+                return None, [sentence.replace("lead", "|ˈlid|") for sentence in sentences]
+
+        input_texts = ["Hello lead.", "lead world", "Hello world."]
+        g2p = self._create_g2p(locale="en-US")
+        g2p.heteronym_model = HeteronymModel()
+
+        phonemes = g2p.batch_call(input_texts)
+        assert g2p.heteronym_model.num_calls == 1
+        assert phonemes == [g2p(text) for text in input_texts]
+        assert phonemes[0] == list("həˈɫoʊ ") + ["ˈlid", "."]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_word_cache(self):
+        input_text = "Hello world, Jones's airports and NVIDIA's lead-world Kitty!"
+        g2p = self._create_g2p(locale="en-US", word_cache_size=3)
+        g2p_no_cache = self._create_g2p(locale="en-US", word_cache_size=0)
+
+        expected_output = g2p_no_cache(input_text)
+        assert g2p(input_text) == expected_output
+        assert g2p(input_text) == expected_output
+        assert len(g2p._word_cache) == 3
+        assert len(g2p_no_cache._word_cache) == 0
+
+        # Replacing the dictionary invalidates cached pronunciations
+        g2p.replace_dict({"HELLO": ["ˈhɛɫoʊ"]})
+        assert g2p("Hello") == list("ˈhɛɫoʊ")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_word_cache_with_phoneme_probability(self):
+        input_text = "Hello world, hello world, hello world!"
+        g2p = self._create_g2p(phoneme_probability=0.5)
+        g2p_no_cache = self._create_g2p(phoneme_probability=0.5, word_cache_size=0)
+        g2p._rng.seed(1234)
+        g2p_no_cache._rng.seed(1234)
+
+        for _ in range(5):
+            assert g2p(input_text) == g2p_no_cache(input_text)
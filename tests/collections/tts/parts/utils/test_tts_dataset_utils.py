@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 from pathlib import Path
 
 import librosa
@@ -20,6 +21,8 @@ import pytest
 import torch
 
 from nemo.collections.tts.parts.utils.tts_dataset_utils import (
+    FeatureStore,
+    FeatureStoreWriter,
     filter_dataset_by_duration,
     get_abs_rel_paths,
     get_audio_filepaths,
@@ -208,3 +211,58 @@ class TestTTSDatasetUtils:
         assert filtered_entries[1]["duration"] == 5.0
         assert total_hours == (135.6 / 3600.0)
         assert filtered_hours == (15.0 / 3600.0)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_feature_store(self, tmp_path):
+        store_path = tmp_path / "pitch"
+        features = {"a": np.arange(5, dtype=np.float32), "b": np.zeros(0), "c": np.ones(3, dtype=np.float64)}
+
+        with FeatureStoreWriter(store_path) as writer:
+            for key, feature in features.items():
+                writer.add(key, feature)
+
+        assert FeatureStore.exists(store_path)
+        store = FeatureStore(store_path)
+        assert len(store) == 3
+        assert "d" not in store
+        assert store.get("d") is None
+        for key, feature in features.items():
+            stored_feature = store.get(key)
+            assert stored_feature.dtype == torch.float32
+            torch.testing.assert_close(stored_feature, torch.from_numpy(feature).float())
+
+        # Modifying a returned feature does not change the file
+        store.get("a")[0] = 100.0
+        torch.testing.assert_close(FeatureStore(store_path).get("a"), torch.arange(5, dtype=torch.float32))
+
+        unpickled_store = pickle.loads(pickle.dumps(store))
+        torch.testing.assert_close(unpickled_store.get("c"), torch.ones(3))
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_feature_store_2d(self, tmp_path):
+        store_path = tmp_path / "log_mel"
+        log_mels = [torch.randn(1, 4, 7), torch.randn(1, 4, 2)]
+
+        with FeatureStoreWriter(store_path) as writer:
+            for i, log_mel in enumerate(log_mels):
+                writer.add(str(i), log_mel.numpy())
+            with pytest.raises(ValueError):
+                writer.add("2", np.zeros(3))
+
+        store = FeatureStore(store_path)
+        for i, log_mel in enumerate(log_mels):
+            torch.testing.assert_close(store.get(str(i)), log_mel)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_feature_store_writer_error(self, tmp_path):
+        store_path = tmp_path / "energy"
+        with pytest.raises(RuntimeError):
+            with FeatureStoreWriter(store_path) as writer:
+                writer.add("a", np.ones(2))
+                raise RuntimeError
+
+        assert not FeatureStore.exists(store_path)
+        assert list(tmp_path.iterdir()) == []
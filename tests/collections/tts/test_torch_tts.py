@@ -21,6 +21,7 @@ import torch
 
 from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import EnglishPhonemesTokenizer
 from nemo.collections.tts.data.dataset import TTSDataset
+from nemo.collections.tts.torch.tts_data_types import P_voiced, Voiced_mask
 from nemo.collections.tts.g2p.models.en_us_arpabet import EnglishG2p
 from nemo.collections.tts.parts.utils.tts_dataset_utils import get_base_dir
 
@@ -181,3 +182,70 @@ class TestTTSDataset:
                 z = torch.load(f"{sup_path}/{sup_data_types[2]}/{rel_audio_path_as_text_id}.pt")
                 assert not torch.equal(x, y)
                 assert not torch.equal(x, z)
+
+    @pytest.mark.unit
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.parametrize(
+        "sup_data_types",
+        [
+            ["pitch", "voiced_mask", "p_voiced", "energy"],
+            ["pitch", "p_voiced"],
+            ["energy"],
+        ],
+    )
+    def test_precomputed_sup_data_matches_on_the_fly(self, test_data_dir, sup_data_types, tmp_path):
+        manifest_path = os.path.join(test_data_dir, 'tts/mini_ljspeech/manifest.json')
+
+        def _make_dataset(sup_path):
+            return TTSDataset(
+                manifest_filepath=manifest_path,
+                sample_rate=22050,
+                sup_data_types=sup_data_types,
+                sup_data_path=sup_path,
+                text_tokenizer=EnglishPhonemesTokenizer(
+                    punct=True,
+                    stresses=True,
+                    chars=True,
+                    space=' ',
+                    apostrophe=True,
+                    pad_with_space=True,
+                    g2p=EnglishG2p(),
+                ),
+            )
+
+        on_the_fly = _make_dataset(tmp_path / "on_the_fly")
+        precomputed = _make_dataset(tmp_path / "precomputed")
+        precomputed.precompute_sup_data(num_workers=1)
+
+        for index in range(len(on_the_fly)):
+            expected, actual = on_the_fly[index], precomputed[index]
+            assert len(expected) == len(actual)
+            for expected_item, actual_item in zip(expected, actual):
+                if expected_item is None:
+                    assert actual_item is None
+                else:
+                    torch.testing.assert_close(actual_item, expected_item)
+
+        # __getitem__ of the precomputed dataset must not have computed any feature
+        for sup_data_type in sup_data_types:
+            assert not list((tmp_path / "precomputed" / sup_data_type).glob("*.pt"))
+
+    @pytest.mark.unit
+    @pytest.mark.run_only_on('CPU')
+    def test_compute_voiced_sup_data_without_pitch(self, test_data_dir, tmp_path):
+        manifest_path = os.path.join(test_data_dir, 'tts/mini_ljspeech/manifest.json')
+        dataset = TTSDataset(
+            manifest_filepath=manifest_path,
+            sample_rate=22050,
+            sup_data_types=["pitch", "voiced_mask", "p_voiced"],
+            sup_data_path=tmp_path / "sup_data",
+            text_tokenizer=EnglishPhonemesTokenizer(g2p=EnglishG2p()),
+        )
+        _, expected = dataset.compute_sup_data(0)
+
+        # subclasses may request voiced features without pitch
+        dataset.sup_data_types_set = {Voiced_mask, P_voiced}
+        _, features = dataset.compute_sup_data(0)
+        assert set(features) == {Voiced_mask.name, P_voiced.name}
+        for name, feature in features.items():
+            torch.testing.assert_close(feature, expected[name])
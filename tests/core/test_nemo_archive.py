@@ -0,0 +1,133 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tarfile
+
+import pytest
+import torch
+
+from nemo.core.connectors.nemo_archive import (
+    NemoArchiveIndex,
+    SafetensorsPayload,
+    load_safetensors,
+    save_safetensors,
+    write_nemo_archive,
+)
+
+
+@pytest.fixture()
+def state_dict():
+    return {
+        'encoder.weight': torch.randn(16, 8),
+        'encoder.bias': torch.randn(8, dtype=torch.float16),
+        'decoder.weight': torch.randn(4, 4, dtype=torch.bfloat16).t(),
+        'step': torch.tensor(7),
+        'mask': torch.tensor([True, False]),
+        'empty': torch.empty(0, 3),
+    }
+
+
+def _assert_equal(state_dict, loaded):
+    assert set(loaded) == set(state_dict)
+    for name, tensor in state_dict.items():
+        assert loaded[name].dtype == tensor.dtype
+        assert torch.equal(loaded[name], tensor), name
+
+
+@pytest.fixture()
+def source_dir(tmp_path):
+    source_dir = tmp_path / "source"
+    (source_dir / "sub").mkdir(parents=True)
+    (source_dir / "model_config.yaml").write_text("a: 1\n")
+    (source_dir / "sub" / "vocab.txt").write_bytes(os.urandom(3000))
+    return source_dir
+
+
+class TestSafetensors:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 4])
+    def test_roundtrip(self, state_dict, tmp_path, num_workers):
+        path = str(tmp_path / "weights.safetensors")
+        save_safetensors(state_dict, path, num_workers=num_workers)
+        _assert_equal(state_dict, load_safetensors(path))
+
+    @pytest.mark.unit
+    def test_compatible_with_safetensors_library(self, state_dict, tmp_path):
+        safetensors_torch = pytest.importorskip("safetensors.torch")
+        path = str(tmp_path / "weights.safetensors")
+        save_safetensors(state_dict, path, metadata={'source': 'nemo'})
+        _assert_equal(state_dict, safetensors_torch.load_file(path))
+
+        path = str(tmp_path / "reference.safetensors")
+        safetensors_torch.save_file({k: v.contiguous() for k, v in state_dict.items()}, path)
+        _assert_equal(state_dict, load_safetensors(path))
+
+    @pytest.mark.unit
+    def test_unsupported_values(self):
+        with pytest.raises(ValueError):
+            SafetensorsPayload({'extra_state': b'bytes'})
+        with pytest.raises(ValueError):
+            SafetensorsPayload({'weight': torch.zeros(2, dtype=torch.complex64)})
+
+
+class TestNemoArchive:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 4])
+    def test_write_and_index(self, state_dict, source_dir, tmp_path, num_workers):
+        path = str(tmp_path / "model.nemo")
+        payload = SafetensorsPayload(state_dict)
+        write_nemo_archive(
+            path, str(source_dir), payloads={'model_weights.safetensors': payload}, num_workers=num_workers
+        )
+
+        with tarfile.open(path, 'r:') as tar:
+            assert tar.getnames() == [
+                '.',
+                './model_config.yaml',
+                './sub',
+                './sub/vocab.txt',
+                './model_weights.safetensors',
+            ]
+            assert tar.extractfile('./sub/vocab.txt').read() == (source_dir / "sub" / "vocab.txt").read_bytes()
+        assert os.path.getsize(path) % tarfile.RECORDSIZE == 0
+
+        archive = NemoArchiveIndex.from_path(path)
+        assert NemoArchiveIndex.from_path(path) is archive
+        assert archive.names() == ['model_config.yaml', 'sub/vocab.txt', 'model_weights.safetensors']
+        assert archive.read_bytes('./model_config.yaml') == b"a: 1\n"
+        _assert_equal(state_dict, archive.load_safetensors('model_weights.safetensors'))
+
+        out_dir = tmp_path / "out"
+        archive.extract(archive.names(lambda name: name.endswith('.txt')), str(out_dir))
+        assert (out_dir / "sub" / "vocab.txt").read_bytes() == (source_dir / "sub" / "vocab.txt").read_bytes()
+
+    @pytest.mark.unit
+    def test_torch_load_from_archive(self, state_dict, source_dir, tmp_path):
+        torch.save(state_dict, source_dir / "model_weights.ckpt")
+        path = str(tmp_path / "model.nemo")
+        with tarfile.open(path, 'w:') as tar:
+            tar.add(str(source_dir), arcname='.')
+
+        archive = NemoArchiveIndex(path)
+        _assert_equal(state_dict, archive.torch_load('model_weights.ckpt', map_location='cpu'))
+        with archive.open('sub/vocab.txt') as f:
+            f.seek(100)
+            assert f.read(10) == (source_dir / "sub" / "vocab.txt").read_bytes()[100:110]
+
+        gz_path = str(tmp_path / "model_gz.nemo")
+        with tarfile.open(gz_path, 'w:gz') as tar:
+            tar.add(str(source_dir), arcname='.')
+        assert NemoArchiveIndex.is_indexable(path)
+        assert not NemoArchiveIndex.is_indexable(gz_path)
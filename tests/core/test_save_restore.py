@@ -15,6 +15,7 @@ import filecmp
 import json
 import os
 import shutil
+import tarfile
 import tempfile
 from typing import Any, Callable, Dict, Optional, Set, Union
 
@@ -832,6 +833,82 @@ class TestSaveRestore:
             assert type(restored_model) == MockModelV2
             assert type(restored_model._save_restore_connector) == MySaveRestoreConnector
 
+    @pytest.mark.unit
+    def test_restore_in_place(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact = os.path.join(tmpdir, 'artifact.txt')
+            with open(artifact, 'w') as f:
+                f.write("*****\n")
+            cfg = _mock_model_config()
+            cfg.model.temp_file = artifact
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'model.nemo')
+            model.save_to(save_path)
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            archive = connector._get_nemo_archive_index(save_path)
+            assert archive is not None
+            assert connector.model_config_yaml in archive.names()
+            assert archive.read_bytes(connector.model_config_yaml).startswith(b'temp_file:')
+
+            def _fail(*args, **kwargs):
+                raise AssertionError("The .nemo file should not be extracted.")
+
+            with monkeypatch.context() as m:
+                m.setattr(save_restore_connector.SaveRestoreConnector, '_unpack_nemo_file', _fail)
+                restored = MockModel.restore_from(save_path, map_location='cpu', save_restore_connector=connector)
+            assert torch.equal(restored.w.weight, model.w.weight)
+            assert restored.temp_data == ["*****\n"]
+
+            # Compressed archives and disabled in-place restoration use the extraction path
+            connector.restore_in_place = False
+            assert connector._get_nemo_archive_index(save_path) is None
+            restored = MockModel.restore_from(save_path, map_location='cpu', save_restore_connector=connector)
+            assert torch.equal(restored.w.weight, model.w.weight)
+
+            compressed_path = os.path.join(tmpdir, 'compressed.nemo')
+            with tarfile.open(save_path, 'r:') as src, tarfile.open(compressed_path, 'w:gz') as dst:
+                for member in src.getmembers():
+                    dst.addfile(member, src.extractfile(member) if member.isreg() else None)
+            assert save_restore_connector.SaveRestoreConnector()._get_nemo_archive_index(compressed_path) is None
+            restored = MockModel.restore_from(compressed_path, map_location='cpu')
+            assert torch.equal(restored.w.weight, model.w.weight)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pack_nemo_file", [True, False])
+    def test_safetensors_state_dict_format(self, pack_nemo_file):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact = os.path.join(tmpdir, 'artifact.txt')
+            with open(artifact, 'w') as f:
+                f.write("*****\n")
+            cfg = _mock_model_config()
+            cfg.model.temp_file = artifact
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.state_dict_format = "safetensors"
+            connector.pack_nemo_file = pack_nemo_file
+            model._save_restore_connector = connector
+            save_dir = os.path.join(tmpdir, 'saved')
+            os.makedirs(save_dir)
+            save_path = os.path.join(save_dir, 'model.nemo')
+            model.save_to(save_path)
+
+            restore_connector = save_restore_connector.SaveRestoreConnector()
+            if pack_nemo_file:
+                with tarfile.open(save_path, 'r:') as tar:
+                    names = [os.path.normpath(name) for name in tar.getnames()]
+                assert 'model_weights.safetensors' in names and 'model_weights.ckpt' not in names
+            else:
+                assert 'model_weights.safetensors' in os.listdir(save_dir)
+                restore_connector.model_extracted_dir = save_dir
+            restored = MockModel.restore_from(save_path, map_location='cpu', save_restore_connector=restore_connector)
+            assert torch.equal(restored.w.weight, model.w.weight)
+            assert restored.temp_data == ["*****\n"]
+
+        with pytest.raises(ValueError):
+            connector.state_dict_format = "pickle"
+
     @pytest.mark.unit
     def test_mock_model_model_collision(self):
         # The usual pipeline is working just fine.
@@ -1190,3 +1190,93 @@ class TestNeuralTypeCheckSystem:
             # assert that even if semantic types are disabled, output is attached with appropriate types
             assert result.sum() == torch.tensor(10.0)
             assert result.neural_type.compare(NeuralType(('B',), LabelsType())) == NeuralTypeComparisonResult.SAME
+
+    @pytest.mark.unit
+    def test_validation_plan_reused_across_calls(self):
+        class InputOutputTypes(Typing):
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B', 'T'), ElementType())}
+
+            @property
+            def output_types(self):
+                return {"y": NeuralType(('B', 'T'), LabelsType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1
+
+        obj = InputOutputTypes()
+        result_1 = obj(x=torch.zeros(2, 5))
+        result_2 = obj(x=result_1)
+
+        # Types are attached from the same plan on every call
+        assert result_1.neural_type is result_2.neural_type
+        assert result_2.neural_type.compare(NeuralType(('B', 'T'), LabelsType())) == NeuralTypeComparisonResult.SAME
+
+        # Rank checks are still performed on every call
+        with pytest.raises(TypeError):
+            _ = obj(x=torch.zeros(2))
+
+    @pytest.mark.unit
+    def test_validation_plan_state_dependent_types(self):
+        class StateDependentTypes(Typing):
+            def __init__(self):
+                self.time_major = False
+
+            @property
+            def input_types(self):
+                axes = ('T', 'B', 'D') if self.time_major else ('B', 'D')
+                return {"x": NeuralType(axes, ElementType())}
+
+            @property
+            def output_types(self):
+                axes = ('T', 'B', 'D') if self.time_major else ('B', 'D')
+                return {"y": NeuralType(axes, LabelsType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1
+
+        obj = StateDependentTypes()
+        result = obj(x=torch.zeros(2, 3))
+        assert len(result.neural_type.axes) == 2
+
+        # The types of the class changed, the previous plan must not be used
+        obj.time_major = True
+        with pytest.raises(TypeError):
+            _ = obj(x=torch.zeros(2, 3))
+
+        result = obj(x=torch.zeros(4, 2, 3))
+        assert len(result.neural_type.axes) == 3
+
+    @pytest.mark.unit
+    def test_validation_plan_cached_semantic_check(self):
+        class Producer(Typing):
+            @property
+            def output_types(self):
+                return {"y": NeuralType(('B',), LabelsType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1
+
+        class Consumer(Typing):
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B',), LogprobsType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x
+
+        producer, consumer = Producer(), Consumer()
+
+        # The comparison result is cached, the incompatible type must be rejected on every call
+        for _ in range(3):
+            with pytest.raises(TypeError):
+                _ = consumer(x=producer(x=torch.zeros(3)))
+
+        with typecheck.disable_semantic_checks():
+            result = consumer(x=producer(x=torch.zeros(3)))
+            assert result.sum() == torch.tensor(3.0)
@@ -0,0 +1,266 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from nemo.deploy.service import batching
+from nemo.deploy.service.batching import CompletionParams, LocalLLMBackend, MicroBatcher, TritonLLMBackend
+
+PARAMS = CompletionParams(model="model", max_tokens=2, temperature=1.0, top_p=0.0, top_k=1)
+
+
+class _RecordingInfer:
+    """Blocking inference function which echoes its items, and records the batches it receives."""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    def __call__(self, key, items):
+        self.batches.append((key, list(items)))
+        if self.error is not None:
+            raise self.error
+        return {"items": np.array(items)[..., np.newaxis], "keys": np.array([key] * len(items))}
+
+
+async def _submit_all(batcher, requests):
+    return await asyncio.gather(*[batcher.submit(key, item) for key, item in requests])
+
+
+class TestMicroBatcher:
+    @pytest.mark.unit
+    def test_invalid_max_batch_size(self):
+        with pytest.raises(ValueError):
+            MicroBatcher(_RecordingInfer(), max_batch_size=0)
+
+    @pytest.mark.unit
+    def test_flush_on_size(self):
+        infer = _RecordingInfer()
+        # The timeout would fail the test, batches must be sent as soon as they are full.
+        batcher = MicroBatcher(infer, max_batch_size=3, max_wait_ms=60_000)
+
+        start = time.perf_counter()
+        results = asyncio.run(_submit_all(batcher, [("a", i) for i in range(6)]))
+        assert time.perf_counter() - start < 10
+
+        assert infer.batches == [("a", [0, 1, 2]), ("a", [3, 4, 5])]
+        assert [result["items"].tolist() for result in results] == [[[i]] for i in range(6)]
+
+    @pytest.mark.unit
+    def test_flush_on_timeout(self):
+        infer = _RecordingInfer()
+        batcher = MicroBatcher(infer, max_batch_size=8, max_wait_ms=20)
+
+        async def _run():
+            first = await _submit_all(batcher, [("a", 0), ("a", 1)])
+            second = await batcher.submit("a", 2)
+            return first + [second]
+
+        results = asyncio.run(_run())
+        assert infer.batches == [("a", [0, 1]), ("a", [2])]
+        assert [result["items"].tolist() for result in results] == [[[0]], [[1]], [[2]]]
+
+    @pytest.mark.unit
+    def test_no_batching(self):
+        infer = _RecordingInfer()
+        batcher = MicroBatcher(infer, max_batch_size=1, max_wait_ms=60_000)
+        asyncio.run(_submit_all(batcher, [("a", 0), ("a", 1)]))
+        assert infer.batches == [("a", [0]), ("a", [1])]
+
+    @pytest.mark.unit
+    def test_grouping_by_key(self):
+        infer = _RecordingInfer()
+        batcher = MicroBatcher(infer, max_batch_size=2, max_wait_ms=20)
+        requests = [("a", 0), ("b", 1), ("a", 2), ("c", 3), ("b", 4)]
+
+        results = asyncio.run(_submit_all(batcher, requests))
+        assert sorted(infer.batches) == [("a", [0, 2]), ("b", [1, 4]), ("c", [3])]
+        for (key, item), result in zip(requests, results):
+            assert result["items"].tolist() == [[item]]
+            assert result["keys"].tolist() == [key]
+
+    @pytest.mark.unit
+    def test_exception_propagates_to_every_waiter(self):
+        infer = _RecordingInfer(error=RuntimeError("inference failed"))
+        batcher = MicroBatcher(infer, max_batch_size=3, max_wait_ms=20)
+
+        async def _run():
+            return await asyncio.gather(
+                *[batcher.submit("a", i) for i in range(3)], batcher.submit("b", 3), return_exceptions=True
+            )
+
+        results = asyncio.run(_run())
+        assert len(infer.batches) == 2
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.unit
+    def test_cancelled_request(self):
+        infer = _RecordingInfer()
+        batcher = MicroBatcher(infer, max_batch_size=8, max_wait_ms=50)
+
+        async def _run():
+            tasks = [asyncio.create_task(batcher.submit("a", i)) for i in range(3)]
+            await asyncio.sleep(0)
+            tasks[1].cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # The batcher keeps serving requests after a cancellation.
+            results.append(await batcher.submit("a", 3))
+            return results
+
+        results = asyncio.run(_run())
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert [results[i]["items"].tolist() for i in (0, 2, 3)] == [[[0]], [[2]], [[3]]]
+        assert infer.batches == [("a", [0, 1, 2]), ("a", [3])]
+
+    @pytest.mark.unit
+    def test_local_backend(self):
+        backend = LocalLLMBackend(batch_latency_ms=0, prompt_latency_ms=0)
+        batcher = MicroBatcher(backend, max_batch_size=4, max_wait_ms=20)
+
+        results = asyncio.run(_submit_all(batcher, [(PARAMS, f"prompt {i}") for i in range(6)]))
+        assert [result["sentences"][0][0] for result in results] == [f"{i} {i}" for i in range(6)]
+        assert sorted(backend.batch_sizes) == [2, 4]
+
+
+class _MockModelClient:
+    """Stand-in for pytriton's ModelClient, which echoes the prompts in upper case."""
+
+    instances = []
+
+    def __init__(self, url, model_name, init_timeout_s=None, max_batch_size=4, output_dtype=np.bytes_, error=None):
+        self.url = url
+        self.model_name = model_name
+        self.model_config = SimpleNamespace(
+            max_batch_size=max_batch_size, outputs=[SimpleNamespace(name="outputs", dtype=output_dtype)]
+        )
+        self.error = error
+        self.batch_sizes = []
+        self.closed = False
+        _MockModelClient.instances.append(self)
+
+    def infer_batch(self, **inputs):
+        batch_size = len(inputs["prompts"])
+        assert all(len(value) == batch_size for value in inputs.values())
+        if self.model_config.max_batch_size > 0:
+            assert batch_size <= self.model_config.max_batch_size
+        self.batch_sizes.append(batch_size)
+        if self.error is not None:
+            raise self.error
+
+        if self.model_config.outputs[0].dtype == np.bytes_:
+            return {"outputs": np.char.encode(np.char.upper(np.char.decode(inputs["prompts"], "utf-8")), "utf-8")}
+        return {"outputs": inputs["max_output_len"].astype(np.float32)}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def model_client(monkeypatch):
+    _MockModelClient.instances = []
+
+    def _patch(**kwargs):
+        def _make_client(url, model_name, init_timeout_s=None):
+            return _MockModelClient(url, model_name, init_timeout_s, **kwargs)
+
+        monkeypatch.setattr(batching, "use_pytriton", True)
+        monkeypatch.setattr(batching, "ModelClient", _make_client, raising=False)
+        return _MockModelClient.instances
+
+    return _patch
+
+
+class TestTritonLLMBackend:
+    @pytest.mark.unit
+    def test_infer(self, model_client):
+        clients = model_client()
+        backend = TritonLLMBackend(url="localhost:8000")
+
+        outputs = backend(PARAMS, ["hello", "world"])
+        assert outputs["sentences"].tolist() == [["HELLO"], ["WORLD"]]
+        assert len(clients) == 1
+        assert clients[0].url == "localhost:8000"
+        assert clients[0].model_name == "model"
+
+    @pytest.mark.unit
+    def test_clients_are_reused(self, model_client):
+        clients = model_client()
+        backend = TritonLLMBackend(url="localhost:8000")
+
+        backend(PARAMS, ["a"])
+        backend(PARAMS, ["b"])
+        backend(PARAMS._replace(model="other"), ["c"])
+        assert [client.model_name for client in clients] == ["model", "other"]
+        assert clients[0].batch_sizes == [1, 1]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_batch_size, batch_sizes", [(2, [2, 2, 1]), (5, [5]), (8, [5]), (0, [5])])
+    def test_batches_are_capped_at_model_max_batch_size(self, model_client, max_batch_size, batch_sizes):
+        clients = model_client(max_batch_size=max_batch_size)
+        backend = TritonLLMBackend(url="localhost:8000")
+
+        prompts = [f"prompt {i}" for i in range(5)]
+        outputs = backend(PARAMS, prompts)
+        assert clients[0].batch_sizes == batch_sizes
+        assert outputs["sentences"].tolist() == [[prompt.upper()] for prompt in prompts]
+
+    @pytest.mark.unit
+    def test_non_bytes_outputs(self, model_client):
+        model_client(output_dtype=np.float32)
+        backend = TritonLLMBackend(url="localhost:8000")
+
+        outputs = backend(PARAMS, ["a", "b"])
+        assert "sentences" not in outputs
+        assert outputs["outputs"].tolist() == [[2.0], [2.0]]
+
+    @pytest.mark.unit
+    def test_failed_client_is_closed(self, model_client):
+        clients = model_client(error=ConnectionError("connection lost"))
+        backend = TritonLLMBackend(url="localhost:8000")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                backend(PARAMS, ["a"])
+        assert len(clients) == 2
+        assert all(client.closed for client in clients)
+
+    @pytest.mark.unit
+    def test_with_micro_batcher(self, model_client):
+        clients = model_client(max_batch_size=3)
+        batcher = MicroBatcher(TritonLLMBackend(url="localhost:8000"), max_batch_size=4, max_wait_ms=20)
+
+        prompts = [f"prompt {i}" for i in range(4)]
+        results = asyncio.run(_submit_all(batcher, [(PARAMS, prompt) for prompt in prompts]))
+        assert [result["sentences"].tolist() for result in results] == [[[prompt.upper()]] for prompt in prompts]
+        assert clients[0].batch_sizes == [3, 1]
+
+
+class TestCompletionsV1:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("openai_format_response, expected", [(False, {"output": 2.0}), (True, [[2.0]])])
+    def test_non_bytes_outputs(self, model_client, monkeypatch, openai_format_response, expected):
+        from nemo.deploy.service import rest_model_api
+
+        model_client(output_dtype=np.float32)
+        batcher = MicroBatcher(TritonLLMBackend(url="localhost:8000"), max_batch_size=1)
+        monkeypatch.setattr(rest_model_api, "batcher", batcher)
+        monkeypatch.setattr(rest_model_api.triton_settings, "_openai_format_response", openai_format_response)
+
+        request = rest_model_api.CompletionRequest(model="model", prompt="hello", max_tokens=2)
+        assert asyncio.run(rest_model_api.completions_v1(request)) == expected
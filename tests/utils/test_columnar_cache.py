@@ -0,0 +1,89 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pytest
+
+from nemo.utils.columnar_cache import ColumnarCache, decode_string, encode_ragged, encode_strings
+
+
+@pytest.fixture()
+def source_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("some data\n")
+    return str(path)
+
+
+def _columns(sequences, strings):
+    values, values_offsets = encode_ragged(sequences)
+    buffer, buffer_offsets = encode_strings(strings)
+    return {'values': values, 'values_offsets': values_offsets, 'buffer': buffer, 'buffer_offsets': buffer_offsets}
+
+
+class TestColumnarCache:
+    @pytest.mark.unit
+    def test_save_load(self, source_file, tmp_path):
+        cache = ColumnarCache(str(tmp_path / "cache"), source_file, setting=1)
+        assert cache.load() is None
+
+        cache.save(_columns([[1, 2], [3]], ["a", "bc"]), {'name': 'test'})
+        assert cache.exists()
+        columns, meta = cache.load()
+        assert meta['name'] == 'test'
+        assert meta['columns'] == ['buffer', 'buffer_offsets', 'values', 'values_offsets']
+        assert isinstance(columns['values'], np.memmap)
+        assert decode_string(columns['buffer'], columns['buffer_offsets'], 1) == "bc"
+
+    @pytest.mark.unit
+    def test_key_changes(self, source_file, tmp_path):
+        cache_dir = str(tmp_path / "cache")
+        key = ColumnarCache(cache_dir, source_file, setting=1).key
+        assert ColumnarCache(cache_dir, [source_file], setting=1).key == key
+        assert ColumnarCache(cache_dir, source_file, setting=2).key != key
+
+        with open(source_file, "a") as f:
+            f.write("more data\n")
+        assert ColumnarCache(cache_dir, source_file, setting=1).key != key
+
+    @pytest.mark.unit
+    def test_merge(self, source_file, tmp_path):
+        sequences = [[1, 2, 3], [], [4], [5, 6], [7]]
+        strings = ["", "żółw", "abc", "d", "ef"]
+        cache = ColumnarCache(str(tmp_path / "cache"), source_file)
+        bounds = [(0, 2), (2, 2), (2, 5)]
+        parts = [cache.part(index, len(bounds)) for index in range(len(bounds))]
+        for part, (start, stop) in zip(parts, bounds):
+            part.save(_columns(sequences[start:stop], strings[start:stop]))
+        assert not cache.exists()
+
+        cache.merge(parts, offsets_columns=('values_offsets', 'buffer_offsets'), meta={'num_parts': len(parts)})
+        columns, meta = cache.load()
+        assert meta['num_parts'] == 3
+        for name, expected in _columns(sequences, strings).items():
+            np.testing.assert_array_equal(columns[name], expected)
+            assert columns[name].dtype == expected.dtype
+
+        cache.remove_parts()
+        assert os.listdir(cache.cache_dir) == [cache.key]
+
+    @pytest.mark.unit
+    def test_merge_missing_part(self, source_file, tmp_path):
+        cache = ColumnarCache(str(tmp_path / "cache"), source_file)
+        parts = [cache.part(index, 2) for index in range(2)]
+        parts[0].save(_columns([[1]], ["a"]))
+        with pytest.raises(FileNotFoundError):
+            cache.merge(parts)
+        assert not cache.exists()
@@ -0,0 +1,146 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from nemo.utils.sequence_packing_utils import (
+    PACKING_ALGOS,
+    assign_sequences_to_packs,
+    best_fit_decreasing,
+    create_hist,
+    create_packing_strategy,
+    fast_first_fit,
+    fast_first_fit_shuffle,
+    fill_packing_strategy,
+    first_fit,
+    first_fit_shuffle,
+)
+
+
+def _reference_fill_packing_strategy(assignments, sequences, pack_size, pad_id):
+    """Original loop-based implementation of `fill_packing_strategy`."""
+    ifile_handles = dict()
+    for seq_len in range(pack_size + 1):
+        per_seq_data = sequences[seq_len]
+        if len(per_seq_data) > 0:
+            perm = np.random.permutation(len(per_seq_data))
+            input_ids = np.array([x['input_ids'] for x in per_seq_data])[perm].tolist()
+            loss_mask = np.array(
+                [
+                    [
+                        idx >= x['answer_start_idx'] and x['input_ids'][idx] != pad_id
+                        for idx in range(len(x['input_ids']))
+                    ]
+                    for x in per_seq_data
+                ]
+            )[perm].tolist()
+            ifile_handles[seq_len] = (input_ids, loss_mask)
+
+    output_data = []
+    for assignment in assignments:
+        _input_ids, _loss_mask, _seq_start_id = [], [], [0]
+        for seq_length in assignment:
+            _input_ids.extend(ifile_handles[seq_length][0].pop())
+            _loss_mask.extend(ifile_handles[seq_length][1].pop())
+            _seq_start_id.append(len(_input_ids))
+        output_data.append({'input_ids': _input_ids, 'loss_mask': _loss_mask, 'seq_start_id': _seq_start_id[:-1]})
+    return output_data
+
+
+def _random_dataset(num_sequences, max_len, seed=0):
+    rng = np.random.default_rng(seed)
+    dataset = []
+    for _ in range(num_sequences):
+        length = int(rng.integers(2, max_len + 2))
+        input_ids = rng.integers(0, 5, size=length).tolist()
+        dataset.append({'input_ids': input_ids, 'answer_start_idx': int(rng.integers(0, length))})
+    return np.array(dataset)
+
+
+class TestPackingAlgorithms:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pack_size", [1, 16, 64])
+    def test_fast_first_fit_matches_first_fit(self, pack_size):
+        rng = np.random.default_rng(pack_size)
+        seqlens = rng.integers(0, pack_size + 1, size=500).tolist()
+        assert fast_first_fit(seqlens, pack_size) == first_fit(seqlens, pack_size)
+        assert fast_first_fit(sorted(seqlens, reverse=True), pack_size) == first_fit(
+            sorted(seqlens, reverse=True), pack_size
+        )
+
+    @pytest.mark.unit
+    def test_fast_first_fit_shuffle_matches_first_fit_shuffle(self):
+        seqlens = np.random.default_rng(0).integers(1, 33, size=300).tolist()
+        np.random.seed(1234)
+        expected = first_fit_shuffle(seqlens, 32)
+        np.random.seed(1234)
+        assert fast_first_fit_shuffle(seqlens, 32) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("algorithm", PACKING_ALGOS)
+    def test_valid_packing(self, algorithm):
+        histogram = np.random.default_rng(0).integers(0, 20, size=65).tolist()
+        assignments, metadata = create_packing_strategy(histogram, 64, algorithm)
+        assert all(sum(assignment) <= 64 for assignment in assignments)
+        packed = Counter(seq_len for assignment in assignments for seq_len in assignment)
+        assert packed == Counter({seq_len: count for seq_len, count in enumerate(histogram) if count > 0})
+        assert metadata['max_samples_per_bin'] == max(len(assignment) for assignment in assignments)
+
+    @pytest.mark.unit
+    def test_best_fit_decreasing(self):
+        assert best_fit_decreasing([5, 4, 3, 3, 2, 2, 1], 10) == [[5, 4, 1], [3, 3, 2, 2]]
+        # Sequences longer than the pack size get a bin of their own.
+        assert best_fit_decreasing([12, 3, 3], 10) == [[12], [3, 3]]
+
+
+class TestFillPackingStrategy:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pack_size", [8, 32])
+    def test_matches_reference(self, pack_size):
+        dataset = _random_dataset(num_sequences=200, max_len=pack_size)
+        sequences, histogram = create_hist(dataset, pack_size)
+        assignments, _ = create_packing_strategy(histogram, pack_size, 'first_fit_decreasing')
+
+        np.random.seed(0)
+        expected = _reference_fill_packing_strategy(assignments, sequences, pack_size, pad_id=0)
+        np.random.seed(0)
+        output = fill_packing_strategy(assignments, sequences, pack_size, pad_id=0)
+        assert output == expected
+
+    @pytest.mark.unit
+    def test_leftover_sequences(self):
+        dataset = _random_dataset(num_sequences=20, max_len=8)
+        sequences, histogram = create_hist(dataset, 8)
+        assignments, _ = create_packing_strategy(histogram, 8, 'first_fit_decreasing')
+        with pytest.raises(AssertionError):
+            fill_packing_strategy(assignments[1:], sequences, 8, pad_id=0)
+
+    @pytest.mark.unit
+    def test_assign_sequences_to_packs_matches_fill(self):
+        dataset = _random_dataset(num_sequences=200, max_len=16)
+        sequences, histogram = create_hist(dataset, 16)
+        assignments, _ = create_packing_strategy(histogram, 16, 'best_fit_decreasing')
+
+        np.random.seed(0)
+        expected = fill_packing_strategy(assignments, sequences, 16, pad_id=0)
+        np.random.seed(0)
+        sequence_ids, bin_offsets = assign_sequences_to_packs(
+            assignments, [len(x['input_ids']) - 1 for x in dataset], 16
+        )
+        for i, item in enumerate(expected):
+            ids = sequence_ids[bin_offsets[i] : bin_offsets[i + 1]]
+            assert item['input_ids'] == [token for j in ids for token in dataset[j]['input_ids']]